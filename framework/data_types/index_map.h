@@ -0,0 +1,160 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <cstdint>
+#include <limits>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace opensn
+{
+
+/**
+ * Hash map from 64-bit ids to 64-bit indices, stored in two flat arrays.
+ *
+ * The map uses open addressing with linear probing and keeps its load factor between 1/4 and 1/2,
+ * so that it needs 32 to 64 bytes per entry and a lookup usually touches a single cache line,
+ * whereas a `std::map` allocates a separate tree node of about 64 bytes per entry and walks
+ * log2(N) of them per lookup. Entries cannot be erased individually. The id
+ * `std::numeric_limits<uint64_t>::max()` is reserved.
+ */
+class IndexMap
+{
+public:
+  static constexpr uint64_t NOT_FOUND = std::numeric_limits<uint64_t>::max();
+
+  IndexMap() = default;
+
+  size_t size() const { return size_; }
+  bool empty() const { return size_ == 0; }
+
+  /// Allocates room for `n` entries without rehashing.
+  void reserve(size_t n)
+  {
+    size_t capacity = MIN_CAPACITY;
+    while (capacity < 2 * n)
+      capacity *= 2;
+    if (capacity > keys_.size())
+      Rehash(capacity);
+  }
+
+  /// Removes all entries and releases the memory.
+  void clear()
+  {
+    keys_.clear();
+    keys_.shrink_to_fit();
+    values_.clear();
+    values_.shrink_to_fit();
+    size_ = 0;
+  }
+
+  /**
+   * Adds the entry `id` -> `value` if `id` is not in the map yet. Returns whether the entry was
+   * added.
+   */
+  bool Insert(uint64_t id, uint64_t value) { return Emplace(id, value, false); }
+
+  /// Adds the entry `id` -> `value`, replacing the value of `id` if it is already in the map.
+  void InsertOrAssign(uint64_t id, uint64_t value) { Emplace(id, value, true); }
+
+  /// Returns the value of `id`, or `NOT_FOUND` if `id` is not in the map.
+  uint64_t Find(uint64_t id) const
+  {
+    if (size_ == 0 or id == EMPTY)
+      return NOT_FOUND;
+    const size_t mask = keys_.size() - 1;
+    for (size_t slot = Hash(id) & mask;; slot = (slot + 1) & mask)
+    {
+      if (keys_[slot] == id)
+        return values_[slot];
+      if (keys_[slot] == EMPTY)
+        return NOT_FOUND;
+    }
+  }
+
+  bool Contains(uint64_t id) const { return Find(id) != NOT_FOUND; }
+
+  /// Returns the value of `id`, throwing `std::out_of_range` if `id` is not in the map.
+  uint64_t at(uint64_t id) const
+  {
+    const auto value = Find(id);
+    if (value == NOT_FOUND)
+      throw std::out_of_range("IndexMap: id " + std::to_string(id) + " not found.");
+    return value;
+  }
+
+  /// Returns the memory used by the map, in bytes.
+  size_t GetMemoryUsage() const
+  {
+    return keys_.capacity() * sizeof(uint64_t) + values_.capacity() * sizeof(uint64_t);
+  }
+
+private:
+  static constexpr uint64_t EMPTY = std::numeric_limits<uint64_t>::max();
+  static constexpr size_t MIN_CAPACITY = 16;
+
+  /// Finalizer of MurmurHash3, which spreads consecutive ids over the whole table.
+  static size_t Hash(uint64_t id)
+  {
+    id ^= id >> 33;
+    id *= 0xff51afd7ed558ccdULL;
+    id ^= id >> 33;
+    id *= 0xc4ceb9fe1a85ec53ULL;
+    id ^= id >> 33;
+    return static_cast<size_t>(id);
+  }
+
+  bool Emplace(uint64_t id, uint64_t value, bool assign)
+  {
+    if (id == EMPTY)
+      throw std::invalid_argument("IndexMap: id " + std::to_string(id) + " is reserved.");
+    if (2 * (size_ + 1) > keys_.size())
+      Rehash(keys_.empty() ? MIN_CAPACITY : 2 * keys_.size());
+
+    const size_t mask = keys_.size() - 1;
+    for (size_t slot = Hash(id) & mask;; slot = (slot + 1) & mask)
+    {
+      if (keys_[slot] == EMPTY)
+      {
+        keys_[slot] = id;
+        values_[slot] = value;
+        ++size_;
+        return true;
+      }
+      if (keys_[slot] == id)
+      {
+        if (assign)
+          values_[slot] = value;
+        return false;
+      }
+    }
+  }
+
+  void Rehash(size_t capacity)
+  {
+    std::vector<uint64_t> keys(capacity, EMPTY);
+    std::vector<uint64_t> values(capacity, 0);
+    const size_t mask = capacity - 1;
+    for (size_t i = 0; i < keys_.size(); ++i)
+    {
+      if (keys_[i] == EMPTY)
+        continue;
+      size_t slot = Hash(keys_[i]) & mask;
+      while (keys[slot] != EMPTY)
+        slot = (slot + 1) & mask;
+      keys[slot] = keys_[i];
+      values[slot] = values_[i];
+    }
+    keys_ = std::move(keys);
+    values_ = std::move(values);
+  }
+
+  std::vector<uint64_t> keys_;
+  std::vector<uint64_t> values_;
+  size_t size_ = 0;
+};
+
+} // namespace opensn
@@ -162,30 +162,28 @@ FieldFunctionGridBased::GetPointValue(const Vector3& point) const
       point.z >= zmin and point.z <= zmax)
   {
     const auto& grid = discretization_->GetGrid();
-    for (const auto& cell : grid->local_cells)
+    for (const auto local_id : grid->FindLocalCellsContainingPoint(point))
     {
-      if (grid->CheckPointInsideCell(cell, point))
-      {
-        const auto& cell_mapping = discretization_->GetCellMapping(cell);
-        Vector<double> shape_values;
-        cell_mapping.ShapeValues(point, shape_values);
+      const auto& cell = grid->local_cells[local_id];
+      const auto& cell_mapping = discretization_->GetCellMapping(cell);
+      Vector<double> shape_values;
+      cell_mapping.ShapeValues(point, shape_values);
 
-        local_num_point_hits += 1;
+      local_num_point_hits += 1;
 
-        const auto num_nodes = cell_mapping.GetNumNodes();
-        for (size_t c = 0; c < num_components; ++c)
+      const auto num_nodes = cell_mapping.GetNumNodes();
+      for (size_t c = 0; c < num_components; ++c)
+      {
+        for (size_t j = 0; j < num_nodes; ++j)
         {
-          for (size_t j = 0; j < num_nodes; ++j)
-          {
-            const auto dof_map = discretization_->MapDOFLocal(cell, j, uk_man, 0, c);
-            const double dof_value = field_vector[dof_map];
-
-            local_point_value[c] += dof_value * shape_values(j);
-          } // for node i
-        }   // for component c
-      }     // if inside cell
-    }       // for cell
-  }         // if in bounding box
+          const auto dof_map = discretization_->MapDOFLocal(cell, j, uk_man, 0, c);
+          const double dof_value = field_vector[dof_map];
+
+          local_point_value[c] += dof_value * shape_values(j);
+        } // for node i
+      }   // for component c
+    }     // for cell
+  }       // if in bounding box
 
   // Communicate number of point hits
   size_t global_num_point_hits;
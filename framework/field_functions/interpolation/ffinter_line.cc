@@ -9,6 +9,7 @@
 #include "framework/mesh/cell/cell.h"
 #include "framework/logging/log.h"
 #include "framework/runtime.h"
+#include <algorithm>
 #include <fstream>
 
 namespace opensn
@@ -48,17 +49,18 @@ FieldFunctionInterpolationLine::Initialize()
   auto estimated_local_size = number_of_points_ / opensn::mpi_comm.size();
   local_interpolation_points_.reserve(estimated_local_size);
   local_cells_.reserve(estimated_local_size);
-  for (const auto& cell : grid->local_cells)
+  const auto containing_cells = grid->FindLocalCellsContainingPoints(tmp_points);
+  std::vector<std::pair<uint64_t, int>> cell_points;
+  for (int p = 0; p < number_of_points_; ++p)
+    for (const auto local_id : containing_cells[p])
+      cell_points.emplace_back(local_id, p);
+
+  // Order the points by cell
+  std::sort(cell_points.begin(), cell_points.end());
+  for (const auto& [local_id, p] : cell_points)
   {
-    for (int p = 0; p < number_of_points_; ++p)
-    {
-      auto& point = tmp_points[p];
-      if (grid->CheckPointInsideCell(cell, point))
-      {
-        local_interpolation_points_.push_back(point);
-        local_cells_.push_back(cell.local_id);
-      }
-    }
+    local_interpolation_points_.push_back(tmp_points[p]);
+    local_cells_.push_back(local_id);
   }
 
   log.Log0Verbose1() << "Finished initializing interpolator.";
@@ -30,8 +30,10 @@ FieldFunctionInterpolationPoint::Initialize()
 
   const auto& grid = field_functions_.front()->GetSpatialDiscretization().GetGrid();
   std::vector<uint64_t> cells_potentially_owning_point;
-  for (const auto& cell : grid->local_cells)
+  for (const auto local_id :
+       grid->GetCellSpatialIndex().FindLocalCellCandidates(point_of_interest_))
   {
+    const auto& cell = grid->local_cells[local_id];
     const auto& vcc = cell.centroid;
     const auto& poi = point_of_interest_;
     const auto nudged_point = poi + 1.0e-6 * (vcc - poi);
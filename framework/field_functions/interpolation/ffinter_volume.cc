@@ -61,6 +61,13 @@ FieldFunctionInterpolationVolume::Execute()
 
   const auto field_data = ref_ff.GetGhostedFieldVector();
 
+  const bool apply_function = op_type_ >= FieldFunctionInterpolationOperation::OP_SUM_FUNC and
+                              op_type_ <= FieldFunctionInterpolationOperation::OP_MAX_FUNC;
+
+  // Quadrature point values, block IDs and weights, for a single batched function evaluation
+  std::vector<double> qp_values, qp_weights;
+  std::vector<int> qp_block_ids;
+
   double local_volume = 0.0;
   double local_sum = 0.0;
   double local_max = 0.0;
@@ -97,18 +104,28 @@ FieldFunctionInterpolationVolume::Execute()
       for (size_t j = 0; j < num_nodes; ++j)
         ff_value += fe_vol_data.ShapeValue(j, qp) * node_dof_values[j];
 
-      double function_value = ff_value;
-      if (op_type_ >= FieldFunctionInterpolationOperation::OP_SUM_FUNC and
-          op_type_ <= FieldFunctionInterpolationOperation::OP_MAX_FUNC)
-        function_value = oper_function_->Evaluate(ff_value, cell.block_id);
+      if (apply_function)
+      {
+        qp_values.push_back(ff_value);
+        qp_block_ids.push_back(cell.block_id);
+        qp_weights.push_back(fe_vol_data.JxW(qp));
+      }
+      else
+        local_sum += ff_value * fe_vol_data.JxW(qp);
 
       local_volume += fe_vol_data.JxW(qp);
-      local_sum += function_value * fe_vol_data.JxW(qp);
       local_max = std::fmax(ff_value, local_max);
       local_min = std::fmin(ff_value, local_min);
     }
   }
 
+  if (apply_function)
+  {
+    const auto function_values = oper_function_->EvaluateBatch(qp_values, qp_block_ids);
+    for (size_t i = 0; i < function_values.size(); ++i)
+      local_sum += function_values[i] * qp_weights[i];
+  }
+
   if (op_type_ == FieldFunctionInterpolationOperation::OP_SUM or
       op_type_ == FieldFunctionInterpolationOperation::OP_SUM_FUNC)
   {
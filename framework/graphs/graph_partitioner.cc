@@ -2,6 +2,8 @@
 // SPDX-License-Identifier: MIT
 
 #include "framework/graphs/graph_partitioner.h"
+#include "framework/mpi/mpi_utils.h"
+#include "framework/runtime.h"
 
 namespace opensn
 {
@@ -18,4 +20,81 @@ GraphPartitioner::GraphPartitioner(const InputParameters& params) : Object(param
 {
 }
 
+std::vector<int64_t>
+GraphPartitioner::PartitionDistributed(const std::vector<std::vector<uint64_t>>& local_graph,
+                                       const std::vector<Vector3>& local_centroids,
+                                       int number_of_parts)
+{
+  // Gather the number of rows, the row sizes, the row entries and the centroids on location 0
+  const int num_locations = mpi_comm.size();
+  const int num_local_rows = static_cast<int>(local_graph.size());
+  std::vector<int> row_counts;
+  mpi_comm.gather(num_local_rows, row_counts, 0);
+
+  std::vector<int> local_row_sizes;
+  std::vector<uint64_t> local_entries;
+  std::vector<double> local_coordinates;
+  local_row_sizes.reserve(num_local_rows);
+  local_coordinates.reserve(3 * num_local_rows);
+  for (int i = 0; i < num_local_rows; ++i)
+  {
+    local_row_sizes.push_back(static_cast<int>(local_graph[i].size()));
+    local_entries.insert(local_entries.end(), local_graph[i].begin(), local_graph[i].end());
+    for (int d = 0; d < 3; ++d)
+      local_coordinates.push_back(local_centroids[i][d]);
+  }
+
+  int num_local_entries = static_cast<int>(local_entries.size());
+  std::vector<int> entry_counts;
+  mpi_comm.gather(num_local_entries, entry_counts, 0);
+
+  std::vector<int> row_offsets(num_locations, 0), entry_offsets(num_locations, 0);
+  std::vector<int> coordinate_counts(num_locations, 0), coordinate_offsets(num_locations, 0);
+  if (mpi_comm.rank() == 0)
+    for (int p = 0; p < num_locations; ++p)
+    {
+      coordinate_counts[p] = 3 * row_counts[p];
+      if (p > 0)
+      {
+        row_offsets[p] = row_offsets[p - 1] + row_counts[p - 1];
+        entry_offsets[p] = entry_offsets[p - 1] + entry_counts[p - 1];
+        coordinate_offsets[p] = coordinate_offsets[p - 1] + coordinate_counts[p - 1];
+      }
+    }
+  else
+    row_counts = entry_counts = std::vector<int>(num_locations, 0);
+
+  std::vector<int> row_sizes;
+  std::vector<uint64_t> entries;
+  std::vector<double> coordinates;
+  mpi_comm.gather(local_row_sizes, row_sizes, row_counts, row_offsets, 0);
+  mpi_comm.gather(local_entries, entries, entry_counts, entry_offsets, 0);
+  mpi_comm.gather(local_coordinates, coordinates, coordinate_counts, coordinate_offsets, 0);
+
+  // Partition the whole graph on location 0, and send the partition ids of the rows of each
+  // location back
+  std::map<int, std::vector<int64_t>> location_pids;
+  if (mpi_comm.rank() == 0)
+  {
+    const size_t num_rows = row_sizes.size();
+    std::vector<std::vector<uint64_t>> graph(num_rows);
+    std::vector<Vector3> centroids(num_rows);
+    size_t e = 0;
+    for (size_t i = 0; i < num_rows; ++i)
+    {
+      graph[i].assign(entries.begin() + e, entries.begin() + e + row_sizes[i]);
+      e += row_sizes[i];
+      centroids[i] = Vector3(coordinates[3 * i], coordinates[3 * i + 1], coordinates[3 * i + 2]);
+    }
+
+    const auto pids = Partition(graph, centroids, number_of_parts);
+    for (int p = 0; p < num_locations; ++p)
+      location_pids[p].assign(pids.begin() + row_offsets[p],
+                              pids.begin() + row_offsets[p] + row_counts[p]);
+  }
+
+  auto received_pids = MapAllToAll(location_pids);
+  return std::move(received_pids[0]);
+}
+
 } // namespace opensn
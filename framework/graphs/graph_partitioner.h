@@ -18,6 +18,16 @@ public:
                                          const std::vector<Vector3>& centroids,
                                          int number_of_parts) = 0;
 
+  /**
+   * Given the rows of a graph that are distributed over all locations, in the order of their
+   * global row indices, returns the partition ids of the local rows. Must be called by all
+   * locations. The default gathers the graph on location 0 and partitions it with Partition.
+   */
+  virtual std::vector<int64_t>
+  PartitionDistributed(const std::vector<std::vector<uint64_t>>& local_graph,
+                       const std::vector<Vector3>& local_centroids,
+                       int number_of_parts);
+
 protected:
   static InputParameters GetInputParameters();
   explicit GraphPartitioner(const InputParameters& params);
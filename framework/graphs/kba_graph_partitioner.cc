@@ -144,4 +144,12 @@ KBAGraphPartitioner::Partition(const std::vector<std::vector<uint64_t>>& graph,
   return real_pids;
 }
 
+std::vector<int64_t>
+KBAGraphPartitioner::PartitionDistributed(const std::vector<std::vector<uint64_t>>& local_graph,
+                                          const std::vector<Vector3>& local_centroids,
+                                          int number_of_parts)
+{
+  return Partition(local_graph, local_centroids, number_of_parts);
+}
+
 } // namespace opensn
@@ -20,6 +20,11 @@ public:
                                  const std::vector<Vector3>& centroids,
                                  int number_of_parts) override;
 
+  /// The partition of a row only depends on its centroid, so the local rows are partitioned.
+  std::vector<int64_t> PartitionDistributed(const std::vector<std::vector<uint64_t>>& local_graph,
+                                            const std::vector<Vector3>& local_centroids,
+                                            int number_of_parts) override;
+
 protected:
   const size_t nx_, ny_, nz_;
   const std::vector<double> xcuts_, ycuts_, zcuts_;
@@ -4,6 +4,8 @@
 #include "framework/graphs/linear_graph_partitioner.h"
 #include "framework/utils/utils.h"
 #include "framework/logging/log.h"
+#include "framework/mpi/mpi_utils.h"
+#include "framework/runtime.h"
 #include <cmath>
 
 namespace opensn
@@ -69,4 +71,33 @@ LinearGraphPartitioner::Partition(const std::vector<std::vector<uint64_t>>& grap
   return pids;
 }
 
+std::vector<int64_t>
+LinearGraphPartitioner::PartitionDistributed(const std::vector<std::vector<uint64_t>>& local_graph,
+                                             const std::vector<Vector3>&,
+                                             const int number_of_parts)
+{
+  log.Log0Verbose1() << "Partitioning with LinearGraphPartitioner";
+
+  const auto extents = BuildLocationExtents(local_graph.size(), mpi_comm);
+  const uint64_t num_global_rows = extents.back();
+  const uint64_t first_row = extents[mpi_comm.rank()];
+
+  std::vector<int64_t> pids(local_graph.size(), all_to_rank_);
+
+  if (all_to_rank_ < 0)
+  {
+    const std::vector<SubSetInfo> sub_sets = MakeSubSets(num_global_rows, number_of_parts);
+    int k = 0;
+    for (size_t i = 0; i < local_graph.size(); ++i)
+    {
+      while (first_row + i > sub_sets[k].ss_end)
+        ++k;
+      pids[i] = k;
+    }
+  }
+
+  log.Log0Verbose1() << "Done partitioning with LinearGraphPartitioner";
+  return pids;
+}
+
 } // namespace opensn
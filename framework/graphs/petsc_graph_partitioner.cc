@@ -4,6 +4,7 @@
 #include "framework/graphs/petsc_graph_partitioner.h"
 #include "framework/runtime.h"
 #include "framework/logging/log.h"
+#include "framework/mpi/mpi_utils.h"
 #include "petsc.h"
 
 namespace opensn
@@ -131,4 +132,76 @@ PETScGraphPartitioner::Partition(const std::vector<std::vector<uint64_t>>& graph
   return cell_pids;
 }
 
+std::vector<int64_t>
+PETScGraphPartitioner::PartitionDistributed(const std::vector<std::vector<uint64_t>>& local_graph,
+                                            const std::vector<Vector3>&,
+                                            int number_of_parts)
+{
+  log.Log0Verbose1() << "Partitioning distributed graph with PETScGraphPartitioner";
+
+  const size_t num_local_rows = local_graph.size();
+  const auto extents = BuildLocationExtents(num_local_rows, mpi_comm);
+  const uint64_t num_global_rows = extents.back();
+
+  std::vector<int64_t> cell_pids(num_local_rows, 0);
+  if (num_global_rows <= 1)
+    return cell_pids;
+
+  // Build the indices of the local rows. The arrays are owned by the adjacency matrix.
+  size_t num_local_entries = 0;
+  for (const auto& row : local_graph)
+    num_local_entries += row.size();
+
+  int64_t* i_indices_raw;
+  int64_t* j_indices_raw;
+  PetscMalloc((num_local_rows + 1) * sizeof(int64_t), &i_indices_raw);
+  PetscMalloc(std::max<size_t>(num_local_entries, 1) * sizeof(int64_t), &j_indices_raw);
+  {
+    int64_t icount = 0;
+    for (size_t i = 0; i < num_local_rows; ++i)
+    {
+      i_indices_raw[i] = icount;
+      for (const uint64_t neighbor_id : local_graph[i])
+        j_indices_raw[icount++] = static_cast<int64_t>(neighbor_id);
+    }
+    i_indices_raw[num_local_rows] = icount;
+  }
+
+  log.Log0Verbose1() << "Done building indices.";
+
+  // Create adjacency matrix
+  Mat Adj; // Adjacency matrix
+  MatCreateMPIAdj(mpi_comm,
+                  static_cast<int64_t>(num_local_rows),
+                  static_cast<int64_t>(num_global_rows),
+                  i_indices_raw,
+                  j_indices_raw,
+                  nullptr,
+                  &Adj);
+
+  log.Log0Verbose1() << "Done creating adjacency matrix.";
+
+  // Create partitioning
+  MatPartitioning part;
+  IS is;
+  MatPartitioningCreate(mpi_comm, &part);
+  MatPartitioningSetAdjacency(part, Adj);
+  MatPartitioningSetType(part, type_.c_str());
+  MatPartitioningSetNParts(part, number_of_parts);
+  MatPartitioningApply(part, &is);
+  MatPartitioningDestroy(&part);
+  MatDestroy(&Adj);
+
+  // Get the partition ids of the local rows
+  const int64_t* cell_pids_raw;
+  ISGetIndices(is, &cell_pids_raw);
+  for (size_t i = 0; i < num_local_rows; ++i)
+    cell_pids[i] = cell_pids_raw[i];
+  ISRestoreIndices(is, &cell_pids_raw);
+  ISDestroy(&is);
+
+  log.Log0Verbose1() << "Done partitioning distributed graph with PETScGraphPartitioner";
+  return cell_pids;
+}
+
 } // namespace opensn
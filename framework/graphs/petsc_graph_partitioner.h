@@ -18,6 +18,10 @@ public:
                                  const std::vector<Vector3>& centroids,
                                  int number_of_parts) override;
 
+  std::vector<int64_t> PartitionDistributed(const std::vector<std::vector<uint64_t>>& local_graph,
+                                            const std::vector<Vector3>& local_centroids,
+                                            int number_of_parts) override;
+
 protected:
   const std::string type_;
 
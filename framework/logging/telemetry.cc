@@ -0,0 +1,188 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "framework/logging/telemetry.h"
+#include "framework/logging/log.h"
+#include "framework/runtime.h"
+#include <cmath>
+#include <iomanip>
+#include <sstream>
+
+namespace opensn
+{
+
+namespace
+{
+
+void
+WriteJSONString(std::ostream& out, const std::string& str)
+{
+  out << '"';
+  for (const char c : str)
+  {
+    if (c == '"' or c == '\\')
+      out << '\\' << c;
+    else if (static_cast<unsigned char>(c) < 0x20)
+      out << "\\u" << std::hex << std::setw(4) << std::setfill('0') << static_cast<int>(c)
+          << std::dec << std::setfill(' ');
+    else
+      out << c;
+  }
+  out << '"';
+}
+
+void
+WriteJSONNumber(std::ostream& out, double value)
+{
+  // JSON has no representation of infinity and NaN
+  if (std::isfinite(value))
+    out << value;
+  else
+    out << "null";
+}
+
+} // namespace
+
+const std::array<const char*, Telemetry::NUM_CATEGORIES>&
+Telemetry::GetCategoryNames()
+{
+  static const std::array<const char*, NUM_CATEGORIES> names = {
+    "sweep", "communication", "source", "dsa"};
+  return names;
+}
+
+void
+Telemetry::Enable(const std::filesystem::path& file_path)
+{
+  Disable();
+  if (not file_path.empty() and mpi_comm.rank() == 0)
+  {
+    file_.open(file_path, std::ios::trunc);
+    OpenSnLogicalErrorIf(not file_.is_open(),
+                         "Failed to open telemetry file " + file_path.string() + ".");
+  }
+  enabled_ = true;
+
+  // The scopes that are already open are recorded from now on
+  totals_.fill(0.0);
+  const auto now = std::chrono::steady_clock::now();
+  for (auto& scope : scopes_)
+  {
+    scope.totals.fill(0.0);
+    scope.wall_time = now;
+  }
+}
+
+void
+Telemetry::Disable()
+{
+  enabled_ = false;
+  if (file_.is_open())
+    file_.close();
+}
+
+void
+Telemetry::BeginSolver(const char* solver)
+{
+  scopes_.push_back({solver, 0, totals_, std::chrono::steady_clock::now()});
+}
+
+void
+Telemetry::EndSolver()
+{
+  OpenSnLogicalErrorIf(scopes_.empty(), "Telemetry: No solver scope to end.");
+  scopes_.pop_back();
+}
+
+void
+Telemetry::RecordIteration(int iteration,
+                           std::initializer_list<std::pair<const char*, double>> values)
+{
+  if (not enabled_)
+    return;
+  OpenSnLogicalErrorIf(scopes_.empty(),
+                       "Telemetry: Iterations must be recorded in a solver scope.");
+
+  auto& scope = scopes_.back();
+  ++scope.num_iterations;
+
+  // Reduce the time of each category since the last record over all ranks. The maximum and the
+  // negated minimum are reduced together.
+  std::array<double, NUM_CATEGORIES> sums{};
+  std::array<double, 2 * NUM_CATEGORIES> extrema{};
+  for (int c = 0; c < NUM_CATEGORIES; ++c)
+  {
+    const double time = totals_[c] - scope.totals[c];
+    sums[c] = time;
+    extrema[c] = time;
+    extrema[NUM_CATEGORIES + c] = -time;
+  }
+  std::array<double, NUM_CATEGORIES> global_sums{};
+  std::array<double, 2 * NUM_CATEGORIES> global_extrema{};
+  mpi_comm.all_reduce(sums.data(), NUM_CATEGORIES, global_sums.data(), mpi::op::sum<double>());
+  mpi_comm.all_reduce(
+    extrema.data(), 2 * NUM_CATEGORIES, global_extrema.data(), mpi::op::max<double>());
+  scope.totals = totals_;
+
+  const auto now = std::chrono::steady_clock::now();
+  Record record;
+  record.solver = scope.solver;
+  record.iteration = iteration;
+  for (size_t i = 0; i + 1 < scopes_.size(); ++i)
+    record.outer.push_back({scopes_[i].solver, scopes_[i].num_iterations});
+  record.wall_time = std::chrono::duration<double>(now - scope.wall_time).count();
+  scope.wall_time = now;
+  for (int c = 0; c < NUM_CATEGORIES; ++c)
+  {
+    record.times[c].min = -global_extrema[NUM_CATEGORIES + c];
+    record.times[c].max = global_extrema[c];
+    record.times[c].mean = global_sums[c] / mpi_comm.size();
+  }
+  for (const auto& [name, value] : values)
+    record.values.emplace_back(name, value);
+
+  if (file_.is_open())
+    file_ << ToJSON(record) << std::endl;
+  records_.push_back(std::move(record));
+}
+
+std::string
+Telemetry::ToJSON(const Record& record)
+{
+  std::ostringstream out;
+  out << std::setprecision(10);
+  out << "{\"solver\": ";
+  WriteJSONString(out, record.solver);
+  out << ", \"iteration\": " << record.iteration << ", \"outer\": [";
+  for (size_t i = 0; i < record.outer.size(); ++i)
+  {
+    out << (i > 0 ? ", " : "") << "{\"solver\": ";
+    WriteJSONString(out, record.outer[i].solver);
+    out << ", \"iteration\": " << record.outer[i].iteration << "}";
+  }
+  out << "], \"wall_time\": ";
+  WriteJSONNumber(out, record.wall_time);
+  out << ", \"times\": {";
+  for (int c = 0; c < NUM_CATEGORIES; ++c)
+  {
+    out << (c > 0 ? ", " : "") << "\"" << GetCategoryNames()[c] << "\": {\"min\": ";
+    WriteJSONNumber(out, record.times[c].min);
+    out << ", \"max\": ";
+    WriteJSONNumber(out, record.times[c].max);
+    out << ", \"mean\": ";
+    WriteJSONNumber(out, record.times[c].mean);
+    out << "}";
+  }
+  out << "}, \"values\": {";
+  for (size_t i = 0; i < record.values.size(); ++i)
+  {
+    out << (i > 0 ? ", " : "");
+    WriteJSONString(out, record.values[i].first);
+    out << ": ";
+    WriteJSONNumber(out, record.values[i].second);
+  }
+  out << "}}";
+  return out.str();
+}
+
+} // namespace opensn
@@ -0,0 +1,190 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <array>
+#include <chrono>
+#include <filesystem>
+#include <fstream>
+#include <initializer_list>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace opensn
+{
+
+/**
+ * Records per-iteration performance data of the iterative solvers.
+ *
+ * Solvers open a scope for each solve and record each of their iterations with their convergence
+ * data, e.g., the residual. A record also holds the time each rank spent in every timing category
+ * since the previous record of the same solver, reduced over all ranks to the minimum, maximum and
+ * mean, so that load imbalance shows as a maximum well above the mean. Because solves are nested,
+ * e.g., within-groupset solves within across-groupset iterations within power iterations, the time
+ * of an outer iteration includes that of its inner iterations, and each record lists the iteration
+ * of every enclosing solver.
+ *
+ * Recording is collective and must be enabled on all ranks. The records are kept in memory and,
+ * optionally, written by rank 0 to a file as JSON lines.
+ *
+ * \code
+ * auto& telemetry = Telemetry::GetInstance();
+ * Telemetry::SolverScope telemetry_scope("wgs");
+ * for (int k = 0; k < max_iterations; ++k)
+ * {
+ *   {
+ *     Telemetry::ScopedTimer timer(Telemetry::SWEEP);
+ *     Sweep();
+ *   }
+ *   telemetry.RecordIteration(k, {{"residual", residual}});
+ * }
+ * \endcode
+ */
+class Telemetry
+{
+public:
+  /// Timing categories
+  enum Category
+  {
+    SWEEP = 0,         ///< Sweeps, including their communication
+    COMMUNICATION = 1, ///< Sending and polling for sweep messages, part of the sweep time
+    SOURCE = 2,        ///< Setting the sources of the inner solves
+    DSA = 3,           ///< Diffusion synthetic acceleration
+    NUM_CATEGORIES = 4
+  };
+
+  /// Minimum, maximum and mean over all ranks of a time, in seconds.
+  struct TimeStats
+  {
+    double min = 0.0;
+    double max = 0.0;
+    double mean = 0.0;
+  };
+
+  /// An enclosing solve of a record, with the index of its ongoing iteration, counted from zero.
+  struct Level
+  {
+    std::string solver;
+    int iteration;
+  };
+
+  /// Data of an iteration of a solver.
+  struct Record
+  {
+    std::string solver;
+    int iteration;
+    /// Enclosing solves, from the outermost to the innermost
+    std::vector<Level> outer;
+    /// Wall time since the previous record of the solver, in seconds
+    double wall_time;
+    std::array<TimeStats, NUM_CATEGORIES> times;
+    std::vector<std::pair<std::string, double>> values;
+  };
+
+  /// Opens a solver scope for the lifetime of the object.
+  class SolverScope
+  {
+  public:
+    explicit SolverScope(const char* solver) { GetInstance().BeginSolver(solver); }
+    ~SolverScope() { GetInstance().EndSolver(); }
+    SolverScope(const SolverScope&) = delete;
+    SolverScope& operator=(const SolverScope&) = delete;
+  };
+
+  /// Adds the lifetime of the object to a timing category.
+  class ScopedTimer
+  {
+  public:
+    explicit ScopedTimer(Category category)
+      : category_(category), start_(std::chrono::steady_clock::now())
+    {
+    }
+    ~ScopedTimer()
+    {
+      GetInstance().AddTime(
+        category_,
+        std::chrono::duration<double>(std::chrono::steady_clock::now() - start_).count());
+    }
+    ScopedTimer(const ScopedTimer&) = delete;
+    ScopedTimer& operator=(const ScopedTimer&) = delete;
+
+  private:
+    const Category category_;
+    const std::chrono::steady_clock::time_point start_;
+  };
+
+  static Telemetry& GetInstance() noexcept
+  {
+    static Telemetry instance;
+    return instance;
+  }
+
+  /**
+   * Starts recording. If a file path is given, rank 0 also writes every record to it as a line of
+   * JSON, replacing the contents of the file.
+   */
+  void Enable(const std::filesystem::path& file_path = {});
+
+  /// Stops recording and closes the file. The records are kept.
+  void Disable();
+
+  bool IsEnabled() const { return enabled_; }
+
+  /// Removes all records.
+  void Clear() { records_.clear(); }
+
+  const std::vector<Record>& GetRecords() const { return records_; }
+
+  /// Returns the names of the timing categories, as used in the JSON output.
+  static const std::array<const char*, NUM_CATEGORIES>& GetCategoryNames();
+
+  /// Adds time, in seconds, to a timing category of this rank.
+  void AddTime(Category category, double seconds)
+  {
+    if (enabled_)
+      totals_[category] += seconds;
+  }
+
+  /// Opens the scope of a solve, within the scope of the enclosing solve, if any.
+  void BeginSolver(const char* solver);
+
+  /// Closes the scope of the innermost solve.
+  void EndSolver();
+
+  /**
+   * Records an iteration of the innermost solve with the given convergence data. This is a
+   * collective operation.
+   */
+  void RecordIteration(int iteration,
+                       std::initializer_list<std::pair<const char*, double>> values = {});
+
+  /// Returns a record as a single line of JSON.
+  static std::string ToJSON(const Record& record);
+
+private:
+  Telemetry() = default;
+  Telemetry(const Telemetry&) = delete;
+  Telemetry& operator=(const Telemetry&) = delete;
+
+  /**
+   * Open solve, with its number of recorded iterations and the totals of the timing categories and
+   * the wall time at its last record
+   */
+  struct Scope
+  {
+    const char* solver;
+    int num_iterations;
+    std::array<double, NUM_CATEGORIES> totals;
+    std::chrono::steady_clock::time_point wall_time;
+  };
+
+  bool enabled_ = false;
+  std::ofstream file_;
+  std::array<double, NUM_CATEGORIES> totals_{};
+  std::vector<Scope> scopes_;
+  std::vector<Record> records_;
+};
+
+} // namespace opensn
@@ -19,6 +19,7 @@ MultiGroupXS::Initialize(double sigma_t, double c)
   auto& S = transfer_matrices_.back();
   S.SetDiagonal(std::vector<double>(num_groups_, sigma_t * c));
   ComputeDiffusionParameters();
+  BuildTransferMatricesCSR();
 }
 
 void
@@ -206,6 +207,7 @@ MultiGroupXS::Initialize(std::vector<std::pair<int, double>>& combinations)
   } // for cross sections
 
   ComputeDiffusionParameters();
+  BuildTransferMatricesCSR();
 }
 
 void
@@ -219,6 +221,8 @@ MultiGroupXS::Reset()
   sigma_t_.clear();
   sigma_a_.clear();
   transfer_matrices_.clear();
+  transfer_matrices_csr_.clear();
+  transposed_transfer_matrices_csr_.clear();
 
   sigma_f_.clear();
   chi_.clear();
@@ -392,6 +396,7 @@ MultiGroupXS::SetScalingFactor(const double factor)
   // Reinitialize diffusion
   diffusion_initialized_ = false;
   ComputeDiffusionParameters();
+  BuildTransferMatricesCSR();
 }
 
 void
@@ -424,6 +429,20 @@ MultiGroupXS::TransposeTransferAndProduction()
       for (size_t gp = 0; gp < num_groups_; ++gp)
         transposed_production_matrix_[g].push_back(F[gp][g]);
   }
+
+  BuildTransferMatricesCSR();
+}
+
+void
+MultiGroupXS::BuildTransferMatricesCSR()
+{
+  transfer_matrices_csr_.clear();
+  for (const auto& S_ell : transfer_matrices_)
+    transfer_matrices_csr_.emplace_back(S_ell);
+
+  transposed_transfer_matrices_csr_.clear();
+  for (const auto& S_ell : transposed_transfer_matrices_)
+    transposed_transfer_matrices_csr_.emplace_back(S_ell);
 }
 
 } // namespace opensn
@@ -4,6 +4,7 @@
 #pragma once
 
 #include "framework/math/sparse_matrix/sparse_matrix.h"
+#include "framework/math/sparse_matrix/csr_matrix.h"
 
 namespace opensn
 {
@@ -94,6 +95,12 @@ public:
     return adjoint_ ? transposed_transfer_matrices_.at(ell) : transfer_matrices_.at(ell);
   }
 
+  /// Transfer matrices in contiguous CSR form, for fast traversal.
+  const std::vector<CSRMatrix>& GetTransferMatricesCSR() const
+  {
+    return adjoint_ ? transposed_transfer_matrices_csr_ : transfer_matrices_csr_;
+  }
+
   const std::vector<double>& GetChi() const { return chi_; }
 
   const std::vector<double>& GetSigmaFission() const { return sigma_f_; }
@@ -160,6 +167,9 @@ private:
   /// Sparse scattering matrix
   std::vector<SparseMatrix> transfer_matrices_;
   std::vector<SparseMatrix> transposed_transfer_matrices_;
+  /// Contiguous copies of the transfer matrices
+  std::vector<CSRMatrix> transfer_matrices_csr_;
+  std::vector<CSRMatrix> transposed_transfer_matrices_csr_;
   /// Total neutron production matrix
   std::vector<std::vector<double>> production_matrix_;
   std::vector<std::vector<double>> transposed_production_matrix_;
@@ -183,6 +193,9 @@ private:
 
   void TransposeTransferAndProduction();
 
+  /// Builds the contiguous copies of the transfer matrices.
+  void BuildTransferMatricesCSR();
+
   /// Check vector for all non-negative values
   bool IsNonNegative(const std::vector<double>& vec)
   {
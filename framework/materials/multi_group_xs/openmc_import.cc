@@ -106,6 +106,7 @@ MultiGroupXS::Initialize(const std::string& file_name,
   if (sigma_a_.empty())
     ComputeAbsorption();
   ComputeDiffusionParameters();
+  BuildTransferMatricesCSR();
 
   // Is fissionable?
   H5ReadGroupAttribute<bool>(file, dataset_name, "fissionable", is_fissionable_);
@@ -529,6 +529,7 @@ MultiGroupXS::Initialize(const std::string& file_name)
   if (sigma_a_.empty())
     ComputeAbsorption();
   ComputeDiffusionParameters();
+  BuildTransferMatricesCSR();
 
   //
   // Compute and check fission data
@@ -424,6 +424,63 @@ GaussElimination(DenseMatrix<TYPE>& A, Vector<TYPE>& b, unsigned int n)
   }
 }
 
+/**
+ * Batched Gauss elimination without pivoting. Solves `num_systems` independent systems of size
+ * `n` that are stored interleaved: entry (i, j) of system s is `A[(i * n + j) * num_systems + s]`
+ * and entry i of its right-hand side is `b[i * num_systems + s]`. The innermost loops run over
+ * the systems so that they are contiguous in memory and vectorize. On return, `b` holds the
+ * solutions and `A` is overwritten.
+ */
+template <typename TYPE>
+void
+BatchedGaussElimination(TYPE* A, TYPE* b, unsigned int n, size_t num_systems)
+{
+  const size_t S = num_systems;
+
+  // Forward elimination. The diagonal is replaced by its reciprocal once it is final.
+  for (size_t i = 0; i < n; ++i)
+  {
+    TYPE* Aii = &A[(i * n + i) * S];
+    for (size_t s = 0; s < S; ++s)
+      Aii[s] = 1.0 / Aii[s];
+
+    const TYPE* bi = &b[i * S];
+    for (size_t j = i + 1; j < n; ++j)
+    {
+      TYPE* Aji = &A[(j * n + i) * S];
+      TYPE* bj = &b[j * S];
+      for (size_t s = 0; s < S; ++s)
+      {
+        Aji[s] *= Aii[s];
+        bj[s] -= Aji[s] * bi[s];
+      }
+      for (size_t k = i + 1; k < n; ++k)
+      {
+        const TYPE* Aik = &A[(i * n + k) * S];
+        TYPE* Ajk = &A[(j * n + k) * S];
+        for (size_t s = 0; s < S; ++s)
+          Ajk[s] -= Aji[s] * Aik[s];
+      }
+    }
+  }
+
+  // Back substitution
+  for (size_t ii = n; ii-- > 0;)
+  {
+    TYPE* bi = &b[ii * S];
+    for (size_t j = ii + 1; j < n; ++j)
+    {
+      const TYPE* Aij = &A[(ii * n + j) * S];
+      const TYPE* bj = &b[j * S];
+      for (size_t s = 0; s < S; ++s)
+        bi[s] -= Aij[s] * bj[s];
+    }
+    const TYPE* Aii = &A[(ii * n + ii) * S];
+    for (size_t s = 0; s < S; ++s)
+      bi[s] *= Aii[s];
+  }
+}
+
 /// Computes the inverse of a matrix using Gauss-Elimination with pivoting.
 template <typename TYPE>
 DenseMatrix<TYPE>
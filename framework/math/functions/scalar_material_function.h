@@ -5,6 +5,7 @@
 
 #include "framework/math/functions/function.h"
 #include "framework/math/vector3.h"
+#include <vector>
 
 namespace opensn
 {
@@ -25,6 +26,23 @@ public:
    * \return Function value
    */
   virtual double Evaluate(double val, int mat_id) const = 0;
+
+  /**
+   * Evaluate this function for multiple values
+   *
+   * \param vals The scalar values (for example, field function values)
+   * \param mat_ids The material IDs of the cells, one per value
+   * \return Function values, one per value
+   */
+  virtual std::vector<double> EvaluateBatch(const std::vector<double>& vals,
+                                            const std::vector<int>& mat_ids) const
+  {
+    std::vector<double> values;
+    values.reserve(vals.size());
+    for (size_t i = 0; i < vals.size(); ++i)
+      values.push_back(Evaluate(vals[i], mat_ids[i]));
+    return values;
+  }
 };
 
 } // namespace opensn
@@ -5,6 +5,7 @@
 
 #include "framework/math/functions/function.h"
 #include "framework/math/vector3.h"
+#include <vector>
 
 namespace opensn
 {
@@ -24,6 +25,21 @@ public:
    * \return Function value
    */
   virtual double Evaluate(const Vector3& xyz) const = 0;
+
+  /**
+   * Evaluate this function at multiple points
+   *
+   * \param xyz The xyz coordinates of the points where the function is called.
+   * \return Function values, one per point
+   */
+  virtual std::vector<double> EvaluateBatch(const std::vector<Vector3>& xyz) const
+  {
+    std::vector<double> values;
+    values.reserve(xyz.size());
+    for (const auto& point : xyz)
+      values.push_back(Evaluate(point));
+    return values;
+  }
 };
 
 } // namespace opensn
@@ -5,6 +5,7 @@
 
 #include "framework/math/functions/function.h"
 #include "framework/math/vector3.h"
+#include <vector>
 
 namespace opensn
 {
@@ -25,6 +26,23 @@ public:
    * \return Function value
    */
   virtual double Evaluate(int mat_id, const Vector3& xyz) const = 0;
+
+  /**
+   * Evaluate this function at multiple points
+   *
+   * \param mat_ids The material IDs of the cells, one per point
+   * \param xyz The xyz coordinates of the points where the function is called.
+   * \return Function values, one per point
+   */
+  virtual std::vector<double> EvaluateBatch(const std::vector<int>& mat_ids,
+                                            const std::vector<Vector3>& xyz) const
+  {
+    std::vector<double> values;
+    values.reserve(xyz.size());
+    for (size_t i = 0; i < xyz.size(); ++i)
+      values.push_back(Evaluate(mat_ids[i], xyz[i]));
+    return values;
+  }
 };
 
 } // namespace opensn
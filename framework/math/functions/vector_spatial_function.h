@@ -5,6 +5,7 @@
 
 #include "framework/math/functions/function.h"
 #include "framework/math/vector3.h"
+#include <vector>
 
 namespace opensn
 {
@@ -25,6 +26,26 @@ public:
    * \return A vector with the function evaluation (should have `num_groups` entries)
    */
   virtual std::vector<double> Evaluate(const Vector3& xyz, int num_components) const = 0;
+
+  /**
+   * Evaluate the function at multiple points.
+   *
+   * \param xyz The xyz coordinates of the points where the function is evaluated.
+   * \param num_components The number of components
+   * \return A vector with `num_components` entries per point, ordered point-major.
+   */
+  virtual std::vector<double> EvaluateBatch(const std::vector<Vector3>& xyz,
+                                            int num_components) const
+  {
+    std::vector<double> values;
+    values.reserve(xyz.size() * num_components);
+    for (const auto& point : xyz)
+    {
+      const auto point_values = Evaluate(point, num_components);
+      values.insert(values.end(), point_values.begin(), point_values.end());
+    }
+    return values;
+  }
 };
 
 } // namespace opensn
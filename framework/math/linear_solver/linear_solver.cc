@@ -21,6 +21,8 @@ LinearSolver::IterativeMethodName(LinearSolver::IterativeMethod iterative_method
       return "PETSC_GMRES";
     case IterativeMethod::PETSC_BICGSTAB:
       return "PETSC_BICGSTAB";
+    case IterativeMethod::ANDERSON_RICHARDSON:
+      return "ANDERSON_RICHARDSON";
     default:
       throw std::runtime_error("Unrecognized iterative method.");
   }
@@ -17,10 +17,11 @@ public:
   enum class IterativeMethod : int
   {
     NONE = 0,
-    CLASSIC_RICHARDSON = 1, ///< Classic Richardson (source iteration)
-    PETSC_RICHARDSON = 3,   ///< PETSc Richardson iteration
-    PETSC_GMRES = 2,        ///< PETSc GMRES iterative algorithm
-    PETSC_BICGSTAB = 4,     ///< PETSc BiCGStab iterative algorithm
+    CLASSIC_RICHARDSON = 1,  ///< Classic Richardson (source iteration)
+    PETSC_RICHARDSON = 3,    ///< PETSc Richardson iteration
+    PETSC_GMRES = 2,         ///< PETSc GMRES iterative algorithm
+    PETSC_BICGSTAB = 4,      ///< PETSc BiCGStab iterative algorithm
+    ANDERSON_RICHARDSON = 5, ///< Richardson iteration with Anderson acceleration
   };
 
   LinearSolver(IterativeMethod iterative_method, std::shared_ptr<LinearSolverContext> context_ptr)
@@ -0,0 +1,68 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "framework/math/sparse_matrix/csr_matrix.h"
+#include "framework/math/sparse_matrix/sparse_matrix.h"
+#include <algorithm>
+#include <numeric>
+#include <stdexcept>
+
+namespace opensn
+{
+
+CSRMatrix::CSRMatrix(const SparseMatrix& matrix)
+  : num_rows_(matrix.GetNumRows()), num_cols_(matrix.GetNumCols())
+{
+  row_offsets_.assign(num_rows_ + 1, 0);
+  for (size_t i = 0; i < num_rows_; ++i)
+    row_offsets_[i + 1] = row_offsets_[i] + matrix.rowI_indices[i].size();
+
+  col_indices_.resize(row_offsets_.back());
+  values_.resize(row_offsets_.back());
+
+  std::vector<size_t> order;
+  for (size_t i = 0; i < num_rows_; ++i)
+  {
+    const auto& cols = matrix.rowI_indices[i];
+    const auto& vals = matrix.rowI_values[i];
+
+    // Sort the row entries by column index
+    order.resize(cols.size());
+    std::iota(order.begin(), order.end(), 0);
+    std::stable_sort(
+      order.begin(), order.end(), [&cols](size_t a, size_t b) { return cols[a] < cols[b]; });
+
+    for (size_t k = 0; k < order.size(); ++k)
+    {
+      col_indices_[row_offsets_[i] + k] = cols[order[k]];
+      values_[row_offsets_[i] + k] = vals[order[k]];
+    }
+  }
+}
+
+size_t
+CSRMatrix::FindColumn(size_t i, size_t j) const
+{
+  const auto begin = col_indices_.begin() + row_offsets_[i];
+  const auto end = col_indices_.begin() + row_offsets_[i + 1];
+  return std::lower_bound(begin, end, j) - col_indices_.begin();
+}
+
+void
+CSRMatrix::Multiply(const std::vector<double>& x, std::vector<double>& y) const
+{
+  if (x.size() != num_cols_)
+    throw std::runtime_error("CSRMatrix: Incompatible matrix-vector size encountered in call to "
+                             "Multiply");
+
+  y.assign(num_rows_, 0.0);
+  for (size_t i = 0; i < num_rows_; ++i)
+  {
+    double value = 0.0;
+    for (size_t k = row_offsets_[i]; k < row_offsets_[i + 1]; ++k)
+      value += values_[k] * x[col_indices_[k]];
+    y[i] = value;
+  }
+}
+
+} // namespace opensn
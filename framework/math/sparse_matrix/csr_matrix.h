@@ -0,0 +1,51 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <cstddef>
+#include <vector>
+
+namespace opensn
+{
+
+class SparseMatrix;
+
+/**
+ * Contiguous compressed sparse row (CSR) matrix. Unlike SparseMatrix, which stores each row in its
+ * own vectors so that entries can be inserted, the column indices and values of all rows are
+ * stored in two contiguous arrays and the column indices of each row are sorted. It is intended
+ * for fast traversal of matrices whose entries are final, such as cross-section transfer matrices.
+ */
+class CSRMatrix
+{
+public:
+  CSRMatrix() = default;
+
+  /// Builds a contiguous copy of a sparse matrix.
+  explicit CSRMatrix(const SparseMatrix& matrix);
+
+  size_t GetNumRows() const { return num_rows_; }
+  size_t GetNumCols() const { return num_cols_; }
+  size_t GetNumNonZeros() const { return values_.size(); }
+
+  /// Entries of row `i` are at positions `[row_offsets[i], row_offsets[i + 1])`.
+  const std::vector<size_t>& GetRowOffsets() const { return row_offsets_; }
+  const std::vector<size_t>& GetColumnIndices() const { return col_indices_; }
+  const std::vector<double>& GetValues() const { return values_; }
+
+  /// Returns the position of the first entry of row `i` with a column index of at least `j`.
+  size_t FindColumn(size_t i, size_t j) const;
+
+  /// Computes `y = A x`.
+  void Multiply(const std::vector<double>& x, std::vector<double>& y) const;
+
+private:
+  size_t num_rows_ = 0;
+  size_t num_cols_ = 0;
+  std::vector<size_t> row_offsets_{0};
+  std::vector<size_t> col_indices_;
+  std::vector<double> values_;
+};
+
+} // namespace opensn
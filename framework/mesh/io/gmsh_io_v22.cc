@@ -307,7 +307,7 @@ MeshIO::FromGmshV22(const UnpartitionedMesh::Options& options)
   mesh->SetType(UNSTRUCTURED);
   mesh->ComputeCentroids();
   mesh->CheckQuality();
-  mesh->BuildMeshConnectivity();
+  mesh->BuildMeshConnectivity(options.num_threads);
 
   log.Log() << "Done processing " << options.file_name << ".\n"
             << "Number of nodes read: " << mesh->GetVertices().size() << "\n"
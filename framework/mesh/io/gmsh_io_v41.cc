@@ -4,11 +4,276 @@
 #include "framework/mesh/io/mesh_io.h"
 #include "framework/runtime.h"
 #include "framework/logging/log.h"
+#include <algorithm>
+#include <filesystem>
 #include <fstream>
+#include <limits>
 
 namespace opensn
 {
 
+namespace
+{
+
+bool
+IsElementType1D(int type)
+{
+  return type == 1;
+}
+
+bool
+IsElementType2D(int type)
+{
+  return type == 2 or type == 3;
+}
+
+bool
+IsElementType3D(int type)
+{
+  return type >= 4 and type <= 7;
+}
+
+bool
+IsElementSupported(int type)
+{
+  return type >= 1 and type <= 7;
+}
+
+CellType
+CellTypeFromMSHTypeID(int type)
+{
+  switch (type)
+  {
+    case 1:
+      return CellType::SLAB;
+    case 2:
+      return CellType::TRIANGLE;
+    case 3:
+      return CellType::QUADRILATERAL;
+    case 4:
+      return CellType::TETRAHEDRON;
+    case 5:
+      return CellType::HEXAHEDRON;
+    case 6:
+    case 7:
+      return CellType::POLYHEDRON;
+    default:
+      return CellType::GHOST;
+  }
+}
+
+/// Returns the number of nodes of an element type, or zero for unsupported types.
+int
+GetNumElementNodes(int element_type)
+{
+  if (element_type == 1) // 2-node edge
+    return 2;
+  if (element_type == 2) // 3-node triangle
+    return 3;
+  if (element_type == 3 or element_type == 4) // 4-node quadrangle or tet
+    return 4;
+  if (element_type == 5) // 8-node hexahedron
+    return 8;
+  return 0;
+}
+
+/// Sets the block id, vertices and faces of the light-weight cell of an element.
+void
+SetupCellFromElement(UnpartitionedMesh::LightWeightCell& cell,
+                     int element_type,
+                     int physical_reg,
+                     const std::vector<size_t>& node_tags)
+{
+  cell.block_id = physical_reg;
+  std::vector<uint64_t> nodes(node_tags.size());
+  for (size_t i = 0; i < node_tags.size(); ++i)
+    nodes[i] = node_tags[i] - 1;
+  cell.vertex_ids = nodes;
+
+  // Populate faces
+  if (element_type == 1) // 2-node edge
+  {
+    UnpartitionedMesh::LightWeightFace face0;
+    UnpartitionedMesh::LightWeightFace face1;
+
+    face0.vertex_ids = {cell.vertex_ids.at(0)};
+    face1.vertex_ids = {cell.vertex_ids.at(1)};
+
+    cell.faces.push_back(face0);
+    cell.faces.push_back(face1);
+  }
+  else if (element_type == 2 or element_type == 3) // 3-node triangle or 4-node quadrangle
+  {
+    size_t num_verts = cell.vertex_ids.size();
+    for (size_t e = 0; e < num_verts; e++)
+    {
+      size_t ep1 = (e < (num_verts - 1)) ? e + 1 : 0;
+      UnpartitionedMesh::LightWeightFace face;
+
+      face.vertex_ids = {cell.vertex_ids[e], cell.vertex_ids[ep1]};
+
+      cell.faces.push_back(std::move(face));
+    }
+  }
+  else if (element_type == 4) // 4-node tetrahedron
+  {
+    auto& v = cell.vertex_ids;
+    std::vector<UnpartitionedMesh::LightWeightFace> lw_faces(4);
+    lw_faces[0].vertex_ids = {v[0], v[2], v[1]}; // Base face
+    lw_faces[1].vertex_ids = {v[0], v[3], v[2]};
+    lw_faces[2].vertex_ids = {v[3], v[1], v[2]};
+    lw_faces[3].vertex_ids = {v[3], v[0], v[1]};
+
+    for (auto& lw_face : lw_faces)
+      cell.faces.push_back(lw_face);
+  }
+  else if (element_type == 5) // 8-node hexahedron
+  {
+    auto& v = cell.vertex_ids;
+    std::vector<UnpartitionedMesh::LightWeightFace> lw_faces(6);
+    lw_faces[0].vertex_ids = {v[5], v[1], v[2], v[6]}; // East face
+    lw_faces[1].vertex_ids = {v[0], v[4], v[7], v[3]}; // West face
+    lw_faces[2].vertex_ids = {v[0], v[3], v[2], v[1]}; // North face
+    lw_faces[3].vertex_ids = {v[4], v[5], v[6], v[7]}; // South face
+    lw_faces[4].vertex_ids = {v[2], v[3], v[7], v[6]}; // Top face
+    lw_faces[5].vertex_ids = {v[0], v[1], v[5], v[4]}; // Bottom face
+
+    for (auto& lw_face : lw_faces)
+      cell.faces.push_back(lw_face);
+  }
+  else
+    throw std::runtime_error("MeshIO::FromGmshV41: Unsupported cell type.");
+}
+
+/**
+ * Index of the lines of a text file that is built in parallel. Each location scans an equal range
+ * of the bytes of the file, and records the offset of every CHECKPOINT_INTERVAL-th line start and
+ * the lines of the given section markers. Any line can then be reached by seeking to the nearest
+ * checkpoint and skipping fewer than CHECKPOINT_INTERVAL lines.
+ */
+class ParallelLineIndex
+{
+public:
+  ParallelLineIndex(const std::string& file_name, const std::vector<std::string>& markers)
+  {
+    const auto num_locations = static_cast<uint64_t>(mpi_comm.size());
+    const auto location = static_cast<uint64_t>(mpi_comm.rank());
+    const uint64_t file_size = std::filesystem::file_size(file_name);
+    const uint64_t begin = file_size * location / num_locations;
+    const uint64_t end = file_size * (location + 1) / num_locations;
+
+    std::ifstream file(file_name, std::ios::binary);
+    if (not file.is_open())
+      throw std::runtime_error("Failed to open file " + file_name);
+
+    // A line starts at the beginning of the file and after every newline
+    char previous = '\n';
+    if (begin > 0)
+    {
+      file.seekg(static_cast<std::streamoff>(begin - 1));
+      file.get(previous);
+    }
+
+    uint64_t num_local_lines = 0;
+    std::vector<uint64_t> local_checkpoints;
+    std::vector<uint64_t> local_candidates;
+    std::vector<char> chunk(CHUNK_SIZE);
+    file.seekg(static_cast<std::streamoff>(begin));
+    for (uint64_t offset = begin; offset < end;)
+    {
+      const auto size = static_cast<size_t>(std::min<uint64_t>(CHUNK_SIZE, end - offset));
+      file.read(chunk.data(), static_cast<std::streamsize>(size));
+      for (size_t i = 0; i < size; ++i)
+      {
+        if (previous == '\n')
+        {
+          if (num_local_lines % CHECKPOINT_INTERVAL == 0)
+            local_checkpoints.insert(local_checkpoints.end(), {num_local_lines, offset + i});
+          // Only the section markers start with '$'
+          if (chunk[i] == '$')
+            local_candidates.insert(local_candidates.end(), {num_local_lines, offset + i});
+          ++num_local_lines;
+        }
+        previous = chunk[i];
+      }
+      offset += size;
+    }
+
+    // Convert the local line numbers to global ones
+    std::vector<uint64_t> num_lines;
+    mpi_comm.all_gather(num_local_lines, num_lines);
+    uint64_t first_line = 0;
+    for (uint64_t loc = 0; loc < location; ++loc)
+      first_line += num_lines[loc];
+    for (size_t i = 0; i < local_checkpoints.size(); i += 2)
+      local_checkpoints[i] += first_line;
+
+    // Keep the candidate lines that are section markers
+    std::vector<uint64_t> local_markers;
+    for (size_t i = 0; i < local_candidates.size(); i += 2)
+    {
+      std::string line;
+      file.clear();
+      file.seekg(static_cast<std::streamoff>(local_candidates[i + 1]));
+      std::getline(file, line);
+      if (not line.empty() and line.back() == '\r')
+        line.pop_back();
+      const auto marker = std::find(markers.begin(), markers.end(), line);
+      if (marker != markers.end())
+        local_markers.insert(
+          local_markers.end(),
+          {static_cast<uint64_t>(marker - markers.begin()), local_candidates[i] + first_line});
+    }
+
+    std::vector<uint64_t> checkpoints;
+    mpi_comm.all_gather(local_checkpoints, checkpoints);
+    for (size_t i = 0; i < checkpoints.size(); i += 2)
+    {
+      checkpoint_lines_.push_back(checkpoints[i]);
+      checkpoint_offsets_.push_back(checkpoints[i + 1]);
+    }
+
+    std::vector<uint64_t> marker_lines;
+    mpi_comm.all_gather(local_markers, marker_lines);
+    for (size_t i = 0; i < marker_lines.size(); i += 2)
+      marker_lines_.emplace(markers[marker_lines[i]], marker_lines[i + 1]);
+  }
+
+  /// Returns true if the file has a line with the marker.
+  bool HasMarker(const std::string& marker) const { return marker_lines_.count(marker) > 0; }
+
+  /// Returns the number of the first line with the marker.
+  uint64_t GetMarkerLine(const std::string& marker) const
+  {
+    const auto it = marker_lines_.find(marker);
+    if (it == marker_lines_.end())
+      throw std::logic_error("Section " + marker + " not found.");
+    return it->second;
+  }
+
+  /// Positions the file at the start of a line.
+  void SeekLine(std::ifstream& file, uint64_t line) const
+  {
+    const auto it = std::upper_bound(checkpoint_lines_.begin(), checkpoint_lines_.end(), line);
+    const auto i = static_cast<size_t>(it - checkpoint_lines_.begin()) - 1;
+    file.clear();
+    file.seekg(static_cast<std::streamoff>(checkpoint_offsets_[i]));
+    for (uint64_t l = checkpoint_lines_[i]; l < line; ++l)
+      file.ignore(std::numeric_limits<std::streamsize>::max(), '\n');
+  }
+
+private:
+  static constexpr uint64_t CHECKPOINT_INTERVAL = 4096;
+  static constexpr uint64_t CHUNK_SIZE = 1 << 20;
+
+  std::vector<uint64_t> checkpoint_lines_;
+  std::vector<uint64_t> checkpoint_offsets_;
+  /// Line of the first occurrence of each marker
+  std::map<std::string, uint64_t> marker_lines_;
+};
+
+} // namespace
+
 std::shared_ptr<UnpartitionedMesh>
 MeshIO::FromGmshV41(const UnpartitionedMesh::Options& options)
 {
@@ -134,32 +399,6 @@ MeshIO::FromGmshV41(const UnpartitionedMesh::Options& options)
     }
   }
 
-  auto IsElementType1D = [](int type) { return type == 1; };
-  auto IsElementType2D = [](int type) { return type == 2 || type == 3; };
-  auto IsElementType3D = [](int type) { return type >= 4 && type <= 7; };
-  auto IsElementSupported = [](int type) { return type >= 1 && type <= 7; };
-  auto CellTypeFromMSHTypeID = [](int type)
-  {
-    switch (type)
-    {
-      case 1:
-        return CellType::SLAB;
-      case 2:
-        return CellType::TRIANGLE;
-      case 3:
-        return CellType::QUADRILATERAL;
-      case 4:
-        return CellType::TETRAHEDRON;
-      case 5:
-        return CellType::HEXAHEDRON;
-      case 6:
-      case 7:
-        return CellType::POLYHEDRON;
-      default:
-        return CellType::GHOST;
-    }
-  };
-
   // Determine dimension of mesh. Only 2D and 3D meshes are supported. If the mesh is 1D, no
   // elements will be read.
   bool mesh_is_2D = true;
@@ -253,15 +492,7 @@ MeshIO::FromGmshV41(const UnpartitionedMesh::Options& options)
                              std::to_string(n) + ".");
     }
 
-    int num_cell_nodes = 0;
-    if (element_type == 1) // 2-node edge
-      num_cell_nodes = 2;
-    else if (element_type == 2) // 3-node triangle
-      num_cell_nodes = 3;
-    else if (element_type == 3 or element_type == 4) // 4-node quadrangle or tet
-      num_cell_nodes = 4;
-    else if (element_type == 5) // 8-node hexahedron
-      num_cell_nodes = 8;
+    const int num_cell_nodes = GetNumElementNodes(element_type);
 
     for (size_t i = 0; i < num_elems_in_block; ++i)
     {
@@ -324,83 +555,326 @@ MeshIO::FromGmshV41(const UnpartitionedMesh::Options& options)
     if (raw_cell == nullptr)
       continue;
 
-    auto& cell = *raw_cell;
-    cell.block_id = physical_reg;
-    std::vector<uint64_t> nodes(node_tags.size());
-    for (size_t i = 0; i < node_tags.size(); ++i)
-      nodes[i] = node_tags[i] - 1;
-    cell.vertex_ids = nodes;
+    SetupCellFromElement(*raw_cell, element_type, physical_reg, node_tags);
+  } // for elements
 
-    // Populate faces
-    if (element_type == 1) // 2-node edge
-    {
-      UnpartitionedMesh::LightWeightFace face0;
-      UnpartitionedMesh::LightWeightFace face1;
+  file.close();
+
+  unsigned int dimension = (mesh_is_2D) ? 2 : 3;
+  mesh->SetDimension(dimension);
+  mesh->SetType(UNSTRUCTURED);
+  mesh->ComputeCentroids();
+  mesh->CheckQuality();
+  mesh->BuildMeshConnectivity(options.num_threads);
+
+  log.Log() << "Done processing " << options.file_name << ".\n"
+            << "Number of nodes read: " << mesh->GetVertices().size() << "\n"
+            << "Number of cells read: " << mesh->GetRawCells().size();
+
+  return mesh;
+}
+
+UnpartitionedMeshSlab
+MeshIO::FromGmshSlab(const UnpartitionedMesh::Options& options)
+{
+  const std::string fname = "MeshIO::FromGmshSlab";
+  const std::string format_section_name = "$MeshFormat";
+  const std::string node_section_name = "$Nodes";
+  const std::string element_section_name = "$Elements";
+  const std::string entities_section_name = "$Entities";
+  const std::string partitioned_entities_section_name = "$PartitionedEntities";
+
+  if (not std::filesystem::exists(options.file_name))
+    throw std::runtime_error(fname + ": Failed to open file " + options.file_name);
+
+  log.Log() << "Reading slabs of Gmsh file " << options.file_name << " (format v4.1)";
+
+  const ParallelLineIndex index(options.file_name,
+                                {format_section_name,
+                                 node_section_name,
+                                 element_section_name,
+                                 entities_section_name,
+                                 partitioned_entities_section_name});
+
+  std::ifstream file(options.file_name);
+  if (not file.is_open())
+    throw std::runtime_error(fname + ": Failed to open file " + options.file_name);
+
+  // All locations read the format, the entities and the block headers, so that errors are raised
+  // on all of them
+  std::string file_line;
+  std::istringstream iss;
+  auto read_line = [&](uint64_t line)
+  {
+    index.SeekLine(file, line);
+    std::getline(file, file_line);
+    iss = std::istringstream(file_line);
+  };
+
+  // Check file format version
+  if (not index.HasMarker(format_section_name))
+    throw std::logic_error(fname + ": Section " + format_section_name + " not found.");
+  read_line(index.GetMarkerLine(format_section_name) + 1);
+  double gmsh_version;
+  int file_type = 0;
+  if (not(iss >> gmsh_version >> file_type) or gmsh_version != 4.1)
+    throw std::logic_error(fname + ": Only Gmsh version 4.1 format is supported.");
+  if (file_type != 0)
+    throw std::logic_error(fname + ": Only ASCII files are supported.");
+
+  if (index.HasMarker(partitioned_entities_section_name))
+    log.Log0Warning() << "Found unsuported $PartitionedEntities section in " + options.file_name;
+
+  // Read $Entities section
+  if (not index.HasMarker(entities_section_name))
+    throw std::logic_error(fname + ": Section " + entities_section_name + " not found.");
+  read_line(index.GetMarkerLine(entities_section_name) + 1);
+  size_t num_points, num_curves, num_surfaces, num_volumes;
+  if (not(iss >> num_points >> num_curves >> num_surfaces >> num_volumes))
+    throw std::logic_error(fname + ": Failed to read number of entitities.");
 
-      face0.vertex_ids = {cell.vertex_ids.at(0)};
-      face1.vertex_ids = {cell.vertex_ids.at(1)};
+  // Skip point entities
+  for (size_t i = 0; i < num_points; ++i)
+    std::getline(file, file_line);
 
-      cell.faces.push_back(face0);
-      cell.faces.push_back(face1);
+  // Read curve, surface, and volume entities
+  auto read_entity = [&](std::map<int, int>& entity_map, size_t num_entities)
+  {
+    for (size_t i = 0; i < num_entities; ++i)
+    {
+      int entity_tag, physical_tag = -1;
+      size_t num_physical_tags;
+      double minx, miny, minz, maxx, maxy, maxz;
+      std::getline(file, file_line);
+      iss = std::istringstream(file_line);
+      iss >> entity_tag >> minx >> miny >> minz >> maxx >> maxy >> maxz >> num_physical_tags >>
+        physical_tag;
+      entity_map[entity_tag] = physical_tag;
     }
-    else if (element_type == 2 or element_type == 3) // 3-node triangle or 4-node quadrangle
+  };
+  std::map<int, int> curve_entities, surface_entities, volume_entities;
+  read_entity(curve_entities, num_curves);
+  read_entity(surface_entities, num_surfaces);
+  read_entity(volume_entities, num_volumes);
+
+  // Entity block of the $Nodes or $Elements section
+  struct EntityBlock
+  {
+    int entity_dim;
+    int entity_tag;
+    int type;
+    size_t size;
+    uint64_t header_line;
+  };
+
+  // Read the node block headers. The tags of the nodes of a block are followed by their
+  // coordinates.
+  if (not index.HasMarker(node_section_name))
+    throw std::logic_error(fname + ": Section " + node_section_name + " not found.");
+  uint64_t line = index.GetMarkerLine(node_section_name) + 1;
+  read_line(line);
+  size_t num_entity_blocks, num_nodes, min_node_tag, max_node_tag;
+  if (not(iss >> num_entity_blocks >> num_nodes >> min_node_tag >> max_node_tag))
+    throw std::logic_error(fname + ": Failed to read the number of node entity blocks.");
+  if (max_node_tag > num_nodes)
+    throw std::logic_error(fname + ": Only continuously numbered nodes are supported.");
+
+  std::vector<EntityBlock> node_blocks;
+  ++line;
+  for (size_t n = 0; n < num_entity_blocks; ++n)
+  {
+    read_line(line);
+    EntityBlock block{0, 0, 0, 0, line};
+    if (not(iss >> block.entity_dim >> block.entity_tag >> block.type >> block.size))
     {
-      size_t num_verts = cell.vertex_ids.size();
-      for (size_t e = 0; e < num_verts; e++)
-      {
-        size_t ep1 = (e < (num_verts - 1)) ? e + 1 : 0;
-        UnpartitionedMesh::LightWeightFace face;
+      throw std::logic_error(fname + ": Failed to read number of nodes in block " +
+                             std::to_string(n) + ".");
+    }
+    node_blocks.push_back(block);
+    line += 1 + 2 * block.size;
+  }
 
-        face.vertex_ids = {cell.vertex_ids[e], cell.vertex_ids[ep1]};
+  // Read the element block headers
+  if (not index.HasMarker(element_section_name))
+    throw std::logic_error(fname + ": Section " + element_section_name + " not found.");
+  line = index.GetMarkerLine(element_section_name) + 1;
+  read_line(line);
+  size_t num_elements, min_element_tag, max_element_tag;
+  if (not(iss >> num_entity_blocks >> num_elements >> min_element_tag >> max_element_tag))
+    throw std::logic_error(fname + ": Failed to read number of element entity blocks.");
 
-        cell.faces.push_back(std::move(face));
-      }
+  std::vector<EntityBlock> element_blocks;
+  ++line;
+  for (size_t n = 0; n < num_entity_blocks; ++n)
+  {
+    read_line(line);
+    EntityBlock block{0, 0, 0, 0, line};
+    if (not(iss >> block.entity_dim >> block.entity_tag >> block.type >> block.size))
+    {
+      throw std::logic_error(fname + ": Failed to read number of elements in block " +
+                             std::to_string(n) + ".");
     }
-    else if (element_type == 4) // 4-node tetrahedron
+    element_blocks.push_back(block);
+    line += 1 + block.size;
+  }
+
+  // Determine dimension of mesh. Only 2D and 3D meshes are supported. If the mesh is 1D, no
+  // elements will be read.
+  bool mesh_is_2D = true;
+  for (const auto& block : element_blocks)
+  {
+    // Skip point type element
+    if (block.type == 15)
+      continue;
+
+    if (IsElementType3D(block.type))
     {
-      auto& v = cell.vertex_ids;
-      std::vector<UnpartitionedMesh::LightWeightFace> lw_faces(4);
-      lw_faces[0].vertex_ids = {v[0], v[2], v[1]}; // Base face
-      lw_faces[1].vertex_ids = {v[0], v[3], v[2]};
-      lw_faces[2].vertex_ids = {v[3], v[1], v[2]};
-      lw_faces[3].vertex_ids = {v[3], v[0], v[1]};
-
-      for (auto& lw_face : lw_faces)
-        cell.faces.push_back(lw_face);
+      mesh_is_2D = false;
+      log.Log() << "Mesh identified as 3D.";
+      break;
     }
-    else if (element_type == 5) // 8-node hexahedron
+
+    if (not IsElementSupported(block.type))
+      throw std::logic_error(fname + ": Found unsupported element type.");
+  }
+
+  // Sort the element blocks into cell and boundary blocks, each with its physical region
+  std::vector<std::pair<EntityBlock, int>> cell_blocks, boundary_blocks;
+  for (size_t n = 0; n < element_blocks.size(); ++n)
+  {
+    const auto& block = element_blocks[n];
+
+    // Skip point type elements
+    if (block.type == 15)
+      continue;
+
+    int physical_reg = -1;
+    if (block.entity_dim == 1)
+      physical_reg = curve_entities[block.entity_tag];
+    else if (block.entity_dim == 2)
+      physical_reg = surface_entities[block.entity_tag];
+    else if (block.entity_dim == 3)
+      physical_reg = volume_entities[block.entity_tag];
+    if (physical_reg == -1)
     {
-      auto& v = cell.vertex_ids;
-      std::vector<UnpartitionedMesh::LightWeightFace> lw_faces(6);
-      lw_faces[0].vertex_ids = {v[5], v[1], v[2], v[6]}; // East face
-      lw_faces[1].vertex_ids = {v[0], v[4], v[7], v[3]}; // West face
-      lw_faces[2].vertex_ids = {v[0], v[3], v[2], v[1]}; // North face
-      lw_faces[3].vertex_ids = {v[4], v[5], v[6], v[7]}; // South face
-      lw_faces[4].vertex_ids = {v[2], v[3], v[7], v[6]}; // Top face
-      lw_faces[5].vertex_ids = {v[0], v[1], v[5], v[4]}; // Bottom face
-
-      for (auto& lw_face : lw_faces)
-        cell.faces.push_back(lw_face);
+      throw std::logic_error(fname + ": Failed to map physical region for block " +
+                             std::to_string(n) + ".");
     }
-    else
+
+    const bool is_cell = mesh_is_2D ? IsElementType2D(block.type) : IsElementType3D(block.type);
+    const bool is_boundary = mesh_is_2D ? IsElementType1D(block.type) : IsElementType2D(block.type);
+    if ((is_cell or is_boundary) and GetNumElementNodes(block.type) == 0)
       throw std::runtime_error(fname + ": Unsupported cell type.");
 
-  } // for elements
+    if (is_cell)
+      cell_blocks.emplace_back(block, physical_reg);
+    else if (is_boundary)
+      boundary_blocks.emplace_back(block, physical_reg);
+  }
 
-  file.close();
+  const auto num_locations = static_cast<uint64_t>(mpi_comm.size());
+  const auto location = static_cast<uint64_t>(mpi_comm.rank());
 
-  unsigned int dimension = (mesh_is_2D) ? 2 : 3;
-  mesh->SetDimension(dimension);
-  mesh->SetType(UNSTRUCTURED);
-  mesh->ComputeCentroids();
-  mesh->CheckQuality();
-  mesh->BuildMeshConnectivity();
+  UnpartitionedMeshSlab slab;
+  slab.dimension = mesh_is_2D ? 2 : 3;
+  slab.mesh_type = UNSTRUCTURED;
+  slab.num_global_vertices = num_nodes;
 
-  log.Log() << "Done processing " << options.file_name << ".\n"
-            << "Number of nodes read: " << mesh->GetVertices().size() << "\n"
-            << "Number of cells read: " << mesh->GetRawCells().size();
+  // Read the nodes of the slab, whose ordinals in the file are in a contiguous range
+  const uint64_t node_begin = num_nodes * location / num_locations;
+  const uint64_t node_end = num_nodes * (location + 1) / num_locations;
+  uint64_t block_begin = 0;
+  for (const auto& block : node_blocks)
+  {
+    const uint64_t block_end = block_begin + block.size;
+    const uint64_t begin = std::max(block_begin, node_begin);
+    const uint64_t end = std::min(block_end, node_end);
+    if (begin < end)
+    {
+      index.SeekLine(file, block.header_line + 1 + (begin - block_begin));
+      for (uint64_t i = begin; i < end; ++i)
+      {
+        std::getline(file, file_line);
+        iss = std::istringstream(file_line);
+        size_t node_tag;
+        iss >> node_tag;
+        slab.vertex_ids.push_back(node_tag - 1);
+      }
 
-  return mesh;
+      index.SeekLine(file, block.header_line + 1 + block.size + (begin - block_begin));
+      for (uint64_t i = begin; i < end; ++i)
+      {
+        std::getline(file, file_line);
+        iss = std::istringstream(file_line);
+        double x, y, z;
+        iss >> x >> y >> z;
+        slab.vertices.emplace_back(x, y, z);
+      }
+    }
+    block_begin = block_end;
+  }
+
+  // Reads the elements of the blocks with ordinals in the slab range of the location
+  auto read_elements = [&](const std::vector<std::pair<EntityBlock, int>>& blocks,
+                           bool is_cell,
+                           std::vector<UnpartitionedMesh::LightWeightCell>& cells)
+  {
+    uint64_t num_global_elements = 0;
+    for (const auto& block : blocks)
+      num_global_elements += block.first.size;
+    const uint64_t elements_begin = num_global_elements * location / num_locations;
+    const uint64_t elements_end = num_global_elements * (location + 1) / num_locations;
+
+    uint64_t block_begin = 0;
+    for (const auto& [block, physical_reg] : blocks)
+    {
+      const uint64_t block_end = block_begin + block.size;
+      const uint64_t begin = std::max(block_begin, elements_begin);
+      const uint64_t end = std::min(block_end, elements_end);
+      if (begin < end)
+      {
+        const int num_cell_nodes = GetNumElementNodes(block.type);
+        CellType type, sub_type = CellTypeFromMSHTypeID(block.type);
+        if (mesh_is_2D)
+          type = is_cell ? CellType::POLYGON : CellType::SLAB;
+        else
+          type = is_cell ? CellType::POLYHEDRON : CellType::POLYGON;
+
+        index.SeekLine(file, block.header_line + 1 + (begin - block_begin));
+        for (uint64_t i = begin; i < end; ++i)
+        {
+          std::getline(file, file_line);
+          iss = std::istringstream(file_line);
+          size_t element_tag;
+          iss >> element_tag;
+
+          std::vector<size_t> node_tags(num_cell_nodes);
+          for (int j = 0; j < num_cell_nodes; ++j)
+            iss >> node_tags[j];
+
+          cells.emplace_back(type, sub_type);
+          SetupCellFromElement(cells.back(), block.type, physical_reg, node_tags);
+        }
+      }
+      block_begin = block_end;
+    }
+
+    return std::make_pair(num_global_elements, elements_begin);
+  };
+
+  const auto [num_global_cells, first_cell_global_id] =
+    read_elements(cell_blocks, true, slab.cells);
+  slab.num_global_cells = num_global_cells;
+  slab.first_cell_global_id = first_cell_global_id;
+  read_elements(boundary_blocks, false, slab.boundary_cells);
+
+  file.close();
+
+  log.Log() << "Done reading slabs of " << options.file_name << ".\n"
+            << "Number of nodes: " << slab.num_global_vertices << "\n"
+            << "Number of cells: " << slab.num_global_cells;
+
+  return slab;
 }
 
 } // namespace opensn
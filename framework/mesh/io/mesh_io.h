@@ -20,6 +20,13 @@ public:
   static std::shared_ptr<UnpartitionedMesh> FromOBJ(const UnpartitionedMesh::Options& options);
   static std::shared_ptr<UnpartitionedMesh> FromGmsh(const UnpartitionedMesh::Options& options);
 
+  /**
+   * Read the slab of a Gmsh file (format v4.1, ASCII) of the calling location. Must be called by
+   * all locations. The locations read disjoint ranges of the nodes and the elements in parallel, so
+   * that no location holds the whole mesh.
+   */
+  static UnpartitionedMeshSlab FromGmshSlab(const UnpartitionedMesh::Options& options);
+
   /**
    * Write grid cells into an OBJ file
    *
@@ -337,7 +337,7 @@ MeshIO::FromOBJ(const UnpartitionedMesh::Options& options)
 
   mesh->ComputeCentroids();
   mesh->CheckQuality();
-  mesh->BuildMeshConnectivity();
+  mesh->BuildMeshConnectivity(options.num_threads);
 
   // Set boundary ids
   if (bndry_block_ids.empty())
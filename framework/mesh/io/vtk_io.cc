@@ -647,7 +647,7 @@ MeshIO::FromExodusII(const UnpartitionedMesh::Options& options)
 
   mesh->ComputeCentroids();
   mesh->CheckQuality();
-  mesh->BuildMeshConnectivity();
+  mesh->BuildMeshConnectivity(options.num_threads);
 
   // Set boundary ids
   SetBoundaryIDsFromBlocks(mesh, bndry_grid_blocks);
@@ -704,7 +704,7 @@ MeshIO::FromVTU(const UnpartitionedMesh::Options& options)
 
   mesh->ComputeCentroids();
   mesh->CheckQuality();
-  mesh->BuildMeshConnectivity();
+  mesh->BuildMeshConnectivity(options.num_threads);
 
   log.Log() << "Done reading VTU file: " << options.file_name << ".";
 
@@ -758,7 +758,7 @@ MeshIO::FromPVTU(const UnpartitionedMesh::Options& options)
 
   mesh->ComputeCentroids();
   mesh->CheckQuality();
-  mesh->BuildMeshConnectivity();
+  mesh->BuildMeshConnectivity(options.num_threads);
 
   log.Log() << "Done reading PVTU file: " << options.file_name << ".";
 
@@ -830,7 +830,7 @@ MeshIO::FromEnsightGold(const UnpartitionedMesh::Options& options)
 
   mesh->ComputeCentroids();
   mesh->CheckQuality();
-  mesh->BuildMeshConnectivity();
+  mesh->BuildMeshConnectivity(options.num_threads);
 
   // Set boundary ids
   SetBoundaryIDsFromBlocks(mesh, bndry_grid_blocks);
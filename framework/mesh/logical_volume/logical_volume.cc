@@ -16,4 +16,13 @@ LogicalVolume::LogicalVolume(const InputParameters& params) : Object(params)
 {
 }
 
+std::vector<bool>
+LogicalVolume::InsideBatch(const std::vector<Vector3>& points) const
+{
+  std::vector<bool> inside(points.size());
+  for (size_t i = 0; i < points.size(); ++i)
+    inside[i] = Inside(points[i]);
+  return inside;
+}
+
 } // namespace opensn
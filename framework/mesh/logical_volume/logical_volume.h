@@ -7,6 +7,7 @@
 #include "framework/logging/log.h"
 #include "framework/object.h"
 #include <array>
+#include <vector>
 
 namespace opensn
 {
@@ -20,6 +21,9 @@ public:
   /// Logical operation for surface mesh.
   virtual bool Inside(const Vector3& point) const { return false; }
 
+  /// Logical operation for a batch of points. Entry `i` of the result is `Inside(points[i])`.
+  virtual std::vector<bool> InsideBatch(const std::vector<Vector3>& points) const;
+
 protected:
   explicit LogicalVolume() : Object() {}
   explicit LogicalVolume(const InputParameters& parameters);
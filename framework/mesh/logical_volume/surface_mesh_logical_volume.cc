@@ -7,6 +7,7 @@
 #include "framework/mesh/surface_mesh/surface_mesh.h"
 #include "framework/mesh/raytrace/raytracer.h"
 #include "framework/object_factory.h"
+#include <array>
 #include <utility>
 
 namespace opensn
@@ -14,6 +15,18 @@ namespace opensn
 
 OpenSnRegisterObjectInNamespace(logvol, SurfaceMeshLogicalVolume);
 
+namespace
+{
+
+/// Directions of the rays of the parity check, chosen to not be aligned with typical geometry.
+const std::array<Vector3, 5> RAY_DIRECTIONS{Vector3(0.5773, 0.6219, 0.5298),
+                                            Vector3(-0.7071, 0.3216, 0.6297),
+                                            Vector3(0.2941, -0.8362, 0.4629),
+                                            Vector3(-0.4126, -0.5437, -0.7308),
+                                            Vector3(0.8447, 0.1931, -0.4992)};
+
+} // namespace
+
 InputParameters
 SurfaceMeshLogicalVolume::GetInputParameters()
 {
@@ -64,13 +77,25 @@ SurfaceMeshLogicalVolume::SurfaceMeshLogicalVolume(const InputParameters& params
       zbounds_[1] = std::max(zbounds_[1], z);
     }
   }
+
+  // Triangulate the faces of the surface
+  std::vector<TriangleBVH::Triangle> triangles;
+  for (const auto& face : surf_mesh_->GetTriangles())
+    triangles.push_back(
+      {vertices[face.v_index[0]], vertices[face.v_index[1]], vertices[face.v_index[2]]});
+  for (const auto& polygon : surf_mesh_->GetPolygons())
+  {
+    const auto& v_indices = polygon->v_indices;
+    for (size_t v = 1; v + 1 < v_indices.size(); ++v)
+      triangles.push_back(
+        {vertices[v_indices[0]], vertices[v_indices[v]], vertices[v_indices[v + 1]]});
+  }
+  bvh_ = std::make_unique<TriangleBVH>(std::move(triangles));
 }
 
 bool
 SurfaceMeshLogicalVolume::Inside(const Vector3& point) const
 {
-  double tolerance = 1.0e-5;
-
   // Boundbox check
   double x = point.x;
   double y = point.y;
@@ -83,133 +108,23 @@ SurfaceMeshLogicalVolume::Inside(const Vector3& point) const
   if (not((z >= zbounds_[0]) and (z <= zbounds_[1])))
     return false;
 
-  // Cheapshot pass
-  // This pass purely checks if the point have a
-  // negative sense with all the faces of the surface.
-  // If it does then .. bonus .. we don't need to do
-  // anything more because the surface is probably convex.
-  bool cheap_pass = true; // now try to disprove
-  for (auto& face : surf_mesh_->GetTriangles())
-  {
-    Vector3 fc = face.face_centroid;
-    Vector3 p_to_fc = fc - point;
-
-    p_to_fc = p_to_fc / p_to_fc.Norm();
-
-    double sense = p_to_fc.Dot(face.geometric_normal);
-
-    if (sense < (0.0 - tolerance))
-    {
-      cheap_pass = false;
-      break;
-    }
-  } // for f
-
-  // if (!cheap_pass) return false;
-  if (cheap_pass)
+  if (bvh_->GetNumTriangles() == 0)
     return true;
 
-  // Expensive pass
-  // Getting to here means the cheap pass produced
-  // a negative and now we need to do more work.
-  for (size_t f = 0; f < surf_mesh_->GetTriangles().size(); ++f)
+  // Ray parity check. A ray passing through an edge or a vertex of the surface may count a
+  // crossing twice, or not at all, in which case another direction is tried. If every direction
+  // is degenerate, the majority of the parities is used.
+  unsigned int num_odd = 0;
+  for (const auto& direction : RAY_DIRECTIONS)
   {
-    Vector3 fc = surf_mesh_->GetTriangles()[f].face_centroid;
-    Vector3 p_to_fc = fc - point;
-    double distance_to_face = p_to_fc.Norm();
-    double closest_distance = 1.0e16;
-    bool closest_sense_pos = false;
-
-    p_to_fc = p_to_fc / p_to_fc.Norm();
-
-    double sense = p_to_fc.Dot(surf_mesh_->GetTriangles()[f].geometric_normal);
+    bool degenerate = false;
+    const unsigned int num_crossings = bvh_->CountRayCrossings(point, direction, degenerate);
+    if (not degenerate)
+      return num_crossings % 2 == 1;
+    num_odd += num_crossings % 2;
+  }
 
-    bool good_to_go = true;
-    if (sense < (0.0 - tolerance))
-    {
-      good_to_go = false;
-      for (size_t fi = 0; fi < surf_mesh_->GetTriangles().size(); ++fi)
-      {
-        if (fi == f)
-          continue; // Skip same face
-
-        // Get all the vertices
-        int v0_i = surf_mesh_->GetTriangles()[fi].v_index[0];
-        int v1_i = surf_mesh_->GetTriangles()[fi].v_index[1];
-        int v2_i = surf_mesh_->GetTriangles()[fi].v_index[2];
-        Vector3 v0 = surf_mesh_->GetVertices()[v0_i];
-        Vector3 v1 = surf_mesh_->GetVertices()[v1_i];
-        Vector3 v2 = surf_mesh_->GetVertices()[v2_i];
-
-        // Check if the line intersects plane
-        Vector3 intp; // Intersection point
-        std::pair<double, double> weights;
-        bool intersects_plane = CheckPlaneLineIntersect(
-          surf_mesh_->GetTriangles()[fi].geometric_normal, v0, point, fc, intp, &weights);
-        if (not intersects_plane)
-          continue;
-
-        // Check if the line intersects the triangle
-        bool intersects_triangle = true;
-
-        // Compute the legs
-        Vector3 v01 = v1 - v0;
-        Vector3 v12 = v2 - v1;
-        Vector3 v20 = v0 - v2;
-
-        // Compute the vertices to the point
-        Vector3 v0p = intp - v0;
-        Vector3 v1p = intp - v1;
-        Vector3 v2p = intp - v2;
-
-        // Compute the cross products
-        Vector3 x0p = v01.Cross(v0p);
-        Vector3 x1p = v12.Cross(v1p);
-        Vector3 x2p = v20.Cross(v2p);
-
-        // Normalize them
-        x0p = x0p / x0p.Norm();
-        x1p = x1p / x1p.Norm();
-        x2p = x2p / x2p.Norm();
-
-        Vector3 face_norm = surf_mesh_->GetTriangles()[fi].geometric_normal /
-                            surf_mesh_->GetTriangles()[fi].geometric_normal.Norm();
-
-        if (x0p.Dot(face_norm) < 0.0)
-          intersects_triangle = false;
-        if (x1p.Dot(face_norm) < 0.0)
-          intersects_triangle = false;
-        if (x2p.Dot(face_norm) < 0.0)
-          intersects_triangle = false;
-
-        if (not intersects_triangle)
-          continue;
-
-        // Determine the sense with the triangle
-        double sense_with_this_tri = p_to_fc.Dot(surf_mesh_->GetTriangles()[fi].geometric_normal);
-        double distance_to_triangle = weights.second * distance_to_face;
-
-        if (distance_to_triangle < closest_distance)
-        {
-          closest_distance = distance_to_triangle;
-
-          if (sense_with_this_tri > 0.0)
-            closest_sense_pos = true;
-          else
-            closest_sense_pos = false;
-        } //
-
-      } // for inner iter face
-    }   // if sense negative
-
-    if ((closest_distance < distance_to_face) and closest_sense_pos)
-      good_to_go = true;
-
-    if (not good_to_go)
-      return false;
-  } // for f
-
-  return true;
+  return 2 * num_odd > RAY_DIRECTIONS.size();
 }
 
 } // namespace opensn
@@ -4,13 +4,19 @@
 #pragma once
 
 #include "framework/mesh/logical_volume/logical_volume.h"
+#include "framework/mesh/surface_mesh/triangle_bvh.h"
+#include <memory>
 
 namespace opensn
 {
 
 class SurfaceMesh;
 
-/// SurfaceMesh volume
+/**
+ * SurfaceMesh volume. A point is inside the volume when a ray cast from the point crosses the
+ * surface an odd number of times, which requires the surface to be closed. The crossings are
+ * found with a bounding volume hierarchy over the triangles and polygons of the surface.
+ */
 class SurfaceMeshLogicalVolume : public LogicalVolume
 {
 public:
@@ -23,6 +29,7 @@ private:
   std::array<double, 2> xbounds_;
   std::array<double, 2> ybounds_;
   std::array<double, 2> zbounds_;
+  std::unique_ptr<TriangleBVH> bvh_;
 
 public:
   static InputParameters GetInputParameters();
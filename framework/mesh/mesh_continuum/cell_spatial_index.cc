@@ -0,0 +1,193 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "framework/mesh/mesh_continuum/cell_spatial_index.h"
+#include "framework/mesh/mesh_continuum/mesh_continuum.h"
+#include "caliper/cali.h"
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+namespace opensn
+{
+
+CellSpatialIndex::CellSpatialIndex(const MeshContinuum& grid)
+  : num_local_cells_(grid.local_cells.size()), ghost_global_ids_(grid.cells.GetGhostGlobalIDs())
+{
+  CALI_CXX_MARK_SCOPE("CellSpatialIndex::CellSpatialIndex");
+
+  const size_t num_cells = num_local_cells_ + ghost_global_ids_.size();
+
+  // Bounding boxes of the cells, local cells first
+  constexpr double inf = std::numeric_limits<double>::infinity();
+  std::vector<std::array<double, 6>> cell_boxes;
+  cell_boxes.reserve(num_cells);
+  box_min_ = {inf, inf, inf};
+  box_max_ = {-inf, -inf, -inf};
+  const auto AddCellBox = [this, &grid, &cell_boxes](const Cell& cell)
+  {
+    std::array<double, 6> box{inf, inf, inf, -inf, -inf, -inf};
+    for (const auto vid : cell.vertex_ids)
+    {
+      const auto& vertex = grid.vertices[vid];
+      const std::array<double, 3> v{vertex.x, vertex.y, vertex.z};
+      for (int d = 0; d < 3; ++d)
+      {
+        box[d] = std::min(box[d], v[d]);
+        box[3 + d] = std::max(box[3 + d], v[d]);
+      }
+    }
+    for (int d = 0; d < 3; ++d)
+    {
+      box_min_[d] = std::min(box_min_[d], box[d]);
+      box_max_[d] = std::max(box_max_[d], box[3 + d]);
+    }
+    cell_boxes.push_back(box);
+  };
+  for (const auto& cell : grid.local_cells)
+    AddCellBox(cell);
+  for (const auto global_id : ghost_global_ids_)
+    AddCellBox(grid.cells[global_id]);
+
+  if (num_cells == 0)
+  {
+    bin_offsets_.assign(2, 0);
+    return;
+  }
+
+  // Enlarge the boxes, so that points on the boundary of a cell are found despite roundoff
+  std::array<double, 3> extent{};
+  double diagonal = 0.0;
+  for (int d = 0; d < 3; ++d)
+  {
+    extent[d] = box_max_[d] - box_min_[d];
+    diagonal += extent[d] * extent[d];
+  }
+  const double tolerance = 1.0e-8 * std::sqrt(diagonal) + 1.0e-12;
+  for (auto& box : cell_boxes)
+    for (int d = 0; d < 3; ++d)
+    {
+      box[d] -= tolerance;
+      box[3 + d] += tolerance;
+    }
+
+  // About one bin per cell, with bins as cubic as possible along the dimensions of the mesh
+  double measure = 1.0;
+  int num_dimensions = 0;
+  for (int d = 0; d < 3; ++d)
+    if (extent[d] > 0.0)
+    {
+      measure *= extent[d];
+      ++num_dimensions;
+    }
+  const double bin_width =
+    num_dimensions > 0 ? std::pow(measure / static_cast<double>(num_cells), 1.0 / num_dimensions)
+                       : 0.0;
+  for (int d = 0; d < 3; ++d)
+  {
+    box_min_[d] -= tolerance;
+    box_max_[d] += tolerance;
+    degenerate_axis_[d] = extent[d] == 0.0;
+    if (extent[d] > 0.0 and bin_width > 0.0)
+      num_bins_[d] = std::clamp<size_t>(
+        static_cast<size_t>(std::ceil(extent[d] / bin_width)), size_t{1}, num_cells);
+    bin_size_[d] = (box_max_[d] - box_min_[d]) / static_cast<double>(num_bins_[d]);
+  }
+
+  // Range of bins overlapped by a box, along a dimension
+  const auto BinRange = [this](const std::array<double, 6>& box, int d)
+  {
+    const auto Bin = [this, d](double x)
+    {
+      const auto b = static_cast<long long>(std::floor((x - box_min_[d]) / bin_size_[d]));
+      return static_cast<size_t>(std::clamp<long long>(b, 0, num_bins_[d] - 1));
+    };
+    return std::make_pair(Bin(box[d]), Bin(box[3 + d]));
+  };
+
+  // List the cells of each bin
+  const auto ForEachBin = [&BinRange, this](const std::array<double, 6>& box, auto&& func)
+  {
+    const auto [i0, i1] = BinRange(box, 0);
+    const auto [j0, j1] = BinRange(box, 1);
+    const auto [k0, k1] = BinRange(box, 2);
+    for (size_t k = k0; k <= k1; ++k)
+      for (size_t j = j0; j <= j1; ++j)
+        for (size_t i = i0; i <= i1; ++i)
+          func(i + num_bins_[0] * (j + num_bins_[1] * k));
+  };
+
+  const size_t num_bins = num_bins_[0] * num_bins_[1] * num_bins_[2];
+  bin_offsets_.assign(num_bins + 1, 0);
+  for (const auto& box : cell_boxes)
+    ForEachBin(box, [this](size_t b) { ++bin_offsets_[b + 1]; });
+  for (size_t b = 0; b < num_bins; ++b)
+    bin_offsets_[b + 1] += bin_offsets_[b];
+
+  bin_cells_.resize(bin_offsets_.back());
+  std::vector<size_t> bin_fill(bin_offsets_.begin(), bin_offsets_.end() - 1);
+  for (size_t c = 0; c < num_cells; ++c)
+    ForEachBin(cell_boxes[c], [this, &bin_fill, c](size_t b) { bin_cells_[bin_fill[b]++] = c; });
+}
+
+size_t
+CellSpatialIndex::FindBin(const Vector3& point) const
+{
+  const std::array<double, 3> p{point.x, point.y, point.z};
+  std::array<size_t, 3> ijk{};
+  for (int d = 0; d < 3; ++d)
+  {
+    // Points off the line of a 1D mesh or off the plane of a 2D mesh are in the single bin of the
+    // axis, since CheckPointInsideCell ignores these coordinates for slabs and polygons
+    if (degenerate_axis_[d])
+      continue;
+    if (not(p[d] >= box_min_[d] and p[d] <= box_max_[d]))
+      return NOT_FOUND;
+    ijk[d] = std::min(static_cast<size_t>((p[d] - box_min_[d]) / bin_size_[d]), num_bins_[d] - 1);
+  }
+  return ijk[0] + num_bins_[0] * (ijk[1] + num_bins_[1] * ijk[2]);
+}
+
+std::vector<uint64_t>
+CellSpatialIndex::FindLocalCellCandidates(const Vector3& point) const
+{
+  std::vector<uint64_t> local_ids;
+  const size_t b = FindBin(point);
+  if (b == NOT_FOUND)
+    return local_ids;
+
+  for (size_t i = bin_offsets_[b]; i < bin_offsets_[b + 1]; ++i)
+    if (bin_cells_[i] < num_local_cells_)
+      local_ids.push_back(bin_cells_[i]);
+  return local_ids;
+}
+
+std::vector<uint64_t>
+CellSpatialIndex::FindGhostCellCandidates(const Vector3& point) const
+{
+  std::vector<uint64_t> global_ids;
+  const size_t b = FindBin(point);
+  if (b == NOT_FOUND)
+    return global_ids;
+
+  for (size_t i = bin_offsets_[b]; i < bin_offsets_[b + 1]; ++i)
+    if (bin_cells_[i] >= num_local_cells_)
+      global_ids.push_back(ghost_global_ids_[bin_cells_[i] - num_local_cells_]);
+  return global_ids;
+}
+
+bool
+CellSpatialIndex::IsConsistent(const MeshContinuum& grid) const
+{
+  return num_local_cells_ == grid.local_cells.size() and
+         ghost_global_ids_.size() == grid.cells.GhostCellCount();
+}
+
+size_t
+CellSpatialIndex::GetMemoryUsage() const
+{
+  return ghost_global_ids_.capacity() * sizeof(uint64_t) +
+         bin_offsets_.capacity() * sizeof(size_t) + bin_cells_.capacity() * sizeof(uint64_t);
+}
+
+} // namespace opensn
@@ -0,0 +1,73 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include "framework/math/vector3.h"
+#include <array>
+#include <cstdint>
+#include <vector>
+
+namespace opensn
+{
+
+class MeshContinuum;
+
+/**
+ * Spatial index of the local and ghost cells of a mesh, used to locate the cells containing a
+ * point.
+ *
+ * The bounding box of the cells is divided into a uniform grid of bins, with about as many bins as
+ * cells, and every cell is listed in each bin its bounding box overlaps. The cells that may
+ * contain a point are then the few cells listed in the bin of the point, instead of all cells.
+ */
+class CellSpatialIndex
+{
+public:
+  explicit CellSpatialIndex(const MeshContinuum& grid);
+
+  /**
+   * Returns the local ids, in ascending order, of the local cells whose bounding box contains a
+   * point, ignoring the axes along which the mesh has no extent. These are the only local cells
+   * that can contain the point.
+   */
+  std::vector<uint64_t> FindLocalCellCandidates(const Vector3& point) const;
+
+  /**
+   * Returns the global ids of the ghost cells whose bounding box contains a point. These are the
+   * only ghost cells that can contain the point.
+   */
+  std::vector<uint64_t> FindGhostCellCandidates(const Vector3& point) const;
+
+  /// Returns whether the index was built for the current local and ghost cells of a mesh.
+  bool IsConsistent(const MeshContinuum& grid) const;
+
+  /// Returns the memory used by the index, in bytes.
+  size_t GetMemoryUsage() const;
+
+private:
+  /**
+   * Returns the bin containing a point, or `NOT_FOUND` if the point is outside all bins. Axes along
+   * which the mesh has no extent are ignored.
+   */
+  size_t FindBin(const Vector3& point) const;
+
+  size_t num_local_cells_ = 0;
+  std::vector<uint64_t> ghost_global_ids_;
+
+  std::array<double, 3> box_min_{};
+  std::array<double, 3> box_max_{};
+  std::array<double, 3> bin_size_{};
+  std::array<size_t, 3> num_bins_{1, 1, 1};
+  /// Whether all vertices have the same coordinate along an axis, e.g., z for a 2D mesh.
+  std::array<bool, 3> degenerate_axis_{};
+
+  /// Cells of bin `b` are `bin_cells_[bin_offsets_[b]]` to `bin_cells_[bin_offsets_[b + 1] - 1]`.
+  /// Local cells are stored by local id, ghost cells by `num_local_cells_` plus ghost index.
+  std::vector<size_t> bin_offsets_;
+  std::vector<uint64_t> bin_cells_;
+
+  static constexpr size_t NOT_FOUND = static_cast<size_t>(-1);
+};
+
+} // namespace opensn
@@ -18,6 +18,21 @@
 namespace opensn
 {
 
+namespace
+{
+
+/**
+ * Estimated heap memory of a `std::map` entry: a red-black tree node (color and three pointers)
+ * holding the value, plus the allocator header, rounded up to the 16-byte allocator alignment.
+ */
+constexpr size_t
+MapNodeSize(size_t value_size)
+{
+  return (32 + value_size + 8 + 15) / 16 * 16;
+}
+
+} // namespace
+
 MeshContinuum::MeshContinuum()
   : local_cells(LocalCellHandler::Create(local_cells_)),
     cells(local_cells_,
@@ -82,6 +97,8 @@ MeshContinuum::ComputeGeometricInfo()
 
   for (const auto& ghost_id : cells.GetGhostGlobalIDs())
     cells[ghost_id].ComputeGeometricInfo(this);
+
+  cell_spatial_index_.reset();
 }
 
 void
@@ -92,6 +109,39 @@ MeshContinuum::ClearCellReferences()
   global_cell_id_to_local_id_map_.clear();
   global_cell_id_to_nonlocal_id_map_.clear();
   vertices.Clear();
+  cell_spatial_index_.reset();
+}
+
+MeshContinuum::MemoryUsage
+MeshContinuum::ComputeMemoryUsage() const
+{
+  MemoryUsage usage;
+
+  const auto CellMemory = [](const Cell& cell)
+  {
+    size_t memory = sizeof(Cell) + cell.vertex_ids.capacity() * sizeof(uint64_t) +
+                    cell.faces.capacity() * sizeof(CellFace);
+    for (const auto& face : cell.faces)
+      memory += face.vertex_ids.capacity() * sizeof(uint64_t);
+    return memory;
+  };
+  usage.cells = (local_cells_.capacity() + ghost_cells_.capacity()) * sizeof(std::shared_ptr<Cell>);
+  for (const auto& cell : local_cells_)
+    usage.cells += CellMemory(*cell);
+  for (const auto& cell : ghost_cells_)
+    usage.cells += CellMemory(*cell);
+
+  usage.vertices = vertices.GetMemoryUsage();
+  usage.id_maps = global_cell_id_to_local_id_map_.GetMemoryUsage() +
+                  global_cell_id_to_nonlocal_id_map_.GetMemoryUsage();
+
+  usage.map_based_vertices =
+    vertices.GetNumLocallyStored() * MapNodeSize(sizeof(std::pair<uint64_t, Vector3>));
+  usage.map_based_id_maps =
+    (global_cell_id_to_local_id_map_.size() + global_cell_id_to_nonlocal_id_map_.size()) *
+    MapNodeSize(sizeof(std::pair<uint64_t, uint64_t>));
+
+  return usage;
 }
 
 uint64_t
@@ -240,12 +290,7 @@ MeshContinuum::MakeGridFaceHistogram(double master_tolerance, double slave_toler
 bool
 MeshContinuum::IsCellLocal(uint64_t global_id) const
 {
-  auto native_index = global_cell_id_to_local_id_map_.find(global_id);
-
-  if (native_index != global_cell_id_to_local_id_map_.end())
-    return true;
-
-  return false;
+  return global_cell_id_to_local_id_map_.Contains(global_id);
 }
 
 void
@@ -334,10 +379,13 @@ MeshContinuum::MapCellGlobalID2LocalID(const uint64_t global_id) const
 size_t
 MeshContinuum::CountCellsInLogicalVolume(const LogicalVolume& log_vol) const
 {
-  size_t count = 0;
+  std::vector<Vector3> centroids;
+  centroids.reserve(local_cells.size());
   for (const auto& cell : local_cells)
-    if (log_vol.Inside(cell.centroid))
-      ++count;
+    centroids.push_back(cell.centroid);
+
+  const auto inside = log_vol.InsideBatch(centroids);
+  size_t count = std::count(inside.begin(), inside.end(), true);
   mpi_comm.all_reduce(count, mpi::op::sum<size_t>());
   return count;
 }
@@ -416,6 +464,49 @@ MeshContinuum::CheckPointInsideCell(const Cell& cell, const Vector3& point) cons
   throw std::logic_error("MeshContinuum::CheckPointInsideCell: Unsupported cell-type.");
 }
 
+const CellSpatialIndex&
+MeshContinuum::GetCellSpatialIndex() const
+{
+  if (not cell_spatial_index_ or not cell_spatial_index_->IsConsistent(*this))
+    cell_spatial_index_ = std::make_unique<CellSpatialIndex>(*this);
+  return *cell_spatial_index_;
+}
+
+std::vector<uint64_t>
+MeshContinuum::FindLocalCellsContainingPoint(const Vector3& point) const
+{
+  auto local_ids = GetCellSpatialIndex().FindLocalCellCandidates(point);
+  local_ids.erase(std::remove_if(local_ids.begin(),
+                                 local_ids.end(),
+                                 [this, &point](uint64_t local_id) {
+                                   return not CheckPointInsideCell(local_cells[local_id], point);
+                                 }),
+                  local_ids.end());
+  return local_ids;
+}
+
+std::vector<std::vector<uint64_t>>
+MeshContinuum::FindLocalCellsContainingPoints(const std::vector<Vector3>& points) const
+{
+  std::vector<std::vector<uint64_t>> local_ids;
+  local_ids.reserve(points.size());
+  for (const auto& point : points)
+    local_ids.push_back(FindLocalCellsContainingPoint(point));
+  return local_ids;
+}
+
+std::vector<uint64_t>
+MeshContinuum::FindGhostCellsContainingPoint(const Vector3& point) const
+{
+  auto global_ids = GetCellSpatialIndex().FindGhostCellCandidates(point);
+  global_ids.erase(std::remove_if(global_ids.begin(),
+                                  global_ids.end(),
+                                  [this, &point](uint64_t global_id)
+                                  { return not CheckPointInsideCell(cells[global_id], point); }),
+                   global_ids.end());
+  return global_ids;
+}
+
 bool
 MeshContinuum::CheckPointInsideCellFace(const Cell& cell,
                                         const std::size_t face_i,
@@ -567,21 +658,32 @@ MeshContinuum::SetUniformBlockID(const int blk_id)
 void
 MeshContinuum::SetBlockIDFromLogicalVolume(const LogicalVolume& log_vol, int blk_id, bool sense)
 {
+  // Evaluate the local and ghost cells in one batch
+  const auto& ghost_ids = cells.GetGhostGlobalIDs();
+  std::vector<Vector3> centroids;
+  centroids.reserve(local_cells.size() + ghost_ids.size());
+  for (const auto& cell : local_cells)
+    centroids.push_back(cell.centroid);
+  for (uint64_t ghost_id : ghost_ids)
+    centroids.push_back(cells[ghost_id].centroid);
+
+  const auto inside = log_vol.InsideBatch(centroids);
+
   int num_cells_modified = 0;
+  size_t c = 0;
   for (auto& cell : local_cells)
   {
-    if (log_vol.Inside(cell.centroid) and sense)
+    if (inside[c++] and sense)
     {
       cell.block_id = blk_id;
       ++num_cells_modified;
     }
   }
 
-  const auto& ghost_ids = cells.GetGhostGlobalIDs();
   for (uint64_t ghost_id : ghost_ids)
   {
     auto& cell = cells[ghost_id];
-    if (log_vol.Inside(cell.centroid) and sense)
+    if (inside[c++] and sense)
       cell.block_id = blk_id;
   }
 
@@ -602,15 +704,25 @@ MeshContinuum::SetBoundaryIDFromLogicalVolume(const LogicalVolume& log_vol,
   auto& grid_bndry_id_map = GetBoundaryIDMap();
   uint64_t bndry_id = MakeBoundaryID(boundary_name);
 
+  // Evaluate the boundary faces in one batch
+  std::vector<Vector3> centroids;
+  for (const auto& cell : local_cells)
+    for (const auto& face : cell.faces)
+      if (not face.has_neighbor)
+        centroids.push_back(face.centroid);
+
+  const auto inside = log_vol.InsideBatch(centroids);
+
   // Loop over cells
   int num_faces_modified = 0;
+  size_t f = 0;
   for (auto& cell : local_cells)
   {
     for (auto& face : cell.faces)
     {
       if (face.has_neighbor)
         continue;
-      if (log_vol.Inside(face.centroid) and sense)
+      if (inside[f++] and sense)
       {
         face.neighbor_id = bndry_id;
         ++num_faces_modified;
@@ -8,8 +8,10 @@
 #include "framework/mesh/mesh_continuum/mesh_continuum_local_cell_handler.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum_global_cell_handler.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum_vertex_handler.h"
+#include "framework/mesh/mesh_continuum/cell_spatial_index.h"
 #include <memory>
 #include <array>
+#include <map>
 
 namespace opensn
 {
@@ -55,6 +57,27 @@ public:
   /// Method to be called if cells and nodes have been transferred to another grid.
   void ClearCellReferences();
 
+  /// Memory used to store the local and ghost cells and the vertices, in bytes.
+  struct MemoryUsage
+  {
+    /// Cells, including their faces and vertex id lists
+    size_t cells = 0;
+    /// Vertex ids, coordinates and their hash map
+    size_t vertices = 0;
+    /// Global-to-local and global-to-ghost cell id maps
+    size_t id_maps = 0;
+    /// Estimated memory of the vertices if stored in a `std::map`
+    size_t map_based_vertices = 0;
+    /// Estimated memory of the cell id maps if stored in `std::map`s
+    size_t map_based_id_maps = 0;
+  };
+
+  /**
+   * Computes the memory used by the local storage of the mesh, along with estimates of the memory
+   * the vertices and cell id maps would use in node-based `std::map`s.
+   */
+  MemoryUsage ComputeMemoryUsage() const;
+
   /**
    * Makes a boundary id given a name. If the boundary name already exists, the associated
    * boundary id will be returned. Other the id will be set to one more than the maximum boundary
@@ -104,6 +127,25 @@ public:
   /// Checks whether a point is within a cell face.
   bool CheckPointInsideCellFace(const Cell& cell, size_t face_i, const Vector3& point) const;
 
+  /**
+   * Returns the spatial index of the local and ghost cells, which is built on first use and
+   * rebuilt when cells are added or removed.
+   */
+  const CellSpatialIndex& GetCellSpatialIndex() const;
+
+  /**
+   * Returns the local ids, in ascending order, of the local cells containing a point. A point on
+   * the boundary of a cell is contained in every cell sharing that boundary.
+   */
+  std::vector<uint64_t> FindLocalCellsContainingPoint(const Vector3& point) const;
+
+  /// Returns the local cells containing each point of a list. See FindLocalCellsContainingPoint.
+  std::vector<std::vector<uint64_t>>
+  FindLocalCellsContainingPoints(const std::vector<Vector3>& points) const;
+
+  /// Returns the global ids of the ghost cells containing a point.
+  std::vector<uint64_t> FindGhostCellsContainingPoint(const Vector3& point) const;
+
   /// Provides a mapping from cell ijk indices to global ids.
   NDArray<uint64_t, 3> MakeIJKToGlobalIDMapping() const;
 
@@ -166,8 +208,11 @@ private:
   /// Locally stored ghost cells
   std::vector<std::shared_ptr<Cell>> ghost_cells_;
 
-  std::map<uint64_t, uint64_t> global_cell_id_to_local_id_map_;
-  std::map<uint64_t, uint64_t> global_cell_id_to_nonlocal_id_map_;
+  IndexMap global_cell_id_to_local_id_map_;
+  IndexMap global_cell_id_to_nonlocal_id_map_;
+
+  /// Spatial index of the local and ghost cells, built on first use
+  mutable std::unique_ptr<CellSpatialIndex> cell_spatial_index_;
 
 public:
   /// Returns a new instance of the spatial discretization.
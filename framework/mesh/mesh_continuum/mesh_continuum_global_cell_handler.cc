@@ -15,25 +15,27 @@ GlobalCellHandler::PushBack(std::shared_ptr<Cell> new_cell)
   {
     new_cell->local_id = local_cells_ref_.size();
     local_cells_ref_.push_back(std::move(new_cell));
-    global_to_local_map_[local_cells_ref_.back()->global_id] = local_cells_ref_.size() - 1;
+    global_to_local_map_.InsertOrAssign(local_cells_ref_.back()->global_id,
+                                        local_cells_ref_.size() - 1);
   }
   else
   {
     ghost_cells_ref_.push_back(std::move(new_cell));
-    global_to_ghost_map_[ghost_cells_ref_.back()->global_id] = ghost_cells_ref_.size() - 1;
+    global_to_ghost_map_.InsertOrAssign(ghost_cells_ref_.back()->global_id,
+                                        ghost_cells_ref_.size() - 1);
   }
 }
 
 Cell&
 GlobalCellHandler::operator[](uint64_t cell_global_index)
 {
-  auto local_it = global_to_local_map_.find(cell_global_index);
-  if (local_it != global_to_local_map_.end())
-    return *local_cells_ref_[local_it->second];
+  const auto local_id = global_to_local_map_.Find(cell_global_index);
+  if (local_id != IndexMap::NOT_FOUND)
+    return *local_cells_ref_[local_id];
 
-  auto ghost_it = global_to_ghost_map_.find(cell_global_index);
-  if (ghost_it != global_to_ghost_map_.end())
-    return *ghost_cells_ref_[ghost_it->second];
+  const auto ghost_id = global_to_ghost_map_.Find(cell_global_index);
+  if (ghost_id != IndexMap::NOT_FOUND)
+    return *ghost_cells_ref_[ghost_id];
 
   throw std::out_of_range("Cell with global ID " + std::to_string(cell_global_index) +
                           " not found.");
@@ -42,13 +44,13 @@ GlobalCellHandler::operator[](uint64_t cell_global_index)
 const Cell&
 GlobalCellHandler::operator[](uint64_t cell_global_index) const
 {
-  auto local_it = global_to_local_map_.find(cell_global_index);
-  if (local_it != global_to_local_map_.end())
-    return *local_cells_ref_[local_it->second];
+  const auto local_id = global_to_local_map_.Find(cell_global_index);
+  if (local_id != IndexMap::NOT_FOUND)
+    return *local_cells_ref_[local_id];
 
-  auto ghost_it = global_to_ghost_map_.find(cell_global_index);
-  if (ghost_it != global_to_ghost_map_.end())
-    return *ghost_cells_ref_[ghost_it->second];
+  const auto ghost_id = global_to_ghost_map_.Find(cell_global_index);
+  if (ghost_id != IndexMap::NOT_FOUND)
+    return *ghost_cells_ref_[ghost_id];
 
   throw std::out_of_range("Cell with global ID " + std::to_string(cell_global_index) +
                           " not found.");
@@ -69,10 +71,10 @@ GlobalCellHandler::GetGhostGlobalIDs() const
 uint64_t
 GlobalCellHandler::GetGhostLocalID(uint64_t cell_global_index) const
 {
-  auto foreign_location = global_to_ghost_map_.find(cell_global_index);
+  const auto ghost_id = global_to_ghost_map_.Find(cell_global_index);
 
-  if (foreign_location != global_to_ghost_map_.end())
-    return foreign_location->second;
+  if (ghost_id != IndexMap::NOT_FOUND)
+    return ghost_id;
 
   throw std::out_of_range("Cell with global ID " + std::to_string(cell_global_index) +
                           " not found.");
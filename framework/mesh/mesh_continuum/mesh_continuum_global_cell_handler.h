@@ -4,7 +4,8 @@
 #pragma once
 
 #include "framework/mesh/cell/cell.h"
-#include <map>
+#include "framework/data_types/index_map.h"
+#include <memory>
 
 namespace opensn
 {
@@ -19,15 +20,15 @@ private:
   std::vector<std::shared_ptr<Cell>>& ghost_cells_ref_;
 
   /// Global to local ID map
-  std::map<uint64_t, uint64_t>& global_to_local_map_;
+  IndexMap& global_to_local_map_;
   /// Global to ghost ID map
-  std::map<uint64_t, uint64_t>& global_to_ghost_map_;
+  IndexMap& global_to_ghost_map_;
 
 private:
   explicit GlobalCellHandler(std::vector<std::shared_ptr<Cell>>& native_cells,
                              std::vector<std::shared_ptr<Cell>>& foreign_cells,
-                             std::map<uint64_t, uint64_t>& global_to_local_map,
-                             std::map<uint64_t, uint64_t>& global_to_ghost_map)
+                             IndexMap& global_to_local_map,
+                             IndexMap& global_to_ghost_map)
     : local_cells_ref_(native_cells),
       ghost_cells_ref_(foreign_cells),
       global_to_local_map_(global_to_local_map),
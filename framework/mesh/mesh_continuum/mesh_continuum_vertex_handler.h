@@ -4,44 +4,122 @@
 #pragma once
 
 #include "framework/math/vector3.h"
-#include <map>
+#include "framework/data_types/index_map.h"
+#include <iterator>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
 
 namespace opensn
 {
 
-/// Manages a vertex map with custom calls.
+/**
+ * Manages the locally stored vertices of a mesh.
+ *
+ * The vertices are stored contiguously in insertion order, as an array of global ids and an array
+ * of coordinates, with a hash map from global id to storage index.
+ */
 class VertexHandler
 {
-  using GlobalIDMap = std::map<uint64_t, Vector3>;
+  /// Iterates over the vertices in insertion order, as (global id, vertex) pairs.
+  template <typename VertexType, typename HandlerType>
+  class Iterator
+  {
+  public:
+    using iterator_category = std::forward_iterator_tag;
+    using value_type = std::pair<const uint64_t, VertexType&>;
+    using difference_type = std::ptrdiff_t;
+    using pointer = void;
+    using reference = value_type;
 
-private:
-  std::map<uint64_t, Vector3> m_global_id_vertex_map_;
+    Iterator(HandlerType& handler, size_t index) : handler_(handler), index_(index) {}
+
+    Iterator& operator++()
+    {
+      ++index_;
+      return *this;
+    }
+
+    value_type operator*() const
+    {
+      return {handler_.global_ids_[index_], handler_.coordinates_[index_]};
+    }
+
+    bool operator==(const Iterator& other) const { return index_ == other.index_; }
+    bool operator!=(const Iterator& other) const { return index_ != other.index_; }
+
+  private:
+    HandlerType& handler_;
+    size_t index_;
+  };
 
 public:
+  using iterator = Iterator<Vector3, VertexHandler>;
+  using const_iterator = Iterator<const Vector3, const VertexHandler>;
+
   // Iterators
-  GlobalIDMap::iterator begin() { return m_global_id_vertex_map_.begin(); }
-  GlobalIDMap::iterator end() { return m_global_id_vertex_map_.end(); }
+  iterator begin() { return {*this, 0}; }
+  iterator end() { return {*this, coordinates_.size()}; }
 
-  GlobalIDMap::const_iterator begin() const { return m_global_id_vertex_map_.begin(); }
-  GlobalIDMap::const_iterator end() const { return m_global_id_vertex_map_.end(); }
+  const_iterator begin() const { return {*this, 0}; }
+  const_iterator end() const { return {*this, coordinates_.size()}; }
 
   // Accessors
-  Vector3& operator[](const uint64_t global_id) { return m_global_id_vertex_map_.at(global_id); }
+  Vector3& operator[](const uint64_t global_id) { return coordinates_[GetIndex(global_id)]; }
 
   const Vector3& operator[](const uint64_t global_id) const
   {
-    return m_global_id_vertex_map_.at(global_id);
+    return coordinates_[GetIndex(global_id)];
   }
 
   // Utilities
+  /// Adds a vertex. A vertex whose global id is already stored is ignored.
   void Insert(const uint64_t global_id, const Vector3& vec)
   {
-    m_global_id_vertex_map_.insert(std::make_pair(global_id, vec));
+    if (index_map_.Insert(global_id, coordinates_.size()))
+    {
+      global_ids_.push_back(global_id);
+      coordinates_.push_back(vec);
+    }
+  }
+
+  /// Allocates room for `n` vertices.
+  void Reserve(size_t n)
+  {
+    index_map_.reserve(n);
+    global_ids_.reserve(n);
+    coordinates_.reserve(n);
   }
 
-  size_t GetNumLocallyStored() const { return m_global_id_vertex_map_.size(); }
+  size_t GetNumLocallyStored() const { return coordinates_.size(); }
+
+  /// Returns the memory used by the vertices, in bytes.
+  size_t GetMemoryUsage() const
+  {
+    return index_map_.GetMemoryUsage() + global_ids_.capacity() * sizeof(uint64_t) +
+           coordinates_.capacity() * sizeof(Vector3);
+  }
+
+  void Clear()
+  {
+    index_map_.clear();
+    global_ids_ = {};
+    coordinates_ = {};
+  }
+
+private:
+  size_t GetIndex(const uint64_t global_id) const
+  {
+    const auto index = index_map_.Find(global_id);
+    if (index == IndexMap::NOT_FOUND)
+      throw std::out_of_range("Vertex with global ID " + std::to_string(global_id) + " not found.");
+    return index;
+  }
 
-  void Clear() { m_global_id_vertex_map_.clear(); }
+  IndexMap index_map_;
+  std::vector<uint64_t> global_ids_;
+  std::vector<Vector3> coordinates_;
 };
 
 } // namespace opensn
@@ -24,6 +24,7 @@ DistributedMeshGenerator::Execute()
   const auto rank = mpi_comm.rank();
   const auto num_partitions = mpi_comm.size();
   DistributedMeshData mesh_info;
+  double connectivity_build_time = -1.0;
 
   log.Log() << program_timer.GetTimeString() << " Distributing mesh with " << num_partitions
             << " parts";
@@ -35,6 +36,7 @@ DistributedMeshGenerator::Execute()
       current_umesh = mesh_generator_ptr->GenerateUnpartitionedMesh(current_umesh);
     current_umesh = GenerateUnpartitionedMesh(current_umesh);
 
+    connectivity_build_time = current_umesh->GetConnectivityBuildTime();
     const auto cell_pids = PartitionMesh(*current_umesh, num_partitions);
     auto serial_data = DistributeSerializedMeshData(cell_pids, *current_umesh, num_partitions);
     mesh_info = DeserializeMeshData(serial_data);
@@ -47,7 +49,7 @@ DistributedMeshGenerator::Execute()
     mesh_info = DeserializeMeshData(serial_data);
   }
 
-  auto grid_ptr = SetupLocalMesh(mesh_info);
+  auto grid_ptr = SetupLocalMesh(mesh_info, connectivity_build_time);
 
   mpi_comm.barrier();
 
@@ -278,12 +280,14 @@ DistributedMeshGenerator::DeserializeMeshData(ByteArray& serial_data)
 }
 
 std::shared_ptr<MeshContinuum>
-DistributedMeshGenerator::SetupLocalMesh(DistributedMeshData& mesh_info)
+DistributedMeshGenerator::SetupLocalMesh(DistributedMeshData& mesh_info,
+                                         double connectivity_build_time)
 {
   auto grid_ptr = MeshContinuum::New();
   grid_ptr->GetBoundaryIDMap() = mesh_info.boundary_id_map;
 
   auto& vertices = mesh_info.vertices;
+  grid_ptr->vertices.Reserve(vertices.size());
   for (const auto& [vid, vertex] : vertices)
     grid_ptr->vertices.Insert(vid, vertex);
 
@@ -302,7 +306,7 @@ DistributedMeshGenerator::SetupLocalMesh(DistributedMeshData& mesh_info)
   grid_ptr->SetGlobalVertexCount(mesh_info.num_global_vertices);
   grid_ptr->ComputeGeometricInfo();
 
-  ComputeAndPrintStats(grid_ptr);
+  ComputeAndPrintStats(grid_ptr, connectivity_build_time);
 
   return grid_ptr;
 }
@@ -111,9 +111,12 @@ private:
    *
    * \param mesh_info The deserialized mesh data containing information about cells, vertices, and
    * boundaries.
+   * \param connectivity_build_time The time spent connecting the cell faces on this location, or a
+   * negative value if none.
    * \return A shared pointer to the local mesh.
    */
-  static std::shared_ptr<MeshContinuum> SetupLocalMesh(DistributedMeshData& mesh_info);
+  static std::shared_ptr<MeshContinuum> SetupLocalMesh(DistributedMeshData& mesh_info,
+                                                       double connectivity_build_time);
 };
 
 } // namespace opensn
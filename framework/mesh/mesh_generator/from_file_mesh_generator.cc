@@ -18,6 +18,7 @@ FromFileMeshGenerator::FromFileMeshGenerator(const InputParameters& params)
     filename_(params.GetParamValue<std::string>("filename")),
     block_id_fieldname_(params.GetParamValue<std::string>("block_id_fieldname")),
     boundary_id_fieldname_(params.GetParamValue<std::string>("boundary_id_fieldname")),
+    num_threads_(params.GetParamValue<unsigned int>("num_threads")),
     coord_sys_(params.GetParamValue<std::string>("coord_sys") == "cartesian"     ? CARTESIAN
                : params.GetParamValue<std::string>("coord_sys") == "cylindrical" ? CYLINDRICAL
                                                                                  : SPHERICAL)
@@ -36,6 +37,7 @@ FromFileMeshGenerator::GenerateUnpartitionedMesh(std::shared_ptr<UnpartitionedMe
   options.scale = scale_;
   options.block_id_fieldname = block_id_fieldname_;
   options.boundary_id_fieldname = boundary_id_fieldname_;
+  options.num_threads = num_threads_;
 
   const std::filesystem::path filepath(filename_);
   AssertReadableFile(filename_);
@@ -82,6 +84,9 @@ FromFileMeshGenerator::GetInputParameters()
                               "used for .vtu, .pvtu and .e files.");
   params.AddOptionalParameter(
     "boundary_id_fieldname", "", "The name of the field storing boundary-ids");
+  params.AddOptionalParameter(
+    "num_threads", 1, "Number of threads used to build the connectivity of the cells.");
+  params.ConstrainParameterRange("num_threads", AllowableRangeLowLimit::New(1));
 
   params.AddOptionalParameter("coord_sys", "cartesian", "The coordinate system of the mesh.");
   params.ConstrainParameterRange(
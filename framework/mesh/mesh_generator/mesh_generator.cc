@@ -10,6 +10,8 @@
 #include "framework/logging/log.h"
 #include "framework/mesh/cell/cell.h"
 #include <memory>
+#include <array>
+#include <iomanip>
 
 namespace opensn
 {
@@ -162,7 +164,7 @@ MeshGenerator::SetupMesh(const std::shared_ptr<UnpartitionedMesh>& input_umesh,
   grid_ptr->SetGlobalVertexCount(input_umesh->GetVertices().size());
   grid_ptr->ComputeGeometricInfo();
 
-  ComputeAndPrintStats(grid_ptr);
+  ComputeAndPrintStats(grid_ptr, input_umesh->GetConnectivityBuildTime());
 
   return grid_ptr;
 }
@@ -257,7 +259,8 @@ MeshGenerator::Create(const ParameterBlock& params)
 }
 
 void
-MeshGenerator::ComputeAndPrintStats(const std::shared_ptr<MeshContinuum>& grid)
+MeshGenerator::ComputeAndPrintStats(const std::shared_ptr<MeshContinuum>& grid,
+                                    double connectivity_build_time)
 {
   const size_t num_local_cells = grid->local_cells.size();
   size_t num_global_cells = 0;
@@ -279,6 +282,21 @@ MeshGenerator::ComputeAndPrintStats(const std::shared_ptr<MeshContinuum>& grid)
 
   average_ghost_ratio /= mpi_comm.size();
 
+  double max_connectivity_build_time;
+  mpi_comm.all_reduce(connectivity_build_time, max_connectivity_build_time, mpi::op::max<double>());
+
+  // Memory of the mesh storage, compared to node-based maps for the vertices and cell ids
+  const auto memory = grid->ComputeMemoryUsage();
+  const std::array<size_t, 5> local_memory = {memory.cells,
+                                              memory.vertices,
+                                              memory.id_maps,
+                                              memory.map_based_vertices,
+                                              memory.map_based_id_maps};
+  std::array<size_t, 5> global_memory = {0, 0, 0, 0, 0};
+  mpi_comm.all_reduce(
+    local_memory.data(), local_memory.size(), global_memory.data(), mpi::op::sum<size_t>());
+  const auto MB = [](size_t bytes) { return static_cast<double>(bytes) / (1024.0 * 1024.0); };
+
   std::stringstream outstr;
   outstr << "Mesh statistics:\n";
   outstr << "  Global cell count             : " << num_global_cells << "\n";
@@ -286,7 +304,14 @@ MeshGenerator::ComputeAndPrintStats(const std::shared_ptr<MeshContinuum>& grid)
   outstr << avg_num_local_cells << ",";
   outstr << max_num_local_cells << ",";
   outstr << min_num_local_cells << "\n";
-  outstr << "  Ghost-to-local ratio (avg)    : " << average_ghost_ratio;
+  outstr << "  Ghost-to-local ratio (avg)    : " << average_ghost_ratio << "\n";
+  outstr << std::fixed << std::setprecision(2);
+  outstr << "  Storage memory (MB)           : cells " << MB(global_memory[0]) << ", vertices "
+         << MB(global_memory[1]) << ", cell id maps " << MB(global_memory[2]) << "\n";
+  outstr << "  std::map storage memory (MB)  : vertices " << MB(global_memory[3])
+         << ", cell id maps " << MB(global_memory[4]);
+  if (max_connectivity_build_time >= 0.0)
+    outstr << "\n  Connectivity build time (s)   : " << max_connectivity_build_time;
 
   log.Log() << "\n" << outstr.str() << "\n\n";
 
@@ -82,7 +82,13 @@ protected:
                                          uint64_t global_id,
                                          uint64_t partition_id);
 
-  static void ComputeAndPrintStats(const std::shared_ptr<MeshContinuum>& grid);
+  /**
+   * Computes and prints the statistics of the partitioned mesh. The connectivity build time is the
+   * time, in seconds, spent connecting the cell faces, or a negative value if unknown. The maximum
+   * over the locations is reported.
+   */
+  static void ComputeAndPrintStats(const std::shared_ptr<MeshContinuum>& grid,
+                                   double connectivity_build_time = -1.0);
 
   /// Broadcasts PIDs to other locations.
   static void
@@ -0,0 +1,555 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "framework/mesh/mesh_generator/parallel_file_mesh_generator.h"
+#include "framework/mesh/mesh_continuum/mesh_continuum.h"
+#include "framework/mesh/io/mesh_io.h"
+#include "framework/graphs/graph_partitioner.h"
+#include "framework/data_types/byte_array.h"
+#include "framework/mpi/mpi_utils.h"
+#include "framework/logging/log.h"
+#include "framework/utils/timer.h"
+#include "framework/utils/utils.h"
+#include "framework/object_factory.h"
+#include "framework/runtime.h"
+#include <algorithm>
+#include <filesystem>
+
+namespace opensn
+{
+
+namespace
+{
+
+/**
+ * Distribution of the vertices over the locations in contiguous blocks of vertex ids. A vertex is
+ * owned by the location that stores its coordinates while the mesh is assembled.
+ */
+class VertexBlocks
+{
+public:
+  VertexBlocks(uint64_t num_vertices, int num_locations)
+    : num_vertices_(num_vertices), num_locations_(static_cast<uint64_t>(num_locations))
+  {
+  }
+
+  int GetOwner(uint64_t vid) const
+  {
+    return static_cast<int>(vid * num_locations_ / num_vertices_);
+  }
+
+  /// Returns the first vertex id of a location.
+  uint64_t GetFirst(int location) const
+  {
+    return (static_cast<uint64_t>(location) * num_vertices_ + num_locations_ - 1) / num_locations_;
+  }
+
+private:
+  const uint64_t num_vertices_;
+  const uint64_t num_locations_;
+};
+
+/// Returns the coordinates of the vertices, requested from their owners.
+std::map<uint64_t, Vector3>
+FetchVertices(const std::set<uint64_t>& vids,
+              const VertexBlocks& blocks,
+              const std::vector<Vector3>& owned_vertices)
+{
+  std::map<int, std::vector<uint64_t>> requests;
+  for (const auto vid : vids)
+    requests[blocks.GetOwner(vid)].push_back(vid);
+  const auto received_requests = MapAllToAll(requests);
+
+  const uint64_t first_vid = blocks.GetFirst(mpi_comm.rank());
+  std::map<int, std::vector<double>> replies;
+  for (const auto& [pid, requested_vids] : received_requests)
+  {
+    auto& reply = replies[pid];
+    reply.reserve(3 * requested_vids.size());
+    for (const auto vid : requested_vids)
+    {
+      const auto& vertex = owned_vertices.at(vid - first_vid);
+      reply.insert(reply.end(), {vertex.x, vertex.y, vertex.z});
+    }
+  }
+  const auto received_replies = MapAllToAll(replies);
+
+  std::map<uint64_t, Vector3> vertices;
+  for (const auto& [pid, requested_vids] : requests)
+  {
+    const auto& reply = received_replies.at(pid);
+    for (size_t i = 0; i < requested_vids.size(); ++i)
+      vertices[requested_vids[i]] = Vector3(reply[3 * i], reply[3 * i + 1], reply[3 * i + 2]);
+  }
+  return vertices;
+}
+
+/// Hash of the sorted vertex ids of a face (FNV-1a).
+uint64_t
+HashFace(const std::vector<uint64_t>& sorted_vids)
+{
+  uint64_t hash = 14695981039346656037ULL;
+  for (const auto vid : sorted_vids)
+    for (size_t b = 0; b < sizeof(uint64_t); ++b)
+    {
+      hash ^= (vid >> (8 * b)) & 0xffULL;
+      hash *= 1099511628211ULL;
+    }
+  return hash;
+}
+
+/**
+ * Connects the faces of the cells of the slabs of all locations. The faces are sent to the location
+ * given by the hash of their vertex ids, which matches the faces with the same vertices. A face
+ * that matches another cell face is connected to that cell, and a face that matches a boundary
+ * element gets the boundary id of the element.
+ */
+void
+ConnectFaces(UnpartitionedMeshSlab& slab)
+{
+  const auto num_locations = mpi_comm.size();
+
+  // Each record holds the kind of face (0 for a cell face, 1 for a boundary element), the number of
+  // vertices, the sorted vertex ids and two values: the cell global id and the face index, or the
+  // boundary id and the boundary element index.
+  std::map<int, std::vector<uint64_t>> records;
+  auto add_record =
+    [&](uint64_t kind, const std::vector<uint64_t>& vertex_ids, uint64_t value0, uint64_t value1)
+  {
+    std::vector<uint64_t> sorted_vids(vertex_ids);
+    std::sort(sorted_vids.begin(), sorted_vids.end());
+    auto& record = records[static_cast<int>(HashFace(sorted_vids) % num_locations)];
+    record.push_back(kind);
+    record.push_back(sorted_vids.size());
+    record.insert(record.end(), sorted_vids.begin(), sorted_vids.end());
+    record.push_back(value0);
+    record.push_back(value1);
+  };
+  for (size_t c = 0; c < slab.cells.size(); ++c)
+    for (size_t f = 0; f < slab.cells[c].faces.size(); ++f)
+      add_record(0, slab.cells[c].faces[f].vertex_ids, slab.first_cell_global_id + c, f);
+  for (size_t b = 0; b < slab.boundary_cells.size(); ++b)
+  {
+    const auto& boundary_cell = slab.boundary_cells[b];
+    add_record(1, boundary_cell.vertex_ids, static_cast<uint64_t>(boundary_cell.block_id), b);
+  }
+  const auto received_records = MapAllToAll(records);
+  records.clear();
+
+  // Match the faces with equal vertex ids. Cell faces come before boundary elements and, like in
+  // the file, boundary elements are ordered by location and index.
+  struct FaceRecord
+  {
+    std::vector<uint64_t> vertex_ids;
+    uint64_t kind;
+    uint64_t value0;
+    uint64_t value1;
+    int pid;
+  };
+  std::vector<FaceRecord> faces;
+  for (const auto& [pid, data] : received_records)
+    for (size_t i = 0; i < data.size();)
+    {
+      const auto kind = data[i];
+      const auto num_vids = data[i + 1];
+      std::vector<uint64_t> vertex_ids(data.begin() + i + 2, data.begin() + i + 2 + num_vids);
+      faces.push_back(
+        {std::move(vertex_ids), kind, data[i + 2 + num_vids], data[i + 3 + num_vids], pid});
+      i += 4 + num_vids;
+    }
+  std::stable_sort(faces.begin(),
+                   faces.end(),
+                   [](const FaceRecord& a, const FaceRecord& b)
+                   { return std::tie(a.vertex_ids, a.kind) < std::tie(b.vertex_ids, b.kind); });
+
+  // Each reply holds the cell global id, the face index, whether the face has a neighbor cell and
+  // the neighbor
+  std::map<int, std::vector<uint64_t>> replies;
+  for (size_t i = 0; i < faces.size();)
+  {
+    size_t end = i + 1;
+    while (end < faces.size() and faces[end].vertex_ids == faces[i].vertex_ids)
+      ++end;
+
+    size_t num_cell_faces = 0;
+    while (i + num_cell_faces < end and faces[i + num_cell_faces].kind == 0)
+      ++num_cell_faces;
+
+    if (num_cell_faces >= 2)
+    {
+      const auto& face0 = faces[i];
+      const auto& face1 = faces[i + 1];
+      replies[face0.pid].insert(replies[face0.pid].end(),
+                                {face0.value0, face0.value1, 1, face1.value0});
+      replies[face1.pid].insert(replies[face1.pid].end(),
+                                {face1.value0, face1.value1, 1, face0.value0});
+    }
+    else if (num_cell_faces == 1 and end > i + 1)
+    {
+      const auto& face = faces[i];
+      replies[face.pid].insert(replies[face.pid].end(),
+                               {face.value0, face.value1, 0, faces[i + 1].value0});
+    }
+    i = end;
+  }
+  faces.clear();
+  const auto received_replies = MapAllToAll(replies);
+
+  for (const auto& [pid, data] : received_replies)
+    for (size_t i = 0; i < data.size(); i += 4)
+    {
+      auto& face = slab.cells[data[i] - slab.first_cell_global_id].faces[data[i + 1]];
+      face.has_neighbor = data[i + 2] != 0;
+      face.neighbor = data[i + 3];
+    }
+}
+
+} // namespace
+
+ParallelFileMeshGenerator::ParallelFileMeshGenerator(const InputParameters& params)
+  : MeshGenerator(params),
+    filename_(params.GetParamValue<std::string>("filename")),
+    coord_sys_(params.GetParamValue<std::string>("coord_sys") == "cartesian"     ? CARTESIAN
+               : params.GetParamValue<std::string>("coord_sys") == "cylindrical" ? CYLINDRICAL
+                                                                                 : SPHERICAL)
+{
+}
+
+std::shared_ptr<MeshContinuum>
+ParallelFileMeshGenerator::Execute()
+{
+  if (replicated_)
+    throw std::invalid_argument("ParallelFileMeshGenerator does not support replicated meshes.");
+  if (not inputs_.empty())
+    throw std::invalid_argument("ParallelFileMeshGenerator can not be preceded by another "
+                                "mesh generator because it cannot process an input mesh");
+
+  AssertReadableFile(filename_);
+  const std::string extension = std::filesystem::path(filename_).extension();
+  if (extension != ".msh")
+    throw std::invalid_argument("Unsupported file type \"" + extension +
+                                "\". Supported types limited to .msh.");
+
+  const auto rank = mpi_comm.rank();
+  const auto num_partitions = mpi_comm.size();
+
+  log.Log() << program_timer.GetTimeString() << " Reading mesh in parallel with " << num_partitions
+            << " parts";
+
+  UnpartitionedMesh::Options options;
+  options.file_name = filename_;
+  auto slab = MeshIO::FromGmshSlab(options);
+  if (slab.num_global_cells == 0)
+    throw std::logic_error("No cells in final input mesh");
+
+  // Redistribute the vertices to their owners
+  const VertexBlocks vertex_blocks(slab.num_global_vertices, num_partitions);
+  const uint64_t first_vid = vertex_blocks.GetFirst(rank);
+  std::vector<Vector3> owned_vertices(vertex_blocks.GetFirst(rank + 1) - first_vid);
+  {
+    std::map<int, std::vector<uint64_t>> vids;
+    std::map<int, std::vector<double>> coordinates;
+    for (size_t v = 0; v < slab.vertex_ids.size(); ++v)
+    {
+      const auto pid = vertex_blocks.GetOwner(slab.vertex_ids[v]);
+      const auto& vertex = slab.vertices[v];
+      vids[pid].push_back(slab.vertex_ids[v]);
+      coordinates[pid].insert(coordinates[pid].end(), {vertex.x, vertex.y, vertex.z});
+    }
+    slab.vertex_ids.clear();
+    slab.vertex_ids.shrink_to_fit();
+    slab.vertices.clear();
+    slab.vertices.shrink_to_fit();
+
+    const auto received_vids = MapAllToAll(vids);
+    const auto received_coordinates = MapAllToAll(coordinates);
+    for (const auto& [pid, pid_vids] : received_vids)
+    {
+      const auto& pid_coordinates = received_coordinates.at(pid);
+      for (size_t v = 0; v < pid_vids.size(); ++v)
+        owned_vertices.at(pid_vids[v] - first_vid) =
+          Vector3(pid_coordinates[3 * v], pid_coordinates[3 * v + 1], pid_coordinates[3 * v + 2]);
+    }
+  }
+
+  // Compute the centroids of the cells of the slab
+  std::set<uint64_t> slab_vids;
+  for (const auto& cell : slab.cells)
+    slab_vids.insert(cell.vertex_ids.begin(), cell.vertex_ids.end());
+  {
+    const auto vertices = FetchVertices(slab_vids, vertex_blocks, owned_vertices);
+    for (auto& cell : slab.cells)
+    {
+      cell.centroid = Vector3(0.0, 0.0, 0.0);
+      for (const auto vid : cell.vertex_ids)
+        cell.centroid += vertices.at(vid);
+      cell.centroid = cell.centroid / static_cast<double>(cell.vertex_ids.size());
+    }
+  }
+
+  log.Log() << program_timer.GetTimeString() << " Establishing cell connectivity.";
+  const Timer connectivity_timer;
+  ConnectFaces(slab);
+  const double connectivity_build_time = connectivity_timer.GetTime() / 1000.0;
+  slab.boundary_cells.clear();
+  slab.boundary_cells.shrink_to_fit();
+
+  // Partition the cells
+  std::vector<int64_t> cell_pids;
+  {
+    std::vector<std::vector<uint64_t>> cell_graph;
+    std::vector<Vector3> cell_centroids;
+    cell_graph.reserve(slab.cells.size());
+    cell_centroids.reserve(slab.cells.size());
+    for (const auto& cell : slab.cells)
+    {
+      std::vector<uint64_t> cell_graph_node;
+      for (const auto& face : cell.faces)
+        if (face.has_neighbor)
+          cell_graph_node.push_back(face.neighbor);
+      cell_graph.push_back(std::move(cell_graph_node));
+      cell_centroids.push_back(cell.centroid);
+    }
+    cell_pids = partitioner_->PartitionDistributed(cell_graph, cell_centroids, num_partitions);
+  }
+
+  std::vector<size_t> local_partI_num_cells(num_partitions, 0);
+  for (const auto pid : cell_pids)
+    local_partI_num_cells[pid] += 1;
+  std::vector<size_t> partI_num_cells(num_partitions, 0);
+  mpi_comm.all_reduce(local_partI_num_cells, partI_num_cells, mpi::op::sum<size_t>());
+
+  size_t avg_num_cells = 0;
+  auto max_num_cells = partI_num_cells.front();
+  auto min_num_cells = partI_num_cells.front();
+  for (size_t count : partI_num_cells)
+  {
+    max_num_cells = std::max(max_num_cells, count);
+    min_num_cells = std::min(min_num_cells, count);
+    avg_num_cells += count;
+  }
+  avg_num_cells /= num_partitions;
+
+  log.Log() << "Number of cells per partition (max,min,avg) = " << max_num_cells << ","
+            << min_num_cells << "," << avg_num_cells;
+  if (min_num_cells == 0)
+    throw std::runtime_error("Partitioning failed. At least one partition contains no cells.");
+
+  // Gather the partitions of the cells that use each vertex at the vertex owners. A cell is sent
+  // to its own partition and, as a ghost, to the partitions of the cells that share a vertex
+  // with it.
+  std::map<uint64_t, std::vector<int>> vertex_pids;
+  {
+    std::set<std::pair<uint64_t, int64_t>> vid_pid_pairs;
+    for (size_t c = 0; c < slab.cells.size(); ++c)
+      for (const auto vid : slab.cells[c].vertex_ids)
+        vid_pid_pairs.emplace(vid, cell_pids[c]);
+
+    std::map<int, std::vector<uint64_t>> subscriptions;
+    for (const auto& [vid, pid] : vid_pid_pairs)
+    {
+      auto& subscription = subscriptions[vertex_blocks.GetOwner(vid)];
+      subscription.insert(subscription.end(), {vid, static_cast<uint64_t>(pid)});
+    }
+    const auto received_subscriptions = MapAllToAll(subscriptions);
+
+    std::vector<std::vector<int>> owned_vertex_pids(owned_vertices.size());
+    for (const auto& [pid, data] : received_subscriptions)
+      for (size_t i = 0; i < data.size(); i += 2)
+        owned_vertex_pids[data[i] - first_vid].push_back(static_cast<int>(data[i + 1]));
+    for (auto& pids : owned_vertex_pids)
+    {
+      std::sort(pids.begin(), pids.end());
+      pids.erase(std::unique(pids.begin(), pids.end()), pids.end());
+    }
+
+    // Reply with the partitions of the requested vertices, in the order of the requests
+    std::map<int, std::vector<uint64_t>> replies;
+    for (const auto& [pid, data] : received_subscriptions)
+    {
+      auto& reply = replies[pid];
+      for (size_t i = 0; i < data.size(); i += 2)
+      {
+        if (i > 0 and data[i] == data[i - 2])
+          continue;
+        const auto& pids = owned_vertex_pids[data[i] - first_vid];
+        reply.push_back(pids.size());
+        reply.insert(reply.end(), pids.begin(), pids.end());
+      }
+    }
+    const auto received_replies = MapAllToAll(replies);
+
+    for (const auto& [pid, data] : subscriptions)
+    {
+      const auto& reply = received_replies.at(pid);
+      size_t r = 0;
+      for (size_t i = 0; i < data.size(); i += 2)
+      {
+        if (i > 0 and data[i] == data[i - 2])
+          continue;
+        auto& pids = vertex_pids[data[i]];
+        const auto num_pids = reply[r++];
+        for (size_t p = 0; p < num_pids; ++p)
+          pids.push_back(static_cast<int>(reply[r++]));
+      }
+    }
+  }
+
+  log.Log() << program_timer.GetTimeString() << " Distributing cells.";
+
+  // Serialize and send the cells to the locations that need them
+  std::map<std::pair<int, uint64_t>, UnpartitionedMesh::LightWeightCell> cells;
+  {
+    std::map<int, ByteArray> serial_data;
+    for (size_t c = 0; c < slab.cells.size(); ++c)
+    {
+      const auto& cell = slab.cells[c];
+      std::set<int> destinations = {static_cast<int>(cell_pids[c])};
+      for (const auto vid : cell.vertex_ids)
+      {
+        const auto& pids = vertex_pids.at(vid);
+        destinations.insert(pids.begin(), pids.end());
+      }
+
+      for (const auto destination : destinations)
+      {
+        auto& data = serial_data[destination];
+        data.Write(static_cast<int>(cell_pids[c]));
+        data.Write(slab.first_cell_global_id + c);
+        data.Write(cell.type);
+        data.Write(cell.sub_type);
+        data.Write(cell.centroid.x);
+        data.Write(cell.centroid.y);
+        data.Write(cell.centroid.z);
+        data.Write(cell.block_id);
+        data.Write(cell.vertex_ids.size());
+        for (const auto vid : cell.vertex_ids)
+          data.Write(vid);
+
+        data.Write(cell.faces.size());
+        for (const auto& face : cell.faces)
+        {
+          data.Write(face.vertex_ids.size());
+          for (const auto vid : face.vertex_ids)
+            data.Write(vid);
+          data.Write(face.has_neighbor);
+          data.Write(face.neighbor);
+        }
+      }
+    }
+    slab.cells.clear();
+    slab.cells.shrink_to_fit();
+    vertex_pids.clear();
+
+    std::map<int, std::vector<std::byte>> send_data;
+    for (auto& [pid, data] : serial_data)
+      send_data[pid] = std::move(data.Data());
+    serial_data.clear();
+    auto received_data = MapAllToAll(send_data);
+    send_data.clear();
+
+    for (auto& [pid, data] : received_data)
+    {
+      ByteArray cell_data(std::move(data));
+      while (not cell_data.EndOfBuffer())
+      {
+        const auto cell_pid = cell_data.Read<int>();
+        const auto cell_gid = cell_data.Read<uint64_t>();
+        const auto type = cell_data.Read<CellType>();
+        const auto sub_type = cell_data.Read<CellType>();
+
+        UnpartitionedMesh::LightWeightCell cell(type, sub_type);
+
+        cell.centroid.x = cell_data.Read<double>();
+        cell.centroid.y = cell_data.Read<double>();
+        cell.centroid.z = cell_data.Read<double>();
+        cell.block_id = cell_data.Read<int>();
+
+        const auto num_vids = cell_data.Read<size_t>();
+        for (size_t v = 0; v < num_vids; ++v)
+          cell.vertex_ids.push_back(cell_data.Read<uint64_t>());
+
+        const auto num_faces = cell_data.Read<size_t>();
+        for (size_t f = 0; f < num_faces; ++f)
+        {
+          UnpartitionedMesh::LightWeightFace face;
+          const auto num_face_vids = cell_data.Read<size_t>();
+          for (size_t v = 0; v < num_face_vids; ++v)
+            face.vertex_ids.push_back(cell_data.Read<uint64_t>());
+
+          face.has_neighbor = cell_data.Read<bool>();
+          face.neighbor = cell_data.Read<uint64_t>();
+
+          cell.faces.push_back(std::move(face));
+        }
+        cells.insert(std::make_pair(std::make_pair(cell_pid, cell_gid), std::move(cell)));
+      }
+    }
+  }
+
+  // Get the vertices of the received cells
+  std::set<uint64_t> cell_vids;
+  for (const auto& [pidgid, cell] : cells)
+    cell_vids.insert(cell.vertex_ids.begin(), cell.vertex_ids.end());
+  const auto vertices = FetchVertices(cell_vids, vertex_blocks, owned_vertices);
+  owned_vertices.clear();
+  owned_vertices.shrink_to_fit();
+
+  // Set up the local mesh
+  auto grid_ptr = MeshContinuum::New();
+
+  grid_ptr->vertices.Reserve(vertices.size());
+  for (const auto& [vid, vertex] : vertices)
+    grid_ptr->vertices.Insert(vid, vertex);
+
+  for (const auto& [pidgid, raw_cell] : cells)
+  {
+    const auto& [cell_pid, cell_global_id] = pidgid;
+    grid_ptr->cells.PushBack(SetupCell(raw_cell, cell_global_id, cell_pid));
+  }
+
+  grid_ptr->SetDimension(slab.dimension);
+  grid_ptr->SetCoordinateSystem(coord_sys_);
+  grid_ptr->SetType(slab.mesh_type);
+  grid_ptr->SetGlobalVertexCount(slab.num_global_vertices);
+  grid_ptr->ComputeGeometricInfo();
+
+  ComputeAndPrintStats(grid_ptr, connectivity_build_time);
+
+  mpi_comm.barrier();
+
+  log.Log() << program_timer.GetTimeString() << " Mesh successfully read in parallel";
+
+  return grid_ptr;
+}
+
+OpenSnRegisterObjectInNamespace(mesh, ParallelFileMeshGenerator);
+
+InputParameters
+ParallelFileMeshGenerator::GetInputParameters()
+{
+  InputParameters params = MeshGenerator::GetInputParameters();
+
+  params.SetGeneralDescription(
+    "Generator for loading a mesh from a file in parallel. Each location reads a part of the file, "
+    "and the cells are partitioned and distributed without replicating the mesh. Only Gmsh files "
+    "(format v4.1, ASCII) are supported.");
+  params.SetDocGroup("doc_MeshGenerators");
+
+  params.AddRequiredParameter<std::string>("filename", "Path to the file.");
+
+  params.AddOptionalParameter("coord_sys", "cartesian", "The coordinate system of the mesh.");
+  params.ConstrainParameterRange(
+    "coord_sys", AllowableRangeList::New({"cartesian", "cylindrical", "spherical"}));
+
+  return params;
+}
+
+std::shared_ptr<ParallelFileMeshGenerator>
+ParallelFileMeshGenerator::Create(const ParameterBlock& params)
+{
+  const auto& factory = ObjectFactory::GetInstance();
+  return factory.Create<ParallelFileMeshGenerator>("mesh::ParallelFileMeshGenerator", params);
+}
+
+} // namespace opensn
@@ -0,0 +1,39 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include "framework/mesh/mesh_generator/mesh_generator.h"
+
+namespace opensn
+{
+
+/**
+ * This class generates a mesh from a file without holding the whole mesh on any location. Each
+ * location reads a slab of the cells and vertices of the file. The faces are connected, the cells
+ * partitioned and the partitions exchanged between the locations in parallel, so that the memory
+ * of a location is proportional to the number of cells it reads and receives.
+ *
+ * Only Gmsh files (format v4.1, ASCII) are supported.
+ */
+class ParallelFileMeshGenerator : public MeshGenerator
+{
+public:
+  explicit ParallelFileMeshGenerator(const InputParameters& params);
+
+  /**
+   * Reads the slab of the file of this location, and returns the local mesh of this location.
+   * Must be called by all locations.
+   */
+  std::shared_ptr<MeshContinuum> Execute() override;
+
+protected:
+  const std::string filename_;
+  const CoordinateSystemType coord_sys_;
+
+public:
+  static InputParameters GetInputParameters();
+  static std::shared_ptr<ParallelFileMeshGenerator> Create(const ParameterBlock& params);
+};
+
+} // namespace opensn
@@ -29,6 +29,7 @@ SplitFileMeshGenerator::Execute()
 {
   const auto num_mpi = mpi_comm.size();
   const auto num_partitions = num_mpi == 1 ? num_partitions_ : num_mpi;
+  double connectivity_build_time = -1.0;
 
   if (mpi_comm.rank() == 0 and (not read_only_))
   {
@@ -41,6 +42,8 @@ SplitFileMeshGenerator::Execute()
     // Generate final umesh
     current_umesh = GenerateUnpartitionedMesh(current_umesh);
 
+    connectivity_build_time = current_umesh->GetConnectivityBuildTime();
+
     log.Log() << "Writing split-mesh with " << num_partitions << " parts";
     const auto cell_pids = PartitionMesh(*current_umesh, num_partitions);
     WriteSplitMesh(cell_pids, *current_umesh, num_partitions);
@@ -56,7 +59,7 @@ SplitFileMeshGenerator::Execute()
     log.Log() << "Reading split-mesh";
     auto mesh_info = ReadSplitMesh();
 
-    grid_ptr = SetupLocalMesh(mesh_info);
+    grid_ptr = SetupLocalMesh(mesh_info, connectivity_build_time);
 
     log.Log() << "Done reading split-mesh files";
   }
@@ -370,7 +373,7 @@ SplitFileMeshGenerator::Create(const ParameterBlock& params)
 }
 
 std::shared_ptr<MeshContinuum>
-SplitFileMeshGenerator::SetupLocalMesh(SplitMeshInfo& mesh_info)
+SplitFileMeshGenerator::SetupLocalMesh(SplitMeshInfo& mesh_info, double connectivity_build_time)
 {
   auto grid_ptr = MeshContinuum::New();
   grid_ptr->GetBoundaryIDMap() = mesh_info.boundary_id_map;
@@ -378,6 +381,7 @@ SplitFileMeshGenerator::SetupLocalMesh(SplitMeshInfo& mesh_info)
   auto& cells = mesh_info.cells;
   auto& vertices = mesh_info.vertices;
 
+  grid_ptr->vertices.Reserve(vertices.size());
   for (const auto& [vid, vertex] : vertices)
     grid_ptr->vertices.Insert(vid, vertex);
 
@@ -396,7 +400,7 @@ SplitFileMeshGenerator::SetupLocalMesh(SplitMeshInfo& mesh_info)
   grid_ptr->SetGlobalVertexCount(mesh_info.num_global_vertices);
   grid_ptr->ComputeGeometricInfo();
 
-  ComputeAndPrintStats(grid_ptr);
+  ComputeAndPrintStats(grid_ptr, connectivity_build_time);
 
   return grid_ptr;
 }
@@ -53,7 +53,8 @@ public:
   static std::shared_ptr<SplitFileMeshGenerator> Create(const ParameterBlock& params);
 
 protected:
-  static std::shared_ptr<MeshContinuum> SetupLocalMesh(SplitMeshInfo& mesh_info);
+  static std::shared_ptr<MeshContinuum> SetupLocalMesh(SplitMeshInfo& mesh_info,
+                                                       double connectivity_build_time);
 
   static void SerializeCell(const UnpartitionedMesh::LightWeightCell& cell,
                             ByteArray& serial_buffer);
@@ -41,6 +41,8 @@ public:
 
   const std::vector<Face>& GetTriangles() const { return faces_; }
 
+  const std::vector<std::shared_ptr<PolyFace>>& GetPolygons() const { return poly_faces_; }
+
   SurfaceMesh();
   ~SurfaceMesh() override;
 
@@ -0,0 +1,211 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "framework/mesh/surface_mesh/triangle_bvh.h"
+#include "framework/logging/log_exceptions.h"
+#include "caliper/cali.h"
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <numeric>
+
+namespace opensn
+{
+
+namespace
+{
+
+/// Relative tolerance of the ray/triangle intersection tests.
+constexpr double INTERSECTION_TOLERANCE = 1.0e-10;
+
+std::array<double, 3>
+ToArray(const Vector3& v)
+{
+  return {v.x, v.y, v.z};
+}
+
+} // namespace
+
+TriangleBVH::TriangleBVH(std::vector<Triangle> triangles)
+{
+  CALI_CXX_MARK_SCOPE("TriangleBVH::TriangleBVH");
+
+  const size_t num_triangles = triangles.size();
+  OpenSnInvalidArgumentIf(num_triangles > std::numeric_limits<uint32_t>::max(),
+                          "Too many triangles for a bounding volume hierarchy.");
+  if (num_triangles == 0)
+    return;
+
+  std::vector<Vector3> centroids;
+  centroids.reserve(num_triangles);
+  for (const auto& triangle : triangles)
+    centroids.push_back((triangle[0] + triangle[1] + triangle[2]) / 3.0);
+
+  std::vector<uint32_t> order(num_triangles);
+  std::iota(order.begin(), order.end(), 0);
+
+  nodes_.reserve(2 * (num_triangles / MAX_LEAF_SIZE + 1));
+  nodes_.emplace_back();
+  Build(0, triangles, centroids, order, 0, static_cast<uint32_t>(num_triangles));
+  nodes_.shrink_to_fit();
+
+  // Store the triangles in leaf order
+  triangles_.reserve(num_triangles);
+  for (const auto t : order)
+    triangles_.push_back(triangles[t]);
+}
+
+void
+TriangleBVH::Build(uint32_t node_index,
+                   const std::vector<Triangle>& triangles,
+                   const std::vector<Vector3>& centroids,
+                   std::vector<uint32_t>& order,
+                   uint32_t begin,
+                   uint32_t end)
+{
+  constexpr double inf = std::numeric_limits<double>::infinity();
+
+  // Bounding boxes of the triangles and of their centroids
+  Node node{{inf, inf, inf}, {-inf, -inf, -inf}, begin, end - begin};
+  std::array<double, 3> centroid_min{inf, inf, inf};
+  std::array<double, 3> centroid_max{-inf, -inf, -inf};
+  for (uint32_t i = begin; i < end; ++i)
+  {
+    for (const auto& vertex : triangles[order[i]])
+    {
+      const auto v = ToArray(vertex);
+      for (int d = 0; d < 3; ++d)
+      {
+        node.box_min[d] = std::min(node.box_min[d], v[d]);
+        node.box_max[d] = std::max(node.box_max[d], v[d]);
+      }
+    }
+
+    const auto c = ToArray(centroids[order[i]]);
+    for (int d = 0; d < 3; ++d)
+    {
+      centroid_min[d] = std::min(centroid_min[d], c[d]);
+      centroid_max[d] = std::max(centroid_max[d], c[d]);
+    }
+  }
+
+  // Split along the axis with the largest extent of the centroids
+  int axis = 0;
+  for (int d = 1; d < 3; ++d)
+    if (centroid_max[d] - centroid_min[d] > centroid_max[axis] - centroid_min[axis])
+      axis = d;
+
+  // Small sets of triangles, and triangles that cannot be separated, make a leaf
+  if (end - begin <= MAX_LEAF_SIZE or centroid_max[axis] <= centroid_min[axis])
+  {
+    nodes_[node_index] = node;
+    return;
+  }
+
+  const uint32_t mid = begin + (end - begin) / 2;
+  std::nth_element(order.begin() + begin,
+                   order.begin() + mid,
+                   order.begin() + end,
+                   [&centroids, axis](uint32_t a, uint32_t b)
+                   { return ToArray(centroids[a])[axis] < ToArray(centroids[b])[axis]; });
+
+  const auto first_child = static_cast<uint32_t>(nodes_.size());
+  nodes_.emplace_back();
+  nodes_.emplace_back();
+  node.first = first_child;
+  node.count = 0;
+  nodes_[node_index] = node;
+
+  Build(first_child, triangles, centroids, order, begin, mid);
+  Build(first_child + 1, triangles, centroids, order, mid, end);
+}
+
+unsigned int
+TriangleBVH::CountRayCrossings(const Vector3& origin,
+                               const Vector3& direction,
+                               bool& degenerate) const
+{
+  degenerate = false;
+  if (nodes_.empty())
+    return 0;
+
+  const auto o = ToArray(origin);
+  const std::array<double, 3> inv_direction{
+    1.0 / direction.x, 1.0 / direction.y, 1.0 / direction.z};
+  const double direction_norm = direction.Norm();
+  constexpr double eps = INTERSECTION_TOLERANCE;
+
+  unsigned int num_crossings = 0;
+
+  // The depth of the tree is bounded by the number of bits of the triangle indices
+  std::array<uint32_t, 2 * 32 + 2> stack{};
+  size_t stack_size = 0;
+  stack[stack_size++] = 0;
+  while (stack_size > 0)
+  {
+    const auto& node = nodes_[stack[--stack_size]];
+
+    // Slab test of the ray against the bounding box
+    double t_enter = 0.0;
+    double t_exit = std::numeric_limits<double>::infinity();
+    for (int d = 0; d < 3; ++d)
+    {
+      double t0 = (node.box_min[d] - o[d]) * inv_direction[d];
+      double t1 = (node.box_max[d] - o[d]) * inv_direction[d];
+      if (t0 > t1)
+        std::swap(t0, t1);
+      t_enter = std::max(t_enter, t0);
+      t_exit = std::min(t_exit, t1);
+    }
+    if (t_enter > t_exit)
+      continue;
+
+    if (node.count == 0)
+    {
+      stack[stack_size++] = node.first;
+      stack[stack_size++] = node.first + 1;
+      continue;
+    }
+
+    // Moller-Trumbore intersection with the triangles of the leaf
+    for (uint32_t t = node.first; t < node.first + node.count; ++t)
+    {
+      const auto& [v0, v1, v2] = triangles_[t];
+      const Vector3 e1 = v1 - v0;
+      const Vector3 e2 = v2 - v0;
+      const Vector3 s = origin - v0;
+      const Vector3 p = direction.Cross(e2);
+      const double det = e1.Dot(p);
+
+      // A ray parallel to the triangle only matters when it lies in the plane of the triangle
+      if (std::fabs(det) <= eps * e1.Norm() * e2.Norm() * direction_norm)
+      {
+        const Vector3 normal = e1.Cross(e2);
+        if (std::fabs(s.Dot(normal)) <= eps * s.Norm() * normal.Norm())
+          degenerate = true;
+        continue;
+      }
+
+      const double inv_det = 1.0 / det;
+      const double u = s.Dot(p) * inv_det;
+      if (u < -eps or u > 1.0 + eps)
+        continue;
+
+      const Vector3 q = s.Cross(e1);
+      const double v = direction.Dot(q) * inv_det;
+      if (v < -eps or u + v > 1.0 + eps)
+        continue;
+
+      if (e2.Dot(q) * inv_det <= 0.0)
+        continue;
+
+      if (u < eps or v < eps or u + v > 1.0 - eps)
+        degenerate = true;
+      ++num_crossings;
+    }
+  }
+
+  return num_crossings;
+}
+
+} // namespace opensn
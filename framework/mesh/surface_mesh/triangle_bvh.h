@@ -0,0 +1,67 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include "framework/math/vector3.h"
+#include <array>
+#include <cstdint>
+#include <vector>
+
+namespace opensn
+{
+
+/**
+ * Bounding volume hierarchy over a set of triangles.
+ *
+ * The hierarchy is a binary tree of axis-aligned bounding boxes, built by recursively splitting
+ * the triangles at the median of their centroids along the longest axis. A ray query only visits
+ * the boxes the ray passes through, which takes O(log F) time for F triangles instead of O(F).
+ */
+class TriangleBVH
+{
+public:
+  using Triangle = std::array<Vector3, 3>;
+
+  explicit TriangleBVH(std::vector<Triangle> triangles);
+
+  size_t GetNumTriangles() const { return triangles_.size(); }
+
+  /**
+   * Counts the triangles crossed by the ray starting at `origin` in direction `direction`. The
+   * count is flagged as `degenerate` when the ray passes (numerically) through an edge or a vertex
+   * of a triangle, or grazes a triangle, in which case its parity cannot be trusted. The direction
+   * must not have zero components.
+   */
+  unsigned int
+  CountRayCrossings(const Vector3& origin, const Vector3& direction, bool& degenerate) const;
+
+private:
+  struct Node
+  {
+    std::array<double, 3> box_min;
+    std::array<double, 3> box_max;
+    /// First child for an interior node (the second child follows it), first triangle for a leaf.
+    uint32_t first;
+    /// Number of triangles of a leaf, 0 for an interior node.
+    uint32_t count;
+  };
+
+  /**
+   * Builds the subtree of the triangles `order[begin, end)` into node `node_index`. The triangles
+   * are reordered such that the triangles of each subtree are contiguous.
+   */
+  void Build(uint32_t node_index,
+             const std::vector<Triangle>& triangles,
+             const std::vector<Vector3>& centroids,
+             std::vector<uint32_t>& order,
+             uint32_t begin,
+             uint32_t end);
+
+  std::vector<Triangle> triangles_;
+  std::vector<Node> nodes_;
+
+  static constexpr uint32_t MAX_LEAF_SIZE = 4;
+};
+
+} // namespace opensn
@@ -6,11 +6,157 @@
 #include "framework/runtime.h"
 #include "framework/logging/log.h"
 #include "framework/utils/timer.h"
+#include "framework/utils/thread_pool.h"
 #include <algorithm>
 
 namespace opensn
 {
 
+namespace
+{
+
+/// Number of cells or faces processed by a thread at a time.
+constexpr size_t BLOCK_SIZE = 4096;
+
+/**
+ * Keys of faces, i.e., their sorted and unique vertex ids, stored contiguously with their hashes.
+ * Two faces match if their keys are equal.
+ */
+struct FaceKeys
+{
+  std::vector<size_t> offsets;
+  std::vector<size_t> sizes;
+  std::vector<uint64_t> vertex_ids;
+  std::vector<uint64_t> hashes;
+
+  /// Allocates the keys of faces with the given numbers of vertices.
+  void Allocate(const std::vector<size_t>& num_face_vertices)
+  {
+    const size_t num_faces = num_face_vertices.size();
+    offsets.assign(num_faces + 1, 0);
+    for (size_t i = 0; i < num_faces; ++i)
+      offsets[i + 1] = offsets[i] + num_face_vertices[i];
+    sizes.assign(num_faces, 0);
+    vertex_ids.assign(offsets.back(), 0);
+    hashes.assign(num_faces, 0);
+  }
+
+  /// Sets the key of a face from its vertex ids.
+  void Set(size_t i, const std::vector<uint64_t>& face_vertex_ids)
+  {
+    const auto begin = vertex_ids.begin() + static_cast<std::ptrdiff_t>(offsets[i]);
+    std::copy(face_vertex_ids.begin(), face_vertex_ids.end(), begin);
+    std::sort(begin, begin + static_cast<std::ptrdiff_t>(face_vertex_ids.size()));
+    const auto end =
+      std::unique(begin, begin + static_cast<std::ptrdiff_t>(face_vertex_ids.size()));
+    sizes[i] = static_cast<size_t>(end - begin);
+
+    uint64_t hash = sizes[i];
+    for (auto it = begin; it != end; ++it)
+    {
+      uint64_t h = *it + 0x9e3779b97f4a7c15ULL + (hash << 6) + (hash >> 2);
+      h = (h ^ (h >> 30)) * 0xbf58476d1ce4e5b9ULL;
+      h = (h ^ (h >> 27)) * 0x94d049bb133111ebULL;
+      hash = h ^ (h >> 31);
+    }
+    hashes[i] = hash;
+  }
+
+  size_t Size() const { return sizes.size(); }
+
+  /// Returns true if the key of face i equals the key of face j of other.
+  bool Equal(size_t i, const FaceKeys& other, size_t j) const
+  {
+    if (hashes[i] != other.hashes[j] or sizes[i] != other.sizes[j])
+      return false;
+    return std::equal(vertex_ids.begin() + static_cast<std::ptrdiff_t>(offsets[i]),
+                      vertex_ids.begin() + static_cast<std::ptrdiff_t>(offsets[i] + sizes[i]),
+                      other.vertex_ids.begin() + static_cast<std::ptrdiff_t>(other.offsets[j]));
+  }
+};
+
+/**
+ * Hash table of faces, split into shards that are built concurrently. A face belongs to the shard
+ * given by its hash, so that matching faces are always in the same shard. The shards use open
+ * addressing, with slots that hold the index of a face plus one, or zero if empty.
+ */
+class FaceHashTable
+{
+public:
+  FaceHashTable(const FaceKeys& keys, ThreadPool& pool)
+    : keys_(keys), num_shards_(pool.GetNumThreads()), shard_faces_(num_shards_), slots_(num_shards_)
+  {
+    // Sort the faces into their shards, keeping their order within each shard
+    const size_t num_faces = keys.Size();
+    const size_t num_blocks = (num_faces + BLOCK_SIZE - 1) / BLOCK_SIZE;
+    std::vector<std::vector<size_t>> block_counts(num_blocks, std::vector<size_t>(num_shards_, 0));
+    pool.ParallelFor(
+      num_blocks,
+      [&](size_t b, unsigned int)
+      {
+        for (size_t i = b * BLOCK_SIZE; i < std::min(num_faces, (b + 1) * BLOCK_SIZE); ++i)
+          ++block_counts[b][GetShard(keys.hashes[i])];
+      });
+
+    std::vector<size_t> shard_sizes(num_shards_, 0);
+    for (auto& counts : block_counts)
+      for (size_t s = 0; s < num_shards_; ++s)
+      {
+        const size_t count = counts[s];
+        counts[s] = shard_sizes[s];
+        shard_sizes[s] += count;
+      }
+    for (size_t s = 0; s < num_shards_; ++s)
+    {
+      shard_faces_[s].resize(shard_sizes[s]);
+      size_t num_slots = 16;
+      while (num_slots < 2 * shard_sizes[s])
+        num_slots *= 2;
+      slots_[s].assign(num_slots, 0);
+    }
+
+    pool.ParallelFor(
+      num_blocks,
+      [&](size_t b, unsigned int)
+      {
+        auto& positions = block_counts[b];
+        for (size_t i = b * BLOCK_SIZE; i < std::min(num_faces, (b + 1) * BLOCK_SIZE); ++i)
+        {
+          const size_t s = GetShard(keys.hashes[i]);
+          shard_faces_[s][positions[s]++] = i;
+        }
+      });
+  }
+
+  size_t GetNumShards() const { return num_shards_; }
+
+  /// Returns the indices of the faces of a shard, in increasing order.
+  const std::vector<size_t>& GetShardFaces(size_t shard) const { return shard_faces_[shard]; }
+
+  /**
+   * Returns the slot of the face of the table whose key equals the key of face j of query_keys,
+   * or the empty slot where such a face is to be inserted.
+   */
+  size_t& Find(const FaceKeys& query_keys, size_t j)
+  {
+    auto& slots = slots_[GetShard(query_keys.hashes[j])];
+    const size_t mask = slots.size() - 1;
+    for (size_t k = query_keys.hashes[j] & mask;; k = (k + 1) & mask)
+      if (slots[k] == 0 or keys_.Equal(slots[k] - 1, query_keys, j))
+        return slots[k];
+  }
+
+private:
+  size_t GetShard(uint64_t hash) const { return (hash >> 32) % num_shards_; }
+
+  const FaceKeys& keys_;
+  const size_t num_shards_;
+  std::vector<std::vector<size_t>> shard_faces_;
+  std::vector<std::vector<size_t>> slots_;
+};
+
+} // namespace
+
 UnpartitionedMesh::UnpartitionedMesh() : dim_(0), mesh_type_(UNSTRUCTURED), extruded_(false)
 {
 }
@@ -201,26 +347,35 @@ UnpartitionedMesh::SetOrthoAttributes(size_t nx, size_t ny, size_t nz)
 }
 
 void
-UnpartitionedMesh::BuildMeshConnectivity()
+UnpartitionedMesh::BuildMeshConnectivity(unsigned int num_threads)
 {
+  const Timer timer;
   const size_t num_raw_cells = raw_cells_.size();
   const size_t num_raw_vertices = vertices_.size();
+  ThreadPool pool(std::max(num_threads, 1u));
 
-  // Reset all cell neighbors
-  int num_bndry_faces = 0;
-  for (auto& cell : raw_cells_)
-    for (auto& face : cell->faces)
-      if (not face.has_neighbor)
-        ++num_bndry_faces;
+  // Index the faces that are not yet connected
+  std::vector<std::pair<uint64_t, size_t>> faces;
+  std::vector<size_t> num_face_vertices;
+  for (uint64_t cell_id = 0; cell_id < num_raw_cells; ++cell_id)
+  {
+    const auto& cell_faces = raw_cells_[cell_id]->faces;
+    for (size_t f = 0; f < cell_faces.size(); ++f)
+      if (not cell_faces[f].has_neighbor)
+      {
+        faces.emplace_back(cell_id, f);
+        num_face_vertices.push_back(cell_faces[f].vertex_ids.size());
+      }
+  }
+  const size_t num_faces = faces.size();
 
   log.Log0Verbose1() << program_timer.GetTimeString()
                      << " Number of unconnected faces "
                         "before connectivity: "
-                     << num_bndry_faces;
+                     << num_faces;
 
   log.Log() << program_timer.GetTimeString() << " Establishing cell connectivity.";
 
-  // Establish internal connectivity
   // Populate vertex subscriptions to internal cells
   vertex_cell_subscriptions_.resize(num_raw_vertices);
   {
@@ -235,122 +390,105 @@ UnpartitionedMesh::BuildMeshConnectivity()
 
   log.Log() << program_timer.GetTimeString() << " Vertex cell subscriptions complete.";
 
-  // Process raw cells
+  const size_t num_face_blocks = (num_faces + BLOCK_SIZE - 1) / BLOCK_SIZE;
+  auto get_face = [&](size_t i) -> LightWeightFace&
+  { return raw_cells_[faces[i].first]->faces[faces[i].second]; };
+
+  FaceKeys face_keys;
+  face_keys.Allocate(num_face_vertices);
+  num_face_vertices.clear();
+  num_face_vertices.shrink_to_fit();
+  pool.ParallelFor(num_face_blocks,
+                   [&](size_t b, unsigned int)
+                   {
+                     for (size_t i = b * BLOCK_SIZE; i < std::min(num_faces, (b + 1) * BLOCK_SIZE);
+                          ++i)
+                       face_keys.Set(i, get_face(i).vertex_ids);
+                   });
+
+  // Connect the faces with equal keys. Each shard of the table is processed by a single thread,
+  // in the order of the faces, so that a face is connected to the first unconnected face of
+  // another cell with the same key.
   {
-    uint64_t aux_counter = 0;
-    uint64_t cur_cell_id = 0;
-    for (auto& cell : raw_cells_)
-    {
-      for (auto& cur_cell_face : cell->faces)
-      {
-        if (cur_cell_face.has_neighbor)
-          continue;
-        const std::set<uint64_t> cfvids(cur_cell_face.vertex_ids.begin(),
-                                        cur_cell_face.vertex_ids.end());
-
-        std::set<size_t> cells_to_search;
-        for (uint64_t vid : cfvids)
-          for (uint64_t cell_id : vertex_cell_subscriptions_.at(vid))
-            if (cell_id != cur_cell_id)
-              cells_to_search.insert(cell_id);
-
-        for (uint64_t adj_cell_id : cells_to_search)
-        {
-          auto adj_cell = raw_cells_.at(adj_cell_id);
-
-          for (auto& adj_cell_face : adj_cell->faces)
-          {
-            if (adj_cell_face.has_neighbor)
-              continue;
-            const std::set<uint64_t> afvids(adj_cell_face.vertex_ids.begin(),
-                                            adj_cell_face.vertex_ids.end());
-
-            if (cfvids == afvids)
-            {
-              cur_cell_face.neighbor = adj_cell_id;
-              adj_cell_face.neighbor = cur_cell_id;
-
-              cur_cell_face.has_neighbor = true;
-              adj_cell_face.has_neighbor = true;
-
-              goto face_neighbor_found;
-            }
-          } // for adjacent cell face
-        }
-      face_neighbor_found:;
-      } // for face
-
-      ++cur_cell_id;
-      const double fraction_complete =
-        static_cast<double>(cur_cell_id) / static_cast<double>(num_raw_cells);
-      if (fraction_complete >= static_cast<double>(aux_counter + 1) * 0.1)
-      {
-        log.Log() << program_timer.GetTimeString() << " Surpassing cell " << cur_cell_id << " of "
-                  << num_raw_cells << " (" << (aux_counter + 1) * 10 << "%)";
-        ++aux_counter;
-      }
-    } // for cell
+    FaceHashTable table(face_keys, pool);
+    pool.ParallelFor(table.GetNumShards(),
+                     [&](size_t s, unsigned int)
+                     {
+                       for (const size_t i : table.GetShardFaces(s))
+                       {
+                         auto& slot = table.Find(face_keys, i);
+                         if (slot != 0)
+                         {
+                           const size_t j = slot - 1;
+                           auto& adj_face = get_face(j);
+                           if (adj_face.has_neighbor)
+                             slot = i + 1;
+                           else if (faces[j].first != faces[i].first)
+                           {
+                             auto& face = get_face(i);
+                             face.neighbor = faces[j].first;
+                             adj_face.neighbor = faces[i].first;
+                             face.has_neighbor = true;
+                             adj_face.has_neighbor = true;
+                           }
+                         }
+                         else
+                           slot = i + 1;
+                       }
+                     });
   }
 
   log.Log() << program_timer.GetTimeString() << " Establishing cell boundary connectivity.";
 
-  // Establish boundary connectivity
-  // Make list of internal cells on the boundary
-  std::vector<std::shared_ptr<LightWeightCell>> internal_cells_on_boundary;
-  for (auto& cell : raw_cells_)
+  // Establish boundary connectivity. A face that is still not connected gets the block id of the
+  // first boundary cell with the same vertices.
+  if (not raw_boundary_cells_.empty())
   {
-    bool cell_on_boundary = false;
-    for (auto& face : cell->faces)
-      if (not face.has_neighbor)
+    const size_t num_boundary_cells = raw_boundary_cells_.size();
+    std::vector<size_t> num_boundary_vertices(num_boundary_cells);
+    for (size_t c = 0; c < num_boundary_cells; ++c)
+      num_boundary_vertices[c] = raw_boundary_cells_[c]->vertex_ids.size();
+
+    FaceKeys boundary_keys;
+    boundary_keys.Allocate(num_boundary_vertices);
+    const size_t num_boundary_blocks = (num_boundary_cells + BLOCK_SIZE - 1) / BLOCK_SIZE;
+    pool.ParallelFor(
+      num_boundary_blocks,
+      [&](size_t b, unsigned int)
       {
-        cell_on_boundary = true;
-        break;
-      }
-
-    if (cell_on_boundary)
-      internal_cells_on_boundary.push_back(cell);
-  }
-
-  // Populate vertex subscriptions to boundary cells
-  std::vector<std::set<uint64_t>> vertex_bndry_cell_subscriptions(vertices_.size());
-  {
-    uint64_t cur_cell_id = 0;
-    for (auto& cell : raw_boundary_cells_)
-    {
-      for (auto vid : cell->vertex_ids)
-        vertex_bndry_cell_subscriptions.at(vid).insert(cur_cell_id);
-      ++cur_cell_id;
-    }
-  }
-
-  // Process boundary cells
-  for (auto& cell : internal_cells_on_boundary)
-    for (auto& face : cell->faces)
-    {
-      if (face.has_neighbor)
-        continue;
-      std::set<uint64_t> cfvids(face.vertex_ids.begin(), face.vertex_ids.end());
-
-      std::set<size_t> cells_to_search;
-      for (uint64_t vid : face.vertex_ids)
-        for (uint64_t cell_id : vertex_bndry_cell_subscriptions[vid])
-          cells_to_search.insert(cell_id);
-
-      for (uint64_t adj_cell_id : cells_to_search)
+        for (size_t c = b * BLOCK_SIZE; c < std::min(num_boundary_cells, (b + 1) * BLOCK_SIZE); ++c)
+          boundary_keys.Set(c, raw_boundary_cells_[c]->vertex_ids);
+      });
+
+    FaceHashTable table(boundary_keys, pool);
+    pool.ParallelFor(table.GetNumShards(),
+                     [&](size_t s, unsigned int)
+                     {
+                       for (const size_t c : table.GetShardFaces(s))
+                       {
+                         auto& slot = table.Find(boundary_keys, c);
+                         if (slot == 0)
+                           slot = c + 1;
+                       }
+                     });
+
+    pool.ParallelFor(
+      num_face_blocks,
+      [&](size_t b, unsigned int)
       {
-        auto& adj_cell = raw_boundary_cells_[adj_cell_id];
-
-        std::set<uint64_t> afvids(adj_cell->vertex_ids.begin(), adj_cell->vertex_ids.end());
-
-        if (cfvids == afvids)
+        for (size_t i = b * BLOCK_SIZE; i < std::min(num_faces, (b + 1) * BLOCK_SIZE); ++i)
         {
-          face.neighbor = adj_cell->block_id;
-          break;
+          auto& face = get_face(i);
+          if (face.has_neighbor)
+            continue;
+          const size_t slot = table.Find(face_keys, i);
+          if (slot != 0)
+            face.neighbor = raw_boundary_cells_[slot - 1]->block_id;
         }
-      } // for adj_cell_id
-    }   // for face
+      });
+  }
 
-  num_bndry_faces = 0;
+  size_t num_bndry_faces = 0;
   for (const auto& cell : raw_cells_)
     for (auto& face : cell->faces)
       if (not face.has_neighbor)
@@ -361,6 +499,8 @@ UnpartitionedMesh::BuildMeshConnectivity()
                         "after connectivity: "
                      << num_bndry_faces;
 
+  connectivity_build_time_ = timer.GetTime() / 1000.0;
+
   log.Log() << program_timer.GetTimeString() << " Done establishing cell connectivity.";
 }
 
@@ -45,6 +45,8 @@ public:
     std::string block_id_fieldname = "BlockID";
     std::string boundary_id_fieldname;
     double scale = 1.0;
+    /// Number of threads used to build the connectivity.
+    unsigned int num_threads = 1;
   };
 
   struct BoundBox
@@ -100,8 +102,14 @@ public:
   const std::vector<Vector3>& GetVertices() const { return vertices_; }
   std::vector<Vector3>& GetVertices() { return vertices_; }
 
-  /// Establishes neighbor connectivity for the light-weight mesh.
-  void BuildMeshConnectivity();
+  /**
+   * Establishes neighbor connectivity for the light-weight mesh. The faces are matched by their
+   * vertex ids in a hash table that is built with the given number of threads.
+   */
+  void BuildMeshConnectivity(unsigned int num_threads = 1);
+
+  /// Returns the time, in seconds, of the last connectivity build, or a negative value if none.
+  double GetConnectivityBuildTime() const { return connectivity_build_time_; }
 
   /// Compute centroids for all cells.
   void ComputeCentroids();
@@ -129,6 +137,29 @@ protected:
   std::vector<std::shared_ptr<LightWeightCell>> raw_cells_;
   std::vector<std::shared_ptr<LightWeightCell>> raw_boundary_cells_;
   std::vector<std::set<uint64_t>> vertex_cell_subscriptions_;
+  double connectivity_build_time_ = -1.0;
+};
+
+/**
+ * Part of an unpartitioned mesh that is read by a single location. The locations read disjoint,
+ * contiguous ranges of the cells, in the order of the global cell ids, and disjoint sets of the
+ * vertices. The faces of the cells are not connected.
+ */
+struct UnpartitionedMeshSlab
+{
+  unsigned int dimension = 0;
+  MeshType mesh_type = UNSTRUCTURED;
+
+  size_t num_global_cells = 0;
+  /// Global id of the first cell of the slab.
+  uint64_t first_cell_global_id = 0;
+  std::vector<UnpartitionedMesh::LightWeightCell> cells;
+  /// Boundary elements, whose block ids are the boundary ids of the cell faces they match.
+  std::vector<UnpartitionedMesh::LightWeightCell> boundary_cells;
+
+  size_t num_global_vertices = 0;
+  std::vector<uint64_t> vertex_ids;
+  std::vector<Vector3> vertices;
 };
 
 } // namespace opensn
@@ -4,6 +4,7 @@
 #pragma once
 
 #include "hdf5.h"
+#include <algorithm>
 #include <vector>
 #include <string>
 
@@ -141,6 +142,110 @@ H5WriteDataset1D(hid_t id, const std::string& name, std::vector<T> data)
   return success;
 }
 
+/**
+ * Creates a 1D dataset of `global_size` elements and writes `data` to the elements
+ * `[offset, offset + data.size())`. In parallel, every rank must call this with the same
+ * `global_size`. Datasets are chunked and, if `compression_level > 0`, deflate compressed.
+ */
+template <typename T>
+bool
+H5WriteDatasetSlab1D(hid_t id,
+                     const std::string& name,
+                     hsize_t global_size,
+                     hsize_t offset,
+                     const std::vector<T>& data,
+                     unsigned int compression_level = 0,
+                     hid_t xfer_plist = H5P_DEFAULT)
+{
+  bool success = false;
+
+  hsize_t dim[1] = {global_size};
+  auto filespace = H5Screate_simple(1, dim, dim);
+  if (filespace == H5I_INVALID_HID)
+    return false;
+
+  auto create_plist = H5Pcreate(H5P_DATASET_CREATE);
+  if (global_size > 0)
+  {
+    const hsize_t max_chunk_size = 1 << 16;
+    hsize_t chunk[1] = {std::min(global_size, max_chunk_size)};
+    H5Pset_chunk(create_plist, 1, chunk);
+    if (compression_level > 0)
+      H5Pset_deflate(create_plist, compression_level);
+  }
+
+  auto dataset = H5Dcreate2(
+    id, name.c_str(), get_datatype<T>(), filespace, H5P_DEFAULT, create_plist, H5P_DEFAULT);
+  if (dataset != H5I_INVALID_HID)
+  {
+    hsize_t count[1] = {data.size()};
+    auto memspace = H5Screate_simple(1, count, count);
+    if (data.empty())
+    {
+      H5Sselect_none(filespace);
+      H5Sselect_none(memspace);
+    }
+    else
+    {
+      hsize_t start[1] = {offset};
+      H5Sselect_hyperslab(filespace, H5S_SELECT_SET, start, nullptr, count, nullptr);
+    }
+
+    if (H5Dwrite(dataset, get_datatype<T>(), memspace, filespace, xfer_plist, data.data()) >= 0)
+      success = true;
+
+    H5Sclose(memspace);
+    H5Dclose(dataset);
+  }
+  H5Pclose(create_plist);
+  H5Sclose(filespace);
+
+  return success;
+}
+
+/// Reads the elements `[offset, offset + count)` of a 1D dataset.
+template <typename T>
+bool
+H5ReadDatasetSlab1D(
+  hid_t id, const std::string& name, hsize_t offset, hsize_t count, std::vector<T>& data)
+{
+  bool success = false;
+
+  data.resize(count);
+  auto dataset = H5Dopen2(id, name.c_str(), H5P_DEFAULT);
+  if (dataset != H5I_INVALID_HID)
+  {
+    auto filespace = H5Dget_space(dataset);
+    if (filespace != H5I_INVALID_HID)
+    {
+      hsize_t dims[1] = {count};
+      auto memspace = H5Screate_simple(1, dims, dims);
+      if (count == 0)
+      {
+        H5Sselect_none(filespace);
+        H5Sselect_none(memspace);
+      }
+      else
+      {
+        hsize_t start[1] = {offset};
+        H5Sselect_hyperslab(filespace, H5S_SELECT_SET, start, nullptr, dims, nullptr);
+      }
+
+      if (H5Dread(dataset, get_datatype<T>(), memspace, filespace, H5P_DEFAULT, data.data()) >= 0)
+        success = true;
+
+      H5Sclose(memspace);
+      H5Sclose(filespace);
+    }
+    H5Dclose(dataset);
+  }
+
+  if (not success)
+    data.clear();
+
+  return success;
+}
+
 template <typename T>
 bool
 H5CreateAttribute(hid_t id, const std::string& name, T& data)
@@ -0,0 +1,126 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "framework/utils/thread_pool.h"
+#include <stdexcept>
+
+namespace opensn
+{
+
+ThreadPool::ThreadPool(unsigned int num_threads) : num_threads_(num_threads)
+{
+  if (num_threads_ == 0)
+    throw std::invalid_argument("ThreadPool: The number of threads must be at least 1.");
+
+  workers_.reserve(num_threads_ - 1);
+  for (unsigned int t = 1; t < num_threads_; ++t)
+    workers_.emplace_back(&ThreadPool::WorkerLoop, this, t);
+}
+
+ThreadPool::~ThreadPool()
+{
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    shutdown_ = true;
+  }
+  work_available_.notify_all();
+  for (auto& worker : workers_)
+    worker.join();
+}
+
+void
+ThreadPool::ParallelFor(size_t num_items, const TaskFunction& func)
+{
+  if (num_items == 0)
+    return;
+
+  // Nothing to share, execute inline
+  if (num_threads_ == 1 or num_items == 1)
+  {
+    for (size_t i = 0; i < num_items; ++i)
+      func(i, 0);
+    return;
+  }
+
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    job_ = &func;
+    job_size_ = num_items;
+    next_item_ = 0;
+    num_items_done_ = 0;
+    exception_ = nullptr;
+    ++generation_;
+  }
+  work_available_.notify_all();
+
+  ProcessItems(0);
+
+  std::exception_ptr exception;
+  {
+    std::unique_lock<std::mutex> lock(mutex_);
+    work_done_.wait(lock, [this] { return num_items_done_ == job_size_; });
+    job_ = nullptr;
+    job_size_ = 0;
+    exception = exception_;
+  }
+
+  if (exception)
+    std::rethrow_exception(exception);
+}
+
+void
+ThreadPool::WorkerLoop(unsigned int thread_id)
+{
+  size_t last_generation = 0;
+  while (true)
+  {
+    {
+      std::unique_lock<std::mutex> lock(mutex_);
+      work_available_.wait(
+        lock, [this, last_generation] { return shutdown_ or generation_ != last_generation; });
+      if (shutdown_)
+        return;
+      last_generation = generation_;
+    }
+    ProcessItems(thread_id);
+  }
+}
+
+void
+ThreadPool::ProcessItems(unsigned int thread_id)
+{
+  while (true)
+  {
+    size_t item = 0;
+    const TaskFunction* job = nullptr;
+    {
+      std::lock_guard<std::mutex> lock(mutex_);
+      if (job_ == nullptr or next_item_ >= job_size_)
+        return;
+      item = next_item_++;
+      job = job_;
+    }
+
+    std::exception_ptr exception;
+    try
+    {
+      (*job)(item, thread_id);
+    }
+    catch (...)
+    {
+      exception = std::current_exception();
+    }
+
+    bool all_done = false;
+    {
+      std::lock_guard<std::mutex> lock(mutex_);
+      if (exception and not exception_)
+        exception_ = exception;
+      all_done = (++num_items_done_ == job_size_);
+    }
+    if (all_done)
+      work_done_.notify_one();
+  }
+}
+
+} // namespace opensn
@@ -0,0 +1,72 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <condition_variable>
+#include <cstddef>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace opensn
+{
+
+/**
+ * A fixed-size pool of worker threads for shared-memory parallelism within an MPI rank.
+ *
+ * Work is submitted as a bulk-synchronous parallel-for. The calling thread participates as
+ * thread 0, so a pool constructed with a single thread executes everything inline without any
+ * synchronization.
+ */
+class ThreadPool
+{
+public:
+  /// Signature of a parallel-for body. The arguments are the item index and the thread id.
+  using TaskFunction = std::function<void(size_t, unsigned int)>;
+
+  /// Creates a pool with `num_threads` threads in total (including the calling thread).
+  explicit ThreadPool(unsigned int num_threads);
+
+  ThreadPool(const ThreadPool&) = delete;
+  ThreadPool& operator=(const ThreadPool&) = delete;
+
+  ~ThreadPool();
+
+  /// Returns the total number of threads, including the calling thread.
+  unsigned int GetNumThreads() const { return num_threads_; }
+
+  /**
+   * Executes `func(i, thread_id)` for every `i` in `[0, num_items)` and returns once all items
+   * have been processed. Items are handed out dynamically, one at a time, so uneven amounts of
+   * work per item are balanced across threads. The first exception thrown by any item is
+   * rethrown on the calling thread.
+   */
+  void ParallelFor(size_t num_items, const TaskFunction& func);
+
+private:
+  /// Main loop of a worker thread.
+  void WorkerLoop(unsigned int thread_id);
+
+  /// Processes items of the current job until none are left.
+  void ProcessItems(unsigned int thread_id);
+
+  const unsigned int num_threads_;
+  std::vector<std::thread> workers_;
+
+  std::mutex mutex_;
+  std::condition_variable work_available_;
+  std::condition_variable work_done_;
+
+  const TaskFunction* job_ = nullptr;
+  size_t job_size_ = 0;
+  size_t next_item_ = 0;
+  size_t num_items_done_ = 0;
+  size_t generation_ = 0;
+  bool shutdown_ = false;
+  std::exception_ptr exception_;
+};
+
+} // namespace opensn
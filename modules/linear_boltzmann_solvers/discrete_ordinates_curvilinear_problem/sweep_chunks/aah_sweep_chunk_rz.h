@@ -16,7 +16,7 @@ class AAHSweepChunkRZ : public SweepChunk
 public:
   AAHSweepChunkRZ(const std::shared_ptr<MeshContinuum> grid,
                   const SpatialDiscretization& discretization_primary,
-                  const std::vector<UnitCellMatrices>& unit_cell_matrices,
+                  const UnitCellMatricesStore& unit_cell_matrices,
                   const std::vector<UnitCellMatrices>& secondary_unit_cell_matrices,
                   std::vector<CellLBSView>& cell_transport_views,
                   const std::vector<double>& densities,
@@ -7,6 +7,7 @@
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/angle_set/cbc_angle_set.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/spds/cbc.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/spds/aah.h"
+#include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/spds/aah_spds_cache.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/fluds/aah_fluds.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/angle_set/aah_angle_set.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep_chunks/aah_sweep_chunk.h"
@@ -16,6 +17,7 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/iterative_methods/wgs_linear_solver.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/iterative_methods/classic_richardson.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/source_functions/source_function.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/source_functions/transient_source_function.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/groupset/lbs_groupset.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "framework/math/quadratures/angular/product_quadrature.h"
@@ -27,6 +29,7 @@
 #include "framework/runtime.h"
 #include "caliper/cali.h"
 #include <iomanip>
+#include <array>
 
 namespace opensn
 {
@@ -168,13 +171,61 @@ DiscreteOrdinatesProblem::InitializeWGSSolvers()
       options_.verbose_inner_iterations,
       sweep_chunk);
 
-    if (groupset.iterative_method == LinearSolver::IterativeMethod::CLASSIC_RICHARDSON)
+    if (groupset.iterative_method == LinearSolver::IterativeMethod::CLASSIC_RICHARDSON or
+        groupset.iterative_method == LinearSolver::IterativeMethod::ANDERSON_RICHARDSON)
       wgs_solvers_.push_back(std::make_shared<ClassicRichardson>(sweep_wgs_context_ptr));
     else
       wgs_solvers_.push_back(std::make_shared<WGSLinearSolver>(sweep_wgs_context_ptr));
   }
 }
 
+void
+DiscreteOrdinatesProblem::EnableTimeDependentTerms(const std::vector<std::vector<double>>& psi_old,
+                                                   const std::vector<double>& precursors_old,
+                                                   double theta_dt)
+{
+  CALI_CXX_MARK_SCOPE("DiscreteOrdinatesProblem::EnableTimeDependentTerms");
+
+  OpenSnInvalidArgumentIf(psi_old.size() != groupsets_.size(),
+                          "The old angular fluxes must be given for every groupset.");
+  OpenSnInvalidArgumentIf(theta_dt <= 0.0, "The time step must be positive.");
+
+  if (not steady_state_source_function_)
+    steady_state_source_function_ = active_set_source_function_;
+
+  using namespace std::placeholders;
+  auto src_function = std::make_shared<TransientSourceFunction>(*this, precursors_old, theta_dt);
+  active_set_source_function_ =
+    std::bind(&SourceFunction::operator(), src_function, _1, _2, _3, _4);
+
+  for (const auto& groupset : groupsets_)
+  {
+    OpenSnInvalidArgumentIf(psi_old[groupset.id].size() != psi_new_local_[groupset.id].size(),
+                            "The old angular fluxes of groupset " + std::to_string(groupset.id) +
+                              " do not match the angular flux unknowns.");
+    auto& context = dynamic_cast<SweepWGSContext&>(GetWGSContext(groupset.id));
+    context.sweep_chunk->SetTimeDependentTerm(&psi_old[groupset.id], 1.0 / theta_dt);
+  }
+}
+
+void
+DiscreteOrdinatesProblem::DisableTimeDependentTerms()
+{
+  CALI_CXX_MARK_SCOPE("DiscreteOrdinatesProblem::DisableTimeDependentTerms");
+
+  if (steady_state_source_function_)
+  {
+    active_set_source_function_ = steady_state_source_function_;
+    steady_state_source_function_ = nullptr;
+  }
+
+  for (const auto& groupset : groupsets_)
+  {
+    auto& context = dynamic_cast<SweepWGSContext&>(GetWGSContext(groupset.id));
+    context.sweep_chunk->SetTimeDependentTerm(nullptr, 0.0);
+  }
+}
+
 void
 DiscreteOrdinatesProblem::ReorientAdjointSolution()
 {
@@ -540,7 +591,7 @@ DiscreteOrdinatesProblem::ComputeLeakage(const std::vector<uint64_t>& boundary_i
     for (const auto& cell : grid_->local_cells)
     {
       const auto& cell_mapping = discretization_->GetCellMapping(cell);
-      const auto& fe_values = unit_cell_matrices_.at(cell.local_id);
+      const auto& fe_values = unit_cell_matrices_[cell.local_id];
 
       unsigned int f = 0;
       for (const auto& face : cell.faces)
@@ -623,115 +674,89 @@ DiscreteOrdinatesProblem::InitializeSweepDataStructures()
   quadrature_spds_map_.clear();
   if (sweep_type_ == "AAH")
   {
-    // Creating an AAH SPDS can be an expensive operation. We break it up into multiple phases so
-    // so that we can distribute the work across MPI ranks:
-    // 1) Initialize the SPDS for each angleset. This is done by all ranks.
-    // 2) For each SPDS, generate the feedback arc set (FAS) for the global sweep graph. Angelsets
-    //    are distributed as evenly as possible across MPI ranks.
-    // 3) Gather the FAS for each SPDS on all ranks.
-    // 4) Build the global sweep task dependency graph (TDG) for each SPDS.
-
-    // Initalize SPDS. All ranks initialize a SPDS for each angleset.
-    log.Log0Verbose1() << program_timer.GetTimeString() << " Initializing AAH SPDS.";
-    for (const auto& [quadrature, info] : quadrature_unq_so_grouping_map_)
+    // Reload the SPDSs cached for the same mesh partition and directions, if all ranks have them
+    std::map<std::shared_ptr<AngularQuadrature>, std::shared_ptr<AAHSPDSCache>> spds_caches;
+    if (not options_.sweep_cache_directory.empty())
     {
-      int id = 0;
-      const auto& unique_so_groupings = info.first;
-      for (const auto& so_grouping : unique_so_groupings)
+      const auto partition_hash = AAHSPDSCache::ComputePartitionHash(*grid_);
+      int num_missing = 0;
+      for (const auto& [quadrature, info] : quadrature_unq_so_grouping_map_)
       {
-        if (so_grouping.empty())
-          continue;
-
-        const size_t master_dir_id = so_grouping.front();
-        const auto& omega = quadrature->omegas[master_dir_id];
-        const auto new_swp_order = std::make_shared<AAH_SPDS>(
-          id, omega, this->grid_, quadrature_allow_cycles_map_[quadrature]);
-        quadrature_spds_map_[quadrature].push_back(new_swp_order);
-        ++id;
+        auto cache = std::make_shared<AAHSPDSCache>(options_.sweep_cache_directory,
+                                                    partition_hash,
+                                                    *quadrature,
+                                                    info.first,
+                                                    quadrature_allow_cycles_map_[quadrature]);
+        auto spds_list = cache->Read(grid_);
+        if (spds_list.empty())
+          ++num_missing;
+        else
+          quadrature_spds_map_[quadrature] = std::move(spds_list);
+        spds_caches[quadrature] = cache;
       }
-    }
+      mpi_comm.all_reduce(num_missing, mpi::op::sum<int>());
 
-    // Generate the global sweep FAS for each SPDS. This is an expensive operation. It is
-    // distributed via MPI so that multiple MPI ranks can compute the FAS for one or more SPDS
-    // independently.
-    log.Log0Verbose1() << program_timer.GetTimeString() << " Build global sweep FAS for each SPDS.";
-    for (const auto& quadrature : quadrature_spds_map_)
-    {
-      for (const auto& spds : quadrature.second)
-      {
-        auto aah_spds = std::static_pointer_cast<AAH_SPDS>(spds);
-        auto id = aah_spds->GetId();
-        if (opensn::mpi_comm.rank() == (id % opensn::mpi_comm.size()))
-          aah_spds->BuildGlobalSweepFAS();
-      }
+      if (num_missing == 0)
+        log.Log() << program_timer.GetTimeString() << " Loaded AAH SPDS from sweep cache "
+                  << options_.sweep_cache_directory << ".";
+      else
+        quadrature_spds_map_.clear();
     }
 
-    // Communicate the FAS for each SPDS to all ranks.
-    log.Log0Verbose1() << program_timer.GetTimeString() << " Gather FAS for each SPDS.";
-    std::vector<int> local_edges_to_remove;
-    for (const auto& quadrature : quadrature_spds_map_)
+    if (quadrature_spds_map_.empty())
     {
-      for (const auto& spds : quadrature.second)
+      // Creating an AAH SPDS can be an expensive operation. We break it up into multiple phases so
+      // that no rank needs the location graphs of all ranks:
+      // 1) Initialize the SPDS for each angleset. This is done by all ranks.
+      // 2) Levelize the global sweep graphs of all SPDSs by exchanging levels between neighboring
+      //    locations. The feedback arc sets (FAS) of the cycles that prevent the levelization are
+      //    computed from the gathered dependencies of the unresolved locations only, distributed
+      //    across MPI ranks, and then gathered on all ranks.
+      // 3) Build the global sweep task dependency graph (TDG) of each SPDS, i.e., the level of
+      //    this location after removing the FAS.
+      Timer setup_timer;
+
+      // Initalize SPDS. All ranks initialize a SPDS for each angleset.
+      log.Log0Verbose1() << program_timer.GetTimeString() << " Initializing AAH SPDS.";
+      std::vector<std::shared_ptr<AAH_SPDS>> aah_spds_list;
+      for (const auto& [quadrature, info] : quadrature_unq_so_grouping_map_)
       {
-        auto aah_spds = std::static_pointer_cast<AAH_SPDS>(spds);
-        auto id = aah_spds->GetId();
-        if ((id % opensn::mpi_comm.size()) == opensn::mpi_comm.rank())
+        int id = 0;
+        const auto& unique_so_groupings = info.first;
+        for (const auto& so_grouping : unique_so_groupings)
         {
-          auto edges_to_remove = aah_spds->GetGlobalSweepFAS();
-          local_edges_to_remove.push_back(id);
-          local_edges_to_remove.push_back(static_cast<int>(edges_to_remove.size()));
-          local_edges_to_remove.insert(
-            local_edges_to_remove.end(), edges_to_remove.begin(), edges_to_remove.end());
+          if (so_grouping.empty())
+            continue;
+
+          const size_t master_dir_id = so_grouping.front();
+          const auto& omega = quadrature->omegas[master_dir_id];
+          const auto new_swp_order = std::make_shared<AAH_SPDS>(
+            id, omega, this->grid_, quadrature_allow_cycles_map_[quadrature]);
+          quadrature_spds_map_[quadrature].push_back(new_swp_order);
+          aah_spds_list.push_back(new_swp_order);
+          ++id;
         }
       }
-    }
 
-    int local_size = static_cast<int>(local_edges_to_remove.size());
-    std::vector<int> receive_counts(opensn::mpi_comm.size(), 0);
-    std::vector<int> displacements(opensn::mpi_comm.size(), 0);
-    mpi_comm.all_gather(local_size, receive_counts);
+      // Generate the global sweep FAS for each SPDS
+      log.Log0Verbose1() << program_timer.GetTimeString()
+                         << " Build global sweep FAS for each SPDS.";
+      AAH_SPDS::BuildGlobalSweepFAS(aah_spds_list);
 
-    int total_size = 0;
-    for (auto i = 0; i < receive_counts.size(); ++i)
-    {
-      displacements[i] = total_size;
-      total_size += receive_counts[i];
-    }
+      // Build TDG for each SPDS on all ranks.
+      log.Log0Verbose1() << program_timer.GetTimeString() << " Build global sweep TDGs.";
+      AAH_SPDS::BuildGlobalSweepTDG(aah_spds_list);
 
-    std::vector<int> global_edges_to_remove(total_size, 0);
-    mpi_comm.all_gather(
-      local_edges_to_remove, global_edges_to_remove, receive_counts, displacements);
-
-    // Unpack the gathered data and update SPDS on all ranks.
-    int offset = 0;
-    while (offset < global_edges_to_remove.size())
-    {
-      int spds_id = global_edges_to_remove[offset++];
-      int num_edges = global_edges_to_remove[offset++];
-      std::vector<int> edges;
-      for (auto i = 0; i < num_edges; ++i)
-        edges.emplace_back(global_edges_to_remove[offset++]);
+      double setup_time = setup_timer.GetTime() / 1000.0;
+      mpi_comm.all_reduce(setup_time, mpi::op::max<double>());
+      log.Log() << program_timer.GetTimeString() << " SPDS setup time " << setup_time << " s for "
+                << aah_spds_list.size() << " AAH SPDS.";
 
-      for (const auto& quadrature : quadrature_spds_map_)
-      {
-        for (const auto& spds : quadrature.second)
-        {
-          auto aah_spds = std::static_pointer_cast<AAH_SPDS>(spds);
-          if (aah_spds->GetId() == spds_id)
-          {
-            aah_spds->SetGlobalSweepFAS(edges);
-            break;
-          }
-        }
-      }
+      // Store the SPDSs for later runs
+      for (const auto& [quadrature, cache] : spds_caches)
+        cache->Write(quadrature_spds_map_[quadrature]);
     }
 
-    // Build TDG for each SPDS on all ranks.
-    log.Log0Verbose1() << program_timer.GetTimeString() << " Build global sweep TDGs.";
-    for (const auto& quadrature : quadrature_spds_map_)
-      for (const auto& spds : quadrature.second)
-        std::static_pointer_cast<AAH_SPDS>(spds)->BuildGlobalSweepTDG();
-
     // Print ghosted sweep graph if requested
     if (not verbose_sweep_angles_.empty())
     {
@@ -799,9 +824,53 @@ DiscreteOrdinatesProblem::InitializeSweepDataStructures()
     }
   }
 
+  InitializeStreamingOperatorCaches();
+
   log.Log() << program_timer.GetTimeString() << " Done initializing sweep datastructures.\n";
 }
 
+void
+DiscreteOrdinatesProblem::InitializeStreamingOperatorCaches()
+{
+  CALI_CXX_MARK_SCOPE("DiscreteOrdinatesProblem::InitializeStreamingOperatorCaches");
+
+  quadrature_streaming_operator_cache_map_.clear();
+  if (options_.streaming_operator_cache_size <= 0)
+    return;
+
+  // The budget is shared by the caches of all quadratures
+  size_t remaining_memory = static_cast<size_t>(options_.streaming_operator_cache_size) << 20;
+  size_t local_memory = 0;
+  size_t num_local_cached_cells = 0;
+  for (const auto& [quadrature, spds_list] : quadrature_spds_map_)
+  {
+    auto cache = std::make_shared<StreamingOperatorCache>(
+      *grid_, unit_cell_matrices_, *quadrature, remaining_memory);
+    const size_t memory = cache->GetMemoryUsage();
+    remaining_memory -= std::min(memory, remaining_memory);
+    local_memory += memory;
+    num_local_cached_cells += cache->GetNumCachedCells();
+    quadrature_streaming_operator_cache_map_[quadrature] = cache;
+  }
+
+  // Report the memory consumed by the caches
+  const size_t num_local_cells = grid_->local_cells.size() * quadrature_spds_map_.size();
+  std::array<size_t, 3> local_stats = {local_memory, num_local_cached_cells, num_local_cells};
+  std::array<size_t, 3> global_stats = {0, 0, 0};
+  mpi_comm.all_reduce(local_stats.data(), 3, global_stats.data(), mpi::op::sum<size_t>());
+  size_t max_local_memory = 0;
+  mpi_comm.all_reduce(local_memory, max_local_memory, mpi::op::max<size_t>());
+
+  const double MB = 1024.0 * 1024.0;
+  log.Log() << "Streaming operator cache: " << std::fixed << std::setprecision(2)
+            << static_cast<double>(global_stats[0]) / MB << " MB total, "
+            << static_cast<double>(max_local_memory) / MB << " MB max per rank, " << global_stats[1]
+            << " of " << global_stats[2] << " cells cached.";
+  if (global_stats[1] < global_stats[2])
+    log.Log0Warning() << "The streaming operator cache is limited by "
+                         "streaming_operator_cache_size. Uncached cells are evaluated on the fly.";
+}
+
 std::pair<UniqueSOGroupings, DirIDToSOMap>
 DiscreteOrdinatesProblem::AssociateSOsAndDirections(const std::shared_ptr<MeshContinuum> grid,
                                                     const AngularQuadrature& quadrature,
@@ -1047,7 +1116,8 @@ DiscreteOrdinatesProblem::InitFluxDataStructures(LBSGroupset& groupset)
                                                         fluds,
                                                         angle_indices,
                                                         sweep_boundaries_,
-                                                        *grid_local_comm_set_);
+                                                        *grid_local_comm_set_,
+                                                        options_.cbc_ready_queue);
 
         angle_set_group.GetAngleSets().push_back(angle_set);
       }
@@ -1083,6 +1153,9 @@ DiscreteOrdinatesProblem::SetSweepChunk(LBSGroupset& groupset)
                                                        block_id_to_xs_map_,
                                                        num_moments_,
                                                        max_cell_dof_count_);
+    if (quadrature_streaming_operator_cache_map_.count(groupset.quadrature) > 0)
+      sweep_chunk->SetStreamingOperatorCache(
+        quadrature_streaming_operator_cache_map_.at(groupset.quadrature));
 
     return sweep_chunk;
   }
@@ -1100,6 +1173,9 @@ DiscreteOrdinatesProblem::SetSweepChunk(LBSGroupset& groupset)
                                                        block_id_to_xs_map_,
                                                        num_moments_,
                                                        max_cell_dof_count_);
+    if (quadrature_streaming_operator_cache_map_.count(groupset.quadrature) > 0)
+      sweep_chunk->SetStreamingOperatorCache(
+        quadrature_streaming_operator_cache_map_.at(groupset.quadrature));
 
     return sweep_chunk;
   }
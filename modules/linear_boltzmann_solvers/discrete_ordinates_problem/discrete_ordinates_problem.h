@@ -57,6 +57,25 @@ public:
   std::map<uint64_t, std::vector<double>>
   ComputeLeakage(const std::vector<uint64_t>& boundary_ids) const;
 
+  /**
+   * Adds the time derivative of a theta-scheme time step to the sweeps and sources, so that a
+   * solve gives the solution at \f$ t^{n+\theta} \f$. The total cross sections are augmented by
+   * \f$ 1/(v \theta \Delta t) \f$ and the sources by \f$ \psi^n/(v \theta \Delta t) \f$, and the
+   * delayed fission sources account for the precursor decay over the time step.
+   *
+   * \param psi_old The angular fluxes of each groupset at the start of the time step.
+   * \param precursors_old The precursor concentrations at the start of the time step.
+   * \param theta_dt The product \f$ \theta \Delta t \f$.
+   *
+   * Both vectors must remain valid until DisableTimeDependentTerms is called.
+   */
+  void EnableTimeDependentTerms(const std::vector<std::vector<double>>& psi_old,
+                                const std::vector<double>& precursors_old,
+                                double theta_dt);
+
+  /// Restores the steady-state sweeps and sources.
+  void DisableTimeDependentTerms();
+
 protected:
   explicit DiscreteOrdinatesProblem(const std::string& name,
                                     std::shared_ptr<MeshContinuum> grid_ptr);
@@ -78,6 +97,12 @@ protected:
    */
   void InitializeSweepDataStructures();
 
+  /**
+   * Builds the streaming operator cache of each quadrature, subject to the memory budget given by
+   * the `streaming_operator_cache_size` option, and reports the memory it consumes.
+   */
+  void InitializeStreamingOperatorCaches();
+
   /// Initializes fluds_ data structures.
   void InitFluxDataStructures(LBSGroupset& groupset);
 
@@ -93,6 +118,11 @@ protected:
     quadrature_spds_map_;
   std::map<std::shared_ptr<AngularQuadrature>, std::vector<std::unique_ptr<FLUDSCommonData>>>
     quadrature_fluds_commondata_map_;
+  std::map<std::shared_ptr<AngularQuadrature>, std::shared_ptr<StreamingOperatorCache>>
+    quadrature_streaming_operator_cache_map_;
+
+  /// Source function of steady-state solves, while the time-dependent terms are enabled.
+  SetSourceFunction steady_state_source_function_;
 
   std::vector<size_t> verbose_sweep_angles_;
   const std::string sweep_type_;
@@ -7,6 +7,7 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/preconditioning/lbs_shell_operations.h"
 #include "framework/runtime.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include <petscksp.h>
 #include "caliper/cali.h"
 #include <iomanip>
@@ -29,7 +30,8 @@ SweepWGSContext::SweepWGSContext(DiscreteOrdinatesProblem& lbs_problem,
     sweep_scheduler(lbs_problem.GetSweepType() == "AAH" ? SchedulingAlgorithm::DEPTH_OF_GRAPH
                                                         : SchedulingAlgorithm::FIRST_IN_FIRST_OUT,
                     *groupset.angle_agg,
-                    *sweep_chunk)
+                    *sweep_chunk,
+                    groupset.num_threads)
 {
 }
 
@@ -43,8 +45,8 @@ SweepWGSContext::PreSetupCallback()
               << "********** Solving groupset " << groupset.id << " with "
               << LinearSolver::IterativeMethodName(groupset.iterative_method) << ".\n\n"
               << "Quadrature number of angles: " << groupset.quadrature->abscissae.size() << "\n"
-              << "Groups " << groupset.groups.front().id << " " << groupset.groups.back().id
-              << "\n\n";
+              << "Groups " << groupset.groups.front().id << " " << groupset.groups.back().id << "\n"
+              << "Sweep threads per rank: " << sweep_scheduler.GetNumThreads() << "\n\n";
 }
 
 void
@@ -113,6 +115,7 @@ SweepWGSContext::ApplyInverseTransportOperator(SourceFlags scope)
   const bool zero_incoming_delayed_psi = (scope & ZERO_INCOMING_DELAYED_PSI);
   dynamic_cast<DiscreteOrdinatesProblem&>(lbs_problem).ZeroOutflowBalanceVars(groupset);
   sweep_scheduler.PrepareForSweep(use_bndry_source_flag, zero_incoming_delayed_psi);
+  sweep_chunk->SetTimeSourceActiveFlag(scope & APPLY_FIXED_SOURCES);
 
   high_resolution_clock::time_point sweep_start = high_resolution_clock::now();
   sweep_scheduler.Sweep();
@@ -120,6 +123,7 @@ SweepWGSContext::ApplyInverseTransportOperator(SourceFlags scope)
 
   double sweep_time = (duration_cast<nanoseconds>(sweep_end - sweep_start).count()) / 1.0e+9;
   sweep_times.push_back(sweep_time);
+  Telemetry::GetInstance().AddTime(Telemetry::SWEEP, sweep_time);
 }
 
 void
@@ -4,6 +4,7 @@
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/angle_set/aah_angle_set.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep_chunks/sweep_chunk.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/runtime.h"
 #include "caliper/cali.h"
 
@@ -34,15 +35,21 @@ AAH_AngleSet::AngleSetAdvance(SweepChunk& sweep_chunk, AngleSetStatus permission
 {
   CALI_CXX_MARK_SCOPE("AAH_AngleSet::AngleSetAdvance");
 
+  // Polling for sweep messages is timed as communication
   if (executed_)
   {
+    Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
     if (not async_comm_.DoneSending())
       async_comm_.ClearDownstreamBuffers();
     return AngleSetStatus::FINISHED;
   }
 
   // Check upstream data available
-  AngleSetStatus status = async_comm_.ReceiveUpstreamPsi(static_cast<int>(this->GetID()));
+  AngleSetStatus status = AngleSetStatus::RECEIVING;
+  {
+    Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
+    status = async_comm_.ReceiveUpstreamPsi(static_cast<int>(this->GetID()));
+  }
 
   // Also check boundaries
   for (auto& [bid, boundary] : boundaries_)
@@ -56,25 +63,39 @@ AAH_AngleSet::AngleSetAdvance(SweepChunk& sweep_chunk, AngleSetStatus permission
     return status;
   else if (status == AngleSetStatus::READY_TO_EXECUTE and permission == AngleSetStatus::EXECUTE)
   {
-    async_comm_.InitializeLocalAndDownstreamBuffers();
-
+    PrepareExecution();
     sweep_chunk.Sweep(*this); // Execute chunk
+    FinalizeExecution();
 
-    // Send outgoing psi and clear local and receive buffers
-    async_comm_.SendDownstreamPsi(static_cast<int>(this->GetID()));
-    async_comm_.ClearLocalAndReceiveBuffers();
-
-    // Update boundary readiness
-    for (auto& [bid, boundary] : boundaries_)
-      boundary->UpdateAnglesReadyStatus(angles_);
-
-    executed_ = true;
     return AngleSetStatus::FINISHED;
   }
   else
     return AngleSetStatus::READY_TO_EXECUTE;
 }
 
+void
+AAH_AngleSet::PrepareExecution()
+{
+  async_comm_.InitializeLocalAndDownstreamBuffers();
+}
+
+void
+AAH_AngleSet::FinalizeExecution()
+{
+  // Send outgoing psi and clear local and receive buffers
+  {
+    Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
+    async_comm_.SendDownstreamPsi(static_cast<int>(this->GetID()));
+  }
+  async_comm_.ClearLocalAndReceiveBuffers();
+
+  // Update boundary readiness
+  for (auto& [bid, boundary] : boundaries_)
+    boundary->UpdateAnglesReadyStatus(angles_);
+
+  executed_ = true;
+}
+
 AngleSetStatus
 AAH_AngleSet::FlushSendBuffers()
 {
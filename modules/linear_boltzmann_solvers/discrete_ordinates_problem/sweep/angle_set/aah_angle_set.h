@@ -33,6 +33,10 @@ public:
 
   AngleSetStatus AngleSetAdvance(SweepChunk& sweep_chunk, AngleSetStatus permission) override;
 
+  void PrepareExecution() override;
+
+  void FinalizeExecution() override;
+
   AngleSetStatus FlushSendBuffers() override;
 
   void ResetSweepBuffers() override;
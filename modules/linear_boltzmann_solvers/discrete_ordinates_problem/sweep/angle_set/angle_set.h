@@ -82,6 +82,18 @@ public:
   /// This function advances the work stages of an angleset.
   virtual AngleSetStatus AngleSetAdvance(SweepChunk& sweep_chunk, AngleSetStatus permission) = 0;
 
+  /**
+   * Prepares a ready angleset for execution. This is the first stage of the split-phase execution
+   * used by threaded sweep schedulers and is always called from the scheduling thread.
+   */
+  virtual void PrepareExecution() { OpenSnLogicalError("Method not implemented"); }
+
+  /**
+   * Completes the execution of an angleset once its sweep chunk has executed, i.e., sends
+   * downstream data and updates boundary readiness. Always called from the scheduling thread.
+   */
+  virtual void FinalizeExecution() { OpenSnLogicalError("Method not implemented"); }
+
   virtual AngleSetStatus FlushSendBuffers() = 0;
 
   /// Resets the sweep buffer.
@@ -8,6 +8,7 @@
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "framework/math/math_range.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/runtime.h"
 #include "caliper/cali.h"
 
@@ -20,11 +21,15 @@ CBC_AngleSet::CBC_AngleSet(size_t id,
                            std::shared_ptr<FLUDS>& fluds,
                            const std::vector<size_t>& angle_indices,
                            std::map<uint64_t, std::shared_ptr<SweepBoundary>>& boundaries,
-                           const MPICommunicatorSet& comm_set)
+                           const MPICommunicatorSet& comm_set,
+                           bool use_ready_queue)
   : AngleSet(id, num_groups, spds, fluds, angle_indices, boundaries),
     cbc_spds_(dynamic_cast<const CBC_SPDS&>(spds_)),
-    async_comm_(id, *fluds, comm_set)
+    async_comm_(id, *fluds, comm_set),
+    use_ready_queue_(use_ready_queue)
 {
+  if (use_ready_queue_)
+    ResetReadyQueue();
 }
 
 AsynchronousCommunicator*
@@ -33,6 +38,22 @@ CBC_AngleSet::GetCommunicator()
   return static_cast<AsynchronousCommunicator*>(&async_comm_);
 }
 
+void
+CBC_AngleSet::ResetReadyQueue()
+{
+  const auto& task_list = cbc_spds_.GetTaskList();
+  num_dependencies_.resize(task_list.size());
+  ready_tasks_.clear();
+  ready_tasks_.reserve(task_list.size());
+  next_ready_task_ = 0;
+  for (size_t i = 0; i < task_list.size(); ++i)
+  {
+    num_dependencies_[i] = task_list[i].num_dependencies;
+    if (num_dependencies_[i] == 0)
+      ready_tasks_.push_back(i);
+  }
+}
+
 AngleSetStatus
 CBC_AngleSet::AngleSetAdvance(SweepChunk& sweep_chunk, AngleSetStatus permission)
 {
@@ -41,17 +62,84 @@ CBC_AngleSet::AngleSetAdvance(SweepChunk& sweep_chunk, AngleSetStatus permission
   if (executed_)
     return AngleSetStatus::FINISHED;
 
+  if (not use_ready_queue_)
+    return AdvanceByScan(sweep_chunk);
+
+  sweep_chunk.SetAngleSet(*this);
+
+  // Each task becomes ready exactly once per sweep, when its last dependency is resolved.
+  // Polling for sweep messages is timed as communication.
+  {
+    Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
+    for (const uint64_t task_number : async_comm_.ReceiveData())
+      if (--num_dependencies_[task_number] == 0)
+        ready_tasks_.push_back(task_number);
+
+    async_comm_.SendData();
+  }
+
+  // Check if boundaries allow for execution
+  for (auto& [bid, boundary] : boundaries_)
+    if (not boundary->CheckAnglesReadyStatus(angles_))
+      return AngleSetStatus::NOT_FINISHED;
+
+  const auto& task_list = cbc_spds_.GetTaskList();
+  size_t num_batched_tasks = 0;
+  while (next_ready_task_ < ready_tasks_.size())
+  {
+    const auto& cell_task = task_list[ready_tasks_[next_ready_task_++]];
+    sweep_chunk.SetCell(cell_task.cell_ptr, *this);
+    sweep_chunk.Sweep(*this);
+
+    for (const uint64_t local_task_num : cell_task.successors)
+      if (--num_dependencies_[local_task_num] == 0)
+        ready_tasks_.push_back(local_task_num);
+
+    if (++num_batched_tasks == SEND_BATCH_SIZE)
+    {
+      Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
+      async_comm_.SendData();
+      num_batched_tasks = 0;
+    }
+  }
+
+  bool all_messages_sent = false;
+  {
+    Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
+    all_messages_sent = async_comm_.SendData();
+  }
+
+  // All tasks have been queued and the queue is empty
+  if (ready_tasks_.size() == task_list.size() and all_messages_sent)
+  {
+    // Update boundary readiness
+    for (auto& [bid, boundary] : boundaries_)
+      boundary->UpdateAnglesReadyStatus(angles_);
+    executed_ = true;
+    return AngleSetStatus::FINISHED;
+  }
+
+  return AngleSetStatus::NOT_FINISHED;
+}
+
+AngleSetStatus
+CBC_AngleSet::AdvanceByScan(SweepChunk& sweep_chunk)
+{
   if (current_task_list_.empty())
     current_task_list_ = cbc_spds_.GetTaskList();
 
   sweep_chunk.SetAngleSet(*this);
 
-  auto tasks_who_received_data = async_comm_.ReceiveData();
+  // Polling for sweep messages is timed as communication
+  {
+    Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
+    auto tasks_who_received_data = async_comm_.ReceiveData();
 
-  for (const uint64_t task_number : tasks_who_received_data)
-    --current_task_list_[task_number].num_dependencies;
+    for (const uint64_t task_number : tasks_who_received_data)
+      --current_task_list_[task_number].num_dependencies;
 
-  async_comm_.SendData();
+    async_comm_.SendData();
+  }
 
   // Check if boundaries allow for execution
   for (auto& [bid, boundary] : boundaries_)
@@ -77,13 +165,19 @@ CBC_AngleSet::AngleSetAdvance(SweepChunk& sweep_chunk, AngleSetStatus permission
 
         cell_task.completed = true;
         a_task_executed = true;
+        Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
         async_comm_.SendData();
       }
     } // for cell_task
+    Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
     async_comm_.SendData();
   }
 
-  const bool all_messages_sent = async_comm_.SendData();
+  bool all_messages_sent = false;
+  {
+    Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
+    all_messages_sent = async_comm_.SendData();
+  }
 
   if (all_tasks_completed and all_messages_sent)
   {
@@ -100,7 +194,10 @@ CBC_AngleSet::AngleSetAdvance(SweepChunk& sweep_chunk, AngleSetStatus permission
 void
 CBC_AngleSet::ResetSweepBuffers()
 {
-  current_task_list_.clear();
+  if (use_ready_queue_)
+    ResetReadyQueue();
+  else
+    current_task_list_.clear();
   async_comm_.Reset();
   fluds_->ClearLocalAndReceivePsi();
   executed_ = false;
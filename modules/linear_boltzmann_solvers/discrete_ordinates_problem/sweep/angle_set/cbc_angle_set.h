@@ -12,12 +12,32 @@ namespace opensn
 struct Task;
 class CBC_SPDS;
 
+/**
+ * Angle set that sweeps cell by cell, executing each cell as soon as its upwind data is available.
+ *
+ * By default, the cells are executed from a ready queue: the dependency counter of each cell is
+ * decremented as upwind cells are executed and upwind messages are received, and a cell is queued
+ * when its counter reaches zero, so that each advance only visits executable cells. Outgoing
+ * messages are sent in batches of cells. Alternatively, the tasks are executed by repeatedly
+ * scanning the whole task list for executable cells, which is kept for comparison.
+ */
 class CBC_AngleSet : public AngleSet
 {
 protected:
   const CBC_SPDS& cbc_spds_;
+  /// Copy of the task list of the SPDS that is consumed by the scan over all tasks
   std::vector<Task> current_task_list_;
   CBC_ASynchronousCommunicator async_comm_;
+  const bool use_ready_queue_;
+  /// Number of unresolved dependencies of each task
+  std::vector<unsigned int> num_dependencies_;
+  /// Tasks whose dependencies are resolved, in the order they became ready
+  std::vector<uint64_t> ready_tasks_;
+  /// Position of the next task to execute in the ready queue
+  size_t next_ready_task_ = 0;
+
+  /// Number of tasks executed between attempts to send the outgoing messages
+  static constexpr size_t SEND_BATCH_SIZE = 32;
 
 public:
   CBC_AngleSet(size_t id,
@@ -26,7 +46,8 @@ public:
                std::shared_ptr<FLUDS>& fluds,
                const std::vector<size_t>& angle_indices,
                std::map<uint64_t, std::shared_ptr<SweepBoundary>>& boundaries,
-               const MPICommunicatorSet& comm_set);
+               const MPICommunicatorSet& comm_set,
+               bool use_ready_queue = true);
 
   AsynchronousCommunicator* GetCommunicator() override;
 
@@ -61,6 +82,13 @@ public:
                        uint64_t cell_local_id,
                        unsigned int face_num,
                        unsigned int fi) override;
+
+private:
+  /// Resets the dependency counters from the task list and queues the tasks without dependencies.
+  void ResetReadyQueue();
+
+  /// Advances the angle set by repeatedly scanning the task list for executable tasks.
+  AngleSetStatus AdvanceByScan(SweepChunk& sweep_chunk);
 };
 
 } // namespace opensn
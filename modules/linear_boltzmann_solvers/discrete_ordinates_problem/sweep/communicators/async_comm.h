@@ -24,11 +24,15 @@ public:
 
   virtual ~AsynchronousCommunicator() = default;
 
-  virtual std::vector<double>& InitGetDownwindMessageData(int location_id,
-                                                          uint64_t cell_global_id,
-                                                          unsigned int face_id,
-                                                          size_t angle_set_id,
-                                                          size_t data_size)
+  /**
+   * Returns where the `data_size` angular flux values of a face, to be sent to the downwind cell
+   * on another location, are written. The values are zero when first requested.
+   */
+  virtual double* InitGetDownwindMessageData(int location_id,
+                                             uint64_t cell_global_id,
+                                             unsigned int face_id,
+                                             size_t angle_set_id,
+                                             size_t data_size)
   {
     OpenSnLogicalError("Method not implemented");
   }
@@ -4,27 +4,130 @@
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/communicators/cbc_async_comm.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/spds/spds.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/fluds/fluds.h"
+#include "framework/math/spatial_discretization/spatial_discretization.h"
+#include "framework/math/spatial_discretization/cell_mappings/cell_mapping.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "framework/mpi/mpi_comm_set.h"
 #include "framework/logging/log.h"
 #include "framework/runtime.h"
 #include "caliper/cali.h"
+#include <algorithm>
+#include <cstring>
+#include <limits>
 
 namespace opensn
 {
 
-std::vector<double>&
+namespace
+{
+
+/**
+ * Writes the header of the data of a face. The bits of the cell global id, and of the face id and
+ * number of values, are stored in the two values of the header.
+ */
+void
+WriteHeader(double* header, uint64_t cell_global_id, unsigned int face_id, size_t num_values)
+{
+  const uint64_t face_and_size = (static_cast<uint64_t>(face_id) << 32) | num_values;
+  std::memcpy(&header[0], &cell_global_id, sizeof(uint64_t));
+  std::memcpy(&header[1], &face_and_size, sizeof(uint64_t));
+}
+
+void
+ReadHeader(const double* header,
+           uint64_t& cell_global_id,
+           unsigned int& face_id,
+           size_t& num_values)
+{
+  uint64_t face_and_size = 0;
+  std::memcpy(&cell_global_id, &header[0], sizeof(uint64_t));
+  std::memcpy(&face_and_size, &header[1], sizeof(uint64_t));
+  face_id = static_cast<unsigned int>(face_and_size >> 32);
+  num_values = static_cast<size_t>(face_and_size & 0xffffffffULL);
+}
+
+} // namespace
+
+CBC_ASynchronousCommunicator::CBC_ASynchronousCommunicator(size_t angle_set_id,
+                                                           FLUDS& fluds,
+                                                           const MPICommunicatorSet& comm_set)
+  : AsynchronousCommunicator(fluds, comm_set),
+    angle_set_id_(angle_set_id),
+    cbc_fluds_(dynamic_cast<CBC_FLUDS&>(fluds))
+{
+  const auto& spds = fluds_.GetSPDS();
+  const auto& grid = *spds.GetGrid();
+
+  for (const int location_id : spds.GetLocationSuccessors())
+    outgoing_locations_.push_back({location_id, {}});
+
+  // Size the receive buffer of each predecessor location for the data of all the faces through
+  // which it is upwind of this location
+  const auto& location_dependencies = spds.GetLocationDependencies();
+  std::map<int, size_t> location_index;
+  incoming_locations_.resize(location_dependencies.size());
+  for (size_t i = 0; i < location_dependencies.size(); ++i)
+  {
+    location_index[location_dependencies[i]] = i;
+    incoming_locations_[i].source =
+      comm_set_.MapIonJ(location_dependencies[i], opensn::mpi_comm.rank());
+  }
+
+  const auto& sdm = cbc_fluds_.GetSpatialDiscretization();
+  const auto& face_orientations = spds.GetCellFaceOrientations();
+  std::vector<size_t> capacities(incoming_locations_.size(), 0);
+  for (const auto& cell : grid.local_cells)
+  {
+    const auto& cell_mapping = sdm.GetCellMapping(cell);
+    for (size_t f = 0; f < cell.faces.size(); ++f)
+    {
+      const auto& face = cell.faces[f];
+      if (face_orientations[cell.local_id][f] != FaceOrientation::INCOMING or
+          not face.has_neighbor or face.IsNeighborLocal(&grid))
+        continue;
+
+      const size_t i = location_index.at(face.GetNeighborPartitionID(&grid));
+      ++incoming_locations_[i].num_faces;
+      capacities[i] +=
+        HEADER_SIZE + cell_mapping.GetNumFaceNodes(f) * cbc_fluds_.GetNumGroupsAndAngles();
+    }
+  }
+  for (size_t i = 0; i < incoming_locations_.size(); ++i)
+    incoming_locations_[i].data.assign(capacities[i], 0.0);
+}
+
+double*
 CBC_ASynchronousCommunicator::InitGetDownwindMessageData(int location_id,
                                                          uint64_t cell_global_id,
                                                          unsigned int face_id,
                                                          size_t angle_set_id,
                                                          size_t data_size)
 {
-  MessageKey key{location_id, cell_global_id, face_id};
-  std::vector<double>& data = outgoing_message_queue_[key];
-  if (data.empty())
-    data.assign(data_size, 0.0);
-  return data;
+  const MessageKey key{location_id, cell_global_id, face_id};
+  auto face_it = outgoing_faces_.find(key);
+  if (face_it == outgoing_faces_.end())
+  {
+    const auto location_it = std::find_if(outgoing_locations_.begin(),
+                                          outgoing_locations_.end(),
+                                          [location_id](const OutgoingLocation& location)
+                                          { return location.location_id == location_id; });
+    OpenSnLogicalErrorIf(location_it == outgoing_locations_.end(),
+                         "Location " + std::to_string(location_id) +
+                           " is not a successor of this location.");
+    OpenSnLogicalErrorIf(data_size > std::numeric_limits<uint32_t>::max(),
+                         "Face data too large for a sweep message.");
+
+    auto& data = location_it->data;
+    const size_t offset = data.size();
+    data.resize(offset + HEADER_SIZE + data_size, 0.0);
+    WriteHeader(&data[offset], cell_global_id, face_id, data_size);
+
+    const auto l = static_cast<size_t>(location_it - outgoing_locations_.begin());
+    face_it = outgoing_faces_.emplace(key, std::make_pair(l, offset)).first;
+  }
+
+  const auto [l, offset] = face_it->second;
+  return &outgoing_locations_[l].data[offset + HEADER_SIZE];
 }
 
 bool
@@ -32,58 +135,46 @@ CBC_ASynchronousCommunicator::SendData()
 {
   CALI_CXX_MARK_SCOPE("CBC_ASynchronousCommunicator::SendData");
 
-  // First we convert any new outgoing messages from the queue into
-  // buffer messages. We aggregate these messages per location-id
-  // they need to be sent to
-  if (not outgoing_message_queue_.empty())
+  // Send the data aggregated for each location as a single message, in a buffer that is not in
+  // use by a pending send
+  const auto tag = static_cast<int>(angle_set_id_);
+  for (auto& location : outgoing_locations_)
   {
-    std::map<int, BufferItem> locI_buffer_map;
+    if (location.data.empty())
+      continue;
 
-    for (const auto& [msg_key, data] : outgoing_message_queue_)
+    auto buffer = std::find_if(send_buffers_.begin(),
+                               send_buffers_.end(),
+                               [](const SendBuffer& buffer) { return not buffer.in_flight; });
+    if (buffer == send_buffers_.end())
     {
-      const int locI = std::get<0>(msg_key);
-      const uint64_t cell_global_id = std::get<1>(msg_key);
-      const unsigned int face_id = std::get<2>(msg_key);
-      const size_t data_size = data.size();
-
-      BufferItem& buffer_item = locI_buffer_map[locI];
-      buffer_item.destination = locI;
-      auto& buffer_array = buffer_item.data_array;
-      buffer_array.Write(cell_global_id);
-      buffer_array.Write(face_id);
-      buffer_array.Write(data_size);
-      for (const double value : data) // actual psi_data
-        buffer_array.Write(value);
+      send_buffers_.emplace_back();
+      buffer = std::prev(send_buffers_.end());
     }
 
-    for (auto& [locI, buffer] : locI_buffer_map)
-      send_buffer_.push_back(std::move(buffer));
+    // The buffers are swapped, so that the capacity of both is kept
+    buffer->data.swap(location.data);
+    location.data.clear();
 
-    outgoing_message_queue_.clear();
-  } // if there are outgoing messages
+    const int locJ = location.location_id;
+    const auto& comm = comm_set_.LocICommunicator(locJ);
+    const auto dest = comm_set_.MapIonJ(locJ, locJ);
+    buffer->mpi_request =
+      comm.isend(dest, tag, buffer->data.data(), static_cast<int>(buffer->data.size()));
+    buffer->in_flight = true;
+  }
+  outgoing_faces_.clear();
 
-  // Now we attempt to flush items in the send buffer
   bool all_messages_sent = true;
-  for (auto& buffer_item : send_buffer_)
+  for (auto& buffer : send_buffers_)
   {
-    if (not buffer_item.send_initiated)
-    {
-      const int locJ = buffer_item.destination;
-      auto& comm = comm_set_.LocICommunicator(locJ);
-      auto dest = comm_set_.MapIonJ(locJ, locJ);
-      auto tag = static_cast<int>(angle_set_id_);
-      buffer_item.mpi_request = comm.isend(dest, tag, buffer_item.data_array.Data());
-      buffer_item.send_initiated = true;
-    }
-
-    if (not buffer_item.completed)
-    {
-      if (mpi::test(buffer_item.mpi_request))
-        buffer_item.completed = true;
-      else
-        all_messages_sent = false;
-    }
-  } // for item in buffer
+    if (not buffer.in_flight)
+      continue;
+    if (mpi::test(buffer.mpi_request))
+      buffer.in_flight = false;
+    else
+      all_messages_sent = false;
+  }
 
   return all_messages_sent;
 }
@@ -93,44 +184,64 @@ CBC_ASynchronousCommunicator::ReceiveData()
 {
   CALI_CXX_MARK_SCOPE("CBC_ASynchronousCommunicator::ReceiveData");
 
-  using CellFaceKey = std::pair<uint64_t, unsigned int>; // cell_gid + face_id
-  std::map<CellFaceKey, std::vector<double>> received_messages;
   std::vector<uint64_t> cells_who_received_data;
-  auto& location_dependencies = fluds_.GetSPDS().GetLocationDependencies();
-  for (int locJ : location_dependencies)
+  const auto& grid = *fluds_.GetSPDS().GetGrid();
+  auto& received_data = cbc_fluds_.GetDeplocsOutgoingMessages();
+  const auto& comm = comm_set_.LocICommunicator(opensn::mpi_comm.rank());
+  const auto tag = static_cast<int>(angle_set_id_);
+
+  for (auto& location : incoming_locations_)
   {
-    auto& comm = comm_set_.LocICommunicator(opensn::mpi_comm.rank());
-    auto source_rank = comm_set_.MapIonJ(locJ, opensn::mpi_comm.rank());
-    auto tag = static_cast<int>(angle_set_id_);
-    mpi::Status status;
-    if (comm.iprobe(source_rank, tag, status))
+    // A receive is only posted while faces of the current sweep are missing, so that it cannot
+    // match a message of a later sweep
+    while (location.num_received_faces < location.num_faces)
     {
-      int num_items = status.get_count<std::byte>();
-      std::vector<std::byte> recv_buffer(num_items);
-      comm.recv(source_rank, status.tag(), recv_buffer.data(), num_items);
-      ByteArray data_array(recv_buffer);
-
-      while (not data_array.EndOfBuffer())
+      if (not location.receive_posted)
       {
-        const uint64_t cell_global_id = data_array.Read<uint64_t>();
-        const auto face_id = data_array.Read<unsigned int>();
-        const size_t data_size = data_array.Read<size_t>();
-
-        std::vector<double> psi_data;
-        psi_data.reserve(data_size);
-        for (size_t k = 0; k < data_size; ++k)
-          psi_data.push_back(data_array.Read<double>());
-
-        received_messages[{cell_global_id, face_id}] = std::move(psi_data);
-        cells_who_received_data.push_back(
-          fluds_.GetSPDS().GetGrid()->MapCellGlobalID2LocalID(cell_global_id));
-      } // while not at end of buffer
-    }   // Process each message embedded in buffer
-  }
+        location.mpi_request = comm.irecv(location.source,
+                                          tag,
+                                          location.data.data() + location.size,
+                                          static_cast<int>(location.data.size() - location.size));
+        location.receive_posted = true;
+      }
+
+      mpi::Status status;
+      if (not mpi::test(location.mpi_request, status))
+        break;
+      location.receive_posted = false;
+
+      const size_t end = location.size + status.get_count<double>();
+      while (location.size < end)
+      {
+        uint64_t cell_global_id = 0;
+        unsigned int face_id = 0;
+        size_t num_values = 0;
+        ReadHeader(&location.data[location.size], cell_global_id, face_id, num_values);
 
-  cbc_fluds_.GetDeplocsOutgoingMessages().merge(received_messages);
+        received_data[{cell_global_id, face_id}] = &location.data[location.size + HEADER_SIZE];
+        cells_who_received_data.push_back(grid.MapCellGlobalID2LocalID(cell_global_id));
+
+        location.size += HEADER_SIZE + num_values;
+        ++location.num_received_faces;
+      }
+    }
+  }
 
   return cells_who_received_data;
 }
 
+void
+CBC_ASynchronousCommunicator::Reset()
+{
+  for (auto& location : outgoing_locations_)
+    location.data.clear();
+  outgoing_faces_.clear();
+
+  for (auto& location : incoming_locations_)
+  {
+    location.num_received_faces = 0;
+    location.size = 0;
+  }
+}
+
 } // namespace opensn
@@ -5,9 +5,9 @@
 
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/communicators/async_comm.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/fluds/cbc_fluds.h"
-#include "framework/data_types/byte_array.h"
 #include "mpicpp-lite/mpicpp-lite.h"
 #include <map>
+#include <tuple>
 #include <vector>
 #include <cstdint>
 #include <cstddef>
@@ -18,54 +18,90 @@ namespace opensn
 {
 
 class MPICommunicatorSet;
-class ByteArray;
 class CBC_FLUDS;
 
+/**
+ * Handles the interprocess communication of a CBC angle set.
+ *
+ * The angular fluxes of the outgoing faces of the swept cells are written directly into one
+ * aggregation buffer per successor location, as a header with the downwind cell, face and number
+ * of values followed by the values. SendData sends each non-empty buffer as a single message and
+ * reuses the buffers of completed sends.
+ *
+ * On the receiving side, the data of a whole sweep from a predecessor location is received into a
+ * buffer sized for all of its faces, which is allocated once and reused by every sweep. A receive
+ * for the remaining part of the buffer is kept posted until all faces of the location have been
+ * received, and the FLUDS refers to the received values in place.
+ */
 class CBC_ASynchronousCommunicator : public AsynchronousCommunicator
 {
 public:
-  explicit CBC_ASynchronousCommunicator(size_t angle_set_id,
-                                        FLUDS& fluds,
-                                        const MPICommunicatorSet& comm_set)
-    : AsynchronousCommunicator(fluds, comm_set),
-      angle_set_id_(angle_set_id),
-      cbc_fluds_(dynamic_cast<CBC_FLUDS&>(fluds))
-  {
-  }
+  CBC_ASynchronousCommunicator(size_t angle_set_id,
+                               FLUDS& fluds,
+                               const MPICommunicatorSet& comm_set);
 
-  std::vector<double>& InitGetDownwindMessageData(int location_id,
-                                                  uint64_t cell_global_id,
-                                                  unsigned int face_id,
-                                                  size_t angle_set_id,
-                                                  size_t data_size) override;
+  double* InitGetDownwindMessageData(int location_id,
+                                     uint64_t cell_global_id,
+                                     unsigned int face_id,
+                                     size_t angle_set_id,
+                                     size_t data_size) override;
 
+  /**
+   * Sends the data aggregated for each successor location since the previous call. Returns true if
+   * all sends have completed.
+   */
   bool SendData();
 
+  /**
+   * Processes the messages received from predecessor locations, and returns the local ids of the
+   * cells, once for each face whose data was received.
+   */
   std::vector<uint64_t> ReceiveData();
 
-  void Reset()
-  {
-    outgoing_message_queue_.clear();
-    send_buffer_.clear();
-  }
+  /// Prepares the buffers for another sweep.
+  void Reset();
 
 protected:
+  /// Number of values of the header of the data of a face in a message
+  static constexpr size_t HEADER_SIZE = 2;
+
   const size_t angle_set_id_;
   CBC_FLUDS& cbc_fluds_;
 
   // location_id, cell_global_id, face_id
   using MessageKey = std::tuple<int, uint64_t, unsigned int>;
-  std::map<MessageKey, std::vector<double>> outgoing_message_queue_;
 
-  struct BufferItem
+  /// Successor location, with the data aggregated for it since the last send
+  struct OutgoingLocation
+  {
+    int location_id = 0;
+    std::vector<double> data;
+  };
+  std::vector<OutgoingLocation> outgoing_locations_;
+  /// Successor location index and data offset of the faces aggregated since the last send
+  std::map<MessageKey, std::pair<size_t, size_t>> outgoing_faces_;
+
+  struct SendBuffer
+  {
+    std::vector<double> data;
+    mpi::Request mpi_request;
+    bool in_flight = false;
+  };
+  std::vector<SendBuffer> send_buffers_;
+
+  /// Predecessor location, with the data received from it during the current sweep
+  struct IncomingLocation
   {
-    int destination = 0;
+    int source = 0;
+    size_t num_faces = 0;
+    size_t num_received_faces = 0;
+    /// Number of received values
+    size_t size = 0;
+    std::vector<double> data;
     mpi::Request mpi_request;
-    bool send_initiated = false;
-    bool completed = false;
-    ByteArray data_array;
+    bool receive_posted = false;
   };
-  std::vector<BufferItem> send_buffer_;
+  std::vector<IncomingLocation> incoming_locations_;
 };
 
 } // namespace opensn
@@ -42,14 +42,14 @@ CBC_FLUDS::GetLocalCellUpwindPsi(const std::vector<double>& psi_data_block, cons
   return &psi_data_block[dof_map];
 }
 
-const std::vector<double>&
+const double*
 CBC_FLUDS::GetNonLocalUpwindData(uint64_t cell_global_id, unsigned int face_id) const
 {
   return deplocs_outgoing_messages_.at({cell_global_id, face_id});
 }
 
 const double*
-CBC_FLUDS::GetNonLocalUpwindPsi(const std::vector<double>& psi_data,
+CBC_FLUDS::GetNonLocalUpwindPsi(const double* psi_data,
                                 unsigned int face_node_mapped,
                                 unsigned int angle_set_index)
 {
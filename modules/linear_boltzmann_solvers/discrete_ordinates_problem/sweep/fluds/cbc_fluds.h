@@ -27,14 +27,17 @@ public:
 
   const FLUDSCommonData& GetCommonData() const;
 
+  const SpatialDiscretization& GetSpatialDiscretization() const { return sdm_; }
+
+  size_t GetNumGroupsAndAngles() const { return num_groups_and_angles_; }
+
   const std::vector<double>& GetLocalUpwindDataBlock() const;
 
   const double* GetLocalCellUpwindPsi(const std::vector<double>& psi_data_block, const Cell& cell);
 
-  const std::vector<double>& GetNonLocalUpwindData(uint64_t cell_global_id,
-                                                   unsigned int face_id) const;
+  const double* GetNonLocalUpwindData(uint64_t cell_global_id, unsigned int face_id) const;
 
-  const double* GetNonLocalUpwindPsi(const std::vector<double>& psi_data,
+  const double* GetNonLocalUpwindPsi(const double* psi_data,
                                      unsigned int face_node_mapped,
                                      unsigned int angle_set_index);
 
@@ -72,7 +75,8 @@ public:
   // cell_global_id, face_id
   using CellFaceKey = std::pair<uint64_t, unsigned int>;
 
-  std::map<CellFaceKey, std::vector<double>>& GetDeplocsOutgoingMessages()
+  /// Returns the received upwind angular fluxes of the faces, held by the communicator.
+  std::map<CellFaceKey, const double*>& GetDeplocsOutgoingMessages()
   {
     return deplocs_outgoing_messages_;
   }
@@ -92,7 +96,7 @@ private:
   std::vector<std::vector<double>> delayed_prelocI_outgoing_psi_;
   std::vector<std::vector<double>> delayed_prelocI_outgoing_psi_old_;
 
-  std::map<CellFaceKey, std::vector<double>> deplocs_outgoing_messages_;
+  std::map<CellFaceKey, const double*> deplocs_outgoing_messages_;
 };
 
 } // namespace opensn
@@ -5,7 +5,9 @@
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/spds/aah.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/boundary/reflecting_boundary.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/runtime.h"
+#include "framework/utils/utils.h"
 #include "caliper/cali.h"
 #include <sstream>
 #include <algorithm>
@@ -15,13 +17,26 @@ namespace opensn
 
 SweepScheduler::SweepScheduler(SchedulingAlgorithm scheduler_type,
                                AngleAggregation& angle_agg,
-                               SweepChunk& sweep_chunk)
+                               SweepChunk& sweep_chunk,
+                               unsigned int num_threads)
   : scheduler_type_(scheduler_type), angle_agg_(angle_agg), sweep_chunk_(sweep_chunk)
 {
   CALI_CXX_MARK_SCOPE("SweepScheduler::SweepScheduler");
 
   angle_agg_.InitializeReflectingBCs();
 
+  if (num_threads > 1)
+  {
+    if (sweep_chunk_.SupportsThreadedSweep())
+    {
+      sweep_chunk_.EnableThreadedSweep();
+      thread_pool_ = std::make_unique<ThreadPool>(num_threads);
+    }
+    else
+      log.Log0Warning() << "SweepScheduler: The sweep chunk does not support threaded sweeps. "
+                        << "Sweeping with a single thread per rank.";
+  }
+
   if (scheduler_type_ == SchedulingAlgorithm::DEPTH_OF_GRAPH)
     InitializeAlgoDOG();
 
@@ -64,21 +79,9 @@ SweepScheduler::InitializeAlgoDOG()
       auto angleset = angleset_group.GetAngleSets()[as];
       const auto& spds = dynamic_cast<const AAH_SPDS&>(angleset->GetSPDS());
 
-      const std::vector<STDG>& leveled_graph = spds.GetGlobalSweepPlanes();
-
       // Find location depth
-      int loc_depth = -1;
-      for (size_t level = 0; level < leveled_graph.size(); ++level)
-      {
-        for (size_t index = 0; index < leveled_graph[level].item_id.size(); ++index)
-        {
-          if (leveled_graph[level].item_id[index] == opensn::mpi_comm.rank())
-          {
-            loc_depth = static_cast<int>(leveled_graph.size() - level);
-            break;
-          }
-        } // for locations in plane
-      }   // for sweep planes
+      const int level = spds.GetGlobalSweepLevel();
+      const int loc_depth = level >= 0 ? spds.GetNumGlobalSweepLevels() - level : -1;
 
       // Set up rule values
       if (loc_depth >= 0)
@@ -118,11 +121,15 @@ SweepScheduler::ScheduleAlgoDOG(SweepChunk& sweep_chunk)
 {
   CALI_CXX_MARK_SCOPE("SweepScheduler::ScheduleAlgoDOG");
 
+  // When threaded, ready anglesets are collected and executed together after each pass
+  const auto permission = thread_pool_ ? AngleSetStatus::NO_EXEC_IF_READY : AngleSetStatus::EXECUTE;
+
   // Loop till done
   bool finished = false;
   while (not finished)
   {
     finished = true;
+    ready_angle_sets_.clear();
     for (auto& rule_value : rule_values_)
     {
       auto angleset = rule_value.angle_set;
@@ -135,14 +142,21 @@ SweepScheduler::ScheduleAlgoDOG(SweepChunk& sweep_chunk)
       //      Meaning it has received all upstream data and can be executed
       //  - FINISHED.
       //      Meaning the angleset has executed its sweep chunk
-      AngleSetStatus status = angleset->AngleSetAdvance(sweep_chunk, AngleSetStatus::EXECUTE);
+      AngleSetStatus status = angleset->AngleSetAdvance(sweep_chunk, permission);
+
+      if (status == AngleSetStatus::READY_TO_EXECUTE)
+        ready_angle_sets_.push_back(angleset.get());
 
       if (status != AngleSetStatus::FINISHED)
         finished = false;
     } // for each angleset rule
-  }   // while not finished
+
+    if (not ready_angle_sets_.empty())
+      ExecuteReadyAngleSets(sweep_chunk);
+  } // while not finished
 
   // Receive delayed data
+  Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
   opensn::mpi_comm.barrier();
   bool received_delayed_data = false;
   while (not received_delayed_data)
@@ -180,23 +194,33 @@ SweepScheduler::ScheduleAlgoFIFO(SweepChunk& sweep_chunk)
 {
   CALI_CXX_MARK_SCOPE("SweepScheduler::ScheduleAlgoFIFO");
 
+  // When threaded, ready anglesets are collected and executed together after each pass
+  const auto permission = thread_pool_ ? AngleSetStatus::NO_EXEC_IF_READY : AngleSetStatus::EXECUTE;
+
   // Loop over AngleSetGroups
   AngleSetStatus completion_status = AngleSetStatus::NOT_FINISHED;
   while (completion_status == AngleSetStatus::NOT_FINISHED)
   {
     completion_status = AngleSetStatus::FINISHED;
+    ready_angle_sets_.clear();
 
     for (auto& angle_set_group : angle_agg_.angle_set_groups)
       for (auto& angle_set : angle_set_group.GetAngleSets())
       {
-        const auto angle_set_status =
-          angle_set->AngleSetAdvance(sweep_chunk, AngleSetStatus::EXECUTE);
-        if (angle_set_status == AngleSetStatus::NOT_FINISHED)
+        const auto angle_set_status = angle_set->AngleSetAdvance(sweep_chunk, permission);
+        if (angle_set_status == AngleSetStatus::READY_TO_EXECUTE)
+          ready_angle_sets_.push_back(angle_set.get());
+        if (angle_set_status == AngleSetStatus::NOT_FINISHED or
+            angle_set_status == AngleSetStatus::READY_TO_EXECUTE)
           completion_status = AngleSetStatus::NOT_FINISHED;
       } // for angleset
-  }     // while not finished
+
+    if (not ready_angle_sets_.empty())
+      ExecuteReadyAngleSets(sweep_chunk);
+  } // while not finished
 
   // Receive delayed data
+  Telemetry::ScopedTimer telemetry_timer(Telemetry::COMMUNICATION);
   opensn::mpi_comm.barrier();
   bool received_delayed_data = false;
   while (not received_delayed_data)
@@ -229,6 +253,44 @@ SweepScheduler::ScheduleAlgoFIFO(SweepChunk& sweep_chunk)
   }
 }
 
+void
+SweepScheduler::ExecuteReadyAngleSets(SweepChunk& sweep_chunk)
+{
+  CALI_CXX_MARK_SCOPE("SweepScheduler::ExecuteReadyAngleSets");
+
+  // Buffer allocation is not thread-safe, it is done up front
+  for (auto angle_set : ready_angle_sets_)
+    angle_set->PrepareExecution();
+
+  // Split the groups of each angleset into blocks when there are fewer ready anglesets than
+  // threads. Groups are independent within a sweep so the blocks write to disjoint data.
+  const size_t num_angle_sets = ready_angle_sets_.size();
+  const size_t num_threads = thread_pool_->GetNumThreads();
+  const size_t num_groups = ready_angle_sets_.front()->GetNumGroups();
+  const size_t num_group_blocks =
+    std::min(num_groups, std::max<size_t>(1, (num_threads + num_angle_sets - 1) / num_angle_sets));
+  const auto group_blocks = MakeSubSets(num_groups, num_group_blocks);
+
+  thread_pool_->ParallelFor(num_angle_sets * num_group_blocks,
+                            [&](size_t task, unsigned int)
+                            {
+                              auto& angle_set = *ready_angle_sets_[task / num_group_blocks];
+                              const auto& block = group_blocks[task % num_group_blocks];
+                              sweep_chunk.SweepGroupRange(
+                                angle_set, block.ss_begin, block.ss_end + 1);
+                            });
+
+  // Communication is done by the scheduling thread only
+  for (auto angle_set : ready_angle_sets_)
+    angle_set->FinalizeExecution();
+}
+
+unsigned int
+SweepScheduler::GetNumThreads() const
+{
+  return thread_pool_ ? thread_pool_->GetNumThreads() : 1;
+}
+
 void
 SweepScheduler::Sweep()
 {
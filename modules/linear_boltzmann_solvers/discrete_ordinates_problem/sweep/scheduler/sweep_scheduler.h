@@ -5,6 +5,8 @@
 
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/angle_aggregation/angle_aggregation.h"
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep_chunks/sweep_chunk.h"
+#include "framework/utils/thread_pool.h"
+#include <memory>
 
 namespace opensn
 {
@@ -44,10 +46,24 @@ private:
   };
   std::vector<RuleValues> rule_values_;
 
+  /// Thread pool for hybrid MPI/threaded sweeps. Only allocated when more than one thread is used.
+  std::unique_ptr<ThreadPool> thread_pool_;
+  /// Anglesets that are ready to be executed concurrently in the current scheduling pass.
+  std::vector<AngleSet*> ready_angle_sets_;
+
 public:
+  /**
+   * Creates a sweep scheduler. When `num_threads` is greater than one, anglesets that are ready to
+   * execute at the same time (and blocks of groups within them) are swept concurrently by a
+   * thread pool. Communication is always performed by the calling thread.
+   */
   SweepScheduler(SchedulingAlgorithm scheduler_type,
                  AngleAggregation& angle_agg,
-                 SweepChunk& sweep_chunk);
+                 SweepChunk& sweep_chunk,
+                 unsigned int num_threads = 1);
+
+  /// Returns the number of threads used to execute sweep chunks.
+  unsigned int GetNumThreads() const;
 
   void Sweep();
 
@@ -62,6 +78,13 @@ private:
 
   /// Executes the depth-of-graph algorithm.
   void ScheduleAlgoDOG(SweepChunk& sweep_chunk);
+
+  /**
+   * Executes the sweep chunk for all anglesets in `ready_angle_sets_` using the thread pool. The
+   * work is split into (angleset, group block) tasks so that all threads stay busy even when only
+   * a few anglesets are ready.
+   */
+  void ExecuteReadyAngleSets(SweepChunk& sweep_chunk);
 };
 
 } // namespace opensn
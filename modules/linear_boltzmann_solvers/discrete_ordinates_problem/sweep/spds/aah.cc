@@ -6,18 +6,84 @@
 #include "framework/logging/log.h"
 #include "framework/utils/timer.h"
 #include "framework/runtime.h"
+#include "framework/mpi/mpi_utils.h"
 #include "caliper/cali.h"
 #include <boost/graph/topological_sort.hpp>
 #include <algorithm>
+#include <array>
+#include <map>
 
 namespace opensn
 {
 
+namespace
+{
+
+template <typename T>
+void
+WriteVector(ByteArray& raw, const std::vector<T>& values)
+{
+  raw.Write<size_t>(values.size());
+  for (const auto& value : values)
+    raw.Write<T>(value);
+}
+
+template <typename T>
+std::vector<T>
+ReadVector(const ByteArray& raw, size_t& address)
+{
+  const auto size = raw.Read<size_t>(address, &address);
+  std::vector<T> values;
+  values.reserve(size);
+  for (size_t i = 0; i < size; ++i)
+    values.push_back(raw.Read<T>(address, &address));
+  return values;
+}
+
+template <typename T>
+void
+WriteVectors(ByteArray& raw, const std::vector<std::vector<T>>& values)
+{
+  raw.Write<size_t>(values.size());
+  for (const auto& value : values)
+    WriteVector(raw, value);
+}
+
+template <typename T>
+std::vector<std::vector<T>>
+ReadVectors(const ByteArray& raw, size_t& address)
+{
+  const auto size = raw.Read<size_t>(address, &address);
+  std::vector<std::vector<T>> values;
+  values.reserve(size);
+  for (size_t i = 0; i < size; ++i)
+    values.push_back(ReadVector<T>(raw, address));
+  return values;
+}
+
+/// Tag of the messages exchanging global sweep levels between neighboring locations.
+constexpr int LEVEL_EXCHANGE_TAG = 1009;
+
+} // namespace
+
+AAH_SPDS::AAH_SPDS(int id, const Vector3& omega, const std::shared_ptr<MeshContinuum> grid)
+  : SPDS(omega, grid),
+    id_(id),
+    allow_cycles_(false),
+    global_sweep_level_(-1),
+    num_global_sweep_levels_(0)
+{
+}
+
 AAH_SPDS::AAH_SPDS(int id,
                    const Vector3& omega,
                    const std::shared_ptr<MeshContinuum> grid,
                    bool allow_cycles)
-  : SPDS(omega, grid), id_(id), allow_cycles_(allow_cycles)
+  : SPDS(omega, grid),
+    id_(id),
+    allow_cycles_(allow_cycles),
+    global_sweep_level_(-1),
+    num_global_sweep_levels_(0)
 {
   CALI_CXX_MARK_SCOPE("AAH_SPDS::AAH_SPDS");
 
@@ -83,134 +149,281 @@ AAH_SPDS::AAH_SPDS(int id,
   for (auto& level : levelized_spls_)
     for (auto& cell : level)
       spls_.push_back(cell);
+}
+
+bool
+AAH_SPDS::LevelizeGlobalSweeps(const std::vector<std::shared_ptr<AAH_SPDS>>& spds_list)
+{
+  CALI_CXX_MARK_SCOPE("AAH_SPDS::LevelizeGlobalSweeps");
+
+  const size_t num_spds = spds_list.size();
+
+  // Locations neighboring this location in any of the sweeps. Location graphs are symmetric, a
+  // location being a (possibly delayed) successor of each of its dependencies, so every neighbor
+  // also lists this location as a neighbor.
+  std::vector<int> neighbors;
+  for (const auto& spds : spds_list)
+    for (const auto* locations : {&spds->location_dependencies_,
+                                  &spds->location_successors_,
+                                  &spds->delayed_location_dependencies_,
+                                  &spds->delayed_location_successors_})
+      neighbors.insert(neighbors.end(), locations->begin(), locations->end());
+  std::sort(neighbors.begin(), neighbors.end());
+  neighbors.erase(std::unique(neighbors.begin(), neighbors.end()), neighbors.end());
+  const auto NeighborIndex = [&neighbors](int location)
+  { return std::lower_bound(neighbors.begin(), neighbors.end(), location) - neighbors.begin(); };
+
+  // Levels of this location and of its neighbors, for each SPDS
+  std::vector<int> levels(num_spds, -1);
+  std::vector<std::vector<int>> neighbor_levels(neighbors.size(), std::vector<int>(num_spds, -1));
+
+  // A location is resolved once all its dependencies are, one level of the TDGs per round
+  size_t num_unresolved = 0;
+  while (true)
+  {
+    std::array<size_t, 2> counts = {0, 0};
+    for (size_t s = 0; s < num_spds; ++s)
+    {
+      if (levels[s] >= 0)
+        continue;
+
+      int level = 0;
+      bool resolved = true;
+      for (const int dependency : spds_list[s]->location_dependencies_)
+      {
+        const int dependency_level = neighbor_levels[NeighborIndex(dependency)][s];
+        if (dependency_level < 0)
+        {
+          resolved = false;
+          break;
+        }
+        level = std::max(level, dependency_level + 1);
+      }
+
+      if (resolved)
+      {
+        levels[s] = level;
+        ++counts[0];
+      }
+      else
+        ++counts[1];
+    }
+
+    std::array<size_t, 2> global_counts = {0, 0};
+    opensn::mpi_comm.all_reduce(counts.data(), 2, global_counts.data(), mpi::op::sum<size_t>());
+    num_unresolved = global_counts[1];
+    if (global_counts[0] == 0 or num_unresolved == 0)
+      break;
+
+    // Exchange the levels with the neighbors
+    std::vector<mpi::Request> requests;
+    requests.reserve(2 * neighbors.size());
+    for (size_t n = 0; n < neighbors.size(); ++n)
+      requests.push_back(opensn::mpi_comm.irecv(
+        neighbors[n], LEVEL_EXCHANGE_TAG, neighbor_levels[n].data(), static_cast<int>(num_spds)));
+    for (const int neighbor : neighbors)
+      requests.push_back(opensn::mpi_comm.isend(neighbor, LEVEL_EXCHANGE_TAG, levels));
+    mpi::wait_all(requests);
+  }
 
-  // Generate location-to-location dependencies
-  global_dependencies_.resize(opensn::mpi_comm.size());
-  CommunicateLocationDependencies(location_dependencies_, global_dependencies_);
+  for (size_t s = 0; s < num_spds; ++s)
+    spds_list[s]->global_sweep_level_ = levels[s];
+
+  return num_unresolved == 0;
 }
 
 void
-AAH_SPDS::BuildGlobalSweepFAS()
+AAH_SPDS::BuildGlobalSweepFAS(const std::vector<std::shared_ptr<AAH_SPDS>>& spds_list)
 {
-  assert(not global_dependencies_.empty());
-
   CALI_CXX_MARK_SCOPE("AAH_SPDS::BuildGlobalSweepFAS");
 
-  // Create global sweep graph
-  Graph global_tdg(opensn::mpi_comm.size());
+  for (const auto& spds : spds_list)
+    spds->global_sweep_fas_.clear();
 
-  for (int loc = 0; loc < opensn::mpi_comm.size(); ++loc)
-    for (int dep : global_dependencies_[loc])
-      boost::add_edge(dep, loc, 1.0, global_tdg);
+  // Without cycles, there is no FAS
+  if (LevelizeGlobalSweeps(spds_list))
+    return;
 
-  // Remove cycles and generate the feedback arc set (FAS). The FAS is the list of edges that must
-  // be removed from the graph to make it acyclic.
-  if (allow_cycles_)
+  // Send the dependencies of the locations in, or downstream of, cycles to the rank that computes
+  // the FAS of the SPDS, as (SPDS index, location, dependency) triplets. These include all the
+  // edges of the cycles.
+  const int rank = opensn::mpi_comm.rank();
+  const int num_ranks = opensn::mpi_comm.size();
+  std::map<int, std::vector<int>> local_edges;
+  for (size_t s = 0; s < spds_list.size(); ++s)
   {
-    auto edges_to_remove = RemoveCyclicDependencies(global_tdg);
-    for (const auto& [e0, e1] : edges_to_remove)
+    const auto& spds = *spds_list[s];
+    if (spds.allow_cycles_ and spds.global_sweep_level_ < 0)
     {
-      global_sweep_fas_.emplace_back(e0);
-      global_sweep_fas_.emplace_back(e1);
+      auto& edges = local_edges[static_cast<int>(s % num_ranks)];
+      for (const int dependency : spds.location_dependencies_)
+        edges.insert(edges.end(), {static_cast<int>(s), rank, dependency});
     }
   }
+
+  std::map<size_t, std::vector<std::array<int, 2>>> spds_edges;
+  for (const auto& [pid, edges] : MapAllToAll(local_edges))
+    for (size_t i = 0; i < edges.size(); i += 3)
+      spds_edges[edges[i]].push_back({edges[i + 2], edges[i + 1]});
+
+  // Remove cycles and generate the FAS of each SPDS owned by this rank. The FAS is the list of
+  // edges that must be removed from the graph to make it acyclic. Each FAS edge is sent, as
+  // (SPDS index, dependency, location) triplets, to the two locations it connects.
+  std::map<int, std::vector<int>> fas_edges;
+  for (const auto& [s, edges] : spds_edges)
+  {
+    // Graph of the locations involved, numbered in increasing order
+    std::vector<int> locations;
+    for (const auto& [dependency, location] : edges)
+    {
+      locations.push_back(dependency);
+      locations.push_back(location);
+    }
+    std::sort(locations.begin(), locations.end());
+    locations.erase(std::unique(locations.begin(), locations.end()), locations.end());
+    const auto Vertex = [&locations](int location)
+    { return std::lower_bound(locations.begin(), locations.end(), location) - locations.begin(); };
+
+    Graph graph(locations.size());
+    for (const auto& [dependency, location] : edges)
+      boost::add_edge(Vertex(dependency), Vertex(location), 1.0, graph);
+
+    for (const auto& [e0, e1] : spds_list[s]->RemoveCyclicDependencies(graph))
+      for (const int pid : {locations[e0], locations[e1]})
+        fas_edges[pid].insert(fas_edges[pid].end(),
+                              {static_cast<int>(s), locations[e0], locations[e1]});
+  }
+
+  // Each location only stores the FAS edges it is part of
+  for (const auto& [pid, edges] : MapAllToAll(fas_edges))
+    for (size_t i = 0; i < edges.size(); i += 3)
+    {
+      auto& fas = spds_list[edges[i]]->global_sweep_fas_;
+      fas.insert(fas.end(), {edges[i + 1], edges[i + 2]});
+    }
 }
 
 void
-AAH_SPDS::BuildGlobalSweepTDG()
+AAH_SPDS::BuildGlobalSweepTDG(const std::vector<std::shared_ptr<AAH_SPDS>>& spds_list)
 {
   CALI_CXX_MARK_SCOPE("AAH_SPDS::BuildGlobalSweepTDG");
 
-  // Create graph
-  Graph global_tdg(opensn::mpi_comm.size());
-
-  for (int loc = 0; loc < opensn::mpi_comm.size(); ++loc)
-    for (int dep : global_dependencies_[loc])
-      boost::add_edge(dep, loc, 1.0, global_tdg);
-
-  // De-serialize edges
-  std::vector<std::pair<int, int>> edges_to_remove;
-  edges_to_remove.resize(global_sweep_fas_.size() / 2, std::pair<int, int>(0, 0));
-  int i = 0;
-  for (auto& edge : edges_to_remove)
-  {
-    edge.first = global_sweep_fas_[i++];
-    edge.second = global_sweep_fas_[i++];
-  }
+  const int rank = opensn::mpi_comm.rank();
 
-  // Remove edges
-  for (auto& edge_to_remove : edges_to_remove)
+  // Remove the FAS edges, delaying the corresponding dependencies
+  size_t num_fas_edges = 0;
+  for (const auto& spds : spds_list)
   {
-    int rlocI = edge_to_remove.first;
-    int locI = edge_to_remove.second;
+    const auto& fas = spds->global_sweep_fas_;
+    num_fas_edges += fas.size() / 2;
+    for (size_t i = 0; i + 1 < fas.size(); i += 2)
+    {
+      const int rlocI = fas[i];
+      const int locI = fas[i + 1];
 
-    boost::remove_edge(rlocI, locI, global_tdg);
+      if (locI == rank)
+      {
+        auto& dependencies = spds->location_dependencies_;
+        auto dependent_location = std::find(dependencies.begin(), dependencies.end(), rlocI);
+        if (dependent_location != dependencies.end())
+          dependencies.erase(dependent_location);
+        spds->delayed_location_dependencies_.push_back(rlocI);
+      }
 
-    if (locI == opensn::mpi_comm.rank())
-    {
-      auto dependent_location =
-        std::find(location_dependencies_.begin(), location_dependencies_.end(), rlocI);
-      location_dependencies_.erase(dependent_location);
-      delayed_location_dependencies_.push_back(rlocI);
+      if (rlocI == rank)
+        spds->delayed_location_successors_.push_back(locI);
     }
-
-    if (rlocI == opensn::mpi_comm.rank())
-      delayed_location_successors_.push_back(locI);
   }
 
-  // Generate topological ordering
-  std::vector<size_t> global_linear_sweep_order;
-  boost::topological_sort(global_tdg, std::back_inserter(global_linear_sweep_order));
-  std::reverse(global_linear_sweep_order.begin(), global_linear_sweep_order.end());
-  if (global_linear_sweep_order.empty())
+  // Levelize the acyclic graphs, unless the levels computed with the FAS are already complete
+  size_t num_unresolved = num_fas_edges;
+  for (const auto& spds : spds_list)
+    if (spds->global_sweep_level_ < 0)
+      ++num_unresolved;
+  opensn::mpi_comm.all_reduce(num_unresolved, mpi::op::sum<size_t>());
+  if (num_unresolved > 0 and not LevelizeGlobalSweeps(spds_list))
   {
     throw std::logic_error("AAH_SPDS: Cyclic dependencies found in the global sweep graph.\n"
                            "Cycles need to be allowed by the calling application.");
   }
 
-  // Rank to global_tdg id mapping
-  std::vector<int> global_order_mapping(opensn::mpi_comm.size(), -1);
-  for (int k = 0; k < opensn::mpi_comm.size(); ++k)
+  // Number of levels of each TDG
+  std::vector<int> levels;
+  levels.reserve(spds_list.size());
+  for (const auto& spds : spds_list)
+    levels.push_back(spds->global_sweep_level_);
+  std::vector<int> max_levels(levels.size(), 0);
+  opensn::mpi_comm.all_reduce(levels, max_levels, mpi::op::max<int>());
+  for (size_t s = 0; s < spds_list.size(); ++s)
+    spds_list[s]->num_global_sweep_levels_ = max_levels[s] + 1;
+}
+
+ByteArray
+AAH_SPDS::Serialize() const
+{
+  ByteArray raw;
+
+  raw.Write<int>(id_);
+  raw.Write<double>(omega_.x);
+  raw.Write<double>(omega_.y);
+  raw.Write<double>(omega_.z);
+  raw.Write<bool>(allow_cycles_);
+
+  WriteVector(raw, spls_);
+  WriteVectors(raw, levelized_spls_);
+  WriteVector(raw, location_dependencies_);
+  WriteVector(raw, location_successors_);
+  WriteVector(raw, delayed_location_dependencies_);
+  WriteVector(raw, delayed_location_successors_);
+  raw.Write<size_t>(local_sweep_fas_.size());
+  for (const auto& [u, v] : local_sweep_fas_)
   {
-    int loc = global_linear_sweep_order[k];
-    global_order_mapping[loc] = k;
+    raw.Write<int>(u);
+    raw.Write<int>(v);
   }
+  WriteVectors(raw, cell_face_orientations_);
 
-  // Determine sweep order ranks
-  int abs_max_rank = 0;
-  std::vector<int> global_sweep_order_rank(opensn::mpi_comm.size(), -1);
-  for (int k = 0; k < opensn::mpi_comm.size(); ++k)
-  {
-    int loc = global_linear_sweep_order[k];
-    if (global_dependencies_[loc].empty())
-      global_sweep_order_rank[k] = 0;
-    else
-    {
-      int max_rank = -1;
-      for (auto dep_loc : global_dependencies_[loc])
-      {
-        if (dep_loc < 0)
-          continue;
+  WriteVector(raw, global_sweep_fas_);
+  raw.Write<int>(global_sweep_level_);
+  raw.Write<int>(num_global_sweep_levels_);
 
-        int dep_mapped_index = global_order_mapping[dep_loc];
-        if (global_sweep_order_rank[dep_mapped_index] > max_rank)
-          max_rank = global_sweep_order_rank[dep_mapped_index];
-      }
-      global_sweep_order_rank[k] = max_rank + 1;
-      if ((max_rank + 1) > abs_max_rank)
-        abs_max_rank = max_rank + 1;
-    }
-  }
+  return raw;
+}
 
-  // Generate TDG
-  for (int rank = 0; rank <= abs_max_rank; ++rank)
+std::shared_ptr<AAH_SPDS>
+AAH_SPDS::DeSerialize(const ByteArray& raw,
+                      size_t& address,
+                      const std::shared_ptr<MeshContinuum> grid)
+{
+  const auto id = raw.Read<int>(address, &address);
+  Vector3 omega;
+  omega.x = raw.Read<double>(address, &address);
+  omega.y = raw.Read<double>(address, &address);
+  omega.z = raw.Read<double>(address, &address);
+
+  std::shared_ptr<AAH_SPDS> spds(new AAH_SPDS(id, omega, grid));
+  spds->allow_cycles_ = raw.Read<bool>(address, &address);
+
+  spds->spls_ = ReadVector<int>(raw, address);
+  spds->levelized_spls_ = ReadVectors<int>(raw, address);
+  spds->location_dependencies_ = ReadVector<int>(raw, address);
+  spds->location_successors_ = ReadVector<int>(raw, address);
+  spds->delayed_location_dependencies_ = ReadVector<int>(raw, address);
+  spds->delayed_location_successors_ = ReadVector<int>(raw, address);
+  const auto num_local_fas_edges = raw.Read<size_t>(address, &address);
+  for (size_t e = 0; e < num_local_fas_edges; ++e)
   {
-    STDG stdg;
-    for (int k = 0; k < opensn::mpi_comm.size(); ++k)
-      if (global_sweep_order_rank[k] == rank)
-        stdg.item_id.push_back(global_linear_sweep_order[k]);
-    global_sweep_planes_.push_back(stdg);
+    const auto u = raw.Read<int>(address, &address);
+    const auto v = raw.Read<int>(address, &address);
+    spds->local_sweep_fas_.emplace_back(u, v);
   }
+  spds->cell_face_orientations_ = ReadVectors<FaceOrientation>(raw, address);
+
+  spds->global_sweep_fas_ = ReadVector<int>(raw, address);
+  spds->global_sweep_level_ = raw.Read<int>(address, &address);
+  spds->num_global_sweep_levels_ = raw.Read<int>(address, &address);
+
+  return spds;
 }
 
 } // namespace opensn
@@ -4,6 +4,7 @@
 #pragma once
 
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/spds/spds.h"
+#include "framework/data_types/byte_array.h"
 
 namespace opensn
 {
@@ -27,16 +28,33 @@ public:
   /// Returns the id of this SPDS.
   int GetId() { return id_; }
 
-  /// Return the levelized global sweep TDG.
-  const std::vector<STDG>& GetGlobalSweepPlanes() const { return global_sweep_planes_; }
+  /**
+   * Returns the level of this location in the global sweep task dependency graph (TDG), i.e., the
+   * length of the longest chain of locations this location depends on.
+   */
+  int GetGlobalSweepLevel() const { return global_sweep_level_; }
+
+  /// Returns the number of levels of the global sweep TDG.
+  int GetNumGlobalSweepLevels() const { return num_global_sweep_levels_; }
 
-  /// Builds the Feedback Arc Set (FAS) for the global sweep.
-  void BuildGlobalSweepFAS();
+  /**
+   * Builds the Feedback Arc Sets (FAS) of the global sweeps of a set of SPDSs, which must be the
+   * same on all ranks. This is a collective operation.
+   *
+   * Each location only exchanges levels with its neighbors to find the locations that are not in,
+   * or downstream of, a cycle of the global sweep graph. Only the dependencies of the remaining
+   * locations are sent to the rank that computes the FAS of the SPDS from this subgraph, and each
+   * FAS edge is only sent to the two locations it connects.
+   */
+  static void BuildGlobalSweepFAS(const std::vector<std::shared_ptr<AAH_SPDS>>& spds_list);
 
-  /// Builds the Task Dependency Graph (TDG) for the global sweep.
-  void BuildGlobalSweepTDG();
+  /**
+   * Builds the Task Dependency Graphs (TDG) of the global sweeps of a set of SPDSs, once their FAS
+   * is set. Each location only stores its own level in the TDG. This is a collective operation.
+   */
+  static void BuildGlobalSweepTDG(const std::vector<std::shared_ptr<AAH_SPDS>>& spds_list);
 
-  /// Returns the global sweep FAS as a vector of edges.
+  /// Returns the edges of the global sweep FAS that this location is part of.
   std::vector<int> GetGlobalSweepFAS() { return global_sweep_fas_; }
 
   /**
@@ -45,16 +63,42 @@ public:
    */
   void SetGlobalSweepFAS(std::vector<int>& edges) { global_sweep_fas_ = edges; }
 
+  /**
+   * Serializes the local sweep ordering, the location dependencies, the FAS and the TDG of this
+   * SPDS. Must be called after BuildGlobalSweepTDG.
+   */
+  ByteArray Serialize() const;
+
+  /**
+   * Creates an SPDS from the data written by Serialize, for the same grid partition, without
+   * recomputing the sweep ordering, the FAS or the TDG.
+   */
+  static std::shared_ptr<AAH_SPDS>
+  DeSerialize(const ByteArray& raw, size_t& address, const std::shared_ptr<MeshContinuum> grid);
+
 private:
+  AAH_SPDS(int id, const Vector3& omega, const std::shared_ptr<MeshContinuum> grid);
+
+  /**
+   * Computes the levels of the locations in the global sweep graphs of a set of SPDSs, by
+   * exchanging levels with the neighboring locations until no more levels can be resolved. The
+   * levels of the locations in, or downstream of, a cycle remain -1. Returns whether all levels
+   * were resolved on all ranks. This is a collective operation.
+   */
+  static bool LevelizeGlobalSweeps(const std::vector<std::shared_ptr<AAH_SPDS>>& spds_list);
+
   /// Unique identifier for this SPDS.
   int id_;
   /// Flag indicating whether cycles are allowed in the dependency graphs.
   bool allow_cycles_;
-  /// Location-to-location global sweep dependencies.
-  std::vector<std::vector<int>> global_dependencies_;
-  /// Levelized global sweep task dependency graph.
-  std::vector<STDG> global_sweep_planes_;
-  /// Vector of edges representing the FAS used to break cycles in the global sweep graph.
+  /// Level of this location in the global sweep TDG, -1 if not resolved.
+  int global_sweep_level_;
+  /// Number of levels of the global sweep TDG.
+  int num_global_sweep_levels_;
+  /**
+   * Edges of the FAS used to break cycles in the global sweep graph that this location is part of,
+   * as (dependency, location) pairs.
+   */
   std::vector<int> global_sweep_fas_;
 };
 
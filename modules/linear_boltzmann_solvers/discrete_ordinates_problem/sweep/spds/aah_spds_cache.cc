@@ -0,0 +1,196 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/spds/aah_spds_cache.h"
+#include "framework/mesh/mesh_continuum/mesh_continuum.h"
+#include "framework/math/quadratures/angular/angular_quadrature.h"
+#include "framework/logging/log.h"
+#include "framework/runtime.h"
+#include "caliper/cali.h"
+#include <cstring>
+#include <fstream>
+#include <iomanip>
+#include <sstream>
+#include <unistd.h>
+
+namespace opensn
+{
+
+namespace
+{
+
+/// 64-bit FNV-1a hash, updated with the bytes of trivially copyable values.
+class Hasher
+{
+public:
+  template <typename T>
+  void Add(const T& value)
+  {
+    unsigned char bytes[sizeof(T)];
+    std::memcpy(bytes, &value, sizeof(T));
+    for (const auto byte : bytes)
+    {
+      hash_ ^= byte;
+      hash_ *= 0x100000001b3ULL;
+    }
+  }
+
+  void Add(const Vector3& v)
+  {
+    Add(v.x);
+    Add(v.y);
+    Add(v.z);
+  }
+
+  uint64_t Get() const { return hash_; }
+
+private:
+  uint64_t hash_ = 0xcbf29ce484222325ULL;
+};
+
+void
+AddCell(Hasher& hasher, const Cell& cell)
+{
+  hasher.Add(cell.global_id);
+  hasher.Add(cell.partition_id);
+  hasher.Add(cell.faces.size());
+  for (const auto& face : cell.faces)
+  {
+    hasher.Add(face.has_neighbor);
+    hasher.Add(face.neighbor_id);
+    hasher.Add(face.normal);
+    hasher.Add(face.area);
+  }
+}
+
+} // namespace
+
+uint64_t
+AAHSPDSCache::ComputePartitionHash(const MeshContinuum& grid)
+{
+  CALI_CXX_MARK_SCOPE("AAHSPDSCache::ComputePartitionHash");
+
+  Hasher local_hasher;
+  local_hasher.Add(grid.local_cells.size());
+  for (const auto& cell : grid.local_cells)
+    AddCell(local_hasher, cell);
+
+  const auto ghost_ids = grid.cells.GetGhostGlobalIDs();
+  local_hasher.Add(ghost_ids.size());
+  for (const auto global_id : ghost_ids)
+    AddCell(local_hasher, grid.cells[global_id]);
+
+  const uint64_t local_hash = local_hasher.Get();
+  std::vector<uint64_t> hashes(opensn::mpi_comm.size());
+  opensn::mpi_comm.all_gather(local_hash, hashes);
+
+  Hasher hasher;
+  hasher.Add(hashes.size());
+  for (const auto hash : hashes)
+    hasher.Add(hash);
+  return hasher.Get();
+}
+
+AAHSPDSCache::AAHSPDSCache(const std::filesystem::path& directory,
+                           uint64_t partition_hash,
+                           const AngularQuadrature& quadrature,
+                           const UniqueSOGroupings& so_groupings,
+                           bool allow_cycles)
+{
+  // An SPDS is built for the first direction of every non-empty sweep ordering grouping
+  Hasher hasher;
+  hasher.Add(VERSION);
+  hasher.Add(partition_hash);
+  hasher.Add(allow_cycles);
+  for (const auto& so_grouping : so_groupings)
+    if (not so_grouping.empty())
+      hasher.Add(quadrature.omegas[so_grouping.front()]);
+  key_ = hasher.Get();
+
+  std::ostringstream file_name;
+  file_name << "aah_spds_" << std::hex << std::setw(16) << std::setfill('0') << key_ << std::dec
+            << "_" << opensn::mpi_comm.rank() << ".bin";
+  file_path_ = directory / file_name.str();
+}
+
+std::vector<std::shared_ptr<SPDS>>
+AAHSPDSCache::Read(const std::shared_ptr<MeshContinuum>& grid) const
+{
+  CALI_CXX_MARK_SCOPE("AAHSPDSCache::Read");
+
+  std::vector<std::shared_ptr<SPDS>> spds_list;
+
+  std::ifstream file(file_path_, std::ios::binary | std::ios::ate);
+  if (not file.is_open())
+    return spds_list;
+
+  std::vector<std::byte> data(static_cast<size_t>(file.tellg()));
+  file.seekg(0);
+  file.read(reinterpret_cast<char*>(data.data()), static_cast<std::streamsize>(data.size()));
+  if (not file)
+    return spds_list;
+  const ByteArray raw(std::move(data));
+
+  try
+  {
+    size_t address = 0;
+    if (raw.Read<uint64_t>(address, &address) != MAGIC or
+        raw.Read<uint64_t>(address, &address) != VERSION or
+        raw.Read<uint64_t>(address, &address) != key_)
+      return spds_list;
+
+    const auto num_spds = raw.Read<size_t>(address, &address);
+    for (size_t i = 0; i < num_spds; ++i)
+      spds_list.push_back(AAH_SPDS::DeSerialize(raw, address, grid));
+  }
+  catch (const std::exception& e)
+  {
+    log.LogAllWarning() << "Ignoring corrupt sweep cache file " << file_path_ << ": " << e.what();
+    spds_list.clear();
+  }
+
+  return spds_list;
+}
+
+void
+AAHSPDSCache::Write(const std::vector<std::shared_ptr<SPDS>>& spds_list) const
+{
+  CALI_CXX_MARK_SCOPE("AAHSPDSCache::Write");
+
+  ByteArray raw;
+  raw.Write<uint64_t>(MAGIC);
+  raw.Write<uint64_t>(VERSION);
+  raw.Write<uint64_t>(key_);
+  raw.Write<size_t>(spds_list.size());
+  for (const auto& spds : spds_list)
+    raw.Append(std::static_pointer_cast<AAH_SPDS>(spds)->Serialize());
+
+  // Write to a temporary file that is renamed when complete, so that concurrent or interrupted
+  // runs never read a partial cache file. The temporary file is named after the process, so that
+  // concurrent runs writing the same cache file do not write to the same temporary file.
+  std::error_code error;
+  std::filesystem::create_directories(file_path_.parent_path(), error);
+  auto tmp_file_path = file_path_;
+  tmp_file_path += ".tmp." + std::to_string(getpid());
+  {
+    std::ofstream file(tmp_file_path, std::ios::binary | std::ios::trunc);
+    file.write(reinterpret_cast<const char*>(raw.Data().data()),
+               static_cast<std::streamsize>(raw.Size()));
+    if (not file)
+    {
+      log.LogAllWarning() << "Failed to write sweep cache file " << file_path_ << ".";
+      file.close();
+      std::filesystem::remove(tmp_file_path, error);
+      return;
+    }
+  }
+  std::filesystem::rename(tmp_file_path, file_path_, error);
+  if (error)
+  {
+    log.LogAllWarning() << "Failed to write sweep cache file " << file_path_ << ": "
+                        << error.message();
+    std::filesystem::remove(tmp_file_path, error);
+  }
+}
+
+} // namespace opensn
@@ -0,0 +1,68 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/spds/aah.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/lbs_structs.h"
+#include <filesystem>
+#include <memory>
+#include <vector>
+
+namespace opensn
+{
+
+class AngularQuadrature;
+
+/**
+ * On-disk cache of the AAH sweep-plane data structures (SPDS) of a quadrature, including their
+ * feedback arc sets and global task dependency graphs.
+ *
+ * Each rank stores its SPDSs in its own file, named after a key that hashes the partitioned mesh
+ * on all ranks, the sweep directions and the cycle handling. A cache is only valid if the key
+ * matches, so that a changed mesh, partition, process count or quadrature is never reused.
+ */
+class AAHSPDSCache
+{
+public:
+  /**
+   * Creates the cache of the SPDSs for the sweep ordering groupings of a quadrature, given the
+   * hash of the mesh partition computed by ComputePartitionHash.
+   */
+  AAHSPDSCache(const std::filesystem::path& directory,
+               uint64_t partition_hash,
+               const AngularQuadrature& quadrature,
+               const UniqueSOGroupings& so_groupings,
+               bool allow_cycles);
+
+  /// Returns the key of the cache.
+  uint64_t GetKey() const { return key_; }
+
+  /// Returns the cache file of this rank.
+  const std::filesystem::path& GetFilePath() const { return file_path_; }
+
+  /**
+   * Reads the SPDSs of this rank from the cache. Returns an empty list if there is no cache file
+   * with a matching key.
+   */
+  std::vector<std::shared_ptr<SPDS>> Read(const std::shared_ptr<MeshContinuum>& grid) const;
+
+  /// Writes the SPDSs of this rank to the cache.
+  void Write(const std::vector<std::shared_ptr<SPDS>>& spds_list) const;
+
+  /**
+   * Computes a hash of the local and ghost cells of all ranks, i.e., of everything the sweep
+   * orderings depend on besides the directions. This is a collective operation.
+   */
+  static uint64_t ComputePartitionHash(const MeshContinuum& grid);
+
+private:
+  uint64_t key_;
+  std::filesystem::path file_path_;
+
+  /// Identifies the cache files, followed by the version of their format.
+  static constexpr uint64_t MAGIC = 0x5344505348414141ULL;
+  static constexpr uint64_t VERSION = 2;
+};
+
+} // namespace opensn
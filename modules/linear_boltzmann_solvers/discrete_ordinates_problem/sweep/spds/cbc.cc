@@ -63,10 +63,6 @@ CBC_SPDS::CBC_SPDS(const Vector3& omega,
   }
 
   // Create task list
-  std::vector<std::vector<int>> global_dependencies;
-  global_dependencies.resize(opensn::mpi_comm.size());
-  CommunicateLocationDependencies(location_dependencies_, global_dependencies);
-
   constexpr auto INCOMING = FaceOrientation::INCOMING;
   constexpr auto OUTGOING = FaceOrientation::OUTGOING;
 
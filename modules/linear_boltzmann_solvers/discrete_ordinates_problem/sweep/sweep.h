@@ -42,16 +42,6 @@ struct Task
   bool completed = false;
 };
 
-/// Stage Task Dependency Graphs
-struct STDG
-{
-  std::vector<int> item_id;
-};
-
-/// Communicates location by location dependencies.
-void CommunicateLocationDependencies(const std::vector<int>& location_dependencies,
-                                     std::vector<std::vector<int>>& global_dependencies);
-
 /// Print a sweep ordering to file.
 void PrintSweepOrdering(SPDS* sweep_order, std::shared_ptr<MeshContinuum> vol_continuum);
 
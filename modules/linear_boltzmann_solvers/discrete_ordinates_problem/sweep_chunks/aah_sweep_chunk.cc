@@ -5,13 +5,14 @@
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/fluds/aah_fluds.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "caliper/cali.h"
+#include <algorithm>
 
 namespace opensn
 {
 
 AAHSweepChunk::AAHSweepChunk(const std::shared_ptr<MeshContinuum> grid,
                              const SpatialDiscretization& discretization,
-                             const std::vector<UnitCellMatrices>& unit_cell_matrices,
+                             const UnitCellMatricesStore& unit_cell_matrices,
                              std::vector<CellLBSView>& cell_transport_views,
                              const std::vector<double>& densities,
                              std::vector<double>& destination_phi,
@@ -38,11 +39,23 @@ AAHSweepChunk::AAHSweepChunk(const std::shared_ptr<MeshContinuum> grid,
 
 void
 AAHSweepChunk::Sweep(AngleSet& angle_set)
+{
+  SweepGroupRange(angle_set, 0, groupset_.groups.size());
+}
+
+void
+AAHSweepChunk::SweepGroupRange(AngleSet& angle_set, size_t gs_begin, size_t gs_end)
 {
   CALI_CXX_MARK_SCOPE("AAHSweepChunk::Sweep");
 
-  auto gs_size = groupset_.groups.size();
-  auto gs_gi = groupset_.groups.front().id;
+  // All scratch data is local so that the chunk can be executed concurrently. Shared
+  // accumulators (phi and outflows) are guarded with the cell locks.
+  const auto gs_gi = groupset_.groups.front().id;
+
+  // Groups of the range are solved together. All per-group scratch data is stored with the group
+  // index innermost (contiguous) so that the loops over groups vectorize.
+  const size_t num_groups = gs_end - gs_begin;
+  const size_t gi = gs_gi + gs_begin;
 
   int deploc_face_counter = -1;
   int preloc_face_counter = -1;
@@ -51,10 +64,13 @@ AAHSweepChunk::Sweep(AngleSet& angle_set)
   const auto& m2d_op = groupset_.quadrature->GetMomentToDiscreteOperator();
   const auto& d2m_op = groupset_.quadrature->GetDiscreteToMomentOperator();
 
-  DenseMatrix<double> Amat(max_num_cell_dofs_, max_num_cell_dofs_);
-  DenseMatrix<double> Atemp(max_num_cell_dofs_, max_num_cell_dofs_);
-  std::vector<Vector<double>> b(groupset_.groups.size(), Vector<double>(max_num_cell_dofs_, 0.));
-  std::vector<double> source(max_num_cell_dofs_);
+  const size_t max_dofs = max_num_cell_dofs_;
+  DenseMatrix<double> Amat(max_dofs, max_dofs);
+  std::vector<double> Ag(max_dofs * max_dofs * num_groups);
+  std::vector<double> bg(max_dofs * num_groups);
+  std::vector<double> source(max_dofs * num_groups);
+  std::vector<double> sigma_tg(num_groups);
+  std::vector<double> tau_g(psi_old_ ? num_groups : 0);
 
   // Loop over each cell
   const auto& spds = angle_set.GetSPDS();
@@ -74,6 +90,23 @@ AAHSweepChunk::Sweep(AngleSet& angle_set)
 
     const auto& rho = densities_[cell.local_id];
     const auto& sigma_t = xs_.at(cell.block_id)->GetSigmaTotal();
+    for (size_t g = 0; g < num_groups; ++g)
+      sigma_tg[g] = rho * sigma_t[gi + g];
+
+    // Time derivative tau_g = 1 / (v_g theta dt), added to the total cross section
+    const double* cell_psi_old = nullptr;
+    if (psi_old_)
+    {
+      const auto& inv_velocity = xs_.at(cell.block_id)->GetInverseVelocity();
+      for (size_t g = 0; g < num_groups; ++g)
+      {
+        tau_g[g] = inv_velocity[gi + g] * inv_theta_dt_;
+        sigma_tg[g] += tau_g[g];
+      }
+      if (time_source_active_)
+        cell_psi_old =
+          &(*psi_old_)[discretization_.MapDOFLocal(cell, 0, groupset_.psi_uk_man_, 0, 0)];
+    }
 
     // Get cell matrices
     const auto& G = unit_cell_matrices_[cell_local_id].intV_shapeI_gradshapeJ;
@@ -94,17 +127,10 @@ AAHSweepChunk::Sweep(AngleSet& angle_set)
       preloc_face_counter = ni_preloc_face_counter;
 
       // Reset right-hand side
-      for (int gsg = 0; gsg < gs_size; ++gsg)
-        for (int i = 0; i < cell_num_nodes; ++i)
-          b[gsg](i) = 0.0;
+      std::fill(bg.begin(), bg.begin() + cell_num_nodes * num_groups, 0.0);
 
-      for (int i = 0; i < cell_num_nodes; ++i)
-        for (int j = 0; j < cell_num_nodes; ++j)
-          Amat(i, j) = omega.Dot(G(i, j));
-
-      // Update face orientations
-      for (int f = 0; f < cell_num_faces; ++f)
-        face_mu_values[f] = omega.Dot(cell.faces[f].normal);
+      // Streaming operator, shared by all groups, and face orientations
+      EvaluateStreamingOperator(cell, direction_num, omega, G, Amat, face_mu_values);
 
       // Surface integrals
       int in_face_counter = -1;
@@ -127,6 +153,7 @@ AAHSweepChunk::Sweep(AngleSet& angle_set)
         for (int fi = 0; fi < num_face_nodes; ++fi)
         {
           const int i = cell_mapping.MapFaceNode(f, fi);
+          double* b_i = &bg[i * num_groups];
 
           for (int fj = 0; fj < num_face_nodes; ++fj)
           {
@@ -152,57 +179,72 @@ AAHSweepChunk::Sweep(AngleSet& angle_set)
             if (not psi)
               continue;
 
-            for (int gsg = 0; gsg < gs_size; ++gsg)
-              b[gsg](i) += psi[gsg] * mu_Nij;
+            psi += gs_begin;
+            for (size_t g = 0; g < num_groups; ++g)
+              b_i[g] += psi[g] * mu_Nij;
           } // for face node j
         }   // for face node i
       }     // for f
 
-      // Looping over groups, assembling mass terms
-      for (int gsg = 0; gsg < gs_size; ++gsg)
+      // Contribute source moments q = M_n^T * q_moms
+      for (int i = 0; i < cell_num_nodes; ++i)
       {
-        double sigma_tg = rho * sigma_t[gs_gi + gsg];
+        double* source_i = &source[i * num_groups];
+        std::fill(source_i, source_i + num_groups, 0.0);
+        for (int m = 0; m < num_moments_; ++m)
+        {
+          const double m2d = m2d_op[m][direction_num];
+          const double* q_moms = &source_moments_[cell_transport_view.MapDOF(i, m, gi)];
+          for (size_t g = 0; g < num_groups; ++g)
+            source_i[g] += m2d * q_moms[g];
+        }
 
-        // Contribute source moments q = M_n^T * q_moms
-        for (int i = 0; i < cell_num_nodes; ++i)
+        // Time derivative source tau_g * psi_old
+        if (cell_psi_old)
         {
-          double temp_src = 0.0;
-          for (int m = 0; m < num_moments_; ++m)
-          {
-            const size_t ir = cell_transport_view.MapDOF(i, m, static_cast<int>(gs_gi + gsg));
-            temp_src += m2d_op[m][direction_num] * source_moments_[ir];
-          }
-          source[i] = temp_src;
+          const double* psi_old = &cell_psi_old[i * groupset_angle_group_stride_ +
+                                                direction_num * groupset_group_stride_ + gs_begin];
+          for (size_t g = 0; g < num_groups; ++g)
+            source_i[g] += tau_g[g] * psi_old[g];
         }
+      }
 
-        // Mass matrix and source
-        // Atemp = Amat + sigma_tgr * M
-        // b += M * q
-        for (int i = 0; i < cell_num_nodes; ++i)
+      // Mass matrix and source, assembled for all groups at once
+      // A_g = Amat + sigma_tg * M
+      // b_g += M * q_g
+      for (int i = 0; i < cell_num_nodes; ++i)
+      {
+        double* b_i = &bg[i * num_groups];
+        for (int j = 0; j < cell_num_nodes; ++j)
         {
-          double temp = 0.0;
-          for (int j = 0; j < cell_num_nodes; ++j)
+          const double Aij = Amat(i, j);
+          const double Mij = M(i, j);
+          double* A_ij = &Ag[(i * cell_num_nodes + j) * num_groups];
+          const double* source_j = &source[j * num_groups];
+          for (size_t g = 0; g < num_groups; ++g)
           {
-            auto Mij = M(i, j);
-            Atemp(i, j) = Amat(i, j) + Mij * sigma_tg;
-            temp += Mij * source[j];
+            A_ij[g] = Aij + Mij * sigma_tg[g];
+            b_i[g] += Mij * source_j[g];
           }
-          b[gsg](i) += temp;
         }
+      }
 
-        // Solve system
-        GaussElimination(Atemp, b[gsg], static_cast<int>(cell_num_nodes));
-      } // for gsg
+      // Solve the systems of all groups
+      BatchedGaussElimination(Ag.data(), bg.data(), cell_num_nodes, num_groups);
 
       // Update phi
-      for (int m = 0; m < num_moments_; ++m)
       {
-        const double wn_d2m = d2m_op[m][direction_num];
-        for (int i = 0; i < cell_num_nodes; ++i)
+        const auto lock = LockCell(cell_local_id);
+        for (int m = 0; m < num_moments_; ++m)
         {
-          const size_t ir = cell_transport_view.MapDOF(i, m, gs_gi);
-          for (int gsg = 0; gsg < gs_size; ++gsg)
-            destination_phi_[ir + gsg] += wn_d2m * b[gsg](i);
+          const double wn_d2m = d2m_op[m][direction_num];
+          for (int i = 0; i < cell_num_nodes; ++i)
+          {
+            double* phi = &destination_phi_[cell_transport_view.MapDOF(i, m, gi)];
+            const double* b_i = &bg[i * num_groups];
+            for (size_t g = 0; g < num_groups; ++g)
+              phi[g] += wn_d2m * b_i[g];
+          }
         }
       }
 
@@ -215,9 +257,8 @@ AAHSweepChunk::Sweep(AngleSet& angle_set)
         for (size_t i = 0; i < cell_num_nodes; ++i)
         {
           const size_t imap =
-            i * groupset_angle_group_stride_ + direction_num * groupset_group_stride_;
-          for (int gsg = 0; gsg < gs_size; ++gsg)
-            cell_psi_data[imap + gsg] = b[gsg](i);
+            i * groupset_angle_group_stride_ + direction_num * groupset_group_stride_ + gs_begin;
+          std::copy_n(&bg[i * num_groups], num_groups, &cell_psi_data[imap]);
         }
       }
 
@@ -240,16 +281,21 @@ AAHSweepChunk::Sweep(AngleSet& angle_set)
         if (not is_boundary_face and not is_local_face)
           ++deploc_face_counter;
 
+        std::unique_lock<std::mutex> outflow_lock;
+        if (is_boundary_face)
+          outflow_lock = LockCell(cell_local_id);
+
         const size_t num_face_nodes = cell_mapping.GetNumFaceNodes(f);
         for (int fi = 0; fi < num_face_nodes; ++fi)
         {
           const int i = cell_mapping.MapFaceNode(f, fi);
+          const double* b_i = &bg[i * num_groups];
 
           if (is_boundary_face)
           {
-            for (int gsg = 0; gsg < gs_size; ++gsg)
+            for (size_t g = 0; g < num_groups; ++g)
               cell_transport_view.AddOutflow(
-                f, gs_gi + gsg, wt * face_mu_values[f] * b[gsg](i) * IntF_shapeI(i));
+                f, gi + g, wt * face_mu_values[f] * b_i[g] * IntF_shapeI(i));
           }
 
           double* psi = nullptr;
@@ -263,10 +309,7 @@ AAHSweepChunk::Sweep(AngleSet& angle_set)
             continue;
 
           if (not is_boundary_face or is_reflecting_boundary_face)
-          {
-            for (int gsg = 0; gsg < gs_size; ++gsg)
-              psi[gsg] = b[gsg](i);
-          }
+            std::copy_n(b_i, num_groups, psi + gs_begin);
         } // for fi
       }   // for face
     }     // for angleset/subset
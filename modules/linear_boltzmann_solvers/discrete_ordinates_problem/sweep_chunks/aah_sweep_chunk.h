@@ -15,7 +15,7 @@ class AAHSweepChunk : public SweepChunk
 public:
   AAHSweepChunk(const std::shared_ptr<MeshContinuum> grid,
                 const SpatialDiscretization& discretization,
-                const std::vector<UnitCellMatrices>& unit_cell_matrices,
+                const UnitCellMatricesStore& unit_cell_matrices,
                 std::vector<CellLBSView>& cell_transport_views,
                 const std::vector<double>& densities,
                 std::vector<double>& destination_phi,
@@ -27,6 +27,10 @@ public:
                 int max_num_cell_dofs);
 
   void Sweep(AngleSet& angle_set) override;
+
+  void SweepGroupRange(AngleSet& angle_set, size_t gs_begin, size_t gs_end) override;
+
+  bool SupportsThreadedSweep() const override { return true; }
 };
 
 } // namespace opensn
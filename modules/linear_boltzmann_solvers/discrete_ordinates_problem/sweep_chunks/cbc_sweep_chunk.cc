@@ -16,7 +16,7 @@ CBCSweepChunk::CBCSweepChunk(std::vector<double>& destination_phi,
                              std::vector<double>& destination_psi,
                              const std::shared_ptr<MeshContinuum> grid,
                              const SpatialDiscretization& discretization,
-                             const std::vector<UnitCellMatrices>& unit_cell_matrices,
+                             const UnitCellMatricesStore& unit_cell_matrices,
                              std::vector<CellLBSView>& cell_transport_views,
                              const std::vector<double>& densities,
                              const std::vector<double>& source_moments,
@@ -100,6 +100,12 @@ CBCSweepChunk::Sweep(AngleSet& angle_set)
   const auto& rho = densities_[cell_local_id_];
   const auto& sigma_t = xs_.at(cell_->block_id)->GetSigmaTotal();
 
+  // Angular fluxes at the start of the time step, when sweeping a time step
+  const double* cell_psi_old = nullptr;
+  if (psi_old_ and time_source_active_)
+    cell_psi_old =
+      &(*psi_old_)[discretization_.MapDOFLocal(*cell_, 0, groupset_.psi_uk_man_, 0, 0)];
+
   // as = angle set
   // ss = subset
   const std::vector<size_t>& as_angle_indices = angle_set.GetAngleIndices();
@@ -114,13 +120,8 @@ CBCSweepChunk::Sweep(AngleSet& angle_set)
       for (int i = 0; i < cell_num_nodes_; ++i)
         b[gsg](i) = 0.0;
 
-    for (int i = 0; i < cell_num_nodes_; ++i)
-      for (int j = 0; j < cell_num_nodes_; ++j)
-        Amat(i, j) = omega.Dot(G_(i, j));
-
-    // Update face orientations
-    for (int f = 0; f < cell_num_faces_; ++f)
-      face_mu_values[f] = omega.Dot(cell_->faces[f].normal);
+    // Streaming operator and face orientations
+    EvaluateStreamingOperator(*cell_, direction_num, omega, G_, Amat, face_mu_values);
 
     // Surface integrals
     for (int f = 0; f < cell_num_faces_; ++f)
@@ -133,17 +134,16 @@ CBCSweepChunk::Sweep(AngleSet& angle_set)
       const bool is_boundary_face = not face.has_neighbor;
       auto face_nodal_mapping = &fluds_->GetCommonData().GetFaceNodalMapping(cell_local_id_, f);
 
-      const std::vector<double>* psi_upwnd_data_block = nullptr;
+      const double* psi_nonlocal_face_upwnd_data = nullptr;
       const double* psi_local_face_upwnd_data = nullptr;
       if (is_local_face)
       {
-        psi_upwnd_data_block = &fluds_->GetLocalUpwindDataBlock();
         psi_local_face_upwnd_data = fluds_->GetLocalCellUpwindPsi(
-          *psi_upwnd_data_block, *cell_transport_view_->FaceNeighbor(f));
+          fluds_->GetLocalUpwindDataBlock(), *cell_transport_view_->FaceNeighbor(f));
       }
       else if (not is_boundary_face)
       {
-        psi_upwnd_data_block = &fluds_->GetNonLocalUpwindData(cell_->global_id, f);
+        psi_nonlocal_face_upwnd_data = fluds_->GetNonLocalUpwindData(cell_->global_id, f);
       }
 
       // IntSf_mu_psi_Mij_dA
@@ -169,9 +169,10 @@ CBCSweepChunk::Sweep(AngleSet& angle_set)
           }
           else if (not is_boundary_face)
           {
-            assert(psi_upwnd_data_block);
+            assert(psi_nonlocal_face_upwnd_data);
             const unsigned int adj_face_node = face_nodal_mapping->face_node_mapping_[fj];
-            psi = fluds_->GetNonLocalUpwindPsi(*psi_upwnd_data_block, adj_face_node, as_ss_idx);
+            psi =
+              fluds_->GetNonLocalUpwindPsi(psi_nonlocal_face_upwnd_data, adj_face_node, as_ss_idx);
           }
           else
             psi = angle_set.PsiBoundary(face.neighbor_id,
@@ -196,6 +197,14 @@ CBCSweepChunk::Sweep(AngleSet& angle_set)
     {
       double sigma_tg = rho * sigma_t[gs_gi_ + gsg];
 
+      // Time derivative tau_g = 1 / (v_g theta dt), added to the total cross section
+      double tau_g = 0.0;
+      if (psi_old_)
+      {
+        tau_g = xs_.at(cell_->block_id)->GetInverseVelocity()[gs_gi_ + gsg] * inv_theta_dt_;
+        sigma_tg += tau_g;
+      }
+
       // Contribute source moments q = M_n^T * q_moms
       for (int i = 0; i < cell_num_nodes_; ++i)
       {
@@ -205,6 +214,9 @@ CBCSweepChunk::Sweep(AngleSet& angle_set)
           const size_t ir = cell_transport_view_->MapDOF(i, m, static_cast<int>(gs_gi_ + gsg));
           temp_src += m2d_op[m][direction_num] * source_moments_[ir];
         }
+        if (cell_psi_old)
+          temp_src += tau_g * cell_psi_old[i * groupset_angle_group_stride_ +
+                                           direction_num * groupset_group_stride_ + gsg];
         source[i] = temp_src;
       }
 
@@ -270,16 +282,16 @@ CBCSweepChunk::Sweep(AngleSet& angle_set)
       const int locality = cell_transport_view_->FaceLocality(f);
       const size_t num_face_nodes = cell_mapping_->GetNumFaceNodes(f);
       auto& face_nodal_mapping = fluds_->GetCommonData().GetFaceNodalMapping(cell_local_id_, f);
-      std::vector<double>* psi_dnwnd_data = nullptr;
+      double* psi_dnwnd_data = nullptr;
       if (not is_boundary_face and not is_local_face)
       {
         auto& async_comm = *angle_set.GetCommunicator();
         size_t data_size = num_face_nodes * group_angle_stride_;
-        psi_dnwnd_data = &async_comm.InitGetDownwindMessageData(locality,
-                                                                face.neighbor_id,
-                                                                face_nodal_mapping.associated_face_,
-                                                                angle_set.GetID(),
-                                                                data_size);
+        psi_dnwnd_data = async_comm.InitGetDownwindMessageData(locality,
+                                                               face.neighbor_id,
+                                                               face_nodal_mapping.associated_face_,
+                                                               angle_set.GetID(),
+                                                               data_size);
       }
 
       for (int fi = 0; fi < num_face_nodes; ++fi)
@@ -300,7 +312,7 @@ CBCSweepChunk::Sweep(AngleSet& angle_set)
         {
           assert(psi_dnwnd_data);
           const size_t addr_offset = fi * group_angle_stride_ + as_ss_idx * group_stride_;
-          psi = &(*psi_dnwnd_data)[addr_offset];
+          psi = &psi_dnwnd_data[addr_offset];
         }
         else if (is_reflecting_boundary_face)
           psi = angle_set.PsiReflected(face.neighbor_id, direction_num, cell_local_id_, f, fi);
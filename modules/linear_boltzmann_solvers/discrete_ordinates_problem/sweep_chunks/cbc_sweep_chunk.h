@@ -17,7 +17,7 @@ public:
                 std::vector<double>& destination_psi,
                 const std::shared_ptr<MeshContinuum> grid,
                 const SpatialDiscretization& discretization,
-                const std::vector<UnitCellMatrices>& unit_cell_matrices,
+                const UnitCellMatricesStore& unit_cell_matrices,
                 std::vector<CellLBSView>& cell_transport_views,
                 const std::vector<double>& densities,
                 const std::vector<double>& source_moments,
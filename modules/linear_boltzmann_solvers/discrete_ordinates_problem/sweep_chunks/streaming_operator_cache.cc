@@ -0,0 +1,70 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep_chunks/streaming_operator_cache.h"
+#include "framework/mesh/mesh_continuum/mesh_continuum.h"
+#include "framework/math/quadratures/angular/angular_quadrature.h"
+#include "caliper/cali.h"
+
+namespace opensn
+{
+
+StreamingOperatorCache::StreamingOperatorCache(const MeshContinuum& grid,
+                                               const UnitCellMatricesStore& unit_cell_matrices,
+                                               const AngularQuadrature& quadrature,
+                                               const size_t max_memory)
+{
+  CALI_CXX_MARK_SCOPE("StreamingOperatorCache::StreamingOperatorCache");
+
+  const size_t num_directions = quadrature.omegas.size();
+  const size_t num_local_cells = grid.local_cells.size();
+  const size_t max_num_values = max_memory / sizeof(double);
+
+  // Determine which cells fit in the budget
+  cell_offsets_.assign(num_local_cells, NOT_CACHED);
+  cell_strides_.assign(num_local_cells, 0);
+  size_t num_values = 0;
+  for (const auto& cell : grid.local_cells)
+  {
+    const size_t num_nodes = unit_cell_matrices[cell.local_id].intV_shapeI_gradshapeJ.Rows();
+    const size_t stride = num_nodes * num_nodes + cell.faces.size();
+    const size_t cell_num_values = stride * num_directions;
+    if (num_values + cell_num_values > max_num_values)
+      break;
+
+    cell_offsets_[cell.local_id] = num_values;
+    cell_strides_[cell.local_id] = stride;
+    num_values += cell_num_values;
+    ++num_cached_cells_;
+  }
+
+  // Evaluate the cached quantities
+  data_.resize(num_values);
+  for (const auto& cell : grid.local_cells)
+  {
+    if (cell_offsets_[cell.local_id] == NOT_CACHED)
+      continue;
+
+    const auto& G = unit_cell_matrices[cell.local_id].intV_shapeI_gradshapeJ;
+    const size_t num_nodes = G.Rows();
+    for (size_t d = 0; d < num_directions; ++d)
+    {
+      const auto& omega = quadrature.omegas[d];
+      double* values = &data_[cell_offsets_[cell.local_id] + d * cell_strides_[cell.local_id]];
+      for (size_t i = 0; i < num_nodes; ++i)
+        for (size_t j = 0; j < num_nodes; ++j)
+          *values++ = omega.Dot(G(i, j));
+      for (const auto& face : cell.faces)
+        *values++ = omega.Dot(face.normal);
+    }
+  }
+}
+
+size_t
+StreamingOperatorCache::GetMemoryUsage() const
+{
+  return data_.capacity() * sizeof(double) +
+         (cell_offsets_.capacity() + cell_strides_.capacity()) * sizeof(size_t);
+}
+
+} // namespace opensn
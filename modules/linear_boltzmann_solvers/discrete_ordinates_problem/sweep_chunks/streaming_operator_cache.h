@@ -0,0 +1,71 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include "modules/linear_boltzmann_solvers/lbs_problem/lbs_structs.h"
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace opensn
+{
+
+class MeshContinuum;
+class AngularQuadrature;
+
+/**
+ * Precomputed direction-dependent streaming data of local cells for a single angular quadrature.
+ *
+ * For every cached cell and every direction of the quadrature the cache stores the streaming
+ * operator \f$ \Omega \cdot \int_V b_i \nabla b_j \f$ (row-major, `num_nodes x num_nodes`)
+ * followed by the face cosines \f$ \Omega \cdot \hat{n}_f \f$. These quantities do not change
+ * between sweeps, so caching them removes their evaluation from the sweep kernels at the cost of
+ * memory. Cells are cached in local id order until the memory budget is exhausted. The remaining
+ * cells are evaluated on the fly.
+ */
+class StreamingOperatorCache
+{
+public:
+  /**
+   * Builds the cache.
+   *
+   * \param grid The mesh.
+   * \param unit_cell_matrices The unit cell matrices of the local cells.
+   * \param quadrature The angular quadrature whose directions are cached.
+   * \param max_memory Maximum size of the cache in bytes.
+   */
+  StreamingOperatorCache(const MeshContinuum& grid,
+                         const UnitCellMatricesStore& unit_cell_matrices,
+                         const AngularQuadrature& quadrature,
+                         size_t max_memory);
+
+  /**
+   * Returns the cached data of a cell for a direction, or `nullptr` if the cell is not cached.
+   * The streaming operator occupies the first `num_nodes * num_nodes` entries and the face
+   * cosines the following `num_faces` entries.
+   */
+  const double* GetData(uint64_t cell_local_id, size_t direction_num) const
+  {
+    const auto offset = cell_offsets_[cell_local_id];
+    if (offset == NOT_CACHED)
+      return nullptr;
+    return &data_[offset + direction_num * cell_strides_[cell_local_id]];
+  }
+
+  /// Returns the number of local cells that are cached.
+  size_t GetNumCachedCells() const { return num_cached_cells_; }
+
+  /// Returns the memory used by the cache, in bytes.
+  size_t GetMemoryUsage() const;
+
+private:
+  static constexpr size_t NOT_CACHED = static_cast<size_t>(-1);
+
+  size_t num_cached_cells_ = 0;
+  std::vector<size_t> cell_offsets_;
+  std::vector<size_t> cell_strides_;
+  std::vector<double> data_;
+};
+
+} // namespace opensn
@@ -3,9 +3,53 @@
 
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep_chunks/sweep_chunk.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
+#include <algorithm>
 
 namespace opensn
 {
+
+void
+SweepChunk::EnableThreadedSweep()
+{
+  // A fixed number of lock stripes keeps the memory overhead bounded for large meshes while
+  // making contention between threads working on different cells unlikely.
+  const size_t max_num_stripes = 4096;
+  const size_t num_stripes =
+    std::max<size_t>(1, std::min(grid_->local_cells.size(), max_num_stripes));
+  if (cell_locks_.size() != num_stripes)
+    cell_locks_ = std::vector<std::mutex>(num_stripes);
+}
+
+void
+SweepChunk::EvaluateStreamingOperator(const Cell& cell,
+                                      const size_t direction_num,
+                                      const Vector3& omega,
+                                      const DenseMatrix<Vector3>& G,
+                                      DenseMatrix<double>& Amat,
+                                      std::vector<double>& face_mu_values) const
+{
+  const size_t num_nodes = G.Rows();
+  const size_t num_faces = cell.faces.size();
+
+  const double* cached = streaming_operator_cache_
+                           ? streaming_operator_cache_->GetData(cell.local_id, direction_num)
+                           : nullptr;
+  if (cached)
+  {
+    for (size_t i = 0; i < num_nodes; ++i)
+      for (size_t j = 0; j < num_nodes; ++j)
+        Amat(i, j) = *cached++;
+    std::copy_n(cached, num_faces, face_mu_values.begin());
+    return;
+  }
+
+  for (size_t i = 0; i < num_nodes; ++i)
+    for (size_t j = 0; j < num_nodes; ++j)
+      Amat(i, j) = omega.Dot(G(i, j));
+  for (size_t f = 0; f < num_faces; ++f)
+    face_mu_values[f] = omega.Dot(cell.faces[f].normal);
+}
+
 void
 SweepChunk::ZeroDestinationPhi()
 {
@@ -5,8 +5,10 @@
 
 #include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep/angle_aggregation/angle_aggregation.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/groupset/lbs_groupset.h"
+#include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/sweep_chunks/streaming_operator_cache.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_structs.h"
 #include <functional>
+#include <mutex>
 
 namespace opensn
 {
@@ -30,7 +32,7 @@ public:
              std::vector<double>& destination_psi,
              const std::shared_ptr<MeshContinuum> grid,
              const SpatialDiscretization& discretization,
-             const std::vector<UnitCellMatrices>& unit_cell_matrices,
+             const UnitCellMatricesStore& unit_cell_matrices,
              std::vector<CellLBSView>& cell_transport_views,
              const std::vector<double>& densities,
              const std::vector<double>& source_moments,
@@ -60,6 +62,47 @@ public:
   /// Sweep chunks should override this.
   virtual void Sweep(AngleSet& angle_set) {}
 
+  /**
+   * Sweeps the groupset-relative groups `[gs_begin, gs_end)` of an angleset. This is only called
+   * by threaded sweep schedulers, possibly concurrently for different anglesets and group ranges,
+   * and only for sweep chunks that report `SupportsThreadedSweep()`.
+   */
+  virtual void SweepGroupRange(AngleSet& angle_set, size_t gs_begin, size_t gs_end)
+  {
+    OpenSnLogicalError("Threaded sweeps are not supported by this sweep chunk.");
+  }
+
+  /// Returns true if the chunk can be executed concurrently by a threaded sweep scheduler.
+  virtual bool SupportsThreadedSweep() const { return false; }
+
+  /**
+   * Allocates the locks that guard shared accumulators (flux moments and outflows) so that the
+   * chunk can be executed concurrently.
+   */
+  void EnableThreadedSweep();
+
+  /**
+   * Sets the cache of precomputed streaming operators and face cosines. Passing `nullptr`
+   * evaluates them on the fly.
+   */
+  void SetStreamingOperatorCache(std::shared_ptr<const StreamingOperatorCache> cache)
+  {
+    streaming_operator_cache_ = std::move(cache);
+  }
+
+  /**
+   * Adds the time derivative of a theta-scheme time step to the sweeps, which then solve
+   * \f$ (\Omega \cdot \nabla + \sigma_t + \frac{1}{v \theta \Delta t}) \psi = q +
+   * \frac{\psi_{old}}{v \theta \Delta t} \f$, with `inv_theta_dt` \f$ = 1/(\theta \Delta t)
+   * \f$ and `psi_old` laid out as the angular fluxes of the groupset. Passing `nullptr` removes
+   * the time derivative.
+   */
+  void SetTimeDependentTerm(const std::vector<double>* psi_old, double inv_theta_dt)
+  {
+    psi_old_ = psi_old;
+    inv_theta_dt_ = inv_theta_dt;
+  }
+
   /// Sets the currently active angleset.
   virtual void SetAngleSet(AngleSet& angle_set) {}
 
@@ -83,10 +126,39 @@ public:
   /// Returns the surface src-active flag.
   bool IsSurfaceSourceActive() const { return surface_source_active_; }
 
+  /**
+   * Activates or deactivates the time derivative source \f$ \psi_{old}/(v \theta \Delta t) \f$.
+   * The time derivative is only added to the total cross section while it is inactive.
+   */
+  void SetTimeSourceActiveFlag(bool flag_value) { time_source_active_ = flag_value; }
+
 protected:
+  /**
+   * Locks the shared accumulators of a cell. Returns an empty lock when the chunk is not
+   * executed concurrently.
+   */
+  std::unique_lock<std::mutex> LockCell(uint64_t cell_local_id)
+  {
+    if (cell_locks_.empty())
+      return {};
+    return std::unique_lock<std::mutex>(cell_locks_[cell_local_id % cell_locks_.size()]);
+  }
+
+  /**
+   * Sets `Amat(i, j)` to the streaming operator \f$ \Omega \cdot \int_V b_i \nabla b_j \f$ of a
+   * cell and `face_mu_values[f]` to \f$ \Omega \cdot \hat{n}_f \f$, using the streaming operator
+   * cache when the cell is cached.
+   */
+  void EvaluateStreamingOperator(const Cell& cell,
+                                 size_t direction_num,
+                                 const Vector3& omega,
+                                 const DenseMatrix<Vector3>& G,
+                                 DenseMatrix<double>& Amat,
+                                 std::vector<double>& face_mu_values) const;
+
   const std::shared_ptr<MeshContinuum> grid_;
   const SpatialDiscretization& discretization_;
-  const std::vector<UnitCellMatrices>& unit_cell_matrices_;
+  const UnitCellMatricesStore& unit_cell_matrices_;
   std::vector<CellLBSView>& cell_transport_views_;
   const std::vector<double>& densities_;
   const std::vector<double>& source_moments_;
@@ -100,6 +172,15 @@ protected:
   std::vector<double>& destination_phi_;
   std::vector<double>& destination_psi_;
   bool surface_source_active_ = false;
+  std::shared_ptr<const StreamingOperatorCache> streaming_operator_cache_;
+  /// Angular fluxes at the start of the time step, when sweeping a time step.
+  const std::vector<double>* psi_old_ = nullptr;
+  double inv_theta_dt_ = 0.0;
+  bool time_source_active_ = false;
+
+private:
+  /// Striped locks over local cells, only allocated for threaded sweeps.
+  std::vector<std::mutex> cell_locks_;
 };
 
 } // namespace opensn
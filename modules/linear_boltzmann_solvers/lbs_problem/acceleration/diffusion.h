@@ -13,7 +13,7 @@ class MeshContinuum;
 class Cell;
 struct Vector3;
 class SpatialDiscretization;
-struct UnitCellMatrices;
+class UnitCellMatricesStore;
 struct Multigroup_D_and_sigR;
 
 /// Generic diffusion solver for acceleration.
@@ -31,7 +31,7 @@ protected:
 
   const MatID2XSMap mat_id_2_xs_map_;
 
-  const std::vector<UnitCellMatrices>& unit_cell_matrices_;
+  const UnitCellMatricesStore& unit_cell_matrices_;
 
   const int64_t num_local_dofs_;
   const int64_t num_global_dofs_;
@@ -64,7 +64,7 @@ public:
                   const UnknownManager& uk_man,
                   std::map<uint64_t, BoundaryCondition> bcs,
                   MatID2XSMap map_mat_id_2_xs,
-                  const std::vector<UnitCellMatrices>& unit_cell_matrices,
+                  const UnitCellMatricesStore& unit_cell_matrices,
                   bool requires_ghosts,
                   bool suppress_bcs,
                   bool verbose);
@@ -33,7 +33,7 @@ DiffusionMIPSolver::DiffusionMIPSolver(std::string name,
                                        const UnknownManager& uk_man,
                                        std::map<uint64_t, BoundaryCondition> bcs,
                                        MatID2XSMap map_mat_id_2_xs,
-                                       const std::vector<UnitCellMatrices>& unit_cell_matrices,
+                                       const UnitCellMatricesStore& unit_cell_matrices,
                                        const bool suppress_bcs,
                                        const bool verbose)
   : DiffusionSolver(std::move(name),
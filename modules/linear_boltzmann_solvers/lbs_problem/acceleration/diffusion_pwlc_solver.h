@@ -16,7 +16,7 @@ public:
                       const UnknownManager& uk_man,
                       std::map<uint64_t, BoundaryCondition> bcs,
                       MatID2XSMap map_mat_id_2_xs,
-                      const std::vector<UnitCellMatrices>& unit_cell_matrices,
+                      const UnitCellMatricesStore& unit_cell_matrices,
                       bool suppress_bcs,
                       bool verbose);
 
@@ -47,8 +47,17 @@ LBSGroupset::GetInputParameters()
                               30,
                               "If this inner linear solver is gmres, sets the number of "
                               "iterations before a restart occurs.");
+  params.AddOptionalParameter("anderson_depth",
+                              5,
+                              "If this inner linear solver is anderson_richardson, sets the number "
+                              "of previous iterates used to accelerate the iteration.");
   params.AddOptionalParameter(
     "allow_cycles", true, "Flag indicating whether cycles are to be allowed or not");
+  params.AddOptionalParameter("num_threads",
+                              1,
+                              "The number of threads per MPI rank used to sweep this groupset. "
+                              "Anglesets that are ready at the same time, and blocks of groups "
+                              "within them, are swept concurrently. Only supported by AAH sweeps.");
 
   // WG DSA options
   params.AddOptionalParameter("apply_wgdsa",
@@ -75,13 +84,17 @@ LBSGroupset::GetInputParameters()
   params.ConstrainParameterRange("angle_aggregation_type",
                                  AllowableRangeList::New({"polar", "single", "azimuthal"}));
   params.ConstrainParameterRange("angle_aggregation_num_subsets", AllowableRangeLowLimit::New(1));
-  params.ConstrainParameterRange(
-    "inner_linear_method",
-    AllowableRangeList::New(
-      {"classic_richardson", "petsc_richardson", "petsc_gmres", "petsc_bicgstab"}));
+  params.ConstrainParameterRange("inner_linear_method",
+                                 AllowableRangeList::New({"classic_richardson",
+                                                          "anderson_richardson",
+                                                          "petsc_richardson",
+                                                          "petsc_gmres",
+                                                          "petsc_bicgstab"}));
   params.ConstrainParameterRange("l_abs_tol", AllowableRangeLowLimit::New(1.0e-18));
   params.ConstrainParameterRange("l_max_its", AllowableRangeLowLimit::New(0));
   params.ConstrainParameterRange("gmres_restart_interval", AllowableRangeLowLimit::New(1));
+  params.ConstrainParameterRange("anderson_depth", AllowableRangeLowLimit::New(1));
+  params.ConstrainParameterRange("num_threads", AllowableRangeLowLimit::New(1));
 
   return params;
 }
@@ -101,7 +114,9 @@ LBSGroupset::Init(int aid)
   residual_tolerance = 1.0e-6;
   max_iterations = 200;
   gmres_restart_intvl = 30;
+  anderson_depth = 5;
   allow_cycles = false;
+  num_threads = 1;
   apply_wgdsa = false;
   apply_tgdsa = false;
   wgdsa_max_iters = 30;
@@ -174,6 +189,8 @@ LBSGroupset::LBSGroupset(const InputParameters& params, const int id, const LBSP
   const auto inner_linear_method = params.GetParamValue<std::string>("inner_linear_method");
   if (inner_linear_method == "classic_richardson")
     iterative_method = LinearSolver::IterativeMethod::CLASSIC_RICHARDSON;
+  else if (inner_linear_method == "anderson_richardson")
+    iterative_method = LinearSolver::IterativeMethod::ANDERSON_RICHARDSON;
   else if (inner_linear_method == "petsc_richardson")
     iterative_method = LinearSolver::IterativeMethod::PETSC_RICHARDSON;
   else if (inner_linear_method == "petsc_gmres")
@@ -182,7 +199,9 @@ LBSGroupset::LBSGroupset(const InputParameters& params, const int id, const LBSP
     iterative_method = LinearSolver::IterativeMethod::PETSC_BICGSTAB;
 
   gmres_restart_intvl = params.GetParamValue<int>("gmres_restart_interval");
+  anderson_depth = params.GetParamValue<int>("anderson_depth");
   allow_cycles = params.GetParamValue<bool>("allow_cycles");
+  num_threads = params.GetParamValue<unsigned int>("num_threads");
   residual_tolerance = params.GetParamValue<double>("l_abs_tol");
   max_iterations = params.GetParamValue<int>("l_max_its");
 
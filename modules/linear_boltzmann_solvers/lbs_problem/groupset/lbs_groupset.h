@@ -38,8 +38,10 @@ public:
   double residual_tolerance;
   int max_iterations;
   int gmres_restart_intvl;
+  int anderson_depth;
 
   bool allow_cycles;
+  unsigned int num_threads;
 
   bool apply_wgdsa;
   bool apply_tgdsa;
@@ -4,7 +4,9 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/io/lbs_problem_io.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/io/single_file_io.h"
 #include "framework/utils/hdf_utils.h"
+#include "caliper/cali.h"
 
 namespace opensn
 {
@@ -13,17 +15,25 @@ void
 LBSSolverIO::WriteAngularFluxes(
   LBSProblem& lbs_problem,
   const std::string& file_base,
+  bool single_file,
+  unsigned int compression_level,
   std::optional<const std::reference_wrapper<std::vector<std::vector<double>>>> opt_src)
 {
+  // Select source vector
+  std::vector<std::vector<double>>& src =
+    opt_src.has_value() ? opt_src.value().get() : lbs_problem.GetPsiNewLocal();
+
+  if (single_file)
+  {
+    WriteAngularFluxesSingleFile(lbs_problem, file_base + ".h5", compression_level, src);
+    return;
+  }
+
   // Open the HDF5 file
   std::string file_name = file_base + std::to_string(opensn::mpi_comm.rank()) + ".h5";
   hid_t file_id = H5Fcreate(file_name.c_str(), H5F_ACC_TRUNC, H5P_DEFAULT, H5P_DEFAULT);
   OpenSnLogicalErrorIf(file_id < 0, "WriteAngularFluxes: Failed to open " + file_name + ".");
 
-  // Select source vector
-  std::vector<std::vector<double>>& src =
-    opt_src.has_value() ? opt_src.value().get() : lbs_problem.GetPsiNewLocal();
-
   log.Log() << "Writing angular flux to " << file_base;
 
   // Write macro info
@@ -106,17 +116,24 @@ void
 LBSSolverIO::ReadAngularFluxes(
   LBSProblem& lbs_problem,
   const std::string& file_base,
+  bool single_file,
   std::optional<std::reference_wrapper<std::vector<std::vector<double>>>> opt_dest)
 {
+  // Select destination vector
+  std::vector<std::vector<double>>& dest =
+    opt_dest.has_value() ? opt_dest.value().get() : lbs_problem.GetPsiNewLocal();
+
+  if (single_file)
+  {
+    ReadAngularFluxesSingleFile(lbs_problem, file_base + ".h5", dest);
+    return;
+  }
+
   // Open HDF5 file
   std::string file_name = file_base + std::to_string(opensn::mpi_comm.rank()) + ".h5";
   hid_t file_id = H5Fopen(file_name.c_str(), H5F_ACC_RDONLY, H5P_DEFAULT);
   OpenSnLogicalErrorIf(file_id < 0, "Failed to open " + file_name + ".");
 
-  // Select destination vector
-  std::vector<std::vector<double>>& dest =
-    opt_dest.has_value() ? opt_dest.value().get() : lbs_problem.GetPsiNewLocal();
-
   log.Log() << "Reading angular flux file from " << file_base;
 
   // Read macro data and check for compatibility
@@ -243,4 +260,137 @@ LBSSolverIO::ReadAngularFluxes(
   H5Fclose(file_id);
 }
 
+void
+LBSSolverIO::WriteAngularFluxesSingleFile(LBSProblem& lbs_problem,
+                                          const std::string& file_name,
+                                          unsigned int compression_level,
+                                          const std::vector<std::vector<double>>& src)
+{
+  CALI_CXX_MARK_SCOPE("LBSSolverIO::WriteAngularFluxesSingleFile");
+
+  hid_t file_id = CreateSingleFile(file_name);
+  OpenSnLogicalErrorIf(file_id < 0, "WriteAngularFluxes: Failed to open " + file_name + ".");
+
+  log.Log() << "Writing angular flux to " << file_name;
+
+  const auto& grid = lbs_problem.GetGrid();
+  const auto& discretization = lbs_problem.GetSpatialDiscretization();
+  const auto& groupsets = lbs_problem.GetGroupsets();
+
+  uint64_t num_groupsets = groupsets.size();
+  H5CreateAttribute(file_id, "num_groupsets", num_groupsets);
+
+  auto xfer_plist = CreateSingleFileTransferPlist();
+  const auto layout = WriteSingleFileMesh(file_id, lbs_problem, compression_level, xfer_plist);
+
+  bool success = true;
+  for (const auto& groupset : groupsets)
+  {
+    const auto& uk_man = groupset.psi_uk_man_;
+    const auto& psi = src.at(groupset.id);
+
+    uint64_t num_gs_dirs = groupset.quadrature->omegas.size();
+    uint64_t num_gs_groups = groupset.groups.size();
+
+    const auto group_name = "groupset_" + std::to_string(groupset.id);
+    success &= H5CreateGroup(file_id, group_name);
+    success &= H5CreateAttribute(file_id, group_name + "/num_directions", num_gs_dirs);
+    success &= H5CreateAttribute(file_id, group_name + "/num_groups", num_gs_groups);
+
+    // Angular fluxes are stored node-major, with all directions and groups of a node contiguous
+    const uint64_t stride = num_gs_dirs * num_gs_groups;
+    std::vector<double> values;
+    values.reserve(layout.num_local_nodes * stride);
+    for (const auto& cell : grid->local_cells)
+      for (uint64_t i = 0; i < discretization.GetCellNumNodes(cell); ++i)
+      {
+        const auto dof_map = discretization.MapDOFLocal(cell, i, uk_man, 0, 0);
+        values.insert(values.end(), psi.begin() + dof_map, psi.begin() + dof_map + stride);
+      }
+
+    success &= H5WriteDatasetSlab1D(file_id,
+                                    group_name + "/values",
+                                    layout.num_nodes * stride,
+                                    layout.node_offset * stride,
+                                    values,
+                                    compression_level,
+                                    xfer_plist);
+  }
+  OpenSnLogicalErrorIf(not success, "Failed to write angular fluxes to " + file_name + ".");
+
+  H5Pclose(xfer_plist);
+  H5Fclose(file_id);
+}
+
+void
+LBSSolverIO::ReadAngularFluxesSingleFile(LBSProblem& lbs_problem,
+                                         const std::string& file_name,
+                                         std::vector<std::vector<double>>& dest)
+{
+  CALI_CXX_MARK_SCOPE("LBSSolverIO::ReadAngularFluxesSingleFile");
+
+  hid_t file_id = H5Fopen(file_name.c_str(), H5F_ACC_RDONLY, H5P_DEFAULT);
+  OpenSnLogicalErrorIf(file_id < 0, "Failed to open " + file_name + ".");
+
+  log.Log() << "Reading angular flux file from " << file_name;
+
+  const auto& grid = lbs_problem.GetGrid();
+  const auto& discretization = lbs_problem.GetSpatialDiscretization();
+  const auto& groupsets = lbs_problem.GetGroupsets();
+
+  uint64_t file_num_groupsets = 0;
+  H5ReadAttribute(file_id, "num_groupsets", file_num_groupsets);
+  OpenSnLogicalErrorIf(file_num_groupsets != groupsets.size(),
+                       "Incompatible number of groupsets found in file " + file_name + ".");
+
+  // Check the groupsets and collect the datasets to read
+  std::vector<std::pair<std::string, uint64_t>> datasets;
+  for (const auto& groupset : groupsets)
+  {
+    const auto group_name = "groupset_" + std::to_string(groupset.id);
+
+    uint64_t file_num_gs_dirs = 0;
+    uint64_t file_num_gs_groups = 0;
+    H5ReadAttribute(file_id, group_name + "/num_directions", file_num_gs_dirs);
+    H5ReadAttribute(file_id, group_name + "/num_groups", file_num_gs_groups);
+
+    const uint64_t num_gs_dirs = groupset.quadrature->omegas.size();
+    const uint64_t num_gs_groups = groupset.groups.size();
+    OpenSnLogicalErrorIf(file_num_gs_dirs != num_gs_dirs,
+                         "Incompatible number of groupset angles found in file " + file_name +
+                           " for groupset " + std::to_string(groupset.id) + ".");
+    OpenSnLogicalErrorIf(file_num_gs_groups != num_gs_groups,
+                         "Incompatible number of groupset groups found in file " + file_name +
+                           " for groupset " + std::to_string(groupset.id) + ".");
+
+    datasets.emplace_back(group_name + "/values", num_gs_dirs * num_gs_groups);
+  }
+
+  const auto cell_data = ReadSingleFileCellData(file_id, lbs_problem, datasets, file_name);
+  H5Fclose(file_id);
+
+  dest.clear();
+  for (const auto& groupset : groupsets)
+    dest.emplace_back(discretization.GetNumLocalDOFs(groupset.psi_uk_man_), 0.0);
+
+  for (const auto& cell : grid->local_cells)
+  {
+    const auto& data = cell_data.at(cell.global_id);
+    const auto mapping =
+      MapFileCellNodes(discretization.GetCellNodeLocations(cell), data.nodes, cell.global_id);
+
+    for (size_t gs = 0; gs < groupsets.size(); ++gs)
+    {
+      const auto& uk_man = groupsets[gs].psi_uk_man_;
+      const auto stride = datasets[gs].second;
+      const auto& values = data.values[gs];
+      for (uint64_t n = 0; n < mapping.size(); ++n)
+      {
+        const auto dof_map = discretization.MapDOFLocal(cell, mapping[n], uk_man, 0, 0);
+        std::copy_n(&values[n * stride], stride, &dest[gs][dof_map]);
+      }
+    }
+  }
+}
+
 } // namespace opensn
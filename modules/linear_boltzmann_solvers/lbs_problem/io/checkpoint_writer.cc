@@ -0,0 +1,127 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "modules/linear_boltzmann_solvers/lbs_problem/io/checkpoint_writer.h"
+#include "framework/utils/hdf_utils.h"
+#include "framework/logging/log_exceptions.h"
+#include "caliper/cali.h"
+
+namespace opensn
+{
+
+CheckpointWriter::CheckpointWriter(bool asynchronous, unsigned int max_in_flight)
+  : asynchronous_(asynchronous), max_in_flight_(max_in_flight)
+{
+  OpenSnInvalidArgumentIf(max_in_flight_ == 0,
+                          "The number of checkpoints in flight must be at least 1.");
+
+  if (asynchronous_)
+    worker_ = std::thread(&CheckpointWriter::WorkerLoop, this);
+}
+
+CheckpointWriter::~CheckpointWriter()
+{
+  if (not asynchronous_)
+    return;
+
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    shutdown_ = true;
+  }
+  queue_changed_.notify_all();
+  worker_.join();
+}
+
+bool
+CheckpointWriter::Write(Checkpoint checkpoint)
+{
+  CALI_CXX_MARK_SCOPE("CheckpointWriter::Write");
+
+  if (not asynchronous_)
+    return WriteFile(checkpoint);
+
+  {
+    std::unique_lock<std::mutex> lock(mutex_);
+    queue_changed_.wait(lock, [this] { return num_in_flight_ < max_in_flight_; });
+    queue_.push_back(std::move(checkpoint));
+    ++num_in_flight_;
+  }
+  queue_changed_.notify_all();
+
+  return true;
+}
+
+bool
+CheckpointWriter::Wait()
+{
+  CALI_CXX_MARK_SCOPE("CheckpointWriter::Wait");
+
+  if (not asynchronous_)
+    return true;
+
+  std::unique_lock<std::mutex> lock(mutex_);
+  queue_changed_.wait(lock, [this] { return num_in_flight_ == 0; });
+  const bool success = (num_failed_ == 0);
+  num_failed_ = 0;
+  return success;
+}
+
+bool
+CheckpointWriter::WriteFile(const Checkpoint& checkpoint)
+{
+  CALI_CXX_MARK_SCOPE("CheckpointWriter::WriteFile");
+
+  auto tmp_file_name = checkpoint.file_name;
+  tmp_file_name += ".tmp";
+
+  auto file = H5Fcreate(tmp_file_name.c_str(), H5F_ACC_TRUNC, H5P_DEFAULT, H5P_DEFAULT);
+  bool success = (file >= 0);
+  if (file >= 0)
+  {
+    for (const auto& [name, values] : checkpoint.datasets)
+      success &= H5WriteDataset1D<double>(file, name, values);
+
+    for (auto [name, value] : checkpoint.attributes)
+      success &= H5CreateAttribute<double>(file, name, value);
+
+    success &= (H5Fclose(file) >= 0);
+  }
+
+  if (success)
+  {
+    std::error_code error;
+    std::filesystem::rename(tmp_file_name, checkpoint.file_name, error);
+    success = not error;
+  }
+
+  return success;
+}
+
+void
+CheckpointWriter::WorkerLoop()
+{
+  while (true)
+  {
+    Checkpoint checkpoint;
+    {
+      std::unique_lock<std::mutex> lock(mutex_);
+      queue_changed_.wait(lock, [this] { return shutdown_ or not queue_.empty(); });
+      if (queue_.empty())
+        return;
+      checkpoint = std::move(queue_.front());
+      queue_.pop_front();
+    }
+
+    const bool success = WriteFile(checkpoint);
+
+    {
+      std::lock_guard<std::mutex> lock(mutex_);
+      --num_in_flight_;
+      if (not success)
+        ++num_failed_;
+    }
+    queue_changed_.notify_all();
+  }
+}
+
+} // namespace opensn
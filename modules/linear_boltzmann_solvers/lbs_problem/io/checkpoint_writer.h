@@ -0,0 +1,89 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <condition_variable>
+#include <deque>
+#include <filesystem>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <utility>
+#include <vector>
+
+namespace opensn
+{
+
+/**
+ * Writes restart checkpoints, either synchronously or on a background I/O thread.
+ *
+ * A checkpoint is a self-contained snapshot of the data to write, so the solver can keep
+ * iterating (and modifying its own vectors) while an asynchronous checkpoint is being written.
+ * The number of checkpoints in flight is bounded, which bounds the memory used for snapshots.
+ * Checkpoints are written to a temporary file that is renamed on completion, so an interrupted
+ * write never replaces a previous, complete checkpoint.
+ *
+ * The HDF5 library is only called from the I/O thread while a checkpoint is in flight. Other
+ * HDF5 I/O on the calling thread must either use a thread-safe HDF5 build or call `Wait()`
+ * first.
+ */
+class CheckpointWriter
+{
+public:
+  /// Snapshot of the data of a checkpoint.
+  struct Checkpoint
+  {
+    std::filesystem::path file_name;
+    std::vector<std::pair<std::string, std::vector<double>>> datasets;
+    std::vector<std::pair<std::string, double>> attributes;
+  };
+
+  /**
+   * \param asynchronous Write checkpoints on a background I/O thread.
+   * \param max_in_flight Maximum number of asynchronous checkpoints queued or being written.
+   */
+  CheckpointWriter(bool asynchronous, unsigned int max_in_flight);
+
+  CheckpointWriter(const CheckpointWriter&) = delete;
+  CheckpointWriter& operator=(const CheckpointWriter&) = delete;
+
+  /// Waits for all checkpoints in flight to be written.
+  ~CheckpointWriter();
+
+  bool IsAsynchronous() const { return asynchronous_; }
+
+  /**
+   * Writes a checkpoint. Asynchronous checkpoints are queued and the call returns immediately,
+   * unless the maximum number of checkpoints is in flight, in which case it blocks until one has
+   * been written. Returns false if a synchronous checkpoint failed.
+   */
+  bool Write(Checkpoint checkpoint);
+
+  /**
+   * Blocks until all checkpoints in flight have been written. Returns false if any asynchronous
+   * checkpoint failed since the last call.
+   */
+  bool Wait();
+
+private:
+  /// Writes a checkpoint file.
+  static bool WriteFile(const Checkpoint& checkpoint);
+
+  /// Main loop of the I/O thread.
+  void WorkerLoop();
+
+  const bool asynchronous_;
+  const unsigned int max_in_flight_;
+
+  std::mutex mutex_;
+  std::condition_variable queue_changed_;
+  std::deque<Checkpoint> queue_;
+  /// Number of checkpoints queued or being written.
+  unsigned int num_in_flight_ = 0;
+  unsigned int num_failed_ = 0;
+  bool shutdown_ = false;
+  std::thread worker_;
+};
+
+} // namespace opensn
@@ -4,7 +4,9 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/io/lbs_problem_io.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/io/single_file_io.h"
 #include "framework/utils/hdf_utils.h"
+#include "caliper/cali.h"
 
 namespace opensn
 {
@@ -13,16 +15,24 @@ void
 LBSSolverIO::WriteFluxMoments(
   LBSProblem& lbs_problem,
   const std::string& file_base,
+  bool single_file,
+  unsigned int compression_level,
   std::optional<const std::reference_wrapper<std::vector<double>>> opt_src)
 {
+  std::vector<double>& src =
+    opt_src.has_value() ? opt_src.value().get() : lbs_problem.GetPhiNewLocal();
+
+  if (single_file)
+  {
+    WriteFluxMomentsSingleFile(lbs_problem, file_base + ".h5", compression_level, src);
+    return;
+  }
+
   // Open file
   std::string file_name = file_base + std::to_string(opensn::mpi_comm.rank()) + ".h5";
   hid_t file_id = H5Fcreate(file_name.c_str(), H5F_ACC_TRUNC, H5P_DEFAULT, H5P_DEFAULT);
   OpenSnLogicalErrorIf(file_id < 0, "Failed to open " + file_name + ".");
 
-  std::vector<double>& src =
-    opt_src.has_value() ? opt_src.value().get() : lbs_problem.GetPhiNewLocal();
-
   log.Log() << "Writing flux moments to " << file_base;
 
   const auto& grid = lbs_problem.GetGrid();
@@ -96,14 +106,23 @@ LBSSolverIO::ReadFluxMoments(LBSProblem& lbs_problem,
                              bool single_file,
                              std::optional<std::reference_wrapper<std::vector<double>>> opt_dest)
 {
+  std::vector<double>& dest =
+    opt_dest.has_value() ? opt_dest.value().get() : lbs_problem.GetPhiOldLocal();
+
   // Open file
   const auto file_name =
     file_base + (single_file ? "" : std::to_string(opensn::mpi_comm.rank())) + ".h5";
   hid_t file_id = H5Fopen(file_name.c_str(), H5F_ACC_RDONLY, H5P_DEFAULT);
   OpenSnLogicalErrorIf(file_id < 0, "Failed to open " + file_name + ".");
 
-  std::vector<double>& dest =
-    opt_dest.has_value() ? opt_dest.value().get() : lbs_problem.GetPhiOldLocal();
+  // A single file is either a file written by WriteFluxMoments with single_file, which is read
+  // with any partition, or a per-rank file read by all ranks
+  if (single_file and H5Has(file_id, "mesh/node_offsets"))
+  {
+    H5Fclose(file_id);
+    ReadFluxMomentsSingleFile(lbs_problem, file_name, dest);
+    return;
+  }
 
   log.Log() << "Reading flux moments from " << file_base;
 
@@ -216,4 +235,105 @@ LBSSolverIO::ReadFluxMoments(LBSProblem& lbs_problem,
   H5Fclose(file_id);
 }
 
+void
+LBSSolverIO::WriteFluxMomentsSingleFile(LBSProblem& lbs_problem,
+                                        const std::string& file_name,
+                                        unsigned int compression_level,
+                                        const std::vector<double>& src)
+{
+  CALI_CXX_MARK_SCOPE("LBSSolverIO::WriteFluxMomentsSingleFile");
+
+  hid_t file_id = CreateSingleFile(file_name);
+  OpenSnLogicalErrorIf(file_id < 0, "Failed to open " + file_name + ".");
+
+  log.Log() << "Writing flux moments to " << file_name;
+
+  const auto& grid = lbs_problem.GetGrid();
+  const auto& discretization = lbs_problem.GetSpatialDiscretization();
+  const auto& uk_man = lbs_problem.GetUnknownManager();
+
+  uint64_t num_moments = lbs_problem.GetNumMoments();
+  uint64_t num_groups = lbs_problem.GetNumGroups();
+  const auto num_local_dofs = discretization.GetNumLocalNodes() * num_moments * num_groups;
+  OpenSnLogicalErrorIf(src.size() != num_local_dofs, "Incompatible flux moments vector provided.");
+
+  H5CreateAttribute(file_id, "num_moments", num_moments);
+  H5CreateAttribute(file_id, "num_groups", num_groups);
+
+  auto xfer_plist = CreateSingleFileTransferPlist();
+  const auto layout = WriteSingleFileMesh(file_id, lbs_problem, compression_level, xfer_plist);
+
+  // Flux values are stored node-major, with all moments and groups of a node contiguous
+  const uint64_t stride = num_moments * num_groups;
+  std::vector<double> values;
+  values.reserve(num_local_dofs);
+  for (const auto& cell : grid->local_cells)
+    for (uint64_t i = 0; i < discretization.GetCellNumNodes(cell); ++i)
+    {
+      const auto dof_map = discretization.MapDOFLocal(cell, i, uk_man, 0, 0);
+      values.insert(values.end(), src.begin() + dof_map, src.begin() + dof_map + stride);
+    }
+
+  const bool success = H5WriteDatasetSlab1D(file_id,
+                                            "values",
+                                            layout.num_nodes * stride,
+                                            layout.node_offset * stride,
+                                            values,
+                                            compression_level,
+                                            xfer_plist);
+  OpenSnLogicalErrorIf(not success, "Failed to write flux moments to " + file_name + ".");
+
+  H5Pclose(xfer_plist);
+  H5Fclose(file_id);
+}
+
+void
+LBSSolverIO::ReadFluxMomentsSingleFile(LBSProblem& lbs_problem,
+                                       const std::string& file_name,
+                                       std::vector<double>& dest)
+{
+  CALI_CXX_MARK_SCOPE("LBSSolverIO::ReadFluxMomentsSingleFile");
+
+  hid_t file_id = H5Fopen(file_name.c_str(), H5F_ACC_RDONLY, H5P_DEFAULT);
+  OpenSnLogicalErrorIf(file_id < 0, "Failed to open " + file_name + ".");
+
+  log.Log() << "Reading flux moments from " << file_name;
+
+  const auto& grid = lbs_problem.GetGrid();
+  const auto& discretization = lbs_problem.GetSpatialDiscretization();
+  const auto& uk_man = lbs_problem.GetUnknownManager();
+
+  const uint64_t num_moments = lbs_problem.GetNumMoments();
+  const uint64_t num_groups = lbs_problem.GetNumGroups();
+
+  uint64_t file_num_moments = 0;
+  uint64_t file_num_groups = 0;
+  H5ReadAttribute(file_id, "num_moments", file_num_moments);
+  H5ReadAttribute(file_id, "num_groups", file_num_groups);
+  OpenSnLogicalErrorIf(file_num_moments != num_moments,
+                       "Incompatible number of moments found in file " + file_name + ".");
+  OpenSnLogicalErrorIf(file_num_groups != num_groups,
+                       "Incompatible number of groups found in file " + file_name + ".");
+
+  const uint64_t stride = num_moments * num_groups;
+  const auto cell_data =
+    ReadSingleFileCellData(file_id, lbs_problem, {{"values", stride}}, file_name);
+  H5Fclose(file_id);
+
+  dest.assign(discretization.GetNumLocalDOFs(uk_man), 0.0);
+  for (const auto& cell : grid->local_cells)
+  {
+    const auto& data = cell_data.at(cell.global_id);
+    const auto mapping =
+      MapFileCellNodes(discretization.GetCellNodeLocations(cell), data.nodes, cell.global_id);
+
+    const auto& values = data.values.front();
+    for (uint64_t n = 0; n < mapping.size(); ++n)
+    {
+      const auto dof_map = discretization.MapDOFLocal(cell, mapping[n], uk_man, 0, 0);
+      std::copy_n(&values[n * stride], stride, &dest[dof_map]);
+    }
+  }
+}
+
 } // namespace opensn
@@ -21,11 +21,15 @@ public:
    *
    * \param lbs_problem LBS problem
    * \param file_base File name stem
+   * \param single_file Single data file (written with parallel HDF5) or data file per rank?
+   * \param compression_level Deflate compression level for single files (0 disables compression)
    * \param per_material Optional angular flux source vector
    */
   static void WriteAngularFluxes(
     LBSProblem& lbs_problem,
     const std::string& file_stem,
+    bool single_file = false,
+    unsigned int compression_level = 0,
     std::optional<const std::reference_wrapper<std::vector<std::vector<double>>>> opt_src =
       std::nullopt);
 
@@ -34,11 +38,14 @@ public:
    *
    * \param lbs_problem LBS problem
    * \param file_base File name stem
+   * \param single_file Single data file or data file per rank? Single files can be read with
+   *        any number of ranks.
    * \param per_material Optional angular flux destination vector
    */
   static void ReadAngularFluxes(
     LBSProblem& lbs_problem,
     const std::string& file_stem,
+    bool single_file = false,
     std::optional<std::reference_wrapper<std::vector<std::vector<double>>>> opt_dest =
       std::nullopt);
 
@@ -47,11 +54,15 @@ public:
    *
    * \param lbs_problem LBS problem
    * \param file_base File name stem
+   * \param single_file Single data file (written with parallel HDF5) or data file per rank?
+   * \param compression_level Deflate compression level for single files (0 disables compression)
    * \param per_material Optional flux moments source vector
    */
   static void WriteFluxMoments(
     LBSProblem& lbs_problem,
     const std::string& file_stem,
+    bool single_file = false,
+    unsigned int compression_level = 0,
     std::optional<const std::reference_wrapper<std::vector<double>>> opt_src = std::nullopt);
 
   /**
@@ -59,7 +70,9 @@ public:
    *
    * \param lbs_problem LBS problem
    * \param file_base File name stem
-   * \param single_file Single data file or data file per rank?
+   * \param single_file Single data file or data file per rank? A file written with
+   *        WriteFluxMoments and single_file can be read with any number of ranks. Otherwise, the
+   *        single file is a per-rank file read by all ranks.
    * \param per_material Optional flux moments destination vector
    */
   static void ReadFluxMoments(
@@ -67,6 +80,25 @@ public:
     const std::string& file_stem,
     bool single_file,
     std::optional<std::reference_wrapper<std::vector<double>>> opt_dest = std::nullopt);
+
+private:
+  static void WriteAngularFluxesSingleFile(LBSProblem& lbs_problem,
+                                           const std::string& file_name,
+                                           unsigned int compression_level,
+                                           const std::vector<std::vector<double>>& src);
+
+  static void ReadAngularFluxesSingleFile(LBSProblem& lbs_problem,
+                                          const std::string& file_name,
+                                          std::vector<std::vector<double>>& dest);
+
+  static void WriteFluxMomentsSingleFile(LBSProblem& lbs_problem,
+                                         const std::string& file_name,
+                                         unsigned int compression_level,
+                                         const std::vector<double>& src);
+
+  static void ReadFluxMomentsSingleFile(LBSProblem& lbs_problem,
+                                        const std::string& file_name,
+                                        std::vector<double>& dest);
 };
 
 } // namespace opensn
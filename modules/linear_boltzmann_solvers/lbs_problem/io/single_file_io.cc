@@ -0,0 +1,301 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "modules/linear_boltzmann_solvers/lbs_problem/io/single_file_io.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
+#include "framework/math/spatial_discretization/spatial_discretization.h"
+#include "framework/mesh/mesh_continuum/mesh_continuum.h"
+#include "framework/mpi/mpi_utils.h"
+#include "framework/logging/log.h"
+#include "framework/utils/hdf_utils.h"
+#include "framework/runtime.h"
+#include "caliper/cali.h"
+
+namespace opensn
+{
+
+hid_t
+CreateSingleFile(const std::string& file_name)
+{
+  auto fapl = H5Pcreate(H5P_FILE_ACCESS);
+#ifdef H5_HAVE_PARALLEL
+  H5Pset_fapl_mpio(fapl, mpi_comm, MPI_INFO_NULL);
+#else
+  OpenSnLogicalErrorIf(opensn::mpi_comm.size() > 1,
+                       "Writing a single file on more than one rank requires an HDF5 library "
+                       "with parallel (MPI-IO) support.");
+#endif
+  hid_t file_id = H5Fcreate(file_name.c_str(), H5F_ACC_TRUNC, H5P_DEFAULT, fapl);
+  H5Pclose(fapl);
+  return file_id;
+}
+
+hid_t
+CreateSingleFileTransferPlist()
+{
+  auto xfer_plist = H5Pcreate(H5P_DATASET_XFER);
+#ifdef H5_HAVE_PARALLEL
+  H5Pset_dxpl_mpio(xfer_plist, H5FD_MPIO_COLLECTIVE);
+#endif
+  return xfer_plist;
+}
+
+SingleFileLayout
+WriteSingleFileMesh(hid_t file_id,
+                    const LBSProblem& lbs_problem,
+                    unsigned int compression_level,
+                    hid_t xfer_plist)
+{
+  CALI_CXX_MARK_SCOPE("WriteSingleFileMesh");
+
+  const auto& grid = lbs_problem.GetGrid();
+  const auto& discretization = lbs_problem.GetSpatialDiscretization();
+
+  const uint64_t num_local_cells = grid->local_cells.size();
+  const uint64_t num_local_nodes = discretization.GetNumLocalNodes();
+  const auto cell_extents = BuildLocationExtents(num_local_cells, mpi_comm);
+  const auto node_extents = BuildLocationExtents(num_local_nodes, mpi_comm);
+
+  SingleFileLayout layout;
+  layout.num_cells = cell_extents.back();
+  layout.num_nodes = node_extents.back();
+  layout.cell_offset = cell_extents[opensn::mpi_comm.rank()];
+  layout.node_offset = node_extents[opensn::mpi_comm.rank()];
+  layout.num_local_nodes = num_local_nodes;
+
+  std::vector<uint64_t> cell_ids, num_cell_nodes, node_offsets;
+  cell_ids.reserve(num_local_cells);
+  num_cell_nodes.reserve(num_local_cells);
+  node_offsets.reserve(num_local_cells);
+
+  std::vector<double> nodes_x, nodes_y, nodes_z;
+  nodes_x.reserve(num_local_nodes);
+  nodes_y.reserve(num_local_nodes);
+  nodes_z.reserve(num_local_nodes);
+
+  uint64_t node_offset = layout.node_offset;
+  for (const auto& cell : grid->local_cells)
+  {
+    const auto nodes = discretization.GetCellNodeLocations(cell);
+    cell_ids.push_back(cell.global_id);
+    num_cell_nodes.push_back(nodes.size());
+    node_offsets.push_back(node_offset);
+    node_offset += nodes.size();
+
+    for (const auto& node : nodes)
+    {
+      nodes_x.push_back(node.x);
+      nodes_y.push_back(node.y);
+      nodes_z.push_back(node.z);
+    }
+  }
+
+  bool success = H5CreateGroup(file_id, "mesh");
+  success &= H5CreateAttribute(file_id, "mesh/num_cells", layout.num_cells);
+  success &= H5CreateAttribute(file_id, "mesh/num_nodes", layout.num_nodes);
+
+  const auto WriteCellDataset = [&](const std::string& name, const std::vector<uint64_t>& data)
+  {
+    return H5WriteDatasetSlab1D(
+      file_id, name, layout.num_cells, layout.cell_offset, data, compression_level, xfer_plist);
+  };
+  success &= WriteCellDataset("mesh/cell_ids", cell_ids);
+  success &= WriteCellDataset("mesh/num_cell_nodes", num_cell_nodes);
+  success &= WriteCellDataset("mesh/node_offsets", node_offsets);
+
+  const auto WriteNodeDataset = [&](const std::string& name, const std::vector<double>& data)
+  {
+    return H5WriteDatasetSlab1D(
+      file_id, name, layout.num_nodes, layout.node_offset, data, compression_level, xfer_plist);
+  };
+  success &= WriteNodeDataset("mesh/nodes_x", nodes_x);
+  success &= WriteNodeDataset("mesh/nodes_y", nodes_y);
+  success &= WriteNodeDataset("mesh/nodes_z", nodes_z);
+
+  OpenSnLogicalErrorIf(not success, "Failed to write single-file mesh data.");
+
+  return layout;
+}
+
+std::map<uint64_t, SingleFileCellData>
+ReadSingleFileCellData(hid_t file_id,
+                       const LBSProblem& lbs_problem,
+                       const std::vector<std::pair<std::string, uint64_t>>& datasets,
+                       const std::string& file_name)
+{
+  CALI_CXX_MARK_SCOPE("ReadSingleFileCellData");
+
+  const auto& grid = lbs_problem.GetGrid();
+  const auto num_ranks = static_cast<uint64_t>(opensn::mpi_comm.size());
+  const auto rank = static_cast<uint64_t>(opensn::mpi_comm.rank());
+
+  uint64_t file_num_cells = 0;
+  uint64_t file_num_nodes = 0;
+  bool success = H5ReadAttribute(file_id, "mesh/num_cells", file_num_cells) and
+                 H5ReadAttribute(file_id, "mesh/num_nodes", file_num_nodes);
+  OpenSnLogicalErrorIf(not success, "Failed to read mesh information from " + file_name + ".");
+  OpenSnLogicalErrorIf(file_num_cells != grid->GetGlobalNumberOfCells(),
+                       "Incompatible number of cells found in " + file_name + ".");
+
+  // Each rank reads a contiguous block of file cells
+  const uint64_t cell_begin = file_num_cells * rank / num_ranks;
+  const uint64_t cell_end = file_num_cells * (rank + 1) / num_ranks;
+  const uint64_t num_block_cells = cell_end - cell_begin;
+
+  std::vector<uint64_t> cell_ids, num_cell_nodes, node_offsets;
+  success &= H5ReadDatasetSlab1D(file_id, "mesh/cell_ids", cell_begin, num_block_cells, cell_ids);
+  success &= H5ReadDatasetSlab1D(
+    file_id, "mesh/num_cell_nodes", cell_begin, num_block_cells, num_cell_nodes);
+  success &=
+    H5ReadDatasetSlab1D(file_id, "mesh/node_offsets", cell_begin, num_block_cells, node_offsets);
+  OpenSnLogicalErrorIf(not success, "Failed to read cell information from " + file_name + ".");
+
+  const uint64_t node_begin = num_block_cells > 0 ? node_offsets.front() : 0;
+  const uint64_t node_end =
+    num_block_cells > 0 ? node_offsets.back() + num_cell_nodes.back() : node_begin;
+  const uint64_t num_block_nodes = node_end - node_begin;
+
+  std::vector<double> nodes_x, nodes_y, nodes_z;
+  success &= H5ReadDatasetSlab1D(file_id, "mesh/nodes_x", node_begin, num_block_nodes, nodes_x);
+  success &= H5ReadDatasetSlab1D(file_id, "mesh/nodes_y", node_begin, num_block_nodes, nodes_y);
+  success &= H5ReadDatasetSlab1D(file_id, "mesh/nodes_z", node_begin, num_block_nodes, nodes_z);
+
+  std::vector<std::vector<double>> values(datasets.size());
+  for (size_t d = 0; d < datasets.size(); ++d)
+  {
+    const auto& [name, stride] = datasets[d];
+    success &=
+      H5ReadDatasetSlab1D(file_id, name, node_begin * stride, num_block_nodes * stride, values[d]);
+  }
+  OpenSnLogicalErrorIf(not success, "Failed to read nodal data from " + file_name + ".");
+
+  // Find the owners of the file cells. Cell ids are registered with a directory rank
+  // (global id modulo the number of ranks) by their owners and looked up by the readers.
+  std::map<int, std::vector<uint64_t>> registrations;
+  for (const auto& cell : grid->local_cells)
+    registrations[static_cast<int>(cell.global_id % num_ranks)].push_back(cell.global_id);
+
+  std::map<uint64_t, uint64_t> directory;
+  for (const auto& [pid, gids] : MapAllToAll(registrations))
+    for (const auto gid : gids)
+      directory[gid] = pid;
+
+  std::map<int, std::vector<uint64_t>> queries;
+  std::map<int, std::vector<uint64_t>> query_cells;
+  for (uint64_t c = 0; c < num_block_cells; ++c)
+  {
+    const auto pid = static_cast<int>(cell_ids[c] % num_ranks);
+    queries[pid].push_back(cell_ids[c]);
+    query_cells[pid].push_back(c);
+  }
+
+  std::map<int, std::vector<uint64_t>> replies;
+  for (const auto& [pid, gids] : MapAllToAll(queries))
+  {
+    auto& reply = replies[pid];
+    reply.reserve(gids.size());
+    for (const auto gid : gids)
+    {
+      const auto it = directory.find(gid);
+      OpenSnLogicalErrorIf(it == directory.end(),
+                           "Cell " + std::to_string(gid) + " found in " + file_name +
+                             " is not part of the mesh.");
+      reply.push_back(it->second);
+    }
+  }
+
+  std::vector<int> cell_owners(num_block_cells, -1);
+  for (const auto& [pid, owners] : MapAllToAll(replies))
+  {
+    const auto& cells = query_cells.at(pid);
+    for (size_t i = 0; i < owners.size(); ++i)
+      cell_owners[cells[i]] = static_cast<int>(owners[i]);
+  }
+
+  // Send the cell data to the owners
+  std::map<int, std::vector<uint64_t>> send_ids;
+  std::map<int, std::vector<double>> send_data;
+  for (uint64_t c = 0; c < num_block_cells; ++c)
+  {
+    const int pid = cell_owners[c];
+    auto& ids = send_ids[pid];
+    ids.push_back(cell_ids[c]);
+    ids.push_back(num_cell_nodes[c]);
+
+    auto& data = send_data[pid];
+    const uint64_t n0 = node_offsets[c] - node_begin;
+    const uint64_t n1 = n0 + num_cell_nodes[c];
+    for (uint64_t n = n0; n < n1; ++n)
+    {
+      data.push_back(nodes_x[n]);
+      data.push_back(nodes_y[n]);
+      data.push_back(nodes_z[n]);
+    }
+    for (size_t d = 0; d < datasets.size(); ++d)
+    {
+      const auto stride = datasets[d].second;
+      data.insert(data.end(), values[d].begin() + n0 * stride, values[d].begin() + n1 * stride);
+    }
+  }
+
+  const auto recv_ids = MapAllToAll(send_ids);
+  const auto recv_data = MapAllToAll(send_data);
+
+  std::map<uint64_t, SingleFileCellData> cell_data;
+  for (const auto& [pid, ids] : recv_ids)
+  {
+    const auto& data = recv_data.at(pid);
+    size_t k = 0;
+    for (size_t i = 0; i < ids.size(); i += 2)
+    {
+      const auto num_nodes = ids[i + 1];
+      auto& entry = cell_data[ids[i]];
+
+      entry.nodes.reserve(num_nodes);
+      for (uint64_t n = 0; n < num_nodes; ++n, k += 3)
+        entry.nodes.emplace_back(data[k], data[k + 1], data[k + 2]);
+
+      entry.values.resize(datasets.size());
+      for (size_t d = 0; d < datasets.size(); ++d)
+      {
+        const auto size = num_nodes * datasets[d].second;
+        entry.values[d].assign(data.begin() + k, data.begin() + k + size);
+        k += size;
+      }
+    }
+  }
+
+  OpenSnLogicalErrorIf(cell_data.size() != grid->local_cells.size(),
+                       "Incompatible number of local cells found in " + file_name + ".");
+
+  return cell_data;
+}
+
+std::vector<uint64_t>
+MapFileCellNodes(const std::vector<Vector3>& nodes,
+                 const std::vector<Vector3>& file_nodes,
+                 uint64_t cell_global_id)
+{
+  OpenSnLogicalErrorIf(nodes.size() != file_nodes.size(),
+                       "Incompatible number of cell nodes encountered on cell " +
+                         std::to_string(cell_global_id) + ".");
+
+  std::vector<uint64_t> mapping(file_nodes.size());
+  for (uint64_t n = 0; n < file_nodes.size(); ++n)
+  {
+    bool mapping_found = false;
+    for (uint64_t m = 0; m < nodes.size(); ++m)
+      if ((nodes[m] - file_nodes[n]).NormSquare() < 1.0e-12)
+      {
+        mapping[n] = m;
+        mapping_found = true;
+      }
+    OpenSnLogicalErrorIf(not mapping_found,
+                         "Incompatible node locations for cell " + std::to_string(cell_global_id) +
+                           ".");
+  }
+
+  return mapping;
+}
+
+} // namespace opensn
@@ -0,0 +1,90 @@
+// SPDX-FileCopyrightText: 2024 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include "framework/math/vector3.h"
+#include "hdf5.h"
+#include <cstdint>
+#include <map>
+#include <string>
+#include <utility>
+#include <vector>
+
+/**
+ * \file
+ * Utilities for single-file (decomposition independent) LBS data files.
+ *
+ * A single file stores the data of all ranks. Cells are stored in rank order and every dataset
+ * with nodal data is stored node-major with a fixed number of values per node, so that every
+ * rank writes one contiguous hyperslab of each dataset. The file layout is:
+ *
+ * - `mesh/num_cells`, `mesh/num_nodes`: global number of cells and nodes (attributes)
+ * - `mesh/cell_ids`, `mesh/num_cell_nodes`, `mesh/node_offsets`: per-cell global id, number of
+ *   nodes and index of the first node
+ * - `mesh/nodes_x`, `mesh/nodes_y`, `mesh/nodes_z`: per-node coordinates
+ * - nodal datasets, written by the callers
+ *
+ * When reading, each rank reads a contiguous block of file cells and the data is redistributed
+ * to the ranks that own the cells in the current partition, so a file can be read with a
+ * different number of ranks than it was written with.
+ */
+
+namespace opensn
+{
+
+class LBSProblem;
+
+/// Position of the local data of a rank in a single file.
+struct SingleFileLayout
+{
+  uint64_t num_cells = 0;
+  uint64_t num_nodes = 0;
+  uint64_t cell_offset = 0;
+  uint64_t node_offset = 0;
+  uint64_t num_local_nodes = 0;
+};
+
+/// Nodal data of a cell read from a single file.
+struct SingleFileCellData
+{
+  std::vector<Vector3> nodes;
+  /// Values of each requested dataset, node-major.
+  std::vector<std::vector<double>> values;
+};
+
+/**
+ * Collectively creates a single file. Requires an HDF5 library with parallel (MPI-IO) support
+ * when running on more than one rank.
+ */
+hid_t CreateSingleFile(const std::string& file_name);
+
+/// Creates the dataset transfer property list used for collective writes to a single file.
+hid_t CreateSingleFileTransferPlist();
+
+/// Collectively writes the mesh datasets of a single file and returns the local data layout.
+SingleFileLayout WriteSingleFileMesh(hid_t file_id,
+                                     const LBSProblem& lbs_problem,
+                                     unsigned int compression_level,
+                                     hid_t xfer_plist);
+
+/**
+ * Reads the nodal datasets `datasets` (pairs of name and number of values per node) of the local
+ * cells from a single file, regardless of the partition the file was written with. The returned
+ * map is keyed by cell global id.
+ */
+std::map<uint64_t, SingleFileCellData>
+ReadSingleFileCellData(hid_t file_id,
+                       const LBSProblem& lbs_problem,
+                       const std::vector<std::pair<std::string, uint64_t>>& datasets,
+                       const std::string& file_name);
+
+/**
+ * Maps the nodes of a cell read from file to the nodes of the cell. Entry `n` of the returned
+ * vector is the cell node matching file node `n`.
+ */
+std::vector<uint64_t> MapFileCellNodes(const std::vector<Vector3>& nodes,
+                                       const std::vector<Vector3>& file_nodes,
+                                       uint64_t cell_global_id);
+
+} // namespace opensn
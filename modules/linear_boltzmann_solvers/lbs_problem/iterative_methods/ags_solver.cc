@@ -6,6 +6,7 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/runtime.h"
 #include "caliper/cali.h"
 #include <iomanip>
@@ -24,6 +25,8 @@ AGSSolver::Solve()
   // to function and for keigen-value problems
   const auto saved_qmoms = lbs_problem_.GetQMomentsLocal();
 
+  Telemetry::SolverScope telemetry_scope("ags");
+
   double pw_change_prev = 1.0;
   bool converged = false;
   for (int iter = 0; iter < max_iterations_; ++iter)
@@ -46,6 +49,8 @@ AGSSolver::Solve()
       iter_stats << std::left << std::setw(5) << iter << " Point-wise change " << std::left
                  << std::setw(14) << pw_change << " Spectral-radius estimate " << std::left
                  << std::setw(10) << rho;
+      Telemetry::GetInstance().RecordIteration(
+        iter, {{"pointwise_change", pw_change}, {"spectral_radius", rho}});
 
       if (pw_change < std::max(tolerance_ * (1.0 - rho), 1.0e-10))
       {
@@ -59,6 +64,7 @@ AGSSolver::Solve()
 
       iter_stats << std::left << std::setw(5) << iter << " Error Norm " << std::left
                  << std::setw(14) << norm;
+      Telemetry::GetInstance().RecordIteration(iter, {{"l2_change", norm}});
 
       if (norm < tolerance_)
       {
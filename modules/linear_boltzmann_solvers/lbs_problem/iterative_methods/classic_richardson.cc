@@ -9,16 +9,90 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
 #include "framework/math/linear_solver/linear_solver.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/utils/timer.h"
 #include "framework/runtime.h"
+#include <algorithm>
+#include <cmath>
 #include <memory>
 #include <iomanip>
 
 namespace opensn
 {
 
+namespace
+{
+
+/// Sets `out` to `a - b`.
+void
+SetToDifference(const std::vector<double>& a,
+                const std::vector<double>& b,
+                std::vector<double>& out)
+{
+  for (size_t i = 0; i < out.size(); ++i)
+    out[i] = a[i] - b[i];
+}
+
+/**
+ * Solves the regularized `m` x `m` system stored row by row, each row followed by its right-hand
+ * side, with Gaussian elimination. The solution replaces the right-hand side. Returns false if
+ * the system is singular.
+ */
+bool
+SolveNormalEquations(size_t m, std::vector<double>& system)
+{
+  const size_t row_size = m + 1;
+  auto entry = [&](size_t i, size_t j) -> double& { return system[i * row_size + j]; };
+
+  double max_diagonal = 0.0;
+  for (size_t i = 0; i < m; ++i)
+    max_diagonal = std::max(max_diagonal, entry(i, i));
+  if (max_diagonal <= 0.0)
+    return false;
+  for (size_t i = 0; i < m; ++i)
+    entry(i, i) += 1.0e-12 * max_diagonal;
+
+  for (size_t k = 0; k < m; ++k)
+  {
+    size_t pivot = k;
+    for (size_t i = k + 1; i < m; ++i)
+      if (std::fabs(entry(i, k)) > std::fabs(entry(pivot, k)))
+        pivot = i;
+    if (std::fabs(entry(pivot, k)) <= 1.0e-14 * max_diagonal)
+      return false;
+    if (pivot != k)
+      for (size_t j = k; j < row_size; ++j)
+        std::swap(entry(k, j), entry(pivot, j));
+    for (size_t i = k + 1; i < m; ++i)
+    {
+      const double factor = entry(i, k) / entry(k, k);
+      for (size_t j = k; j < row_size; ++j)
+        entry(i, j) -= factor * entry(k, j);
+    }
+  }
+
+  for (size_t k = m; k-- > 0;)
+  {
+    double value = entry(k, m);
+    for (size_t j = k + 1; j < m; ++j)
+      value -= entry(k, j) * entry(j, m);
+    entry(k, m) = value / entry(k, k);
+  }
+  return true;
+}
+
+} // namespace
+
 ClassicRichardson::ClassicRichardson(const std::shared_ptr<WGSContext>& gs_context_ptr)
-  : LinearSolver(LinearSolver::IterativeMethod::CLASSIC_RICHARDSON, gs_context_ptr)
+  : LinearSolver(gs_context_ptr->groupset.iterative_method ==
+                     LinearSolver::IterativeMethod::ANDERSON_RICHARDSON
+                   ? LinearSolver::IterativeMethod::ANDERSON_RICHARDSON
+                   : LinearSolver::IterativeMethod::CLASSIC_RICHARDSON,
+                 gs_context_ptr),
+    anderson_depth_(gs_context_ptr->groupset.iterative_method ==
+                        LinearSolver::IterativeMethod::ANDERSON_RICHARDSON
+                      ? static_cast<size_t>(gs_context_ptr->groupset.anderson_depth)
+                      : 0)
 {
 }
 
@@ -36,43 +110,70 @@ ClassicRichardson::Solve()
   auto& lbs_problem = gs_context_ptr->lbs_problem;
   auto& phi_old = lbs_problem.GetPhiOldLocal();
   auto& phi_new = lbs_problem.GetPhiNewLocal();
+  auto& q_moments_local = lbs_problem.GetQMomentsLocal();
   const auto scope = gs_context_ptr->lhs_src_scope | gs_context_ptr->rhs_src_scope;
-  saved_q_moments_local_ = lbs_problem.GetQMomentsLocal();
-  psi_old_.resize(groupset.angle_agg->GetNumDelayedAngularDOFs().first, 0.0);
+
+  // The work vectors only allocate memory when they grow
+  saved_q_moments_local_ = q_moments_local;
+  phi_change_.resize(phi_new.size());
+  const size_t num_delayed_psi = groupset.angle_agg->GetNumDelayedAngularDOFs().first;
+  psi_new_.resize(num_delayed_psi);
+  psi_old_.resize(num_delayed_psi, 0.0);
+  if (anderson_depth_ > 0)
+  {
+    const size_t num_unknowns =
+      lbs_problem.GetLocalNodeCount() * lbs_problem.GetNumMoments() * groupset.groups.size() +
+      num_delayed_psi;
+    for (auto* vec : {&x_, &g_, &f_, &g_prev_, &f_prev_})
+      vec->resize(num_unknowns);
+    delta_g_.resize(anderson_depth_ * num_unknowns);
+    delta_f_.resize(anderson_depth_ * num_unknowns);
+    normal_system_.resize(anderson_depth_ * (anderson_depth_ + 1));
+    reduced_normal_system_.resize(anderson_depth_ * (anderson_depth_ + 1));
+    num_columns_ = 0;
+    next_column_ = 0;
+  }
+
+  Telemetry::SolverScope telemetry_scope("wgs");
 
   double pw_phi_change_prev = 1.0;
   bool converged = false;
   for (int k = 0; k < groupset.max_iterations; ++k)
   {
-    lbs_problem.GetQMomentsLocal() = saved_q_moments_local_;
-    gs_context_ptr->set_source_function(groupset, lbs_problem.GetQMomentsLocal(), phi_old, scope);
+    // The source functions only write to the groups of the groupset
+    LBSVecOps::GSScopedCopyPrimarySTLvectors(
+      lbs_problem, groupset, saved_q_moments_local_, q_moments_local);
+    gs_context_ptr->set_source_function(groupset, q_moments_local, phi_old, scope);
     gs_context_ptr->ApplyInverseTransportOperator(scope);
 
     // Apply WGDSA
     if (groupset.apply_wgdsa)
     {
-      std::vector<double> delta_phi;
-      lbs_problem.AssembleWGDSADeltaPhiVector(groupset, phi_new - phi_old, delta_phi);
-      groupset.wgdsa_solver->Assemble_b(delta_phi);
-      groupset.wgdsa_solver->Solve(delta_phi);
-      lbs_problem.DisAssembleWGDSADeltaPhiVector(groupset, delta_phi, phi_new);
+      Telemetry::ScopedTimer telemetry_timer(Telemetry::DSA);
+      SetToDifference(phi_new, phi_old, phi_change_);
+      lbs_problem.AssembleWGDSADeltaPhiVector(groupset, phi_change_, delta_phi_);
+      groupset.wgdsa_solver->Assemble_b(delta_phi_);
+      groupset.wgdsa_solver->Solve(delta_phi_);
+      lbs_problem.DisAssembleWGDSADeltaPhiVector(groupset, delta_phi_, phi_new);
     }
 
     // Apply TGDSA
     if (groupset.apply_tgdsa)
     {
-      std::vector<double> delta_phi;
-      lbs_problem.AssembleTGDSADeltaPhiVector(groupset, phi_new - phi_old, delta_phi);
-      groupset.tgdsa_solver->Assemble_b(delta_phi);
-      groupset.tgdsa_solver->Solve(delta_phi);
-      lbs_problem.DisAssembleTGDSADeltaPhiVector(groupset, delta_phi, phi_new);
+      Telemetry::ScopedTimer telemetry_timer(Telemetry::DSA);
+      SetToDifference(phi_new, phi_old, phi_change_);
+      lbs_problem.AssembleTGDSADeltaPhiVector(groupset, phi_change_, delta_phi_);
+      groupset.tgdsa_solver->Assemble_b(delta_phi_);
+      groupset.tgdsa_solver->Solve(delta_phi_);
+      lbs_problem.DisAssembleTGDSADeltaPhiVector(groupset, delta_phi_, phi_new);
     }
 
     double pw_phi_change = ComputePointwisePhiChange(lbs_problem, groupset.id);
     double rho = (k == 0) ? 0.0 : sqrt(pw_phi_change / pw_phi_change_prev);
     pw_phi_change_prev = pw_phi_change;
 
-    psi_new_ = groupset.angle_agg->GetNewDelayedAngularDOFsAsSTLVector();
+    int64_t psi_index = -1;
+    groupset.angle_agg->AppendNewDelayedAngularDOFsToArray(psi_index, psi_new_.data());
     double pw_psi_change = ComputePointwiseChange(psi_new_, psi_old_);
 
     if ((pw_phi_change < std::max(groupset.residual_tolerance * (1.0 - rho), 1.0e-10)) &&
@@ -80,14 +181,22 @@ ClassicRichardson::Solve()
     {
       converged = true;
     }
+    else if (anderson_depth_ > 0)
+      AndersonUpdate(k);
     else
     {
-      LBSVecOps::GSScopedCopyPrimarySTLvectors(
-        lbs_problem, groupset, PhiSTLOption::PHI_NEW, PhiSTLOption::PHI_OLD);
-      groupset.angle_agg->SetOldDelayedAngularDOFsFromSTLVector(psi_new_);
-      psi_old_ = psi_new_;
+      LBSVecOps::GSScopedCopyPrimarySTLvectors(lbs_problem, groupset, phi_new, phi_old);
+      psi_index = -1;
+      groupset.angle_agg->SetOldDelayedAngularDOFsFromArray(psi_index, psi_new_.data());
+      psi_old_.swap(psi_new_);
     }
 
+    Telemetry::GetInstance().RecordIteration(k,
+                                             {{"groupset", groupset.id},
+                                              {"pointwise_change", pw_phi_change},
+                                              {"psi_change", pw_psi_change},
+                                              {"spectral_radius", rho}});
+
     std::stringstream iter_stats;
     iter_stats << program_timer.GetTimeString() << " WGS groups [" << groupset.groups.front().id
                << "-" << groupset.groups.back().id << "]:"
@@ -105,9 +214,84 @@ ClassicRichardson::Solve()
       log.Log() << iter_stats.str();
   }
 
-  lbs_problem.GetQMomentsLocal() = saved_q_moments_local_;
+  LBSVecOps::GSScopedCopyPrimarySTLvectors(
+    lbs_problem, groupset, saved_q_moments_local_, q_moments_local);
 
   gs_context_ptr->PostSolveCallback();
 }
 
+void
+ClassicRichardson::AndersonUpdate(int iteration)
+{
+  auto gs_context_ptr = std::dynamic_pointer_cast<WGSContext>(context_ptr_);
+  auto& groupset = gs_context_ptr->groupset;
+  auto& lbs_problem = gs_context_ptr->lbs_problem;
+  const size_t n = x_.size();
+
+  // The iterate x, its image g = G(x) under a sweep (and DSA), and the residual f = g - x
+  LBSVecOps::SetGSArrayFromPrimarySTLvector(
+    lbs_problem, groupset, x_.data(), PhiSTLOption::PHI_OLD);
+  LBSVecOps::SetGSArrayFromPrimarySTLvector(
+    lbs_problem, groupset, g_.data(), PhiSTLOption::PHI_NEW);
+  SetToDifference(g_, x_, f_);
+
+  // Replace the oldest differences by those to the previous iterate
+  if (iteration > 0)
+  {
+    double* delta_g = &delta_g_[next_column_ * n];
+    double* delta_f = &delta_f_[next_column_ * n];
+    for (size_t i = 0; i < n; ++i)
+    {
+      delta_g[i] = g_[i] - g_prev_[i];
+      delta_f[i] = f_[i] - f_prev_[i];
+    }
+    next_column_ = (next_column_ + 1) % anderson_depth_;
+    num_columns_ = std::min(num_columns_ + 1, anderson_depth_);
+  }
+  g_prev_.swap(g_);
+  f_prev_.swap(f_);
+  x_ = g_prev_;
+
+  // Minimize |f - dF gamma| over gamma with the normal equations, which are reduced over all
+  // ranks at once, and set x = g - dG gamma
+  const size_t m = num_columns_;
+  if (m > 0)
+  {
+    for (size_t i = 0; i < m; ++i)
+    {
+      const double* delta_f_i = &delta_f_[i * n];
+      for (size_t j = 0; j <= i; ++j)
+      {
+        const double* delta_f_j = &delta_f_[j * n];
+        double dot = 0.0;
+        for (size_t l = 0; l < n; ++l)
+          dot += delta_f_i[l] * delta_f_j[l];
+        normal_system_[i * (m + 1) + j] = dot;
+        normal_system_[j * (m + 1) + i] = dot;
+      }
+      double dot = 0.0;
+      for (size_t l = 0; l < n; ++l)
+        dot += delta_f_i[l] * f_prev_[l];
+      normal_system_[i * (m + 1) + m] = dot;
+    }
+    mpi_comm.all_reduce(normal_system_.data(),
+                        static_cast<int>(m * (m + 1)),
+                        reduced_normal_system_.data(),
+                        mpi::op::sum<double>());
+
+    if (SolveNormalEquations(m, reduced_normal_system_))
+      for (size_t j = 0; j < m; ++j)
+      {
+        const double gamma = reduced_normal_system_[j * (m + 1) + m];
+        const double* delta_g_j = &delta_g_[j * n];
+        for (size_t l = 0; l < n; ++l)
+          x_[l] -= gamma * delta_g_j[l];
+      }
+  }
+
+  LBSVecOps::SetPrimarySTLvectorFromGSArray(
+    lbs_problem, groupset, x_.data(), PhiSTLOption::PHI_OLD);
+  std::copy(x_.end() - static_cast<std::ptrdiff_t>(psi_old_.size()), x_.end(), psi_old_.begin());
+}
+
 } // namespace opensn
@@ -15,13 +15,19 @@ namespace opensn
 
 /**
  * Linear Solver specialization for Within GroupSet (WGS) solves with classic
- * Richardson.
+ * Richardson, optionally with Anderson acceleration.
+ *
+ * With Anderson acceleration, the next iterate is the combination of the last few sweep results
+ * that minimizes the linearized residual, instead of the last sweep result. The unknowns are the
+ * groupset's flux moments and delayed angular fluxes, as for the PETSc solvers. All work vectors
+ * persist between iterations and solves.
  */
 class ClassicRichardson : public LinearSolver
 {
 public:
   /**
-   * Constructor.
+   * Constructor. Anderson acceleration is applied if the groupset's iterative method is
+   * ANDERSON_RICHARDSON.
    * \param gs_context_ptr Context Pointer to abstract context.
    */
   explicit ClassicRichardson(const std::shared_ptr<WGSContext>& gs_context_ptr);
@@ -31,8 +37,26 @@ public:
   void Solve() override;
 
 private:
+  /**
+   * Replaces the old flux moments and delayed angular fluxes of the groupset by the Anderson
+   * update computed from the old and new ones and those of previous iterations.
+   */
+  void AndersonUpdate(int iteration);
+
+  /// Number of previous iterates used by Anderson acceleration, zero without acceleration
+  const size_t anderson_depth_;
+
   std::vector<double> saved_q_moments_local_;
+  std::vector<double> phi_change_, delta_phi_;
   std::vector<double> psi_new_, psi_old_;
+
+  /// Anderson workspace: the current iterate, its image and residual, those of the previous
+  /// iterate, and the last differences of images and residuals, stored column by column
+  std::vector<double> x_, g_, f_, g_prev_, f_prev_;
+  std::vector<double> delta_g_, delta_f_;
+  std::vector<double> normal_system_, reduced_normal_system_;
+  size_t num_columns_ = 0;
+  size_t next_column_ = 0;
 };
 
 } // namespace opensn
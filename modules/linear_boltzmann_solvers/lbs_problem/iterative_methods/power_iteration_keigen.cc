@@ -6,6 +6,7 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/iterative_methods/wgs_context.h"
 #include "framework/runtime.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/utils/timer.h"
 #include <iomanip>
 
@@ -50,6 +51,7 @@ PowerIterationKEigenSolver(LBSProblem& lbs_problem,
 
   // Start power iterations
   ags_solver->SetVerbosity(lbs_problem.GetOptions().verbose_ags_iterations);
+  Telemetry::SolverScope telemetry_scope("k_eigen");
   int nit = 0;
   bool converged = false;
   while (nit < max_iterations)
@@ -75,6 +77,8 @@ PowerIterationKEigenSolver(LBSProblem& lbs_problem,
     k_eff_change = fabs(k_eff - k_eff_prev) / k_eff;
     k_eff_prev = k_eff;
     F_prev = F_new;
+    Telemetry::GetInstance().RecordIteration(nit,
+                                             {{"k_eff", k_eff}, {"k_eff_change", k_eff_change}});
     nit += 1;
 
     if (k_eff_change < std::max(tolerance, 1.0e-12))
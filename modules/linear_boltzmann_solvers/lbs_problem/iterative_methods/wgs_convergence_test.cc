@@ -5,6 +5,7 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/iterative_methods/wgs_context.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/groupset/lbs_groupset.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/utils/timer.h"
 #include "framework/runtime.h"
 #include "caliper/cali.h"
@@ -72,6 +73,9 @@ GSConvergenceTest(KSP ksp, PetscInt n, PetscReal rnorm, KSPConvergedReason* conv
   if (context->log_info)
     log.Log() << iter_info.str() << std::endl;
 
+  Telemetry::GetInstance().RecordIteration(
+    static_cast<int>(n), {{"groupset", context->groupset.id}, {"residual", scaled_residual}});
+
   return KSP_CONVERGED_ITERATING;
 }
 
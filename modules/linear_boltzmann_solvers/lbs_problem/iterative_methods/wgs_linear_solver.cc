@@ -7,6 +7,7 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
 #include "framework/math/petsc_utils/petsc_utils.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/utils/timer.h"
 #include "framework/runtime.h"
 #include <petscksp.h>
@@ -32,6 +33,13 @@ WGSLinearSolver::~WGSLinearSolver()
   MatDestroy(&A_);
 }
 
+void
+WGSLinearSolver::Solve()
+{
+  Telemetry::SolverScope telemetry_scope("wgs");
+  PETScLinearSolver::Solve();
+}
+
 void
 WGSLinearSolver::PreSetupCallback()
 {
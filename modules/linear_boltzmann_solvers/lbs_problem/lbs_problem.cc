@@ -241,18 +241,12 @@ LBSProblem::GetSpatialDiscretization() const
   return *discretization_;
 }
 
-const std::vector<UnitCellMatrices>&
+const UnitCellMatricesStore&
 LBSProblem::GetUnitCellMatrices() const
 {
   return unit_cell_matrices_;
 }
 
-const std::map<uint64_t, UnitCellMatrices>&
-LBSProblem::GetUnitGhostCellMatrices() const
-{
-  return unit_ghost_cell_matrices_;
-}
-
 const std::vector<CellLBSView>&
 LBSProblem::GetCellTransportViews() const
 {
@@ -446,6 +440,29 @@ LBSProblem::GetOptionsBlock()
   params.AddOptionalParameter("max_mpi_message_size",
                               32768,
                               "The maximum MPI message size used during sweep initialization.");
+  params.AddOptionalParameter("streaming_operator_cache_size",
+                              0,
+                              "Maximum memory, in MB per MPI rank, used to cache the "
+                              "direction-dependent streaming operators and face cosines of cells "
+                              "for sweeps. Cells that do not fit are evaluated on the fly. A value "
+                              "of 0 disables the cache.");
+  params.AddOptionalParameter("sweep_cache_directory",
+                              "",
+                              "Directory in which the AAH sweep-plane data structures, feedback "
+                              "arc sets and task dependency graphs are cached, and from which they "
+                              "are reloaded by later runs with the same mesh partition and "
+                              "directions. An empty string disables the cache.");
+  params.AddOptionalParameter("cbc_task_scheduling",
+                              "ready_queue",
+                              "How the cells of CBC sweeps are scheduled. With `\"ready_queue\"`, "
+                              "cells are queued when their upwind data is available. With "
+                              "`\"scan\"`, the whole task list is repeatedly scanned for cells "
+                              "that can be executed.");
+  params.AddOptionalParameter("share_unit_cell_matrices",
+                              false,
+                              "Flag that enables the sharing of the unit cell matrices between "
+                              "cells of the same shape, up to translation and uniform scaling. "
+                              "Ignored with curvilinear geometries.");
   params.AddOptionalParameter(
     "restart_writes_enabled", false, "Flag that controls writing of restart dumps");
   params.AddOptionalParameter("write_delayed_psi_to_restart",
@@ -458,6 +475,15 @@ LBSProblem::GetOptionsBlock()
   params.AddOptionalParameter("write_restart_time_interval",
                               0,
                               "Time interval in seconds at which restart data is to be written.");
+  params.AddOptionalParameter("restart_writes_async",
+                              false,
+                              "Flag that controls whether restart data is written on a background "
+                              "I/O thread while the solver continues to iterate.");
+  params.AddOptionalParameter("max_async_restart_writes",
+                              1,
+                              "Maximum number of asynchronous restart dumps that can be in flight. "
+                              "The solver blocks when a new dump is requested and this limit is "
+                              "reached.");
   params.AddOptionalParameter(
     "use_precursors", false, "Flag for using delayed neutron precursors.");
   params.AddOptionalParameter("use_source_moments",
@@ -525,6 +551,10 @@ LBSProblem::GetOptionsBlock()
     "volumetric_sources", {}, "An array of handles to volumetric sources.");
   params.AddOptionalParameter("clear_volumetric_sources", false, "Clears all volumetric sources.");
   params.ConstrainParameterRange("spatial_discretization", AllowableRangeList::New({"pwld"}));
+  params.ConstrainParameterRange("streaming_operator_cache_size", AllowableRangeLowLimit::New(0));
+  params.ConstrainParameterRange("cbc_task_scheduling",
+                                 AllowableRangeList::New({"ready_queue", "scan"}));
+  params.ConstrainParameterRange("max_async_restart_writes", AllowableRangeLowLimit::New(1));
   params.ConstrainParameterRange("ags_convergence_check",
                                  AllowableRangeList::New({"l2", "pointwise"}));
   params.ConstrainParameterRange("field_function_prefix_option",
@@ -643,6 +673,18 @@ LBSProblem::SetOptions(const InputParameters& input)
     else if (spec.GetName() == "max_mpi_message_size")
       options_.max_mpi_message_size = spec.GetValue<int>();
 
+    else if (spec.GetName() == "streaming_operator_cache_size")
+      options_.streaming_operator_cache_size = spec.GetValue<int>();
+
+    else if (spec.GetName() == "sweep_cache_directory")
+      options_.sweep_cache_directory = spec.GetValue<std::string>();
+
+    else if (spec.GetName() == "cbc_task_scheduling")
+      options_.cbc_ready_queue = spec.GetValue<std::string>() == "ready_queue";
+
+    else if (spec.GetName() == "share_unit_cell_matrices")
+      options_.share_unit_cell_matrices = spec.GetValue<bool>();
+
     else if (spec.GetName() == "restart_writes_enabled")
       options_.restart_writes_enabled = spec.GetValue<bool>();
 
@@ -666,6 +708,12 @@ LBSProblem::SetOptions(const InputParameters& input)
     else if (spec.GetName() == "write_restart_time_interval")
       options_.write_restart_time_interval = std::chrono::seconds(spec.GetValue<int>());
 
+    else if (spec.GetName() == "restart_writes_async")
+      options_.restart_writes_async = spec.GetValue<bool>();
+
+    else if (spec.GetName() == "max_async_restart_writes")
+      options_.max_async_restart_writes = spec.GetValue<int>();
+
     else if (spec.GetName() == "use_precursors")
       options_.use_precursors = spec.GetValue<bool>();
 
@@ -1135,27 +1183,134 @@ LBSProblem::ComputeUnitIntegrals()
                             IntS_shapeI};
   };
 
-  const size_t num_local_cells = grid_->local_cells.size();
-  unit_cell_matrices_.resize(num_local_cells);
+  // Without a spatial weight function, the matrices of a cell only depend on its shape and size,
+  // and scale with the size as powers of the dimension. The cells are then identified by their
+  // shape, up to translation and uniform scaling, and their size. The matrices of the first cell of
+  // each shape are integrated and scaled for the cells of the same shape and another size, and the
+  // cells of the same shape and size share a single set of matrices.
+  const bool share_matrices = options_.share_unit_cell_matrices and
+                              options_.geometry_type != GeometryType::ONED_SPHERICAL and
+                              options_.geometry_type != GeometryType::TWOD_CYLINDRICAL;
+  if (options_.share_unit_cell_matrices and not share_matrices)
+    log.Log0Warning() << "Unit cell matrices cannot be shared with curvilinear geometries.";
+
+  // Relative tolerance on the vertex positions of cells of the same shape, and on their sizes
+  const double shape_tolerance = 1.0e-10;
+
+  // Computes the shape key of a cell, made of its type, its vertex positions relative to its first
+  // vertex and normalized by its size, and the cell vertices of its faces. Returns the size.
+  auto ComputeCellShapeKey = [this, shape_tolerance](const Cell& cell, std::vector<int64_t>& key)
+  {
+    const auto& v0 = grid_->vertices[cell.vertex_ids.front()];
+    double size = 0.0;
+    for (const auto vertex_id : cell.vertex_ids)
+      size = std::max(size, (grid_->vertices[vertex_id] - v0).Norm());
+
+    key.clear();
+    key.push_back(static_cast<int64_t>(cell.GetType()));
+    key.push_back(static_cast<int64_t>(cell.GetSubType()));
+    key.push_back(static_cast<int64_t>(cell.vertex_ids.size()));
+    for (const auto vertex_id : cell.vertex_ids)
+    {
+      const auto position = (grid_->vertices[vertex_id] - v0) / size;
+      for (int d = 0; d < 3; ++d)
+        key.push_back(std::llround(position[d] / shape_tolerance));
+    }
+    for (const auto& face : cell.faces)
+    {
+      key.push_back(static_cast<int64_t>(face.vertex_ids.size()));
+      for (const auto vertex_id : face.vertex_ids)
+        key.push_back(std::find(cell.vertex_ids.begin(), cell.vertex_ids.end(), vertex_id) -
+                      cell.vertex_ids.begin());
+    }
+    return size;
+  };
+
+  auto ScaleEntries = [](auto& values, double factor)
+  {
+    for (auto& value : values)
+      value *= factor;
+  };
+
+  // Scales the matrices of a cell to those of a cell of the same shape that is larger by a factor
+  const unsigned int dimension = grid_->GetDimension();
+  auto ScaleCellUnitIntegrals =
+    [&ScaleEntries, dimension](const UnitCellMatrices& matrices, double factor)
+  {
+    const double volume_factor = std::pow(factor, dimension);
+    const double surface_factor = volume_factor / factor;
+
+    UnitCellMatrices scaled_matrices = matrices;
+    ScaleEntries(scaled_matrices.intV_gradshapeI_gradshapeJ, surface_factor / factor);
+    ScaleEntries(scaled_matrices.intV_shapeI_gradshapeJ, surface_factor);
+    ScaleEntries(scaled_matrices.intV_shapeI_shapeJ, volume_factor);
+    ScaleEntries(scaled_matrices.intV_shapeI, volume_factor);
+    for (size_t f = 0; f < matrices.intS_shapeI.size(); ++f)
+    {
+      ScaleEntries(scaled_matrices.intS_shapeI_shapeJ[f], surface_factor);
+      ScaleEntries(scaled_matrices.intS_shapeI_gradshapeJ[f], surface_factor / factor);
+      ScaleEntries(scaled_matrices.intS_shapeI[f], surface_factor);
+    }
+    return scaled_matrices;
+  };
+
+  // Shape key -> id of the integrated matrices of the shape, and size of the integrated cell
+  std::map<std::vector<int64_t>, std::pair<size_t, double>> shape_matrices;
+  // Integrated matrices id, and rounded logarithm of the cell size -> id of the matrices
+  std::map<std::pair<size_t, int64_t>, size_t> sized_shape_matrices;
+  std::vector<int64_t> shape_key;
+
+  // Returns the id of the matrices of a cell, which are only computed for cells of a new shape or
+  // size
+  auto GetCellMatricesID = [&](const Cell& cell)
+  {
+    if (not share_matrices)
+      return unit_cell_matrices_.AddMatrices(ComputeCellUnitIntegrals(cell, *swf_ptr));
+
+    const double size = ComputeCellShapeKey(cell, shape_key);
+    auto shape_it = shape_matrices.find(shape_key);
+    if (shape_it == shape_matrices.end())
+    {
+      const auto id = unit_cell_matrices_.AddMatrices(ComputeCellUnitIntegrals(cell, *swf_ptr));
+      shape_it = shape_matrices.emplace(shape_key, std::make_pair(id, size)).first;
+    }
+
+    const auto [shape_id, shape_size] = shape_it->second;
+    const auto size_key = std::make_pair(shape_id, std::llround(std::log(size) / shape_tolerance));
+    auto size_it = sized_shape_matrices.find(size_key);
+    if (size_it == sized_shape_matrices.end())
+    {
+      const auto id = std::abs(std::log(size / shape_size)) < shape_tolerance
+                        ? shape_id
+                        : unit_cell_matrices_.AddMatrices(ScaleCellUnitIntegrals(
+                            unit_cell_matrices_.GetMatrices(shape_id), size / shape_size));
+      size_it = sized_shape_matrices.emplace(size_key, id).first;
+    }
+    return size_it->second;
+  };
 
+  unit_cell_matrices_.Clear();
   for (const auto& cell : grid_->local_cells)
-    unit_cell_matrices_[cell.local_id] = ComputeCellUnitIntegrals(cell, *swf_ptr);
+    unit_cell_matrices_.SetLocalCellMatrices(cell.local_id, GetCellMatricesID(cell));
 
   const auto ghost_ids = grid_->cells.GetGhostGlobalIDs();
   for (uint64_t ghost_id : ghost_ids)
-    unit_ghost_cell_matrices_[ghost_id] =
-      ComputeCellUnitIntegrals(grid_->cells[ghost_id], *swf_ptr);
+    unit_cell_matrices_.SetGhostCellMatrices(ghost_id, GetCellMatricesID(grid_->cells[ghost_id]));
 
   // Assessing global unit cell matrix storage
-  std::array<size_t, 2> num_local_ucms = {unit_cell_matrices_.size(),
-                                          unit_ghost_cell_matrices_.size()};
-  std::array<size_t, 2> num_global_ucms = {0, 0};
+  std::array<size_t, 3> num_local_ucms = {unit_cell_matrices_.size(),
+                                          unit_cell_matrices_.GetNumGhostCells(),
+                                          unit_cell_matrices_.GetNumMatrices()};
+  std::array<size_t, 3> num_global_ucms = {0, 0, 0};
 
-  mpi_comm.all_reduce(num_local_ucms.data(), 2, num_global_ucms.data(), mpi::op::sum<size_t>());
+  mpi_comm.all_reduce(num_local_ucms.data(), 3, num_global_ucms.data(), mpi::op::sum<size_t>());
 
   opensn::mpi_comm.barrier();
   log.Log() << "Ghost cell unit cell-matrix ratio: "
             << (double)num_global_ucms[1] * 100 / (double)num_global_ucms[0] << "%";
+  if (share_matrices)
+    log.Log() << "Unit cell matrices shared by " << num_global_ucms[0] + num_global_ucms[1]
+              << " local and ghost cells: " << num_global_ucms[2];
   log.Log() << "Cell matrices computed.";
 }
 
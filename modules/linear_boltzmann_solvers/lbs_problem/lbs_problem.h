@@ -122,11 +122,8 @@ public:
   /// Obtains a reference to the spatial discretization.
   const class SpatialDiscretization& GetSpatialDiscretization() const;
 
-  /// Returns read-only access to the unit cell matrices.
-  const std::vector<UnitCellMatrices>& GetUnitCellMatrices() const;
-
-  /// Returns read-only access to the unit ghost cell matrices.
-  const std::map<uint64_t, UnitCellMatrices>& GetUnitGhostCellMatrices() const;
+  /// Returns read-only access to the unit cell matrices of the local and ghost cells.
+  const UnitCellMatricesStore& GetUnitCellMatrices() const;
 
   /// Returns a reference to the list of local cell transport views.
   const std::vector<CellLBSView>& GetCellTransportViews() const;
@@ -210,6 +207,9 @@ public:
 
   void Initialize() override;
 
+  /// Returns true if the problem has been initialized.
+  bool IsInitialized() const { return discretization_ != nullptr; }
+
   /// Initializes default materials and physics materials.
   void InitializeMaterials();
 
@@ -345,8 +345,7 @@ protected:
   std::shared_ptr<MPICommunicatorSet> grid_local_comm_set_ = nullptr;
   std::shared_ptr<GridFaceHistogram> grid_face_histogram_ = nullptr;
 
-  std::vector<UnitCellMatrices> unit_cell_matrices_;
-  std::map<uint64_t, UnitCellMatrices> unit_ghost_cell_matrices_;
+  UnitCellMatricesStore unit_cell_matrices_;
   std::vector<CellLBSView> cell_transport_views_;
 
   std::map<uint64_t, BoundaryPreference> boundary_preferences_;
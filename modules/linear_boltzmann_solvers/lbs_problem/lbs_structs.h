@@ -203,6 +203,14 @@ struct LBSOptions
   SpatialDiscretizationType sd_type = SpatialDiscretizationType::PIECEWISE_LINEAR_DISCONTINUOUS;
   unsigned int scattering_order = 1;
   int max_mpi_message_size = 32768;
+  /// Maximum memory, in MB per rank, used for caching direction-dependent sweep operators.
+  int streaming_operator_cache_size = 0;
+  /// Directory of the on-disk cache of the AAH sweep data structures. Empty disables the cache.
+  std::filesystem::path sweep_cache_directory;
+  /// Execute the tasks of CBC sweeps from a ready queue, rather than by scanning all tasks.
+  bool cbc_ready_queue = true;
+  /// Share the unit cell matrices between cells of the same shape, up to translation and scaling.
+  bool share_unit_cell_matrices = false;
 
   bool restart_writes_enabled = false;
   bool write_delayed_psi_to_restart = true;
@@ -210,6 +218,8 @@ struct LBSOptions
   std::filesystem::path write_restart_path;
   std::chrono::time_point<std::chrono::system_clock> last_restart_write_time;
   std::chrono::seconds write_restart_time_interval = std::chrono::seconds(0);
+  bool restart_writes_async = false;
+  unsigned int max_async_restart_writes = 1;
 
   bool use_precursors = false;
   bool use_src_moments = false;
@@ -332,4 +342,69 @@ struct UnitCellMatrices
   std::vector<Vector<double>> intS_shapeI;
 };
 
+/**
+ * Unit cell matrices of the local and ghost cells. Cells with the same shape and size may refer to
+ * a single set of matrices.
+ */
+class UnitCellMatricesStore
+{
+public:
+  /// Returns the matrices of a local cell.
+  const UnitCellMatrices& operator[](uint64_t cell_local_id) const
+  {
+    return matrices_[local_cell_matrices_ids_[cell_local_id]];
+  }
+
+  /// Returns the matrices of a ghost cell.
+  const UnitCellMatrices& GetGhost(uint64_t cell_global_id) const
+  {
+    return matrices_[ghost_cell_matrices_ids_.at(cell_global_id)];
+  }
+
+  /// Returns the number of local cells.
+  size_t size() const { return local_cell_matrices_ids_.size(); }
+
+  /// Returns the number of ghost cells.
+  size_t GetNumGhostCells() const { return ghost_cell_matrices_ids_.size(); }
+
+  /// Returns the number of distinct sets of matrices.
+  size_t GetNumMatrices() const { return matrices_.size(); }
+
+  /// Adds a set of matrices and returns its id.
+  size_t AddMatrices(UnitCellMatrices&& matrices)
+  {
+    matrices_.push_back(std::move(matrices));
+    return matrices_.size() - 1;
+  }
+
+  /// Returns a set of matrices from its id.
+  const UnitCellMatrices& GetMatrices(size_t matrices_id) const { return matrices_[matrices_id]; }
+
+  /// Assigns a set of matrices to a local cell.
+  void SetLocalCellMatrices(uint64_t cell_local_id, size_t matrices_id)
+  {
+    if (cell_local_id >= local_cell_matrices_ids_.size())
+      local_cell_matrices_ids_.resize(cell_local_id + 1);
+    local_cell_matrices_ids_[cell_local_id] = matrices_id;
+  }
+
+  /// Assigns a set of matrices to a ghost cell.
+  void SetGhostCellMatrices(uint64_t cell_global_id, size_t matrices_id)
+  {
+    ghost_cell_matrices_ids_[cell_global_id] = matrices_id;
+  }
+
+  void Clear()
+  {
+    matrices_.clear();
+    local_cell_matrices_ids_.clear();
+    ghost_cell_matrices_ids_.clear();
+  }
+
+private:
+  std::vector<UnitCellMatrices> matrices_;
+  std::vector<size_t> local_cell_matrices_ids_;
+  std::map<uint64_t, size_t> ghost_cell_matrices_ids_;
+};
+
 } // namespace opensn
@@ -101,22 +101,9 @@ LBSVecOps::SetGSPETScVecFromPrimarySTLvector(LBSProblem& lbs_problem,
                                              Vec dest,
                                              PhiSTLOption src)
 {
-  const auto& src_phi =
-    (src == PhiSTLOption::PHI_NEW) ? lbs_problem.GetPhiNewLocal() : lbs_problem.GetPhiOldLocal();
   double* petsc_dest;
   VecGetArray(dest, &petsc_dest);
-  int64_t index = GroupsetScopedCopy(lbs_problem,
-                                     groupset.groups.front().id,
-                                     groupset.groups.size(),
-                                     [&](int64_t idx, size_t mapped_idx)
-                                     { petsc_dest[idx] = src_phi[mapped_idx]; });
-  if (groupset.angle_agg)
-  {
-    if (src == PhiSTLOption::PHI_NEW)
-      groupset.angle_agg->AppendNewDelayedAngularDOFsToArray(index, petsc_dest);
-    else if (src == PhiSTLOption::PHI_OLD)
-      groupset.angle_agg->AppendOldDelayedAngularDOFsToArray(index, petsc_dest);
-  }
+  SetGSArrayFromPrimarySTLvector(lbs_problem, groupset, petsc_dest, src);
   VecRestoreArray(dest, &petsc_dest);
 }
 
@@ -126,23 +113,54 @@ LBSVecOps::SetPrimarySTLvectorFromGSPETScVec(LBSProblem& lbs_problem,
                                              Vec src,
                                              PhiSTLOption dest)
 {
-  auto& dest_phi =
-    (dest == PhiSTLOption::PHI_NEW) ? lbs_problem.GetPhiNewLocal() : lbs_problem.GetPhiOldLocal();
   const double* petsc_src;
   VecGetArrayRead(src, &petsc_src);
-  int64_t index = GroupsetScopedCopy(lbs_problem,
-                                     groupset.groups.front().id,
-                                     groupset.groups.size(),
-                                     [&](int64_t idx, size_t mapped_idx)
-                                     { dest_phi[mapped_idx] = petsc_src[idx]; });
+  SetPrimarySTLvectorFromGSArray(lbs_problem, groupset, petsc_src, dest);
+  VecRestoreArrayRead(src, &petsc_src);
+}
+
+void
+LBSVecOps::SetGSArrayFromPrimarySTLvector(LBSProblem& lbs_problem,
+                                          const LBSGroupset& groupset,
+                                          double* dest,
+                                          PhiSTLOption src)
+{
+  const auto& src_phi =
+    (src == PhiSTLOption::PHI_NEW) ? lbs_problem.GetPhiNewLocal() : lbs_problem.GetPhiOldLocal();
+  int64_t index =
+    GroupsetScopedCopy(lbs_problem,
+                       groupset.groups.front().id,
+                       groupset.groups.size(),
+                       [&](int64_t idx, size_t mapped_idx) { dest[idx] = src_phi[mapped_idx]; });
+  if (groupset.angle_agg)
+  {
+    if (src == PhiSTLOption::PHI_NEW)
+      groupset.angle_agg->AppendNewDelayedAngularDOFsToArray(index, dest);
+    else if (src == PhiSTLOption::PHI_OLD)
+      groupset.angle_agg->AppendOldDelayedAngularDOFsToArray(index, dest);
+  }
+}
+
+void
+LBSVecOps::SetPrimarySTLvectorFromGSArray(LBSProblem& lbs_problem,
+                                          const LBSGroupset& groupset,
+                                          const double* src,
+                                          PhiSTLOption dest)
+{
+  auto& dest_phi =
+    (dest == PhiSTLOption::PHI_NEW) ? lbs_problem.GetPhiNewLocal() : lbs_problem.GetPhiOldLocal();
+  int64_t index =
+    GroupsetScopedCopy(lbs_problem,
+                       groupset.groups.front().id,
+                       groupset.groups.size(),
+                       [&](int64_t idx, size_t mapped_idx) { dest_phi[mapped_idx] = src[idx]; });
   if (groupset.angle_agg)
   {
     if (dest == PhiSTLOption::PHI_NEW)
-      groupset.angle_agg->SetNewDelayedAngularDOFsFromArray(index, petsc_src);
+      groupset.angle_agg->SetNewDelayedAngularDOFsFromArray(index, src);
     else if (dest == PhiSTLOption::PHI_OLD)
-      groupset.angle_agg->SetOldDelayedAngularDOFsFromArray(index, petsc_src);
+      groupset.angle_agg->SetOldDelayedAngularDOFsFromArray(index, src);
   }
-  VecRestoreArrayRead(src, &petsc_src);
 }
 
 void
@@ -36,6 +36,21 @@ public:
                                                 Vec src,
                                                 PhiSTLOption dest);
 
+  /**
+   * Assembles an array for a given groupset from a source vector, i.e., the groupset's flux moments
+   * followed by its delayed angular fluxes, in the layout of the groupset's PETSc vectors.
+   */
+  static void SetGSArrayFromPrimarySTLvector(LBSProblem& lbs_problem,
+                                             const LBSGroupset& groupset,
+                                             double* dest,
+                                             PhiSTLOption src);
+
+  /// Disassembles an array for a given groupset into a destination vector.
+  static void SetPrimarySTLvectorFromGSArray(LBSProblem& lbs_problem,
+                                             const LBSGroupset& groupset,
+                                             const double* src,
+                                             PhiSTLOption dest);
+
   /// Assembles a vector for a given group span from a source vector.
   static void SetGroupScopedPETScVecFromPrimarySTLvector(LBSProblem& lbs_problem,
                                                          int first_group_id,
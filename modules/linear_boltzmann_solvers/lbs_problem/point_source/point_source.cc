@@ -58,44 +58,36 @@ PointSource::Initialize(const LBSProblem& lbs_problem)
   const auto& grid = lbs_problem.GetGrid();
   const auto& discretization = lbs_problem.GetSpatialDiscretization();
   const auto& unit_cell_matrices = lbs_problem.GetUnitCellMatrices();
-  const auto& ghost_unit_cell_matrices = lbs_problem.GetUnitGhostCellMatrices();
 
   // Find local subscribers
   double total_volume = 0.0;
   std::vector<Subscriber> subscribers;
-  for (const auto& cell : grid->local_cells)
+  for (const auto local_id : grid->FindLocalCellsContainingPoint(location_))
   {
-    if (grid->CheckPointInsideCell(cell, location_))
-    {
-      const auto& cell_mapping = discretization.GetCellMapping(cell);
-      const auto& fe_values = unit_cell_matrices[cell.local_id];
-
-      // Map the point source to the finite element space
-      Vector<double> shape_vals;
-      cell_mapping.ShapeValues(location_, shape_vals);
-      const auto M_inv = Inverse(fe_values.intV_shapeI_shapeJ);
-      const auto node_wgts = Mult(M_inv, shape_vals);
-
-      // Increment the total volume
-      total_volume += cell.volume;
-
-      // Add to subscribers
-      subscribers.push_back(Subscriber{cell.volume, cell.local_id, shape_vals, node_wgts});
-    }
+    const auto& cell = grid->local_cells[local_id];
+    const auto& cell_mapping = discretization.GetCellMapping(cell);
+    const auto& fe_values = unit_cell_matrices[cell.local_id];
+
+    // Map the point source to the finite element space
+    Vector<double> shape_vals;
+    cell_mapping.ShapeValues(location_, shape_vals);
+    const auto M_inv = Inverse(fe_values.intV_shapeI_shapeJ);
+    const auto node_wgts = Mult(M_inv, shape_vals);
+
+    // Increment the total volume
+    total_volume += cell.volume;
+
+    // Add to subscribers
+    subscribers.push_back(Subscriber{cell.volume, cell.local_id, shape_vals, node_wgts});
   }
 
   // If the point source lies on a partition boundary, ghost cells must be
   // added to the total volume.
-  auto ghost_global_ids = grid->cells.GetGhostGlobalIDs();
-  for (uint64_t global_id : ghost_global_ids)
+  for (uint64_t global_id : grid->FindGhostCellsContainingPoint(location_))
   {
-    const auto& nbr_cell = grid->cells[global_id];
-    if (grid->CheckPointInsideCell(nbr_cell, location_))
-    {
-      const auto& fe_values = ghost_unit_cell_matrices.at(nbr_cell.global_id);
-      total_volume +=
-        std::accumulate(fe_values.intV_shapeI.begin(), fe_values.intV_shapeI.end(), 0.0);
-    }
+    const auto& fe_values = unit_cell_matrices.GetGhost(global_id);
+    total_volume +=
+      std::accumulate(fe_values.intV_shapeI.begin(), fe_values.intV_shapeI.end(), 0.0);
   }
 
   // Create the actual subscriber list
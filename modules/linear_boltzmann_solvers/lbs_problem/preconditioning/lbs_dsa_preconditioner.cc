@@ -6,6 +6,7 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/acceleration/diffusion_mip_solver.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/iterative_methods/wgs_context.h"
+#include "framework/logging/telemetry.h"
 
 namespace opensn
 {
@@ -22,6 +23,8 @@ WGDSA_TGDSA_PreConditionerMult(PC pc, Vec phi_input, Vec pc_output)
   LBSProblem& lbs_problem = gs_context_ptr->lbs_problem;
   LBSGroupset& groupset = gs_context_ptr->groupset;
 
+  Telemetry::ScopedTimer telemetry_timer(Telemetry::DSA);
+
   // Copy PETSc vector to STL
   auto& phi_new_local = gs_context_ptr->lbs_problem.GetPhiNewLocal();
   LBSVecOps::SetPrimarySTLvectorFromGSPETScVec(
@@ -64,6 +67,8 @@ WGDSA_TGDSA_PreConditionerMult2(WGSContext& gs_context_ptr, Vec phi_input, Vec p
   LBSProblem& lbs_problem = gs_context_ptr.lbs_problem;
   LBSGroupset& groupset = gs_context_ptr.groupset;
 
+  Telemetry::ScopedTimer telemetry_timer(Telemetry::DSA);
+
   // Copy PETSc vector to STL
   auto& phi_new_local = gs_context_ptr.lbs_problem.GetPhiNewLocal();
   LBSVecOps::SetPrimarySTLvectorFromGSPETScVec(
@@ -6,7 +6,9 @@
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "framework/runtime.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "caliper/cali.h"
+#include <map>
 
 namespace opensn
 {
@@ -22,6 +24,7 @@ SourceFunction::operator()(const LBSGroupset& groupset,
                            const SourceFlags source_flags)
 {
   CALI_CXX_MARK_SCOPE("SourceFunction::operator");
+  Telemetry::ScopedTimer telemetry_timer(Telemetry::SOURCE);
 
   if (source_flags.Empty())
     return;
@@ -51,6 +54,11 @@ SourceFunction::operator()(const LBSGroupset& groupset,
 
   const auto& m_to_ell_em_map = groupset.quadrature->GetMomentToHarmonicsIndexMap();
 
+  const bool apply_scatter_src = apply_ags_scatter_src_ or apply_wgs_scatter_src_;
+
+  // Groupset split of the transfer matrices of each cross-section set
+  std::map<const MultiGroupXS*, std::vector<GroupsetTransferMatrix>> transfer_matrices;
+
   // Apply all nodal sources
   const auto& grid = lbs_problem_.GetGrid();
   for (const auto& cell : grid->local_cells)
@@ -62,19 +70,35 @@ SourceFunction::operator()(const LBSGroupset& groupset,
     // Obtain xs
     const auto& xs = transport_view.GetXS();
 
-    const auto& S = xs.GetTransferMatrices();
     const auto& F = xs.GetProductionMatrix();
     const auto& precursors = xs.GetPrecursors();
     const auto& nu_delayed_sigma_f = xs.GetNuDelayedSigmaF();
 
-    // Loop over nodes
+    const std::vector<GroupsetTransferMatrix>* S = nullptr;
+    if (apply_scatter_src)
+    {
+      auto it = transfer_matrices.find(&xs);
+      if (it == transfer_matrices.end())
+        it = transfer_matrices.emplace(&xs, BuildGroupsetTransferMatrices(xs)).first;
+      S = &it->second;
+    }
+
     const auto num_nodes = transport_view.GetNumNodes();
-    for (int i = 0; i < num_nodes; ++i)
+    const size_t node_stride = num_moments * lbs_problem_.GetNumGroups();
+
+    // Loop over moments
+    for (int m = 0; m < static_cast<int>(num_moments); ++m)
     {
-      // Loop over moments
-      for (int m = 0; m < static_cast<int>(num_moments); ++m)
+      const auto ell = m_to_ell_em_map[m].ell;
+
+      // Apply scattering sources to all nodes of the cell at once
+      if (apply_scatter_src and ell < S->size())
+        AddScatterSources(
+          (*S)[ell], rho, num_nodes, node_stride, transport_view.MapDOF(0, m, 0), q, phi);
+
+      // Loop over nodes
+      for (int i = 0; i < num_nodes; ++i)
       {
-        const auto ell = m_to_ell_em_map[m].ell;
         const auto uk_map = transport_view.MapDOF(i, m, 0);
         const double* phi_im = &phi[uk_map];
 
@@ -95,27 +119,6 @@ SourceFunction::operator()(const LBSGroupset& groupset,
           if (apply_fixed_src_)
             rhs += this->AddSourceMoments();
 
-          // Apply scattering sources
-          if (ell < S.size())
-          {
-            const auto& S_ell = S[ell];
-            // Add Across GroupSet Scattering (AGS)
-            if (apply_ags_scatter_src_)
-              for (const auto& [_, gp, sigma_sm] : S_ell.Row(g))
-                if (gp < gs_i_ or gp > gs_f_)
-                  rhs += rho * sigma_sm * phi_im[gp];
-
-            // Add Within GroupSet Scattering (WGS)
-            if (apply_wgs_scatter_src_)
-              for (const auto& [_, gp, sigma_sm] : S_ell.Row(g))
-                if (gp >= gs_i_ and gp <= gs_f_)
-                {
-                  if (suppress_wg_scatter_src_ and g_ == gp)
-                    continue;
-                  rhs += rho * sigma_sm * phi_im[gp];
-                }
-          }
-
           // Apply fission sources
           if (xs.IsFissionable() and ell == 0)
           {
@@ -137,13 +140,79 @@ SourceFunction::operator()(const LBSGroupset& groupset,
           q[uk_map + g] += rhs;
 
         } // for g
-      }   // for m
-    }     // for dof i
+      }   // for dof i
+    }     // for m
   }       // for cell
 
   AddAdditionalSources(groupset, q, phi, source_flags);
 }
 
+std::vector<SourceFunction::GroupsetTransferMatrix>
+SourceFunction::BuildGroupsetTransferMatrices(const MultiGroupXS& xs) const
+{
+  std::vector<GroupsetTransferMatrix> matrices;
+  for (const auto& S_ell : xs.GetTransferMatricesCSR())
+  {
+    GroupsetTransferMatrix matrix;
+    matrix.matrix = &S_ell;
+    for (size_t g = gs_i_; g <= gs_f_; ++g)
+    {
+      matrix.wgs_begin.push_back(S_ell.FindColumn(g, gs_i_));
+      matrix.wgs_end.push_back(S_ell.FindColumn(g, gs_f_ + 1));
+    }
+    matrices.push_back(std::move(matrix));
+  }
+  return matrices;
+}
+
+void
+SourceFunction::AddScatterSources(const GroupsetTransferMatrix& S_ell,
+                                  const double rho,
+                                  const size_t num_nodes,
+                                  const size_t node_stride,
+                                  const size_t uk_map,
+                                  std::vector<double>& q,
+                                  const std::vector<double>& phi) const
+{
+  const auto& row_offsets = S_ell.matrix->GetRowOffsets();
+  const auto& col_indices = S_ell.matrix->GetColumnIndices();
+  const auto& values = S_ell.matrix->GetValues();
+
+  double* q_m = &q[uk_map];
+  const double* phi_m = &phi[uk_map];
+
+  // Adds the entries [begin, end) of row g to all nodes
+  const auto add_entries = [&](const size_t g, const size_t begin, const size_t end)
+  {
+    for (size_t k = begin; k < end; ++k)
+    {
+      const size_t gp = col_indices[k];
+      if (suppress_wg_scatter_src_ and gp == g)
+        continue;
+      const double sigma_sm = rho * values[k];
+      for (size_t i = 0; i < num_nodes; ++i)
+        q_m[i * node_stride + g] += sigma_sm * phi_m[i * node_stride + gp];
+    }
+  };
+
+  for (size_t g = gs_i_; g <= gs_f_; ++g)
+  {
+    const size_t wgs_begin = S_ell.wgs_begin[g - gs_i_];
+    const size_t wgs_end = S_ell.wgs_end[g - gs_i_];
+
+    // Add Across GroupSet Scattering (AGS)
+    if (apply_ags_scatter_src_)
+    {
+      add_entries(g, row_offsets[g], wgs_begin);
+      add_entries(g, wgs_end, row_offsets[g + 1]);
+    }
+
+    // Add Within GroupSet Scattering (WGS)
+    if (apply_wgs_scatter_src_)
+      add_entries(g, wgs_begin, wgs_end);
+  }
+}
+
 double
 SourceFunction::AddSourceMoments() const
 {
@@ -221,7 +290,6 @@ SourceFunction::AddVolumetricSources(const LBSGroupset& groupset,
   const auto& grid = lbs_problem_.GetGrid();
   const auto& discretization = lbs_problem_.GetSpatialDiscretization();
   const auto& cell_transport_views = lbs_problem_.GetCellTransportViews();
-  const auto num_groups = lbs_problem_.GetNumGroups();
 
   const auto gs_i = groupset.groups.front().id;
   const auto gs_f = groupset.groups.back().id;
@@ -231,18 +299,17 @@ SourceFunction::AddVolumetricSources(const LBSGroupset& groupset,
   {
     for (const auto& volumetric_source : lbs_problem_.GetVolumetricSources())
     {
+      size_t node = 0;
       for (const auto local_id : volumetric_source->GetSubscribers())
       {
         const auto& cell = grid->local_cells[local_id];
         const auto& transport_view = cell_transport_views[local_id];
-        const auto nodes = discretization.GetCellNodeLocations(cell);
         const auto num_cell_nodes = discretization.GetCellNumNodes(cell);
 
         // Go through each of the cell nodes
-        for (size_t i = 0; i < num_cell_nodes; ++i)
+        for (size_t i = 0; i < num_cell_nodes; ++i, ++node)
         {
-          // Compute group-wise values for this node
-          const auto src = (*volumetric_source)(cell, nodes[i], num_groups);
+          const auto* src = volumetric_source->GetNodeValues(node);
 
           // Contribute to the source moments
           const auto dof_map = transport_view.MapDOF(i, 0, 0);
@@ -5,6 +5,7 @@
 
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_structs.h"
 #include "framework/materials/multi_group_xs/multi_group_xs.h"
+#include "framework/math/sparse_matrix/csr_matrix.h"
 #include <memory>
 #include <utility>
 
@@ -91,6 +92,41 @@ public:
                             std::vector<double>& q,
                             const std::vector<double>& phi,
                             SourceFlags source_flags);
+
+protected:
+  /**
+   * Transfer matrix of one moment in contiguous CSR form, with the rows of the groupset groups
+   * split by source group. The entries of the row of groupset group `g` at positions
+   * `[wgs_begin[g - gs_i_], wgs_end[g - gs_i_])` scatter within the groupset, the other entries of
+   * the row scatter across groupsets.
+   */
+  struct GroupsetTransferMatrix
+  {
+    const CSRMatrix* matrix = nullptr;
+    std::vector<size_t> wgs_begin;
+    std::vector<size_t> wgs_end;
+  };
+
+  /**
+   * Splits the rows of the CSR transfer matrices of all moments of a cross-section set, which are
+   * stored with the cross sections, by groupset.
+   */
+  std::vector<GroupsetTransferMatrix> BuildGroupsetTransferMatrices(const MultiGroupXS& xs) const;
+
+  /**
+   * Adds the scattering sources of one moment to all nodes of a cell. Each matrix entry is applied
+   * to all nodes at once.
+   *
+   * \param uk_map The index of group 0 of the moment at the first cell node.
+   * \param node_stride The distance between the entries of consecutive cell nodes.
+   */
+  void AddScatterSources(const GroupsetTransferMatrix& S_ell,
+                         double rho,
+                         size_t num_nodes,
+                         size_t node_stride,
+                         size_t uk_map,
+                         std::vector<double>& q,
+                         const std::vector<double>& phi) const;
 };
 
 } // namespace opensn
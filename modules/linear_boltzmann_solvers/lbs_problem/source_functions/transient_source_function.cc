@@ -2,14 +2,16 @@
 // SPDX-License-Identifier: MIT
 
 #include "modules/linear_boltzmann_solvers/lbs_problem/source_functions/transient_source_function.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
+#include "framework/mesh/mesh_continuum/mesh_continuum.h"
 
 namespace opensn
 {
 
 TransientSourceFunction::TransientSourceFunction(const LBSProblem& lbs_problem,
-                                                 double& ref_dt,
-                                                 SteppingMethod& method)
-  : SourceFunction(lbs_problem), dt_(ref_dt), method_(method)
+                                                 const std::vector<double>& precursors_old,
+                                                 double theta_dt)
+  : SourceFunction(lbs_problem), precursors_old_(precursors_old), theta_dt_(theta_dt)
 {
 }
 
@@ -19,19 +21,6 @@ TransientSourceFunction::AddDelayedFission(const PrecursorList& precursors,
                                            const std::vector<double>& nu_delayed_sigma_f,
                                            const double* phi) const
 {
-  const auto& BackwardEuler = SteppingMethod::IMPLICIT_EULER;
-  const auto& CrankNicolson = SteppingMethod::CRANK_NICOLSON;
-
-  double theta;
-  if (method_ == BackwardEuler)
-    theta = 1.0;
-  else if (method_ == CrankNicolson)
-    theta = 0.5;
-  else
-    theta = 0.7;
-
-  const double eff_dt = theta * dt_;
-
   double value = 0.0;
   if (apply_ags_fission_src_)
     for (size_t gp = first_grp_; gp <= last_grp_; ++gp)
@@ -39,10 +28,10 @@ TransientSourceFunction::AddDelayedFission(const PrecursorList& precursors,
         for (const auto& precursor : precursors)
         {
           const double coeff = precursor.emission_spectrum[g_] * precursor.decay_constant /
-                               (1.0 + eff_dt * precursor.decay_constant);
+                               (1.0 + theta_dt_ * precursor.decay_constant);
 
-          value += coeff * eff_dt * precursor.fractional_yield * rho * nu_delayed_sigma_f[gp] *
-                   phi[gp] / cell_volume_;
+          value +=
+            coeff * theta_dt_ * precursor.fractional_yield * rho * nu_delayed_sigma_f[gp] * phi[gp];
         }
 
   if (apply_wgs_fission_src_)
@@ -50,13 +39,65 @@ TransientSourceFunction::AddDelayedFission(const PrecursorList& precursors,
       for (const auto& precursor : precursors)
       {
         const double coeff = precursor.emission_spectrum[g_] * precursor.decay_constant /
-                             (1.0 + eff_dt * precursor.decay_constant);
+                             (1.0 + theta_dt_ * precursor.decay_constant);
 
-        value += coeff * eff_dt * precursor.fractional_yield * rho * nu_delayed_sigma_f[gp] *
-                 phi[gp] / cell_volume_;
+        value +=
+          coeff * theta_dt_ * precursor.fractional_yield * rho * nu_delayed_sigma_f[gp] * phi[gp];
       }
 
   return value;
 }
 
+void
+TransientSourceFunction::AddAdditionalSources(const LBSGroupset& groupset,
+                                              std::vector<double>& q,
+                                              const std::vector<double>& phi,
+                                              const SourceFlags source_flags)
+{
+  SourceFunction::AddAdditionalSources(groupset, q, phi, source_flags);
+  AddPrecursorDecaySources(groupset, q, source_flags);
+}
+
+void
+TransientSourceFunction::AddPrecursorDecaySources(const LBSGroupset& groupset,
+                                                  std::vector<double>& q,
+                                                  const SourceFlags source_flags) const
+{
+  if (not(source_flags & APPLY_FIXED_SOURCES) or not lbs_problem_.GetOptions().use_precursors)
+    return;
+
+  const auto& cell_transport_views = lbs_problem_.GetCellTransportViews();
+  const size_t J = lbs_problem_.GetMaxPrecursorsPerMaterial();
+
+  const auto gs_i = groupset.groups.front().id;
+  const auto gs_f = groupset.groups.back().id;
+
+  for (const auto& cell : lbs_problem_.GetGrid()->local_cells)
+  {
+    const auto& transport_view = cell_transport_views[cell.local_id];
+    const auto& xs = transport_view.GetXS();
+    const auto& precursors = xs.GetPrecursors();
+    if (precursors.empty())
+      continue;
+
+    // Emission from the decay of the (cell-averaged) precursors
+    std::vector<double> emission(gs_f - gs_i + 1, 0.0);
+    for (size_t j = 0; j < xs.GetNumPrecursors(); ++j)
+    {
+      const auto& precursor = precursors[j];
+      const double decay = precursor.decay_constant * precursors_old_[cell.local_id * J + j] /
+                           (1.0 + theta_dt_ * precursor.decay_constant);
+      for (auto g = gs_i; g <= gs_f; ++g)
+        emission[g - gs_i] += precursor.emission_spectrum[g] * decay;
+    }
+
+    for (int i = 0; i < transport_view.GetNumNodes(); ++i)
+    {
+      const auto uk_map = transport_view.MapDOF(i, 0, 0);
+      for (auto g = gs_i; g <= gs_f; ++g)
+        q[uk_map + g] += emission[g - gs_i];
+    }
+  }
+}
+
 } // namespace opensn
@@ -4,32 +4,50 @@
 #pragma once
 
 #include "modules/linear_boltzmann_solvers/lbs_problem/source_functions/source_function.h"
-#include "framework/math/math_time_stepping.h"
 
 namespace opensn
 {
 
 /**
- * A transient source function needs to adjust the AddDelayedFission routine to properly fit with
- * the current timestepping method and timestep.
+ * A transient source function needs to adjust the delayed fission sources to the time step of a
+ * theta scheme, in which the sources are evaluated at \f$ t^{n+\theta} \f$. Integrating the
+ * precursor equations over \f$ \theta \Delta t \f$ gives
+ * \f[
+ *   C_j^{n+\theta} = \frac{C_j^n + \theta \Delta t \, \gamma_j \nu_d \sigma_f \phi^{n+\theta}}
+ *                         {1 + \lambda_j \theta \Delta t},
+ * \f]
+ * so that the delayed emission \f$ \chi_j \lambda_j C_j^{n+\theta} \f$ splits into a fission
+ * source and a fixed source from the decay of the precursors at the start of the time step.
  */
 class TransientSourceFunction : public SourceFunction
 {
 private:
-  double& dt_;
-  SteppingMethod& method_;
+  const std::vector<double>& precursors_old_;
+  const double theta_dt_;
 
 public:
   /**
-   * Constructor for the transient source function. The only difference as compared to a steady
-   * source function is the treatment of delayed fission.
+   * Constructor for the transient source function, given the precursor concentrations at the start
+   * of the time step and \f$ \theta \Delta t \f$.
    */
-  TransientSourceFunction(const LBSProblem& lbs_problem, double& ref_dt, SteppingMethod& method);
+  TransientSourceFunction(const LBSProblem& lbs_problem,
+                          const std::vector<double>& precursors_old,
+                          double theta_dt);
 
   double AddDelayedFission(const PrecursorList& precursors,
                            const double& rho,
                            const std::vector<double>& nu_delayed_sigma_f,
                            const double* phi) const override;
+
+  void AddAdditionalSources(const LBSGroupset& groupset,
+                            std::vector<double>& q,
+                            const std::vector<double>& phi,
+                            SourceFlags source_flags) override;
+
+  /// Adds the decay of the precursors at the start of the time step to the source moments.
+  void AddPrecursorDecaySources(const LBSGroupset& groupset,
+                                std::vector<double>& q,
+                                SourceFlags source_flags) const;
 };
 
 } // namespace opensn
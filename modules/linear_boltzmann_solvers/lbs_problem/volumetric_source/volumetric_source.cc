@@ -8,6 +8,7 @@
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "framework/mesh/logical_volume/logical_volume.h"
 #include "framework/math/functions/vector_spatial_function.h"
+#include "framework/math/spatial_discretization/spatial_discretization.h"
 #include "framework/runtime.h"
 #include "framework/object_factory.h"
 #include <memory>
@@ -114,6 +115,23 @@ VolumetricSource::Initialize(const LBSProblem& lbs_problem)
   num_local_subsribers_ = subscribers_.size();
   mpi_comm.all_reduce(num_local_subsribers_, num_global_subscribers_, mpi::op::sum<size_t>());
 
+  // Evaluate a function-defined source at the nodes of all subscribing cells
+  num_groups_ = lbs_problem.GetNumGroups();
+  node_values_.clear();
+  if (function_)
+  {
+    const auto& grid = lbs_problem.GetGrid();
+    const auto& discretization = lbs_problem.GetSpatialDiscretization();
+
+    std::vector<Vector3> nodes;
+    for (const auto local_id : subscribers_)
+    {
+      const auto cell_nodes = discretization.GetCellNodeLocations(grid->local_cells[local_id]);
+      nodes.insert(nodes.end(), cell_nodes.begin(), cell_nodes.end());
+    }
+    node_values_ = function_->EvaluateBatch(nodes, static_cast<int>(num_groups_));
+  }
+
   log.LogAllVerbose1() << "Volumetric source #" << id_ << " has " << num_local_subsribers_
                        << " subscribing cells on processor " << opensn::mpi_comm.rank() << ".";
   log.Log() << "Volumetric source #" << id_ << " has " << num_global_subscribers_
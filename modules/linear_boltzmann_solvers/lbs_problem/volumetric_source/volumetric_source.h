@@ -14,6 +14,7 @@ class Cell;
 class LogicalVolume;
 class VectorSpatialFunction;
 class LBSProblem;
+class SpatialDiscretization;
 
 /**
  * A class for multi-group isotropic volumetric sources.
@@ -40,6 +41,18 @@ public:
    */
   std::vector<double> operator()(const Cell& cell, const Vector3& xyz, int num_groups) const;
 
+  /**
+   * Returns the group values of the source at a node of the subscribing cells.
+   *
+   * The nodes are ordered by subscribing cell, in the order of GetSubscribers(), and then by cell
+   * node. A function-defined source is evaluated at all nodes, with a single batched function
+   * evaluation, when the source is initialized.
+   */
+  const double* GetNodeValues(size_t node) const
+  {
+    return function_ ? &node_values_[node * num_groups_] : strength_.data();
+  }
+
   size_t GetNumLocalSubscribers() const { return num_local_subsribers_; }
   size_t GetNumGlobalSubsribers() const { return num_global_subscribers_; }
 
@@ -61,6 +74,10 @@ private:
 
   std::vector<uint64_t> subscribers_;
 
+  size_t num_groups_ = 0;
+  /// Group values of a function-defined source at the nodes of the subscribing cells
+  std::vector<double> node_values_;
+
 public:
   static InputParameters GetInputParameters();
   static std::shared_ptr<VolumetricSource> Create(const ParameterBlock& params);
@@ -9,6 +9,7 @@
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "framework/logging/log.h"
 #include "framework/object_factory.h"
+#include "caliper/cali.h"
 #include "mpicpp-lite/mpicpp-lite.h"
 
 namespace mpi = mpicpp_lite;
@@ -92,12 +93,7 @@ ResponseEvaluator::SetOptions(const InputParameters& params)
 
   if (params.IsParameterValid("clear_sources"))
     if (params.GetParamValue<bool>("clear_sources"))
-    {
-      material_sources_.clear();
-      point_sources_.clear();
-      volumetric_sources_.clear();
-      boundary_sources_.clear();
-    }
+      ClearForwardSources();
 
   if (params.IsParameterValid("sources"))
   {
@@ -145,7 +141,7 @@ ResponseEvaluator::SetBufferOptions(const InputParameters& input)
   std::vector<std::vector<double>> psi;
   if (prefixes.Has("angular_fluxes"))
     LBSSolverIO::ReadAngularFluxes(
-      *lbs_problem_, prefixes.GetParamValue<std::string>("angular_fluxes"), psi);
+      *lbs_problem_, prefixes.GetParamValue<std::string>("angular_fluxes"), false, psi);
 
   adjoint_buffers_[name] = {phi, psi};
   log.Log0Verbose1() << "Adjoint buffer " << name << " added to the stack.";
@@ -180,7 +176,12 @@ ResponseEvaluator::SetSourceOptions(const InputParameters& input)
 {
   auto params = ResponseEvaluator::GetSourceOptionsBlock();
   params.AssignParameters(input);
+  AddSources(params, forward_sources_);
+}
 
+void
+ResponseEvaluator::AddSources(const InputParameters& params, ForwardSources& sources) const
+{
   params.RequireBlockTypeIs(ParameterBlockType::BLOCK);
 
   // Add material sources
@@ -191,7 +192,7 @@ ResponseEvaluator::SetSourceOptions(const InputParameters& input)
     {
       auto msrc_params = GetMaterialSourceOptionsBlock();
       msrc_params.AssignParameters(user_msrc_params.GetParam(p));
-      SetMaterialSourceOptions(msrc_params);
+      AddMaterialSource(msrc_params, sources);
     }
   }
 
@@ -201,9 +202,9 @@ ResponseEvaluator::SetSourceOptions(const InputParameters& input)
     const auto& user_psrc_params = params.GetParam("point");
     for (int p = 0; p < user_psrc_params.GetNumParameters(); ++p)
     {
-      point_sources_.push_back(
+      sources.point.push_back(
         user_psrc_params.GetParam(p).GetValue<std::shared_ptr<PointSource>>());
-      point_sources_.back()->Initialize(*lbs_problem_);
+      sources.point.back()->Initialize(*lbs_problem_);
     }
   }
 
@@ -213,9 +214,9 @@ ResponseEvaluator::SetSourceOptions(const InputParameters& input)
     const auto& user_dsrc_params = params.GetParam("volumetric");
     for (int p = 0; p < user_dsrc_params.GetNumParameters(); ++p)
     {
-      volumetric_sources_.push_back(
+      sources.volumetric.push_back(
         user_dsrc_params.GetParam(p).GetValue<std::shared_ptr<VolumetricSource>>());
-      volumetric_sources_.back()->Initialize(*lbs_problem_);
+      sources.volumetric.back()->Initialize(*lbs_problem_);
     }
   }
 
@@ -227,7 +228,7 @@ ResponseEvaluator::SetSourceOptions(const InputParameters& input)
     {
       auto bsrc_params = LBSProblem::GetBoundaryOptionsBlock();
       bsrc_params.AssignParameters(user_bsrc_params.GetParam(p));
-      SetBoundarySourceOptions(bsrc_params);
+      AddBoundarySource(bsrc_params, sources);
     }
   }
 }
@@ -248,9 +249,15 @@ ResponseEvaluator::GetMaterialSourceOptionsBlock()
 
 void
 ResponseEvaluator::SetMaterialSourceOptions(const InputParameters& params)
+{
+  AddMaterialSource(params, forward_sources_);
+}
+
+void
+ResponseEvaluator::AddMaterialSource(const InputParameters& params, ForwardSources& sources) const
 {
   const auto blkid = params.GetParamValue<int>("block_id");
-  OpenSnInvalidArgumentIf(material_sources_.count(blkid) > 0,
+  OpenSnInvalidArgumentIf(sources.material.count(blkid) > 0,
                           "A material source for block id " + std::to_string(blkid) +
                             " already exists.");
 
@@ -262,12 +269,18 @@ ResponseEvaluator::SetMaterialSourceOptions(const InputParameters& params)
                             std::to_string(lbs_problem_->GetNumGroups()) + " but got " +
                             std::to_string(values.size()) + ".");
 
-  material_sources_[blkid] = values;
+  sources.material[blkid] = values;
   log.Log0Verbose1() << "Material source for block id " << blkid << " added to the stack.";
 }
 
 void
 ResponseEvaluator::SetBoundarySourceOptions(const InputParameters& params)
+{
+  AddBoundarySource(params, forward_sources_);
+}
+
+void
+ResponseEvaluator::AddBoundarySource(const InputParameters& params, ForwardSources& sources) const
 {
   const auto bndry_name = params.GetParamValue<std::string>("name");
   const auto bndry_type = params.GetParamValue<std::string>("type");
@@ -278,10 +291,10 @@ ResponseEvaluator::SetBoundarySourceOptions(const InputParameters& params)
     OpenSnInvalidArgumentIf(not params.Has("group_strength"),
                             "Parameter \"group_strength\" is required for "
                             "boundaries of type \"isotropic\".");
-    params.RequireParameterBlockTypeIs("values", ParameterBlockType::ARRAY);
+    params.RequireParameterBlockTypeIs("group_strength", ParameterBlockType::ARRAY);
 
-    boundary_sources_[bid] = {LBSBoundaryType::ISOTROPIC,
-                              params.GetParamVectorValue<double>("group_strength")};
+    sources.boundary[bid] = {LBSBoundaryType::ISOTROPIC,
+                             params.GetParamVectorValue<double>("group_strength")};
   }
   else
     log.Log0Warning() << "Unsupported boundary type. Skipping the entry.";
@@ -290,10 +303,7 @@ ResponseEvaluator::SetBoundarySourceOptions(const InputParameters& params)
 void
 ResponseEvaluator::ClearForwardSources()
 {
-  material_sources_.clear();
-  point_sources_.clear();
-  volumetric_sources_.clear();
-  boundary_sources_.clear();
+  forward_sources_ = ForwardSources();
 }
 
 void
@@ -319,22 +329,69 @@ ResponseEvaluator::AddResponseSources(const InputParameters& params)
 double
 ResponseEvaluator::EvaluateResponse(const std::string& buffer) const
 {
-  const auto& buffer_data = adjoint_buffers_.at(buffer);
-  const auto& phi_dagger = buffer_data.first;
-  const auto& psi_dagger = buffer_data.second;
-
-  OpenSnLogicalErrorIf(not material_sources_.empty() and phi_dagger.empty(),
-                       "If material sources are present, adjoint flux moments "
-                       "must be available for response evaluation.");
-  OpenSnLogicalErrorIf(not point_sources_.empty() and phi_dagger.empty(),
-                       "If point sources are set, adjoint flux moments "
-                       "must be available for response evaluation.");
-  OpenSnLogicalErrorIf(not volumetric_sources_.empty() and phi_dagger.empty(),
-                       "if volumetric sources are set, adjoint flux moments "
-                       "must be available for response evaluation.");
-  OpenSnLogicalErrorIf(not boundary_sources_.empty() and psi_dagger.empty(),
-                       "If boundary sources are set, adjoint angular fluxes "
-                       "must be available for response evaluation.");
+  return EvaluateResponses({&adjoint_buffers_.at(buffer)}, {&forward_sources_}).front();
+}
+
+std::vector<double>
+ResponseEvaluator::EvaluateResponses(const std::vector<std::string>& buffer_names,
+                                     const std::vector<ParameterBlock>& source_options) const
+{
+  CALI_CXX_MARK_SCOPE("ResponseEvaluator::EvaluateResponses");
+
+  std::vector<const AdjointBuffer*> buffers;
+  buffers.reserve(buffer_names.size());
+  for (const auto& name : buffer_names)
+  {
+    const auto it = adjoint_buffers_.find(name);
+    OpenSnInvalidArgumentIf(it == adjoint_buffers_.end(),
+                            "No adjoint buffer with name " + name + " exists.");
+    buffers.push_back(&it->second);
+  }
+
+  std::vector<ForwardSources> source_configurations(source_options.size());
+  std::vector<const ForwardSources*> sources;
+  sources.reserve(source_options.size());
+  for (size_t s = 0; s < source_options.size(); ++s)
+  {
+    auto params = GetSourceOptionsBlock();
+    params.AssignParameters(source_options[s]);
+    AddSources(params, source_configurations[s]);
+    sources.push_back(&source_configurations[s]);
+  }
+
+  return EvaluateResponses(buffers, sources);
+}
+
+std::vector<double>
+ResponseEvaluator::EvaluateResponses(const std::vector<const AdjointBuffer*>& buffers,
+                                     const std::vector<const ForwardSources*>& sources) const
+{
+  const auto num_buffers = buffers.size();
+  const auto num_sources = sources.size();
+
+  // Blocks and boundaries with sources in any configuration
+  std::map<int, size_t> block_indices;
+  std::map<uint64_t, size_t> boundary_indices;
+  bool has_volume_sources = false;
+  for (const auto* src : sources)
+  {
+    for (const auto& [blkid, values] : src->material)
+      block_indices.emplace(blkid, block_indices.size());
+    for (const auto& [bid, bndry] : src->boundary)
+      boundary_indices.emplace(bid, boundary_indices.size());
+    has_volume_sources = has_volume_sources or not src->material.empty() or
+                         not src->point.empty() or not src->volumetric.empty();
+  }
+
+  for (const auto* buffer : buffers)
+  {
+    OpenSnLogicalErrorIf(has_volume_sources and buffer->first.empty(),
+                         "If material, point or volumetric sources are present, adjoint flux "
+                         "moments must be available for response evaluation.");
+    OpenSnLogicalErrorIf(not boundary_indices.empty() and buffer->second.empty(),
+                         "If boundary sources are set, adjoint angular fluxes "
+                         "must be available for response evaluation.");
+  }
 
   const auto& grid = lbs_problem_->GetGrid();
   const auto& discretization = lbs_problem_->GetSpatialDiscretization();
@@ -342,42 +399,58 @@ ResponseEvaluator::EvaluateResponse(const std::string& buffer) const
   const auto& unit_cell_matrices = lbs_problem_->GetUnitCellMatrices();
   const auto num_groups = lbs_problem_->GetNumGroups();
 
-  double local_response = 0.0;
+  std::vector<double> local_responses(num_sources * num_buffers, 0.0);
 
-  // Material sources
-  if (not material_sources_.empty())
+  // Material sources, from the integrals of the adjoint flux over each block
+  if (not block_indices.empty())
   {
+    std::vector<double> block_integrals(block_indices.size() * num_buffers * num_groups, 0.0);
     for (const auto& cell : grid->local_cells)
     {
-      const auto& cell_mapping = discretization.GetCellMapping(cell);
+      const auto it = block_indices.find(cell.block_id);
+      if (it == block_indices.end())
+        continue;
+
       const auto& transport_view = transport_views[cell.local_id];
       const auto& fe_values = unit_cell_matrices[cell.local_id];
-      const auto num_cell_nodes = cell_mapping.GetNumNodes();
-
-      if (material_sources_.count(cell.block_id) > 0)
+      const auto num_cell_nodes = transport_view.GetNumNodes();
+      for (size_t i = 0; i < num_cell_nodes; ++i)
       {
-        const auto& src = material_sources_.at(cell.block_id);
-        for (size_t i = 0; i < num_cell_nodes; ++i)
+        const auto dof_map = transport_view.MapDOF(i, 0, 0);
+        const auto& V_i = fe_values.intV_shapeI(i);
+        for (size_t b = 0; b < num_buffers; ++b)
         {
-          const auto dof_map = transport_view.MapDOF(i, 0, 0);
-          const auto& V_i = fe_values.intV_shapeI(i);
+          const auto* phi_dagger = &buffers[b]->first[dof_map];
+          auto* integrals = &block_integrals[(it->second * num_buffers + b) * num_groups];
           for (size_t g = 0; g < num_groups; ++g)
-            local_response += src[g] * phi_dagger[dof_map + g] * V_i;
+            integrals[g] += phi_dagger[g] * V_i;
         }
       }
     } // for cell
-  }   // if material sources
 
-  // Boundary sources
-  if (not boundary_sources_.empty())
+    for (size_t s = 0; s < num_sources; ++s)
+      for (const auto& [blkid, src] : sources[s]->material)
+        for (size_t b = 0; b < num_buffers; ++b)
+        {
+          const auto* integrals =
+            &block_integrals[(block_indices.at(blkid) * num_buffers + b) * num_groups];
+          for (size_t g = 0; g < num_groups; ++g)
+            local_responses[s * num_buffers + b] += src[g] * integrals[g];
+        }
+  } // if material sources
+
+  // Boundary sources, from the integrals of the incoming adjoint angular flux over each boundary
+  if (not boundary_indices.empty())
   {
+    std::vector<double> boundary_integrals(boundary_indices.size() * num_buffers * num_groups, 0.0);
     size_t gs = 0;
     for (const auto& groupset : lbs_problem_->GetGroupsets())
     {
       const auto& uk_man = groupset.psi_uk_man_;
       const auto& quadrature = groupset.quadrature;
-      const auto& num_gs_angles = quadrature->omegas.size();
-      const auto& num_gs_groups = groupset.groups.size();
+      const auto num_gs_angles = quadrature->omegas.size();
+      const auto num_gs_groups = groupset.groups.size();
+      const auto first_group = groupset.groups.front().id;
 
       for (const auto& cell : grid->local_cells)
       {
@@ -387,18 +460,15 @@ ResponseEvaluator::EvaluateResponse(const std::string& buffer) const
         size_t f = 0;
         for (const auto& face : cell.faces)
         {
-          if (not face.has_neighbor and boundary_sources_.count(face.neighbor_id) > 0)
+          const auto it = boundary_indices.find(face.neighbor_id);
+          if (not face.has_neighbor and it != boundary_indices.end())
           {
-            const auto bndry_id = face.neighbor_id;
             const auto num_face_nodes = cell_mapping.GetNumFaceNodes(f);
             for (size_t fi = 0; fi < num_face_nodes; ++fi)
             {
               const auto i = cell_mapping.MapFaceNode(f, fi);
-              const auto& node = grid->vertices[cell.vertex_ids[i]];
               const auto& intF_shapeI = fe_values.intS_shapeI[f](i);
 
-              const auto psi_bndry = EvaluateBoundaryCondition(bndry_id, node, groupset);
-
               for (size_t n = 0; n < num_gs_angles; ++n)
               {
                 const auto& omega = quadrature->omegas[n];
@@ -409,9 +479,15 @@ ResponseEvaluator::EvaluateResponse(const std::string& buffer) const
                   const auto weight = -mu * wt * intF_shapeI;
                   const auto dof_map = discretization.MapDOFLocal(cell, i, uk_man, n, 0);
 
-                  for (size_t gsg = 0; gsg < num_gs_groups; ++gsg)
-                    local_response +=
-                      weight * psi_dagger[gs][dof_map + gsg] * psi_bndry[num_gs_groups * n + gsg];
+                  for (size_t b = 0; b < num_buffers; ++b)
+                  {
+                    const auto* psi_dagger = &buffers[b]->second[gs][dof_map];
+                    auto* integrals =
+                      &boundary_integrals[(it->second * num_buffers + b) * num_groups +
+                                          first_group];
+                    for (size_t gsg = 0; gsg < num_gs_groups; ++gsg)
+                      integrals[gsg] += weight * psi_dagger[gsg];
+                  }
                 } // if outgoing
               }
             } // for face node fi
@@ -421,73 +497,80 @@ ResponseEvaluator::EvaluateResponse(const std::string& buffer) const
       }   // for cell
       ++gs;
     } // for groupset
-  }   // if boundary sources
 
-  // Point sources
-  for (const auto& point_source : point_sources_)
-    for (const auto& subscriber : point_source->GetSubscribers())
-    {
-      const auto& cell = grid->local_cells[subscriber.cell_local_id];
-      const auto& transport_view = transport_views[cell.local_id];
+    for (size_t s = 0; s < num_sources; ++s)
+      for (const auto& [bid, bc] : sources[s]->boundary)
+      {
+        OpenSnLogicalErrorIf(bc.type != LBSBoundaryType::ISOTROPIC,
+                             "Unexpected behavior. Unsupported boundary condition encountered.");
+        for (size_t b = 0; b < num_buffers; ++b)
+        {
+          const auto* integrals =
+            &boundary_integrals[(boundary_indices.at(bid) * num_buffers + b) * num_groups];
+          for (size_t g = 0; g < num_groups; ++g)
+            local_responses[s * num_buffers + b] += bc.isotropic_mg_source[g] * integrals[g];
+        }
+      }
+  } // if boundary sources
 
-      const auto& src = point_source->GetStrength();
-      const auto& vol_wt = subscriber.volume_weight;
+  for (size_t s = 0; s < num_sources; ++s)
+  {
+    auto* responses = &local_responses[s * num_buffers];
 
-      const auto num_cell_nodes = transport_view.GetNumNodes();
-      for (size_t i = 0; i < num_cell_nodes; ++i)
+    // Point sources
+    for (const auto& point_source : sources[s]->point)
+      for (const auto& subscriber : point_source->GetSubscribers())
       {
-        const auto dof_map = transport_view.MapDOF(i, 0, 0);
-        const auto& shape_val = subscriber.shape_values(i);
-        for (size_t g = 0; g < num_groups; ++g)
-          local_response += vol_wt * shape_val * src[g] * phi_dagger[dof_map + g];
-      } // for node i
-    }   // for subscriber
-
-  // Volumetric sources
-  for (const auto& volumetric_source : volumetric_sources_)
-    for (const uint64_t local_id : volumetric_source->GetSubscribers())
-    {
-      const auto& cell = grid->local_cells[local_id];
-      const auto& transport_view = transport_views[cell.local_id];
-      const auto& fe_values = unit_cell_matrices[cell.local_id];
-      const auto& nodes = discretization.GetCellNodeLocations(cell);
+        const auto& cell = grid->local_cells[subscriber.cell_local_id];
+        const auto& transport_view = transport_views[cell.local_id];
 
-      const auto num_cell_nodes = transport_view.GetNumNodes();
-      for (size_t i = 0; i < num_cell_nodes; ++i)
+        const auto& src = point_source->GetStrength();
+        const auto& vol_wt = subscriber.volume_weight;
+
+        const auto num_cell_nodes = transport_view.GetNumNodes();
+        for (size_t i = 0; i < num_cell_nodes; ++i)
+        {
+          const auto dof_map = transport_view.MapDOF(i, 0, 0);
+          const auto& shape_val = subscriber.shape_values(i);
+          for (size_t b = 0; b < num_buffers; ++b)
+          {
+            const auto* phi_dagger = &buffers[b]->first[dof_map];
+            for (size_t g = 0; g < num_groups; ++g)
+              responses[b] += vol_wt * shape_val * src[g] * phi_dagger[g];
+          }
+        } // for node i
+      }   // for subscriber
+
+    // Volumetric sources
+    for (const auto& volumetric_source : sources[s]->volumetric)
+    {
+      size_t node = 0;
+      for (const uint64_t local_id : volumetric_source->GetSubscribers())
       {
-        const auto& V_i = fe_values.intV_shapeI(i);
-        const auto dof_map = transport_view.MapDOF(i, 0, 0);
-        const auto& vals = (*volumetric_source)(cell, nodes[i], num_groups);
-        for (size_t g = 0; g < num_groups; ++g)
-          local_response += vals[g] * phi_dagger[dof_map + g] * V_i;
+        const auto& cell = grid->local_cells[local_id];
+        const auto& transport_view = transport_views[cell.local_id];
+        const auto& fe_values = unit_cell_matrices[cell.local_id];
+
+        const auto num_cell_nodes = transport_view.GetNumNodes();
+        for (size_t i = 0; i < num_cell_nodes; ++i, ++node)
+        {
+          const auto& V_i = fe_values.intV_shapeI(i);
+          const auto dof_map = transport_view.MapDOF(i, 0, 0);
+          const auto* vals = volumetric_source->GetNodeValues(node);
+          for (size_t b = 0; b < num_buffers; ++b)
+          {
+            const auto* phi_dagger = &buffers[b]->first[dof_map];
+            for (size_t g = 0; g < num_groups; ++g)
+              responses[b] += vals[g] * phi_dagger[g] * V_i;
+          }
+        }
       }
     }
+  } // for source configuration s
 
-  double global_response = 0.0;
-  mpi_comm.all_reduce(local_response, global_response, mpi::op::sum<double>());
-  return global_response;
-}
-
-std::vector<double>
-ResponseEvaluator::EvaluateBoundaryCondition(const uint64_t boundary_id,
-                                             const Vector3& node,
-                                             const LBSGroupset& groupset,
-                                             const double) const
-{
-  const auto num_gs_angles = groupset.quadrature->omegas.size();
-  const auto num_gs_groups = groupset.groups.size();
-  const auto first_group = groupset.groups.front().id;
-
-  std::vector<double> psi;
-  const auto& bc = boundary_sources_.at(boundary_id);
-  if (bc.type == LBSBoundaryType::ISOTROPIC)
-  {
-    for (size_t n = 0; n < num_gs_angles; ++n)
-      for (size_t gsg = 0; gsg < num_gs_groups; ++gsg)
-        psi.emplace_back(bc.isotropic_mg_source[first_group + gsg]);
-    return psi;
-  }
-  OpenSnLogicalError("Unexpected behavior. Unsupported boundary condition encountered.");
+  std::vector<double> global_responses(local_responses.size(), 0.0);
+  mpi_comm.all_reduce(local_responses, global_responses, mpi::op::sum<double>());
+  return global_responses;
 }
 
 } // namespace opensn
@@ -51,6 +51,10 @@ namespace opensn
  *        end
  *    end
  * \endcode
+ *
+ * Many source configurations can also be evaluated against many buffers at once with
+ * EvaluateResponses, which makes a single pass over the mesh and a single reduction for the whole
+ * response matrix.
  */
 class ResponseEvaluator : public Object
 {
@@ -64,6 +68,15 @@ private:
   using VolumetricSources = std::vector<std::shared_ptr<VolumetricSource>>;
   using BoundarySources = std::map<uint64_t, BoundaryPreference>;
 
+  /// A forward source configuration.
+  struct ForwardSources
+  {
+    MaterialSources material;
+    PointSources point;
+    VolumetricSources volumetric;
+    BoundarySources boundary;
+  };
+
 public:
   explicit ResponseEvaluator(const InputParameters& params);
 
@@ -94,29 +107,40 @@ public:
    */
   double EvaluateResponse(const std::string& buffer_name) const;
 
+  /**
+   * Evaluate the responses of several forward source configurations against several adjoint
+   * buffers. Each source configuration is a block of source options, as for
+   * AddResponseSources, and is independent of the currently defined sources. Returns the
+   * response matrix with one row of `buffer_names.size()` values per source configuration.
+   */
+  std::vector<double> EvaluateResponses(const std::vector<std::string>& buffer_names,
+                                        const std::vector<ParameterBlock>& source_options) const;
+
 private:
+  /// Adds the sources specified by a block of source options to a source configuration.
+  void AddSources(const InputParameters& params, ForwardSources& sources) const;
+
+  void AddMaterialSource(const InputParameters& params, ForwardSources& sources) const;
+
+  void AddBoundarySource(const InputParameters& params, ForwardSources& sources) const;
+
   /**
-   * Evaluates a boundary source and returns the angular flux on the boundary.
+   * Evaluates the responses of the source configurations against the adjoint buffers, with one
+   * row of buffers per source configuration.
    *
-   * This returns the full angular flux at a particular spatial location, for a particular
-   * groupset, at a particular time, for a particular boundary. No boundary normal information
-   * is included in the evaluation. The incident fluxes are obtained within the EvaluateResponse
-   * routine.
+   * The isotropic material and boundary sources are uniform over each block and boundary, so
+   * that their responses follow from the integrals of the adjoint fluxes over the blocks and the
+   * incoming half-ranges of the boundaries, which are computed in one pass over the mesh for all
+   * source configurations.
    */
-  std::vector<double> EvaluateBoundaryCondition(uint64_t boundary_id,
-                                                const Vector3& node,
-                                                const LBSGroupset& groupset,
-                                                double time = 0.0) const;
+  std::vector<double> EvaluateResponses(const std::vector<const AdjointBuffer*>& buffers,
+                                        const std::vector<const ForwardSources*>& sources) const;
 
-private:
   std::shared_ptr<LBSProblem> lbs_problem_;
 
   std::map<std::string, AdjointBuffer> adjoint_buffers_;
 
-  MaterialSources material_sources_;
-  PointSources point_sources_;
-  VolumetricSources volumetric_sources_;
-  BoundarySources boundary_sources_;
+  ForwardSources forward_sources_;
 
 public:
   /// Returns the input parameters for this object.
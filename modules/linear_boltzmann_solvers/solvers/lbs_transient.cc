@@ -2,13 +2,36 @@
 // SPDX-License-Identifier: MIT
 
 #include "modules/linear_boltzmann_solvers/solvers/lbs_transient.h"
+#include "modules/linear_boltzmann_solvers/discrete_ordinates_curvilinear_problem/discrete_ordinates_curvilinear_problem.h"
+#include "modules/linear_boltzmann_solvers/discrete_ordinates_problem/discrete_ordinates_problem.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/iterative_methods/ags_solver.h"
+#include "framework/physics/time_steppers/time_stepper.h"
+#include "framework/event_system/physics_event_publisher.h"
 #include "framework/object_factory.h"
-#include "framework/math/time_integrations/time_integration.h"
-#include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
+#include "framework/logging/log.h"
+#include "framework/logging/log_exceptions.h"
+#include "framework/runtime.h"
+#include "caliper/cali.h"
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <limits>
 
 namespace opensn
 {
 
+namespace
+{
+
+/// Bounds on the ratio of successive time steps with adaptive time stepping.
+constexpr double MAX_TIME_STEP_GROWTH = 2.0;
+constexpr double MIN_TIME_STEP_REDUCTION = 0.2;
+
+/// Safety factor applied to the time step that meets the error tolerance.
+constexpr double TIME_STEP_SAFETY = 0.9;
+
+} // namespace
+
 OpenSnRegisterObjectInNamespace(lbs, TransientSolver);
 
 InputParameters
@@ -16,48 +39,328 @@ TransientSolver::GetInputParameters()
 {
   InputParameters params = Solver::GetInputParameters();
 
-  params.SetGeneralDescription("Generalized implementation of a transient solver. This solver calls"
-                               " the Across-Groupset (AGS) solver for the lbs-data block.");
+  params.SetGeneralDescription("Implementation of a transient solver. Each time step of a theta "
+                               "scheme calls the across-groupset (AGS) solver.");
   params.SetDocGroup("LBSExecutors");
 
   params.ChangeExistingParamToOptional("name", "TransientSolver");
 
-  params.AddRequiredParameter<std::shared_ptr<Problem>>("lbs_problem", "An existing lbs problem");
+  params.AddRequiredParameter<std::shared_ptr<Problem>>("lbs_problem",
+                                                        "An existing discrete ordinates problem");
+
+  params.AddOptionalParameter(
+    "time_integration", "implicit_euler", "Time integration scheme to use");
+  params.AddOptionalParameter(
+    "theta", 0.5, "The theta parameter, for the theta_scheme time integration");
 
-  params.AddRequiredParameter<size_t>("time_integration",
-                                      "Handle to a time integration scheme to use");
+  params.AddOptionalParameter("adaptive_time_step",
+                              false,
+                              "Flag to adapt the time step size to the local error estimate of "
+                              "each time step.");
+  params.AddOptionalParameter(
+    "error_tolerance", 1.0e-3, "Tolerance on the relative local error of adaptive time steps.");
+  params.AddOptionalParameter("dt_min", 1.0e-12, "Minimum time step size.");
+  params.AddOptionalParameter(
+    "dt_max", 0.0, "Maximum time step size of adaptive time steps. Zero disables this limit.");
+
+  params.ConstrainParameterRange(
+    "time_integration",
+    AllowableRangeList::New({"implicit_euler", "crank_nicolson", "theta_scheme"}));
+  params.ConstrainParameterRange("theta", AllowableRangeLowHighLimit::New(0.5, 1.0));
+  params.ConstrainParameterRange("error_tolerance", AllowableRangeLowLimit::New(0.0, false));
+  params.ConstrainParameterRange("dt_min", AllowableRangeLowLimit::New(0.0, false));
+  params.ConstrainParameterRange("dt_max", AllowableRangeLowLimit::New(0.0));
 
   return params;
 }
 
+std::shared_ptr<TransientSolver>
+TransientSolver::Create(const ParameterBlock& params)
+{
+  auto& factory = opensn::ObjectFactory::GetInstance();
+  return factory.Create<TransientSolver>("lbs::TransientSolver", params);
+}
+
 TransientSolver::TransientSolver(const InputParameters& params)
   : Solver(params),
-    lbs_problem_(std::dynamic_pointer_cast<LBSProblem>(
+    do_problem_(std::dynamic_pointer_cast<DiscreteOrdinatesProblem>(
       params.GetParamValue<std::shared_ptr<Problem>>("lbs_problem"))),
-    time_integration_(GetStackItemPtrAsType<TimeIntegration>(
-      object_stack, params.GetParamValue<size_t>("time_integration")))
+    time_integration_(params.GetParamValue<std::string>("time_integration")),
+    theta_(1.0),
+    order_(1),
+    adaptive_time_step_(params.GetParamValue<bool>("adaptive_time_step")),
+    error_tolerance_(params.GetParamValue<double>("error_tolerance")),
+    dt_min_(params.GetParamValue<double>("dt_min")),
+    dt_max_(params.GetParamValue<double>("dt_max"))
 {
+  OpenSnInvalidArgumentIf(not do_problem_,
+                          GetName() + ": The problem must be a discrete ordinates problem.");
+  OpenSnInvalidArgumentIf(
+    std::dynamic_pointer_cast<DiscreteOrdinatesCurvilinearProblem>(do_problem_),
+    GetName() + ": Curvilinear problems are not supported.");
+  OpenSnInvalidArgumentIf(dt_max_ > 0.0 and dt_max_ < dt_min_,
+                          GetName() + ": dt_max must not be smaller than dt_min.");
+
+  if (time_integration_ == "crank_nicolson")
+    theta_ = 0.5;
+  else if (time_integration_ == "theta_scheme")
+    theta_ = params.GetParamValue<double>("theta");
+  order_ = theta_ == 0.5 ? 2 : 1;
+
+  timestepper_->SetMinimumTimeStepSize(dt_min_);
+  dt_next_ = timestepper_->GetTimeStepSize();
 }
 
 void
 TransientSolver::Initialize()
 {
-  lbs_problem_->Initialize();
+  CALI_CXX_MARK_SCOPE("TransientSolver::Initialize");
+
+  // Start from the current solution of an initialized problem
+  if (not do_problem_->IsInitialized())
+    do_problem_->Initialize();
+
+  const auto& options = do_problem_->GetOptions();
+  OpenSnLogicalErrorIf(not options.save_angular_flux,
+                       GetName() + ": The option `save_angular_flux` must be set to `true` for "
+                                   "transient solves.");
+  OpenSnLogicalErrorIf(options.adjoint,
+                       GetName() + ": Adjoint transient solves are not supported.");
+  for (const auto& [block_id, xs] : do_problem_->GetMatID2XSMap())
+    OpenSnLogicalErrorIf(xs->GetInverseVelocity().size() != do_problem_->GetNumGroups(),
+                         GetName() + ": The cross sections of block " + std::to_string(block_id) +
+                           " have no inverse velocities.");
+
+  phi_old_ = do_problem_->GetPhiNewLocal();
+  psi_old_ = do_problem_->GetPsiNewLocal();
+  precursors_old_ = do_problem_->GetPrecursorsNewLocal();
+  phi_prev_.clear();
+  phi_prev2_.clear();
+  dt_prev_ = 0.0;
+  dt_prev2_ = 0.0;
+  dt_next_ = timestepper_->GetTimeStepSize();
 }
 
 void
 TransientSolver::Execute()
 {
+  CALI_CXX_MARK_SCOPE("TransientSolver::Execute");
+
+  auto& physics_ev_pub = PhysicsEventPublisher::GetInstance();
+
+  while (timestepper_->IsActive())
+  {
+    physics_ev_pub.SolverStep(*this);
+    physics_ev_pub.SolverAdvance(*this);
+  }
 }
 
 void
 TransientSolver::Step()
 {
+  CALI_CXX_MARK_SCOPE("TransientSolver::Step");
+
+  // Do not step past the end time
+  timestepper_->SetTimeStepSize(timestepper_->GetTimeStepSize());
+  double dt = timestepper_->GetTimeStepSize();
+
+  while (true)
+  {
+    log.Log() << "Solver \"" + GetName() + "\" " + timestepper_->StringTimeInfo();
+
+    SolveTimeStep(dt);
+    if (not adaptive_time_step_)
+      break;
+
+    // Without a previous step, keep the time step size
+    const double error = EstimateLocalError(dt);
+    if (error < 0.0)
+    {
+      dt_next_ = dt;
+      break;
+    }
+
+    // Time step that meets the tolerance, for a local error of order dt^(order + 1)
+    const double factor =
+      error > 0.0 ? TIME_STEP_SAFETY * std::pow(error_tolerance_ / error, 1.0 / (order_ + 1))
+                  : MAX_TIME_STEP_GROWTH;
+
+    if (error <= error_tolerance_ or dt <= dt_min_)
+    {
+      const double dt_max = dt_max_ > 0.0 ? dt_max_ : std::numeric_limits<double>::max();
+      dt_next_ = std::clamp(dt * std::min(factor, MAX_TIME_STEP_GROWTH), dt_min_, dt_max);
+      log.Log() << "  Local error estimate " << error << ", step accepted.";
+      break;
+    }
+
+    dt = std::max(dt_min_, dt * std::max(factor, MIN_TIME_STEP_REDUCTION));
+    log.Log() << "  Local error estimate " << error << ", step rejected.";
+    timestepper_->SetTimeStepSize(dt);
+  }
 }
 
 void
 TransientSolver::Advance()
 {
+  CALI_CXX_MARK_SCOPE("TransientSolver::Advance");
+
+  const double dt = timestepper_->GetTimeStepSize();
+  timestepper_->Advance();
+
+  // The solution at the end of the step is the start of the next step
+  phi_prev2_ = std::move(phi_prev_);
+  dt_prev2_ = dt_prev_;
+  phi_prev_ = std::move(phi_old_);
+  dt_prev_ = dt;
+  phi_old_ = do_problem_->GetPhiNewLocal();
+  psi_old_ = do_problem_->GetPsiNewLocal();
+  precursors_old_ = do_problem_->GetPrecursorsNewLocal();
+
+  if (adaptive_time_step_)
+    timestepper_->SetTimeStepSize(dt_next_);
+
+  do_problem_->UpdateFieldFunctions();
+}
+
+double
+TransientSolver::GetTime() const
+{
+  return timestepper_->GetTime();
+}
+
+double
+TransientSolver::GetTimeStepSize() const
+{
+  return timestepper_->GetTimeStepSize();
+}
+
+void
+TransientSolver::SolveTimeStep(double dt)
+{
+  CALI_CXX_MARK_SCOPE("TransientSolver::SolveTimeStep");
+
+  // Solve for the solution at t^{n+theta}
+  do_problem_->EnableTimeDependentTerms(psi_old_, precursors_old_, theta_ * dt);
+  do_problem_->GetAGSSolver()->Solve();
+  do_problem_->DisableTimeDependentTerms();
+
+  if (do_problem_->GetOptions().use_precursors)
+    UpdatePrecursors(dt);
+
+  // Extrapolate the fluxes to t^{n+1}
+  const double c_new = 1.0 / theta_;
+  const double c_old = (1.0 - theta_) / theta_;
+
+  auto& phi_new = do_problem_->GetPhiNewLocal();
+  for (size_t i = 0; i < phi_new.size(); ++i)
+    phi_new[i] = c_new * phi_new[i] - c_old * phi_old_[i];
+
+  auto& psi_new = do_problem_->GetPsiNewLocal();
+  for (size_t gs = 0; gs < psi_new.size(); ++gs)
+    for (size_t i = 0; i < psi_new[gs].size(); ++i)
+      psi_new[gs][i] = c_new * psi_new[gs][i] - c_old * psi_old_[gs][i];
+
+  do_problem_->GetPhiOldLocal() = phi_new;
+}
+
+void
+TransientSolver::UpdatePrecursors(double dt)
+{
+  CALI_CXX_MARK_SCOPE("TransientSolver::UpdatePrecursors");
+
+  const auto& phi = do_problem_->GetPhiNewLocal();
+  auto& precursors_new = do_problem_->GetPrecursorsNewLocal();
+  const auto& densities = do_problem_->GetDensitiesLocal();
+  const auto& unit_cell_matrices = do_problem_->GetUnitCellMatrices();
+  const auto& cell_transport_views = do_problem_->GetCellTransportViews();
+  const size_t J = do_problem_->GetMaxPrecursorsPerMaterial();
+  const size_t num_groups = do_problem_->GetNumGroups();
+  const double theta_dt = theta_ * dt;
+
+  for (const auto& cell : do_problem_->GetGrid()->local_cells)
+  {
+    const auto& transport_view = cell_transport_views[cell.local_id];
+    const auto& xs = transport_view.GetXS();
+    if (xs.GetNumPrecursors() == 0)
+      continue;
+
+    // Cell-averaged delayed fission rate at t^{n+theta}
+    const auto& nu_delayed_sigma_f = xs.GetNuDelayedSigmaF();
+    const auto& fe_values = unit_cell_matrices[cell.local_id];
+    const double cell_volume = transport_view.GetVolume();
+    double delayed_fission = 0.0;
+    for (int i = 0; i < transport_view.GetNumNodes(); ++i)
+    {
+      const size_t uk_map = transport_view.MapDOF(i, 0, 0);
+      const double node_V_fraction = fe_values.intV_shapeI(i) / cell_volume;
+      for (size_t g = 0; g < num_groups; ++g)
+        delayed_fission += nu_delayed_sigma_f[g] * phi[uk_map + g] * node_V_fraction;
+    }
+    delayed_fission *= densities[cell.local_id];
+
+    // Integrate the precursor equations to t^{n+theta}, and extrapolate to t^{n+1}
+    const auto& precursors = xs.GetPrecursors();
+    for (size_t j = 0; j < xs.GetNumPrecursors(); ++j)
+    {
+      const size_t dof = cell.local_id * J + j;
+      const auto& precursor = precursors[j];
+      const double precursor_theta =
+        (precursors_old_[dof] + theta_dt * precursor.fractional_yield * delayed_fission) /
+        (1.0 + theta_dt * precursor.decay_constant);
+      precursors_new[dof] = (precursor_theta - (1.0 - theta_) * precursors_old_[dof]) / theta_;
+    }
+  }
+}
+
+double
+TransientSolver::EstimateLocalError(double dt) const
+{
+  if (phi_prev_.empty() or dt_prev_ <= 0.0)
+    return -1.0;
+  if (order_ == 2 and (phi_prev2_.empty() or dt_prev2_ <= 0.0))
+    return -1.0;
+
+  // Weights of the extrapolation of the previous steps to the end of this step, and the ratio of
+  // the local error of the step to the deviation from this extrapolation.
+  // First order: the deviation from the linear extrapolation is (dt (dt + dt_prev) / 2) phi'',
+  // whereas the local error of the theta scheme is ((theta - 1/2) dt^2) phi''.
+  // Second order: the deviation from the quadratic extrapolation is
+  // (dt (dt + dt_prev) (dt + dt_prev + dt_prev2) / 6) phi''', whereas the local error of
+  // Crank-Nicolson is (dt^3 / 12) phi'''.
+  double w_old = 0.0, w_prev = 0.0, w_prev2 = 0.0, error_ratio = 0.0;
+  if (order_ == 1)
+  {
+    w_old = 1.0 + dt / dt_prev_;
+    w_prev = -dt / dt_prev_;
+    error_ratio = (2.0 * theta_ - 1.0) * dt / (dt + dt_prev_);
+  }
+  else
+  {
+    const double t_prev = dt + dt_prev_;
+    const double t_prev2 = dt + dt_prev_ + dt_prev2_;
+    w_old = t_prev * t_prev2 / (dt_prev_ * (dt_prev_ + dt_prev2_));
+    w_prev = -dt * t_prev2 / (dt_prev_ * dt_prev2_);
+    w_prev2 = dt * t_prev / ((dt_prev_ + dt_prev2_) * dt_prev2_);
+    error_ratio = dt * dt / (2.0 * t_prev * t_prev2);
+  }
+
+  const auto& phi = do_problem_->GetPhiNewLocal();
+  std::array<double, 2> local_values = {0.0, 0.0};
+  for (size_t i = 0; i < phi.size(); ++i)
+  {
+    double phi_predicted = w_old * phi_old_[i] + w_prev * phi_prev_[i];
+    if (order_ == 2)
+      phi_predicted += w_prev2 * phi_prev2_[i];
+    local_values[0] = std::max(local_values[0], std::fabs(phi[i] - phi_predicted));
+    local_values[1] = std::max(local_values[1], std::fabs(phi[i]));
+  }
+
+  std::array<double, 2> values = {0.0, 0.0};
+  mpi_comm.all_reduce(local_values.data(), 2, values.data(), mpi::op::max<double>());
+  if (values[1] == 0.0)
+    return 0.0;
+
+  return error_ratio * values[0] / values[1];
 }
 
 } // namespace opensn
@@ -4,26 +4,89 @@
 #pragma once
 
 #include "framework/physics/solver.h"
+#include <memory>
+#include <string>
+#include <vector>
 
 namespace opensn
 {
-class TimeIntegration;
-class LBSProblem;
+class DiscreteOrdinatesProblem;
 
+/**
+ * Time-dependent discrete ordinates solver using a theta scheme.
+ *
+ * Each time step solves for the solution at \f$ t^{n+\theta} \f$ with the across-groupset (AGS)
+ * solver, with \f$ 1/(v \theta \Delta t) \f$ folded into the total cross sections and the angular
+ * fluxes at the start of the step as a source, and then extrapolates the scalar and angular fluxes
+ * and the precursors to \f$ t^{n+1} \f$. The initial state is the current solution of the problem,
+ * e.g., from a previous steady-state solve.
+ *
+ * With adaptive time stepping, the local error of each step is estimated from the deviation of the
+ * scalar flux from its linear extrapolation over the previous two steps. Steps with an error above
+ * the tolerance are repeated with a smaller time step, and the next time step is chosen from the
+ * error of the accepted step.
+ */
 class TransientSolver : public Solver
 {
 protected:
-  std::shared_ptr<LBSProblem> lbs_problem_;
-  std::shared_ptr<TimeIntegration> time_integration_;
+  std::shared_ptr<DiscreteOrdinatesProblem> do_problem_;
+  const std::string time_integration_;
+  double theta_;
+  /// Order of accuracy of the time integration, 2 for Crank-Nicolson and 1 otherwise.
+  int order_;
+
+  const bool adaptive_time_step_;
+  const double error_tolerance_;
+  const double dt_min_;
+  const double dt_max_;
+
+  /// Scalar fluxes, angular fluxes and precursors at the start of the time step.
+  std::vector<double> phi_old_;
+  std::vector<std::vector<double>> psi_old_;
+  std::vector<double> precursors_old_;
+
+  /// Scalar fluxes at the start of the previous two time steps, and their time step sizes.
+  std::vector<double> phi_prev_;
+  std::vector<double> phi_prev2_;
+  double dt_prev_ = 0.0;
+  double dt_prev2_ = 0.0;
+
+  /// Time step proposed for the next step.
+  double dt_next_ = 0.0;
 
 public:
   static InputParameters GetInputParameters();
+  static std::shared_ptr<TransientSolver> Create(const ParameterBlock& params);
   explicit TransientSolver(const InputParameters& params);
 
   void Initialize() override;
   void Execute() override;
   void Step() override;
   void Advance() override;
+
+  /// Returns the current time.
+  double GetTime() const;
+
+  /// Returns the size of the next time step.
+  double GetTimeStepSize() const;
+
+protected:
+  /// Solves a time step of size `dt` from the state at the start of the step.
+  void SolveTimeStep(double dt);
+
+  /**
+   * Updates the precursors at the end of a time step of size `dt`, from the scalar fluxes at
+   * \f$ t^{n+\theta} \f$.
+   */
+  void UpdatePrecursors(double dt);
+
+  /**
+   * Estimates the local error of a time step of size `dt`, relative to the maximum scalar flux.
+   * The estimate is of order `dt^2` for first-order schemes and of order `dt^3` for
+   * Crank-Nicolson. Returns a negative value if there are not enough previous steps to estimate
+   * it from.
+   */
+  double EstimateLocalError(double dt) const;
 };
 
 } // namespace opensn
@@ -12,6 +12,7 @@
 #include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "framework/utils/timer.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/object_factory.h"
 #include "framework/runtime.h"
 #include <iomanip>
@@ -195,6 +196,7 @@ PowerIterationKEigenSCDSASolver::Execute()
   double k_eff_change = 1.0;
 
   // Start power iterations
+  Telemetry::SolverScope telemetry_scope("k_eigen");
   int nit = 0;
   bool converged = false;
   while (nit < max_iters_)
@@ -294,6 +296,8 @@ PowerIterationKEigenSCDSASolver::Execute()
     // Check convergence, bookkeeping
     k_eff_change = std::fabs(k_eff_ / k_eff_prev - 1.0);
     k_eff_prev = k_eff_;
+    Telemetry::GetInstance().RecordIteration(nit,
+                                             {{"k_eff", k_eff_}, {"k_eff_change", k_eff_change}});
     nit += 1;
 
     if (k_eff_change < std::max(k_tolerance_, 1.0e-12))
@@ -14,6 +14,7 @@
 #include "framework/object_factory.h"
 #include "framework/utils/timer.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/runtime.h"
 #include <memory>
 #include <numeric>
@@ -213,6 +214,7 @@ PowerIterationKEigenSMMSolver::Execute()
 
   auto phi_ell = phi_old_local_;
 
+  Telemetry::SolverScope telemetry_scope("k_eigen");
   int nit = 0;
   while (nit < max_iters_)
   {
@@ -301,6 +303,8 @@ PowerIterationKEigenSMMSolver::Execute()
     LBSVecOps::GSScopedCopyPrimarySTLvectors(
       *lbs_problem_, front_gs_, phi_new_local_, phi_old_local_);
     LBSVecOps::GSScopedCopyPrimarySTLvectors(*lbs_problem_, front_gs_, phi_new_local_, phi_ell);
+    Telemetry::GetInstance().RecordIteration(
+      nit, {{"k_eff", k_eff_}, {"k_eff_change", k_eff_change}, {"phi_change", phi_change}});
     ++nit;
 
     if (lbs_problem_->GetOptions().verbose_outer_iterations)
@@ -6,6 +6,7 @@
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_vecops.h"
 #include "framework/logging/log_exceptions.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/utils/timer.h"
 #include "framework/utils/hdf_utils.h"
 #include "framework/object_factory.h"
@@ -100,10 +101,12 @@ void
 PowerIterationKEigenSolver::Execute()
 {
   auto& options = lbs_problem_->GetOptions();
-  double k_eff_prev = 1.0;
+  // Relative to the restarted eigenvalue, if any, so that a converged restart converges at once
+  double k_eff_prev = k_eff_;
   double k_eff_change = 1.0;
 
   // Start power iterations
+  Telemetry::SolverScope telemetry_scope("k_eigen");
   int nit = 0;
   bool converged = false;
   while (nit < max_iters_)
@@ -124,6 +127,8 @@ PowerIterationKEigenSolver::Execute()
     k_eff_change = fabs(k_eff_ - k_eff_prev) / k_eff_;
     k_eff_prev = k_eff_;
     F_prev_ = F_new;
+    Telemetry::GetInstance().RecordIteration(nit,
+                                             {{"k_eff", k_eff_}, {"k_eff_change", k_eff_change}});
     nit += 1;
 
     if (k_eff_change < std::max(k_tolerance_, 1.0e-12))
@@ -144,14 +149,22 @@ PowerIterationKEigenSolver::Execute()
     }
 
     if (options.restart_writes_enabled and lbs_problem_->TriggerRestartDump())
+    {
+      if (options.use_precursors)
+        ComputePrecursors();
       WriteRestartData();
+    }
 
     if (converged)
       break;
   } // for k iterations
 
+  if (options.use_precursors)
+    ComputePrecursors();
+
   // If restarts are enabled, always write a restart dump upon convergence or
-  // when we reach the iteration limit
+  // when we reach the iteration limit. An asynchronous dump is written while
+  // the solution is post-processed.
   if (options.restart_writes_enabled)
     WriteRestartData();
 
@@ -170,17 +183,21 @@ PowerIterationKEigenSolver::Execute()
             << " (Total number of sweeps:" << total_num_sweeps << ")"
             << "\n\n";
 
-  if (options.use_precursors)
-  {
-    lbs_problem_->ComputePrecursors();
-    Scale(lbs_problem_->GetPrecursorsNewLocal(), 1.0 / k_eff_);
-  }
-
   lbs_problem_->UpdateFieldFunctions();
 
+  if (options.restart_writes_enabled)
+    WaitForRestartData();
+
   log.Log() << "LinearBoltzmann::KEigenvalueSolver execution completed\n\n";
 }
 
+void
+PowerIterationKEigenSolver::ComputePrecursors()
+{
+  lbs_problem_->ComputePrecursors();
+  Scale(lbs_problem_->GetPrecursorsNewLocal(), 1.0 / k_eff_);
+}
+
 void
 PowerIterationKEigenSolver::SetLBSFissionSource(const std::vector<double>& input,
                                                 const bool additive)
@@ -244,6 +261,11 @@ PowerIterationKEigenSolver::ReadRestartData()
       ++gs_id;
     }
 
+    // Read precursors
+    if (lbs_problem_->GetOptions().use_precursors and H5Has(file, "precursors_new"))
+      success &=
+        H5ReadDataset1D<double>(file, "precursors_new", lbs_problem_->GetPrecursorsNewLocal());
+
     // Read keff and Fprev
     success &= H5ReadAttribute<double>(file, "keff", k_eff_) and
                H5ReadAttribute<double>(file, "Fprev", F_prev_);
@@ -263,47 +285,66 @@ bool
 PowerIterationKEigenSolver::WriteRestartData()
 {
   auto& options = lbs_problem_->GetOptions();
-  auto fname = options.write_restart_path;
-  auto& phi_old_local = lbs_problem_->GetPhiOldLocal();
-  auto& groupsets = lbs_problem_->GetGroupsets();
 
-  auto file = H5Fcreate(fname.c_str(), H5F_ACC_TRUNC, H5P_DEFAULT, H5P_DEFAULT);
-  bool success = (file >= 0);
-  if (file >= 0)
-  {
-    // Write phi
-    success &= H5WriteDataset1D<double>(file, "phi_old", phi_old_local);
+  if (not checkpoint_writer_)
+    checkpoint_writer_ = std::make_unique<CheckpointWriter>(options.restart_writes_async,
+                                                            options.max_async_restart_writes);
+
+  // Snapshot the restart data
+  CheckpointWriter::Checkpoint checkpoint;
+  checkpoint.file_name = options.write_restart_path;
+
+  // Write phi
+  checkpoint.datasets.emplace_back("phi_old", lbs_problem_->GetPhiOldLocal());
 
-    // Write psi
-    if (options.write_delayed_psi_to_restart)
+  // Write psi
+  if (options.write_delayed_psi_to_restart)
+  {
+    int gs_id = 0;
+    for (auto& gs : lbs_problem_->GetGroupsets())
     {
-      int gs_id = 0;
-      for (auto gs : lbs_problem_->GetGroupsets())
+      if (gs.angle_agg)
       {
-        if (gs.angle_agg)
+        auto psi = gs.angle_agg->GetOldDelayedAngularDOFsAsSTLVector();
+        if (not psi.empty())
         {
-          auto psi = gs.angle_agg->GetOldDelayedAngularDOFsAsSTLVector();
-          if (not psi.empty())
-          {
-            std::string name = "delayed_psi_old_gs" + std::to_string(gs_id);
-            success &= H5WriteDataset1D<double>(file, name, psi);
-          }
+          std::string name = "delayed_psi_old_gs" + std::to_string(gs_id);
+          checkpoint.datasets.emplace_back(name, std::move(psi));
         }
-        ++gs_id;
       }
+      ++gs_id;
     }
+  }
 
-    success &= H5CreateAttribute<double>(file, "keff", k_eff_) and
-               H5CreateAttribute<double>(file, "Fprev", F_prev_);
+  // Write precursors
+  if (options.use_precursors)
+    checkpoint.datasets.emplace_back("precursors_new", lbs_problem_->GetPrecursorsNewLocal());
 
-    H5Fclose(file);
-  }
+  checkpoint.attributes.emplace_back("keff", k_eff_);
+  checkpoint.attributes.emplace_back("Fprev", F_prev_);
+
+  const bool success = checkpoint_writer_->Write(std::move(checkpoint));
+  lbs_problem_->UpdateRestartWriteTime();
 
+  if (not success)
+    log.Log() << "Failed to write restart data." << std::endl;
+  else if (checkpoint_writer_->IsAsynchronous())
+    log.Log() << "Queued restart data for writing." << std::endl;
+  else
+    log.Log() << "Successfully wrote restart data." << std::endl;
+
+  return success;
+}
+
+bool
+PowerIterationKEigenSolver::WaitForRestartData()
+{
+  if (not checkpoint_writer_ or not checkpoint_writer_->IsAsynchronous())
+    return true;
+
+  const bool success = checkpoint_writer_->Wait();
   if (success)
-  {
-    lbs_problem_->UpdateRestartWriteTime();
     log.Log() << "Successfully wrote restart data." << std::endl;
-  }
   else
     log.Log() << "Failed to write restart data." << std::endl;
 
@@ -4,7 +4,9 @@
 #pragma once
 
 #include "framework/physics/solver.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/io/checkpoint_writer.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/iterative_methods/wgs_context.h"
+#include <memory>
 
 namespace opensn
 {
@@ -54,10 +56,19 @@ protected:
                            bool suppress_wg_scat = false);
 
 private:
+  /// Computes the delayed neutron precursors of the current solution, scaled by 1/k_eff.
+  void ComputePrecursors();
+
+  /// Writes (or, for asynchronous restarts, queues) a restart dump.
   bool WriteRestartData();
 
+  /// Waits for asynchronous restart dumps in flight to be written.
+  bool WaitForRestartData();
+
   bool ReadRestartData();
 
+  std::unique_ptr<CheckpointWriter> checkpoint_writer_;
+
 public:
   static InputParameters GetInputParameters();
 
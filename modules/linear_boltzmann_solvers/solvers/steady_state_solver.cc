@@ -63,16 +63,20 @@ SteadyStateSolver::Execute()
   auto& ags_solver = *lbs_problem_->GetAGSSolver();
   ags_solver.Solve();
 
-  if (options.restart_writes_enabled)
-    WriteRestartData();
-
   if (options.use_precursors)
     lbs_problem_->ComputePrecursors();
 
+  // An asynchronous restart dump is written while the solution is post-processed
+  if (options.restart_writes_enabled)
+    WriteRestartData();
+
   if (options.adjoint)
     lbs_problem_->ReorientAdjointSolution();
 
   lbs_problem_->UpdateFieldFunctions();
+
+  if (options.restart_writes_enabled)
+    WaitForRestartData();
 }
 
 bool
@@ -106,6 +110,11 @@ SteadyStateSolver::ReadRestartData()
       ++gs_id;
     }
 
+    // Read precursors
+    if (lbs_problem_->GetOptions().use_precursors and H5Has(file, "precursors_new"))
+      success &=
+        H5ReadDataset1D<double>(file, "precursors_new", lbs_problem_->GetPrecursorsNewLocal());
+
     H5Fclose(file);
   }
 
@@ -121,44 +130,63 @@ bool
 SteadyStateSolver::WriteRestartData()
 {
   auto& options = lbs_problem_->GetOptions();
-  auto fname = options.write_restart_path;
-  auto& phi_old_local = lbs_problem_->GetPhiOldLocal();
-  auto& groupsets = lbs_problem_->GetGroupsets();
 
-  auto file = H5Fcreate(fname.c_str(), H5F_ACC_TRUNC, H5P_DEFAULT, H5P_DEFAULT);
-  bool success = (file >= 0);
-  if (file >= 0)
-  {
-    // Write phi
-    success &= H5WriteDataset1D<double>(file, "phi_old", phi_old_local);
+  if (not checkpoint_writer_)
+    checkpoint_writer_ = std::make_unique<CheckpointWriter>(options.restart_writes_async,
+                                                            options.max_async_restart_writes);
+
+  // Snapshot the restart data
+  CheckpointWriter::Checkpoint checkpoint;
+  checkpoint.file_name = options.write_restart_path;
 
-    // Write psi
-    if (options.write_delayed_psi_to_restart)
+  // Write phi
+  checkpoint.datasets.emplace_back("phi_old", lbs_problem_->GetPhiOldLocal());
+
+  // Write psi
+  if (options.write_delayed_psi_to_restart)
+  {
+    int gs_id = 0;
+    for (auto& gs : lbs_problem_->GetGroupsets())
     {
-      int gs_id = 0;
-      for (auto gs : lbs_problem_->GetGroupsets())
+      if (gs.angle_agg)
       {
-        if (gs.angle_agg)
+        auto psi = gs.angle_agg->GetOldDelayedAngularDOFsAsSTLVector();
+        if (not psi.empty())
         {
-          auto psi = gs.angle_agg->GetOldDelayedAngularDOFsAsSTLVector();
-          if (not psi.empty())
-          {
-            std::string name = "delayed_psi_old_gs" + std::to_string(gs_id);
-            success &= H5WriteDataset1D<double>(file, name, psi);
-          }
+          std::string name = "delayed_psi_old_gs" + std::to_string(gs_id);
+          checkpoint.datasets.emplace_back(name, std::move(psi));
         }
-        ++gs_id;
       }
+      ++gs_id;
     }
-
-    H5Fclose(file);
   }
 
+  // Write precursors
+  if (options.use_precursors)
+    checkpoint.datasets.emplace_back("precursors_new", lbs_problem_->GetPrecursorsNewLocal());
+
+  const bool success = checkpoint_writer_->Write(std::move(checkpoint));
+  lbs_problem_->UpdateRestartWriteTime();
+
+  if (not success)
+    log.Log() << "Failed to write restart data." << std::endl;
+  else if (checkpoint_writer_->IsAsynchronous())
+    log.Log() << "Queued restart data for writing." << std::endl;
+  else
+    log.Log() << "Successfully wrote restart data." << std::endl;
+
+  return success;
+}
+
+bool
+SteadyStateSolver::WaitForRestartData()
+{
+  if (not checkpoint_writer_ or not checkpoint_writer_->IsAsynchronous())
+    return true;
+
+  const bool success = checkpoint_writer_->Wait();
   if (success)
-  {
-    lbs_problem_->UpdateRestartWriteTime();
     log.Log() << "Successfully wrote restart data." << std::endl;
-  }
   else
     log.Log() << "Failed to write restart data." << std::endl;
 
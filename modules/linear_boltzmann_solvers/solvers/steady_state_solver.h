@@ -4,6 +4,8 @@
 #pragma once
 
 #include "framework/physics/solver.h"
+#include "modules/linear_boltzmann_solvers/lbs_problem/io/checkpoint_writer.h"
+#include <memory>
 
 namespace opensn
 {
@@ -30,7 +32,13 @@ public:
 private:
   bool ReadRestartData();
 
+  /// Writes (or, for asynchronous restarts, queues) a restart dump.
   bool WriteRestartData();
+
+  /// Waits for asynchronous restart dumps in flight to be written.
+  bool WaitForRestartData();
+
+  std::unique_ptr<CheckpointWriter> checkpoint_writer_;
 };
 
 } // namespace opensn
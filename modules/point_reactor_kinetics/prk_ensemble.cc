@@ -0,0 +1,217 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#include "modules/point_reactor_kinetics/prk_ensemble.h"
+#include "framework/logging/log_exceptions.h"
+#include "caliper/cali.h"
+#include <algorithm>
+#include <cmath>
+
+namespace opensn
+{
+
+namespace
+{
+
+/// Returns `num_values` values per member, given either for every member or shared by all.
+std::vector<double>
+ExpandPerMember(const std::vector<double>& values,
+                size_t num_members,
+                size_t num_values,
+                const std::string& name)
+{
+  if (values.size() == num_members * num_values)
+    return values;
+
+  OpenSnInvalidArgumentIf(values.size() != num_values,
+                          "PRKEnsemble: " + name + " must have " + std::to_string(num_values) +
+                            " values, or " + std::to_string(num_values) + " values per member.");
+  std::vector<double> expanded;
+  expanded.reserve(num_members * num_values);
+  for (size_t m = 0; m < num_members; ++m)
+    expanded.insert(expanded.end(), values.begin(), values.end());
+  return expanded;
+}
+
+} // namespace
+
+PRKEnsemble::PRKEnsemble(size_t num_members,
+                         const std::vector<double>& lambdas,
+                         const std::vector<double>& betas,
+                         const std::vector<double>& gen_times,
+                         const std::vector<double>& initial_rhos,
+                         const std::vector<double>& sources,
+                         const std::vector<double>& initial_populations,
+                         const std::string& time_integration)
+  : num_members_(num_members),
+    num_precursors_(lambdas.size()),
+    time_integration_(time_integration),
+    lambdas_(lambdas),
+    gen_times_(ExpandPerMember(gen_times, num_members, 1, "gen_time")),
+    sources_(ExpandPerMember(sources, num_members, 1, "initial_source")),
+    populations_(num_members),
+    precursors_(num_precursors_ * num_members),
+    periods_(num_members, 0.0),
+    populations_old_(num_members),
+    populations_new_(num_members),
+    diagonal_(num_members)
+{
+  CALI_CXX_MARK_SCOPE("PRKEnsemble::PRKEnsemble");
+
+  OpenSnInvalidArgumentIf(num_members == 0, "PRKEnsemble: The ensemble must have members.");
+  OpenSnInvalidArgumentIf(
+    time_integration_ != "explicit_euler" and time_integration_ != "implicit_euler" and
+      time_integration_ != "crank_nicolson",
+    "PRKEnsemble: Unsupported time integration scheme \"" + time_integration_ + "\".");
+  for (const auto lambda : lambdas_)
+    OpenSnInvalidArgumentIf(lambda <= 0.0, "PRKEnsemble: Decay constants must be positive.");
+  for (const auto gen_time : gen_times_)
+    OpenSnInvalidArgumentIf(gen_time <= 0.0, "PRKEnsemble: Generation times must be positive.");
+
+  // Store the delayed neutron fractions per precursor group
+  const size_t J = num_precursors_;
+  const auto member_betas = ExpandPerMember(betas, num_members, J, "precursor_betas");
+  betas_.resize(J * num_members);
+  beta_totals_.assign(num_members, 0.0);
+  for (size_t m = 0; m < num_members; ++m)
+    for (size_t j = 0; j < J; ++j)
+    {
+      betas_[j * num_members + m] = member_betas[m * J + j];
+      beta_totals_[m] += member_betas[m * J + j];
+    }
+
+  // Initial states, as in PRKSolver: the steady state of subcritical members with a source,
+  // otherwise a critical state
+  const auto rhos = ExpandPerMember(initial_rhos, num_members, 1, "initial_rho");
+  const auto populations =
+    ExpandPerMember(initial_populations, num_members, 1, "initial_population");
+  for (size_t m = 0; m < num_members; ++m)
+  {
+    if (sources_[m] > 0.0 and rhos[m] < 0.0)
+      populations_[m] = -sources_[m] * gen_times_[m] / (beta_totals_[m] * rhos[m]);
+    else
+      populations_[m] = populations[m];
+  }
+  for (size_t j = 0; j < J; ++j)
+    for (size_t m = 0; m < num_members; ++m)
+      precursors_[j * num_members + m] =
+        betas_[j * num_members + m] * populations_[m] / (gen_times_[m] * lambdas_[j]);
+}
+
+void
+PRKEnsemble::Step(double dt, const double* rhos)
+{
+  CALI_CXX_MARK_SCOPE("PRKEnsemble::Step");
+
+  const size_t M = num_members_;
+  const size_t J = num_precursors_;
+  auto& n = populations_;
+  auto& n_old = populations_old_;
+  auto& n_new = populations_new_;
+  std::copy(n.begin(), n.end(), n_old.begin());
+
+  if (time_integration_ == "explicit_euler")
+  {
+    for (size_t m = 0; m < M; ++m)
+      n_new[m] =
+        n[m] + dt * (beta_totals_[m] * (rhos[m] - 1.0) / gen_times_[m] * n[m] + sources_[m]);
+    for (size_t j = 0; j < J; ++j)
+    {
+      const double lambda = lambdas_[j];
+      double* C = &precursors_[j * M];
+      const double* beta = &betas_[j * M];
+      for (size_t m = 0; m < M; ++m)
+      {
+        n_new[m] += dt * lambda * C[m];
+        C[m] += dt * (beta[m] / gen_times_[m] * n[m] - lambda * C[m]);
+      }
+    }
+    std::copy(n_new.begin(), n_new.end(), n.begin());
+  }
+  else
+  {
+    // Solve (I - theta dt A) x^{n+theta} = x^n + theta dt q, eliminating the precursors from the
+    // population equation
+    const double theta = time_integration_ == "crank_nicolson" ? 0.5 : 1.0;
+    const double tau = theta * dt;
+
+    auto& diagonal = diagonal_;
+    for (size_t m = 0; m < M; ++m)
+    {
+      diagonal[m] = 1.0 - tau * beta_totals_[m] * (rhos[m] - 1.0) / gen_times_[m];
+      n_new[m] = n[m] + tau * sources_[m];
+    }
+    for (size_t j = 0; j < J; ++j)
+    {
+      const double f = tau * lambdas_[j] / (1.0 + tau * lambdas_[j]);
+      const double* C = &precursors_[j * M];
+      const double* beta = &betas_[j * M];
+      for (size_t m = 0; m < M; ++m)
+      {
+        diagonal[m] -= f * tau * beta[m] / gen_times_[m];
+        n_new[m] += f * C[m];
+      }
+    }
+    for (size_t m = 0; m < M; ++m)
+      n_new[m] /= diagonal[m];
+
+    // Back substitute the precursors, and extrapolate from t^{n+theta} to t^{n+1}
+    for (size_t j = 0; j < J; ++j)
+    {
+      const double f = 1.0 / (1.0 + tau * lambdas_[j]);
+      double* C = &precursors_[j * M];
+      const double* beta = &betas_[j * M];
+      for (size_t m = 0; m < M; ++m)
+      {
+        const double C_theta = f * (C[m] + tau * beta[m] / gen_times_[m] * n_new[m]);
+        C[m] += (C_theta - C[m]) / theta;
+      }
+    }
+    for (size_t m = 0; m < M; ++m)
+      n[m] += (n_new[m] - n[m]) / theta;
+  }
+
+  // Periods, limited as in PRKSolver
+  for (size_t m = 0; m < M; ++m)
+  {
+    double period = 0.0;
+    if (std::abs(n_old[m]) > 1.0e-12 and std::abs(n[m] / n_old[m] - 1.0) > 1.0e-12)
+      period = std::clamp(dt / std::log(n[m] / n_old[m]), -1.0e6, 1.0e6);
+    periods_[m] = period;
+  }
+
+  time_ += dt;
+}
+
+std::vector<double>
+PRKEnsemble::Run(double dt, size_t num_steps, const std::vector<double>& rhos)
+{
+  CALI_CXX_MARK_SCOPE("PRKEnsemble::Run");
+
+  const size_t M = num_members_;
+  const bool shared_rhos = rhos.size() == num_steps and M != 1;
+  OpenSnInvalidArgumentIf(not shared_rhos and rhos.size() != num_steps * M,
+                          "PRKEnsemble: The reactivities must be given for every time step, "
+                          "either for all members or per member.");
+
+  std::vector<double> populations;
+  populations.reserve((num_steps + 1) * M);
+  populations.insert(populations.end(), populations_.begin(), populations_.end());
+
+  std::vector<double> step_rhos(M);
+  for (size_t step = 0; step < num_steps; ++step)
+  {
+    const double* step_rho = &rhos[step * M];
+    if (shared_rhos)
+    {
+      std::fill(step_rhos.begin(), step_rhos.end(), rhos[step]);
+      step_rho = step_rhos.data();
+    }
+    Step(dt, step_rho);
+    populations.insert(populations.end(), populations_.begin(), populations_.end());
+  }
+
+  return populations;
+}
+
+} // namespace opensn
@@ -0,0 +1,103 @@
+// SPDX-FileCopyrightText: 2025 The OpenSn Authors <https://open-sn.github.io/opensn/>
+// SPDX-License-Identifier: MIT
+
+#pragma once
+
+#include <cstddef>
+#include <string>
+#include <vector>
+
+namespace opensn
+{
+
+/**
+ * Ensemble of point reactor kinetics systems that are advanced together.
+ *
+ * The members share the precursor decay constants and time steps, but each member has its own
+ * reactivity history, delayed neutron fractions, generation time and source. The state is stored
+ * as arrays over the members, i.e., the population of all members followed by each precursor
+ * group of all members, so that a time step is a sequence of loops over contiguous arrays.
+ *
+ * The systems are those of PRKSolver, with the reactivity in dollars. Because the precursor
+ * equations only couple to the population, the implicit time steps are solved in closed form with
+ * O(J) operations per member instead of a dense matrix inverse.
+ */
+class PRKEnsemble
+{
+public:
+  /**
+   * Creates an ensemble of `num_members` systems and initializes them as PRKSolver does: members
+   * with a source and negative reactivity start at their steady state, the others at a critical
+   * state with the given population.
+   *
+   * \param lambdas The decay constants of the J precursor groups.
+   * \param betas The delayed neutron fractions, either J values shared by all members or J values
+   *        per member.
+   * \param gen_times The generation time, shared or per member.
+   * \param initial_rhos The initial reactivity in dollars, shared or per member.
+   * \param sources The source strength, shared or per member.
+   * \param initial_populations The population of critical initial states, shared or per member.
+   * \param time_integration One of `explicit_euler`, `implicit_euler` or `crank_nicolson`.
+   */
+  PRKEnsemble(size_t num_members,
+              const std::vector<double>& lambdas,
+              const std::vector<double>& betas,
+              const std::vector<double>& gen_times,
+              const std::vector<double>& initial_rhos,
+              const std::vector<double>& sources,
+              const std::vector<double>& initial_populations,
+              const std::string& time_integration);
+
+  size_t GetNumMembers() const { return num_members_; }
+  size_t GetNumPrecursors() const { return num_precursors_; }
+
+  /**
+   * Advances all members by a time step of size `dt`, with the reactivity `rhos[m]` (in dollars)
+   * of member m over the step.
+   */
+  void Step(double dt, const double* rhos);
+
+  /**
+   * Advances all members by `num_steps` time steps of size `dt`. `rhos` holds the reactivity of
+   * every member for each step, step by step, or a single reactivity for each step that is shared
+   * by all members. Returns the populations of all members at the start and after each step,
+   * i.e., `num_steps + 1` rows of `num_members` values.
+   */
+  std::vector<double> Run(double dt, size_t num_steps, const std::vector<double>& rhos);
+
+  /// Returns the current time.
+  double GetTime() const { return time_; }
+
+  /// Returns the populations of the members.
+  const std::vector<double>& GetPopulations() const { return populations_; }
+
+  /// Returns the precursor concentrations, as one array over the members per precursor group.
+  const std::vector<double>& GetPrecursors() const { return precursors_; }
+
+  /// Returns the periods of the members computed for the last time step.
+  const std::vector<double>& GetPeriods() const { return periods_; }
+
+private:
+  const size_t num_members_;
+  const size_t num_precursors_;
+  const std::string time_integration_;
+  std::vector<double> lambdas_;
+
+  /// Parameters of the members, with the delayed neutron fractions stored per precursor group
+  std::vector<double> betas_;
+  std::vector<double> beta_totals_;
+  std::vector<double> gen_times_;
+  std::vector<double> sources_;
+
+  std::vector<double> populations_;
+  std::vector<double> precursors_;
+  std::vector<double> periods_;
+  double time_ = 0.0;
+
+  /// Work arrays of a time step
+  std::vector<double> populations_old_;
+  std::vector<double> populations_new_;
+  std::vector<double> diagonal_;
+};
+
+} // namespace opensn
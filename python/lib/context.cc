@@ -4,6 +4,7 @@
 #include "python/lib/py_wrappers.h"
 #include "python/lib/py_env.h"
 #include "framework/logging/log.h"
+#include "framework/logging/telemetry.h"
 #include "framework/runtime.h"
 #include "caliper/cali.h"
 #include "petscsys.h"
@@ -137,6 +138,92 @@ WrapSettings(py::module& context)
   // clang-format on
 }
 
+// Wrap telemetry
+void
+WrapTelemetry(py::module& context)
+{
+  // clang-format off
+  context.def(
+    "EnableTelemetry",
+    [](const std::string& file_name)
+    {
+      Telemetry::GetInstance().Enable(file_name);
+    },
+    R"(
+    Start recording the iterations of the solvers.
+
+    Each iteration of a power iteration (``k_eigen``), across-groupset (``ags``) or within-groupset
+    (``wgs``) solve is recorded with its convergence data and the time spent sweeping, sending
+    and polling for sweep messages, setting sources and applying DSA since the previous iteration
+    of the same solve. The times are the minimum, maximum and mean over all ranks. Recording is collective and
+    must be enabled on all ranks.
+
+    Parameters
+    ----------
+    file_name: str, default=''
+        If not empty, the records are also written to this file as JSON lines.
+    )",
+    py::arg("file_name") = ""
+  );
+  context.def(
+    "DisableTelemetry",
+    []()
+    {
+      Telemetry::GetInstance().Disable();
+    },
+    "Stop recording the iterations of the solvers. The records are kept."
+  );
+  context.def(
+    "GetTelemetry",
+    []()
+    {
+      const auto& names = Telemetry::GetCategoryNames();
+      py::list records;
+      for (const auto& record : Telemetry::GetInstance().GetRecords())
+      {
+        py::list outer;
+        for (const auto& level : record.outer)
+          outer.append(py::dict(py::arg("solver") = level.solver,
+                                py::arg("iteration") = level.iteration));
+        py::dict times;
+        for (int c = 0; c < Telemetry::NUM_CATEGORIES; ++c)
+          times[names[c]] = py::dict(py::arg("min") = record.times[c].min,
+                                     py::arg("max") = record.times[c].max,
+                                     py::arg("mean") = record.times[c].mean);
+        py::dict values;
+        for (const auto& [name, value] : record.values)
+          values[name.c_str()] = value;
+        records.append(py::dict(py::arg("solver") = record.solver,
+                                py::arg("iteration") = record.iteration,
+                                py::arg("outer") = outer,
+                                py::arg("wall_time") = record.wall_time,
+                                py::arg("times") = times,
+                                py::arg("values") = values));
+      }
+      return records;
+    },
+    R"(
+    Get the recorded iterations.
+
+    Returns
+    -------
+    List[dict]
+        One dictionary per iteration with the keys ``solver``, ``iteration``, ``outer`` (the
+        enclosing solves with their ongoing iterations), ``wall_time``, ``times`` (``min``,
+        ``max`` and ``mean`` in seconds per timing category) and ``values`` (the convergence data).
+    )"
+  );
+  context.def(
+    "ClearTelemetry",
+    []()
+    {
+      Telemetry::GetInstance().Clear();
+    },
+    "Remove all recorded iterations."
+  );
+  // clang-format on
+}
+
 // Wrap sys.argv translator
 static void
 WrapSysArgv(py::module& context)
@@ -232,6 +319,7 @@ py_context(py::module& pyopensn)
   py::module context = pyopensn.def_submodule("context", "Context manager module.");
   WrapFinalize(context);
   WrapSettings(context);
+  WrapTelemetry(context);
   WrapSysArgv(context);
 }
 
@@ -61,6 +61,22 @@ WrapFieldFunctionGridBased(py::module& ffunc)
     Wrapper of :cpp:class:`opensn::FieldFunctionGridBased`.
     )"
   );
+  field_func_grid_based.def(
+    "GetLocalFieldVector",
+    [](FieldFunctionGridBased& self)
+    {
+      return convert_vector_to_ndarray(self.GetLocalFieldVector(), py::cast(&self), true);
+    },
+    R"(
+    Get the locally stored field data.
+
+    Returns
+    -------
+    numpy.ndarray
+        A writeable view (not a copy) of the local field vector, ordered according to the spatial
+        discretization and unknown manager of the field function.
+    )"
+  );
   field_func_grid_based.def_static(
     "ExportMultipleToVTK",
     [](py::list& ff_list, const std::string& base_name)
@@ -13,74 +13,168 @@
 #include "framework/math/functions/scalar_spatial_material_function.h"
 #include "framework/math/functions/vector_spatial_function.h"
 #include <functional>
+#include <vector>
 
 namespace opensn
 {
 
-/// Bind class for scalar material function
+/**
+ * Bind class for scalar material function
+ *
+ * A batch function evaluates the function for many values and material IDs in a single call.
+ */
 class PySMFunction : public ScalarMaterialFunction
 {
 public:
+  using BatchFunction =
+    std::function<std::vector<double>(const std::vector<double>&, const std::vector<int>&)>;
+
   PySMFunction(const std::function<double(double, int)>& func)
     : ScalarMaterialFunction(), func_(func)
   {
   }
 
-  inline double Evaluate(double val, int mat_id) const override { return this->func_(val, mat_id); }
+  PySMFunction(const BatchFunction& batch_func) : ScalarMaterialFunction(), batch_func_(batch_func)
+  {
+  }
+
+  inline double Evaluate(double val, int mat_id) const override
+  {
+    if (func_)
+      return this->func_(val, mat_id);
+    return EvaluateBatch({val}, {mat_id}).front();
+  }
+
+  std::vector<double> EvaluateBatch(const std::vector<double>& vals,
+                                    const std::vector<int>& mat_ids) const override
+  {
+    if (not batch_func_)
+      return ScalarMaterialFunction::EvaluateBatch(vals, mat_ids);
+    return this->batch_func_(vals, mat_ids);
+  }
 
 protected:
   std::function<double(double, int)> func_;
+  BatchFunction batch_func_;
 };
 
-/// Bind class for scalar spatial function
+/**
+ * Bind class for scalar spatial function
+ *
+ * A batch function evaluates the function at many points in a single call.
+ */
 class PySSFunction : public ScalarSpatialFunction
 {
 public:
+  using BatchFunction = std::function<std::vector<double>(const std::vector<Vector3>&)>;
+
   PySSFunction(const std::function<double(const Vector3&)>& func)
     : ScalarSpatialFunction(), func_(func)
   {
   }
 
-  inline double Evaluate(const Vector3& xyz) const override { return this->func_(xyz); }
+  PySSFunction(const BatchFunction& batch_func) : ScalarSpatialFunction(), batch_func_(batch_func)
+  {
+  }
+
+  inline double Evaluate(const Vector3& xyz) const override
+  {
+    if (func_)
+      return this->func_(xyz);
+    return EvaluateBatch({xyz}).front();
+  }
+
+  std::vector<double> EvaluateBatch(const std::vector<Vector3>& xyz) const override
+  {
+    if (not batch_func_)
+      return ScalarSpatialFunction::EvaluateBatch(xyz);
+    return this->batch_func_(xyz);
+  }
 
 protected:
   std::function<double(const Vector3&)> func_;
+  BatchFunction batch_func_;
 };
 
-/// Bind class for scalar spatial material function
+/**
+ * Bind class for scalar spatial material function
+ *
+ * A batch function evaluates the function at many points in a single call.
+ */
 class PySSMFunction : public ScalarSpatialMaterialFunction
 {
 public:
+  using BatchFunction =
+    std::function<std::vector<double>(const std::vector<int>&, const std::vector<Vector3>&)>;
+
   PySSMFunction(const std::function<double(int, const Vector3&)>& func)
     : ScalarSpatialMaterialFunction(), func_(func)
   {
   }
 
+  PySSMFunction(const BatchFunction& batch_func)
+    : ScalarSpatialMaterialFunction(), batch_func_(batch_func)
+  {
+  }
+
   inline double Evaluate(int mat_id, const Vector3& xyz) const override
   {
-    return this->func_(mat_id, xyz);
+    if (func_)
+      return this->func_(mat_id, xyz);
+    return EvaluateBatch({mat_id}, {xyz}).front();
+  }
+
+  std::vector<double> EvaluateBatch(const std::vector<int>& mat_ids,
+                                    const std::vector<Vector3>& xyz) const override
+  {
+    if (not batch_func_)
+      return ScalarSpatialMaterialFunction::EvaluateBatch(mat_ids, xyz);
+    return this->batch_func_(mat_ids, xyz);
   }
 
 protected:
   std::function<double(int, const Vector3&)> func_;
+  BatchFunction batch_func_;
 };
 
-/// Bind class for vector spatial function
+/**
+ * Bind class for vector spatial function
+ *
+ * A batch function evaluates the function at many points in a single call, returning the
+ * components of each point contiguously.
+ */
 class PyVSFunction : public VectorSpatialFunction
 {
 public:
+  using BatchFunction = std::function<std::vector<double>(const std::vector<Vector3>&, int)>;
+
   PyVSFunction(const std::function<std::vector<double>(const Vector3&, int)>& func)
     : VectorSpatialFunction(), func_(func)
   {
   }
 
+  PyVSFunction(const BatchFunction& batch_func) : VectorSpatialFunction(), batch_func_(batch_func)
+  {
+  }
+
   inline std::vector<double> Evaluate(const Vector3& xyz, int num_components) const override
   {
-    return this->func_(xyz, num_components);
+    if (func_)
+      return this->func_(xyz, num_components);
+    return EvaluateBatch({xyz}, num_components);
+  }
+
+  std::vector<double> EvaluateBatch(const std::vector<Vector3>& xyz,
+                                    int num_components) const override
+  {
+    if (not batch_func_)
+      return VectorSpatialFunction::EvaluateBatch(xyz, num_components);
+    return this->batch_func_(xyz, num_components);
   }
 
 protected:
   std::function<std::vector<double>(const Vector3&, int)> func_;
+  BatchFunction batch_func_;
 };
 
 } // namespace opensn
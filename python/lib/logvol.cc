@@ -34,6 +34,12 @@ WrapLogicalVolume(py::module& logvol)
     "Check if a point is inside or outside the logical volume.",
     py::arg("point")
   );
+  logical_volume.def(
+    "InsideBatch",
+    &LogicalVolume::InsideBatch,
+    "Check if each point of a list is inside or outside the logical volume.",
+    py::arg("points")
+  );
 
   // boolean logical volume
   auto boolean_logical_volume = py::class_<BooleanLogicalVolume,
@@ -6,14 +6,46 @@
 #include "framework/math/quadratures/angular/legendre_poly/legendrepoly.h"
 #include "framework/math/vector3.h"
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <cstddef>
 #include <memory>
 #include <sstream>
 #include <stdexcept>
+#include <string>
+#include <vector>
 
 namespace opensn
 {
 
+// Type of the NumPy arrays returned by vectorized Python functions
+using PyBatchArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+// Convert points to a NumPy array of shape (num_points, 3)
+static py::array_t<double>
+PointsToNumPy(const std::vector<Vector3>& xyz)
+{
+  py::array_t<double> points({xyz.size(), static_cast<std::size_t>(3)});
+  auto points_view = points.mutable_unchecked<2>();
+  for (std::size_t i = 0; i < xyz.size(); ++i)
+  {
+    points_view(i, 0) = xyz[i].x;
+    points_view(i, 1) = xyz[i].y;
+    points_view(i, 2) = xyz[i].z;
+  }
+  return points;
+}
+
+// Copy the values returned by a vectorized Python function, checking their number
+static std::vector<double>
+NumPyToValues(const PyBatchArray& array, std::size_t num_values)
+{
+  if (static_cast<std::size_t>(array.size()) != num_values)
+    throw std::runtime_error("Vectorized function returned " + std::to_string(array.size()) +
+                             " values, expected " + std::to_string(num_values) + ".");
+  return std::vector<double>(array.data(), array.data() + num_values);
+}
+
 // Wrap spherical harmonics
 void
 WrapYlm(py::module& math)
@@ -263,9 +295,20 @@ WrapFunctors(py::module& math)
   );
   scalar_material_function.def(
     py::init(
-      [](const std::function<double(double, int)>& func)
+      [](const py::function& func, bool vectorized)
       {
-        return std::make_shared<PySMFunction>(func);
+        if (vectorized)
+        {
+          auto batch_func = func.cast<std::function<PyBatchArray(py::array_t<double>, py::array_t<int>)>>();
+          return std::make_shared<PySMFunction>(PySMFunction::BatchFunction(
+            [batch_func](const std::vector<double>& vals, const std::vector<int>& mat_ids)
+            {
+              auto result = batch_func(py::array_t<double>(vals.size(), vals.data()),
+                                       py::array_t<int>(mat_ids.size(), mat_ids.data()));
+              return NumPyToValues(result, vals.size());
+            }));
+        }
+        return std::make_shared<PySMFunction>(func.cast<std::function<double(double, int)>>());
       }
     ),
     R"(
@@ -275,8 +318,12 @@ WrapFunctors(py::module& math)
     ----------
     func: Callable[[float, int], float]
         Referenced scalar material function.
+    vectorized: bool, default=False
+        If True, ``func`` evaluates many points in a single call. It receives a NumPy array of
+        values and a NumPy array of material IDs and returns a NumPy array of function values.
     )",
-    py::arg("func")
+    py::arg("func"),
+    py::arg("vectorized") = false
   );
   scalar_material_function.def(
     "__call__",
@@ -326,9 +373,18 @@ WrapFunctors(py::module& math)
   );
   scalar_spatial_function.def(
     py::init(
-      [](const std::function<double(const Vector3&)>& func)
+      [](const py::function& func, bool vectorized)
       {
-        return std::make_shared<PySSFunction>(func);
+        if (vectorized)
+        {
+          auto batch_func = func.cast<std::function<PyBatchArray(py::array_t<double>)>>();
+          return std::make_shared<PySSFunction>(PySSFunction::BatchFunction(
+            [batch_func](const std::vector<Vector3>& xyz)
+            {
+              return NumPyToValues(batch_func(PointsToNumPy(xyz)), xyz.size());
+            }));
+        }
+        return std::make_shared<PySSFunction>(func.cast<std::function<double(const Vector3&)>>());
       }
     ),
     R"(
@@ -338,8 +394,12 @@ WrapFunctors(py::module& math)
     ----------
     func: Callable[[pyopensn.math.Vector3], float]
         Referenced scalar spatial function.
+    vectorized: bool, default=False
+        If True, ``func`` evaluates many points in a single call. It receives a NumPy array of
+        points of shape ``(num_points, 3)`` and returns a NumPy array of function values.
     )",
-    py::arg("func")
+    py::arg("func"),
+    py::arg("vectorized") = false
   );
   scalar_spatial_function.def(
     "__call__",
@@ -387,9 +447,20 @@ WrapFunctors(py::module& math)
   );
   scalar_spatial_material_function.def(
     py::init(
-      [](const std::function<double(int, const Vector3&)>& func)
+      [](const py::function& func, bool vectorized)
       {
-        return std::make_shared<PySSMFunction>(func);
+        if (vectorized)
+        {
+          auto batch_func = func.cast<std::function<PyBatchArray(py::array_t<int>, py::array_t<double>)>>();
+          return std::make_shared<PySSMFunction>(PySSMFunction::BatchFunction(
+            [batch_func](const std::vector<int>& mat_ids, const std::vector<Vector3>& xyz)
+            {
+              auto result = batch_func(py::array_t<int>(mat_ids.size(), mat_ids.data()),
+                                       PointsToNumPy(xyz));
+              return NumPyToValues(result, xyz.size());
+            }));
+        }
+        return std::make_shared<PySSMFunction>(func.cast<std::function<double(int, const Vector3&)>>());
       }
     ),
     R"(
@@ -399,8 +470,13 @@ WrapFunctors(py::module& math)
     ----------
     func: Callable[[int, pyopensn.math.Vector3], float]
         Referenced scalar spatial material function.
+    vectorized: bool, default=False
+        If True, ``func`` evaluates many points in a single call. It receives a NumPy array of
+        material IDs and a NumPy array of points of shape ``(num_points, 3)`` and returns a NumPy
+        array of function values.
     )",
-    py::arg("func")
+    py::arg("func"),
+    py::arg("vectorized") = false
   );
   scalar_spatial_material_function.def(
     "__call__",
@@ -445,13 +521,29 @@ WrapFunctors(py::module& math)
     [2.0, 2.0]
     >>> g(Vector3(1.0, 2.0, 3.0), 3)
     [6.0, 6.0, 6.0]
+    >>>
+    >>> # Create a vectorized function evaluating many points per call
+    >>> h = VectorSpatialFunction(lambda p, n : np.repeat(p.sum(axis=1)[:, None], n, axis=1),
+    ...                           vectorized=True)
+    >>> h(Vector3(1.0, 2.0, 3.0), 2)
+    [6.0, 6.0]
     )"
   );
   vector_spatial_function.def(
     py::init(
-      [](const std::function<std::vector<double>(const Vector3&, int)>& func)
+      [](const py::function& func, bool vectorized)
       {
-        return std::make_shared<PyVSFunction>(func);
+        if (vectorized)
+        {
+          auto batch_func = func.cast<std::function<PyBatchArray(py::array_t<double>, int)>>();
+          return std::make_shared<PyVSFunction>(PyVSFunction::BatchFunction(
+            [batch_func](const std::vector<Vector3>& xyz, int num_components)
+            {
+              return NumPyToValues(batch_func(PointsToNumPy(xyz), num_components),
+                                   xyz.size() * num_components);
+            }));
+        }
+        return std::make_shared<PyVSFunction>(func.cast<std::function<std::vector<double>(const Vector3&, int)>>());
       }
     ),
     R"(
@@ -461,8 +553,13 @@ WrapFunctors(py::module& math)
     ----------
     func: Callable[[pyopensn.math.Vector3, int], List[float]]
         Referenced vector spatial function.
+    vectorized: bool, default=False
+        If True, ``func`` evaluates many points in a single call. It receives a NumPy array of
+        points of shape ``(num_points, 3)`` and the number of groups and returns a NumPy array of
+        shape ``(num_points, num_groups)``.
     )",
-    py::arg("func")
+    py::arg("func"),
+    py::arg("vectorized") = false
   );
   vector_spatial_function.def(
     "__call__",
@@ -15,6 +15,7 @@
 #include "framework/mesh/mesh_generator/from_file_mesh_generator.h"
 #include "framework/mesh/mesh_generator/split_file_mesh_generator.h"
 #include "framework/mesh/mesh_generator/distributed_mesh_generator.h"
+#include "framework/mesh/mesh_generator/parallel_file_mesh_generator.h"
 #include "framework/mesh/surface_mesh/surface_mesh.h"
 #include "framework/utils/timer.h"
 #include <pybind11/functional.h>
@@ -132,28 +133,53 @@ WrapMesh(py::module& mesh)
   );
   mesh_continuum.def(
     "SetBlockIDFromFunction",
-    [](MeshContinuum& self, const std::function<int(Vector3, int)>& func)
+    [](MeshContinuum& self, const py::function& func, bool vectorized)
     {
-      int local_num_cells_modified = 0;
-      // change local cells
+      // gather local and ghost cells
+      std::vector<Cell*> cells;
+      cells.reserve(self.local_cells.size());
       for (Cell& cell : self.local_cells)
+        cells.push_back(&cell);
+      std::vector<std::uint64_t> ghost_ids = self.cells.GetGhostGlobalIDs();
+      for (std::uint64_t ghost_id : ghost_ids)
+        cells.push_back(&self.cells[ghost_id]);
+      // compute new block IDs
+      std::vector<int> new_block_ids;
+      if (vectorized)
       {
-        int new_block_id = func(cell.centroid, cell.block_id);
-        if (cell.block_id != new_block_id)
+        py::array_t<double> centroids({cells.size(), static_cast<std::size_t>(3)});
+        py::array_t<int> old_block_ids(cells.size());
+        auto centroids_view = centroids.mutable_unchecked<2>();
+        auto old_block_ids_view = old_block_ids.mutable_unchecked<1>();
+        for (std::size_t i = 0; i < cells.size(); ++i)
         {
-          cell.block_id = new_block_id;
-          ++local_num_cells_modified;
+          centroids_view(i, 0) = cells[i]->centroid.x;
+          centroids_view(i, 1) = cells[i]->centroid.y;
+          centroids_view(i, 2) = cells[i]->centroid.z;
+          old_block_ids_view(i) = cells[i]->block_id;
         }
+        auto result = func(centroids, old_block_ids)
+                        .cast<py::array_t<int, py::array::c_style | py::array::forcecast>>();
+        if (static_cast<std::size_t>(result.size()) != cells.size())
+          throw std::runtime_error("Vectorized block ID function returned " +
+                                   std::to_string(result.size()) + " block IDs, expected " +
+                                   std::to_string(cells.size()) + ".");
+        new_block_ids.assign(result.data(), result.data() + cells.size());
       }
-      // change ghost cells
-      std::vector<std::uint64_t> ghost_ids = self.cells.GetGhostGlobalIDs();
-      for (std::uint64_t ghost_id : ghost_ids)
+      else
       {
-        Cell& cell = self.cells[ghost_id];
-        int new_block_id = func(cell.centroid, cell.block_id);
-        if (cell.block_id != new_block_id)
+        auto scalar_func = func.cast<std::function<int(Vector3, int)>>();
+        new_block_ids.reserve(cells.size());
+        for (const Cell* cell : cells)
+          new_block_ids.push_back(scalar_func(cell->centroid, cell->block_id));
+      }
+      // change local and ghost cells
+      int local_num_cells_modified = 0;
+      for (std::size_t i = 0; i < cells.size(); ++i)
+      {
+        if (cells[i]->block_id != new_block_ids[i])
         {
-          cell.block_id = new_block_id;
+          cells[i]->block_id = new_block_ids[i];
           ++local_num_cells_modified;
         }
       }
@@ -171,6 +197,10 @@ WrapMesh(py::module& mesh)
     ----------
     func: Callable[[pyopensn.math.Vector3, int], int]
         Function/lambda computing new block ID from cell centroid and old block ID.
+    vectorized: bool, default=False
+        If True, ``func`` is called once for all local and ghost cells. It receives a NumPy array
+        of cell centroids of shape ``(num_cells, 3)`` and a NumPy array of old block IDs and returns
+        a NumPy array of new block IDs.
 
     Examples
     --------
@@ -180,8 +210,15 @@ WrapMesh(py::module& mesh)
     ...         return 1
     ...     return old_id
     >>> mesh.SetBlockIDFromFunction(block_id_setter)
+    >>>
+    >>> # Same, evaluating all cells in a single call.
+    >>> def block_id_setter_vectorized(centroids, old_ids):
+    ...     inside = (old_ids == 0) & (np.linalg.norm(centroids, axis=1) < 1.0)
+    ...     return np.where(inside, 1, old_ids)
+    >>> mesh.SetBlockIDFromFunction(block_id_setter_vectorized, vectorized=True)
     )",
-    py::arg("func")
+    py::arg("func"),
+    py::arg("vectorized") = false
   );
 #ifdef __comment__  // to be removed once its uselessness is confirmed
   mesh_continuum.def(
@@ -496,6 +533,8 @@ WrapMeshGenerator(py::module& mesh)
         .e files.
     boundary_id_fieldname: str, default=''
         The name of the field storing boundary-ids.
+    num_threads: int, default=1
+        Number of threads used to build the connectivity of the cells.
     coord_sys: {'cartesian', 'cylindrical', 'spherical'}
         The coordinate system of the mesh.
     )"
@@ -594,6 +633,44 @@ WrapMeshGenerator(py::module& mesh)
         The coordinate system of the mesh.
     )"
   );
+
+  // parallel file mesh generator
+  auto parallel_file_mesh_generator = py::class_<ParallelFileMeshGenerator,
+                                                 std::shared_ptr<ParallelFileMeshGenerator>,
+                                                 MeshGenerator>(
+    mesh,
+    "ParallelFileMeshGenerator",
+    R"(
+    Parallel file mesh generator.
+
+    Each MPI rank reads a part of the cells and vertices of the file. The faces are connected, the
+    cells partitioned and the partitions exchanged between the ranks in parallel, so that no rank
+    holds the whole mesh. Only Gmsh files (format v4.1, ASCII) are supported.
+
+    Wrapper of :cpp:class:`opensn::ParallelFileMeshGenerator`.
+    )"
+  );
+  parallel_file_mesh_generator.def(
+    py::init(
+      [](py::kwargs & params)
+      {
+        return ParallelFileMeshGenerator::Create(kwargs_to_param_block(params));
+      }
+    ),
+    R"(
+    Construct a parallel file mesh generator.
+
+    Parameters
+    ----------
+    partitioner: pyopensn.mesh.GraphPartitioner, default=None
+        Handle to a GraphPartitioner object to use for parallel partitioning. This will default to
+        PETScGraphPartitioner with a "parmetis" setting.
+    filename: str
+        Path to the file.
+    coord_sys: {'cartesian', 'cylindrical', 'spherical'}
+        The coordinate system of the mesh.
+    )"
+  );
   // clang-format on
 }
 
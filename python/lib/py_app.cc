@@ -30,6 +30,8 @@ PyApp::PyApp(const mpi::Communicator& comm) : allow_petsc_error_handler_(false)
 
   console.BindBarrier(comm);
 
+  console.BindModule(WrapTelemetry);
+
   console.BindModule(WrapYlm);
   console.BindModule(WrapVector3);
   console.BindModule(WrapFunctors);
@@ -63,7 +65,9 @@ PyApp::PyApp(const mpi::Communicator& comm) : allow_petsc_error_handler_(false)
   console.BindModule(WrapSteadyState);
   console.BindModule(WrapNLKEigen);
   console.BindModule(WrapPIteration);
+  console.BindModule(WrapTransient);
   console.BindModule(WrapPRK);
+  console.BindModule(WrapPRKEnsemble);
 
   console.BindModule(WrapDiffusion);
 
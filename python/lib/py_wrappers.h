@@ -6,6 +6,7 @@
 #include "framework/parameters/parameter_block.h"
 #include "framework/math/vector.h"
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <vector>
 
 namespace py = pybind11;
@@ -31,6 +32,31 @@ convert_vector(const Vector<T>& vec)
   return py::memoryview::from_buffer(const_cast<T*>(vec.data()), {vec.size()}, {sizeof(T)}, true);
 }
 
+/**
+ * Convert a C++ vector to a 1D NumPy array sharing the memory of the vector (no copy is made).
+ * The array keeps `owner`, the Python object owning the vector, alive. The array is only valid as
+ * long as the vector is not resized.
+ */
+template <typename T>
+py::array_t<T>
+convert_vector_to_ndarray(const std::vector<T>& vec, py::handle owner, bool writeable = false)
+{
+  py::array_t<T> array({vec.size()}, {sizeof(T)}, vec.data(), owner);
+  if (not writeable)
+    array.attr("flags").attr("writeable") = false;
+  return array;
+}
+
+/// Move a C++ vector into a 1D NumPy array owning the data of the vector.
+template <typename T>
+py::array_t<T>
+convert_vector_to_ndarray(std::vector<T>&& vec)
+{
+  auto* data = new std::vector<T>(std::move(vec));
+  py::capsule owner(data, [](void* ptr) { delete static_cast<std::vector<T>*>(ptr); });
+  return py::array_t<T>({data->size()}, {sizeof(T)}, data->data(), owner);
+}
+
 /// Translate a Python dictionary into a ParameterBlock.
 ParameterBlock kwargs_to_param_block(const py::kwargs& params);
 
@@ -38,6 +64,7 @@ ParameterBlock kwargs_to_param_block(const py::kwargs& params);
 
 /// Wrap the context components of OpenSn.
 void py_context(py::module& pyopensn);
+void WrapTelemetry(py::module& context);
 
 /// Wrap the angular quadrature components of OpenSn.
 void py_aquad(py::module& pyopensn);
@@ -93,7 +120,9 @@ void WrapLBS(py::module& slv);
 void WrapSteadyState(py::module& slv);
 void WrapNLKEigen(py::module& slv);
 void WrapPIteration(py::module& slv);
+void WrapTransient(py::module& slv);
 void WrapPRK(py::module& slv);
+void WrapPRKEnsemble(py::module& slv);
 
 // Wrap the diffusion components of OpenSn
 void py_diffusion(py::module& pyopensn);
@@ -4,6 +4,8 @@
 #include "python/lib/py_wrappers.h"
 #include "modules/linear_boltzmann_solvers/response_evaluator/response_evaluator.h"
 #include <memory>
+#include <string>
+#include <vector>
 
 namespace opensn
 {
@@ -61,6 +63,45 @@ WrapResEval(py::module& response)
     )",
     py::arg("buffer_name")
   );
+  res_eval.def(
+    "EvaluateResponses",
+    [](ResponseEvaluator& self, const py::list& buffer_names, const py::list& sources)
+    {
+      std::vector<std::string> names;
+      names.reserve(buffer_names.size());
+      for (py::handle name : buffer_names)
+        names.push_back(name.cast<std::string>());
+      std::vector<ParameterBlock> source_options;
+      source_options.reserve(sources.size());
+      for (py::handle source : sources)
+        source_options.push_back(kwargs_to_param_block(source.cast<py::kwargs>()));
+      return convert_vector_to_ndarray(self.EvaluateResponses(names, source_options))
+        .reshape({sources.size(), names.size()});
+    },
+    R"(
+    Evaluate the responses of several forward source configurations against several adjoint
+    buffers.
+
+    The whole response matrix is computed in one pass over the mesh, with a single reduction
+    across processes. The source configurations are independent of the sources defined with
+    ``SetOptions`` or ``SetSourceOptions``.
+
+    Parameters
+    ----------
+    buffer_names: List[str]
+        The names of the adjoint buffers.
+    sources: List[Dict]
+        The source configurations, each a dictionary with the keys ``material``, ``point``,
+        ``volumetric`` and ``boundary``, as the ``sources`` of ``SetOptions``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The responses, of shape (len(sources), len(buffer_names)).
+    )",
+    py::arg("buffer_names"),
+    py::arg("sources")
+  );
   res_eval.def(
     "SetOptions",
     [](ResponseEvaluator& self, py::kwargs& params)
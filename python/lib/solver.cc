@@ -12,9 +12,13 @@
 #include "modules/linear_boltzmann_solvers/solvers/pi_keigen_solver.h"
 #include "modules/linear_boltzmann_solvers/solvers/pi_keigen_scdsa_solver.h"
 #include "modules/linear_boltzmann_solvers/solvers/pi_keigen_smm_solver.h"
+#include "modules/linear_boltzmann_solvers/solvers/lbs_transient.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/io/lbs_problem_io.h"
 #include "modules/linear_boltzmann_solvers/lbs_problem/lbs_problem.h"
+#include "framework/math/spatial_discretization/spatial_discretization.h"
+#include "framework/mesh/mesh_continuum/mesh_continuum.h"
 #include "modules/point_reactor_kinetics/point_reactor_kinetics.h"
+#include "modules/point_reactor_kinetics/prk_ensemble.h"
 #include <pybind11/numpy.h>
 #include <algorithm>
 #include <cstddef>
@@ -186,6 +190,178 @@ WrapLBS(py::module& slv)
     Returns the power generation field function, if enabled.
     )"
   );
+  lbs_problem.def(
+    "GetPhiOldLocal",
+    [](LBSProblem& self)
+    {
+      return convert_vector_to_ndarray(self.GetPhiOldLocal(), py::cast(&self), true);
+    },
+    R"(
+    Get the local flux moments of the previous iterate.
+
+    Returns
+    -------
+    numpy.ndarray
+        A writeable view (not a copy) of the local flux moments vector. The layout of the vector is
+        described by :meth:`GetFluxMomentsLayout`. The view remains valid as long as the problem is
+        not re-initialized.
+    )"
+  );
+  lbs_problem.def(
+    "GetPhiNewLocal",
+    [](LBSProblem& self)
+    {
+      return convert_vector_to_ndarray(self.GetPhiNewLocal(), py::cast(&self), true);
+    },
+    R"(
+    Get the local flux moments of the current iterate.
+
+    Returns
+    -------
+    numpy.ndarray
+        A writeable view (not a copy) of the local flux moments vector. The layout of the vector is
+        described by :meth:`GetFluxMomentsLayout`. The view remains valid as long as the problem is
+        not re-initialized.
+    )"
+  );
+  lbs_problem.def(
+    "GetPrecursorsNewLocal",
+    [](LBSProblem& self)
+    {
+      return convert_vector_to_ndarray(self.GetPrecursorsNewLocal(), py::cast(&self), true);
+    },
+    R"(
+    Get the local delayed neutron precursor concentrations.
+
+    Returns
+    -------
+    numpy.ndarray
+        A writeable view (not a copy) of the local precursors vector. The vector is empty unless the
+        ``use_precursors`` option is set. The view remains valid as long as the problem is not
+        re-initialized.
+    )"
+  );
+  lbs_problem.def(
+    "GetPsiNewLocal",
+    [](LBSProblem& self)
+    {
+      py::list psi_list;
+      py::object owner = py::cast(&self);
+      for (const std::vector<double>& psi : self.GetPsiNewLocal())
+        psi_list.append(convert_vector_to_ndarray(psi, owner, true));
+      return psi_list;
+    },
+    R"(
+    Get the local angular fluxes of each groupset.
+
+    Returns
+    -------
+    List[numpy.ndarray]
+        Writeable views (not copies) of the local angular flux vectors, one per groupset. A vector
+        is empty unless the ``save_angular_flux`` option is set. The layout of the vectors is
+        described by :meth:`GetAngularFluxLayout`.
+    )"
+  );
+  lbs_problem.def(
+    "GetFluxMomentsLayout",
+    [](LBSProblem& self)
+    {
+      const auto& grid = self.GetGrid();
+      const auto& cell_transport_views = self.GetCellTransportViews();
+      const auto num_moments = static_cast<int>(self.GetNumMoments());
+      const auto num_groups = static_cast<int>(self.GetNumGroups());
+      const auto num_dofs = self.GetPhiNewLocal().size();
+
+      std::vector<std::int64_t> cell_ids(num_dofs), nodes(num_dofs), moments(num_dofs),
+        groups(num_dofs);
+      for (const auto& cell : grid->local_cells)
+      {
+        const auto& transport_view = cell_transport_views[cell.local_id];
+        for (int i = 0; i < transport_view.GetNumNodes(); ++i)
+          for (int m = 0; m < num_moments; ++m)
+            for (int g = 0; g < num_groups; ++g)
+            {
+              const auto dof = transport_view.MapDOF(i, m, g);
+              cell_ids[dof] = static_cast<std::int64_t>(cell.global_id);
+              nodes[dof] = i;
+              moments[dof] = m;
+              groups[dof] = g;
+            }
+      }
+
+      py::dict layout;
+      layout["cell"] = convert_vector_to_ndarray(std::move(cell_ids));
+      layout["node"] = convert_vector_to_ndarray(std::move(nodes));
+      layout["moment"] = convert_vector_to_ndarray(std::move(moments));
+      layout["group"] = convert_vector_to_ndarray(std::move(groups));
+      return layout;
+    },
+    R"(
+    Describe the layout of the local flux moments vectors.
+
+    Returns
+    -------
+    Dict[str, numpy.ndarray]
+        Integer arrays ``cell`` (cell global id), ``node`` (cell node index), ``moment`` and
+        ``group``, each giving, for every entry of the flux moments vectors returned by
+        :meth:`GetPhiNewLocal` and :meth:`GetPhiOldLocal`, the index the entry corresponds to.
+    )"
+  );
+  lbs_problem.def(
+    "GetAngularFluxLayout",
+    [](LBSProblem& self, std::size_t groupset_id)
+    {
+      const auto& groupsets = self.GetGroupsets();
+      if (groupset_id >= groupsets.size())
+        throw std::invalid_argument("Invalid groupset_id " + std::to_string(groupset_id) + ".");
+
+      const auto& grid = self.GetGrid();
+      const auto& discretization = self.GetSpatialDiscretization();
+      const auto& groupset = groupsets[groupset_id];
+      const auto& uk_man = groupset.psi_uk_man_;
+      const auto num_gs_dirs = groupset.quadrature->omegas.size();
+      const auto num_gs_groups = groupset.groups.size();
+      const auto num_dofs = discretization.GetNumLocalDOFs(uk_man);
+
+      std::vector<std::int64_t> cell_ids(num_dofs), nodes(num_dofs), directions(num_dofs),
+        groups(num_dofs);
+      for (const auto& cell : grid->local_cells)
+        for (std::size_t i = 0; i < discretization.GetCellNumNodes(cell); ++i)
+          for (std::size_t n = 0; n < num_gs_dirs; ++n)
+            for (std::size_t g = 0; g < num_gs_groups; ++g)
+            {
+              const auto dof = discretization.MapDOFLocal(cell, i, uk_man, n, g);
+              cell_ids[dof] = static_cast<std::int64_t>(cell.global_id);
+              nodes[dof] = static_cast<std::int64_t>(i);
+              directions[dof] = static_cast<std::int64_t>(n);
+              groups[dof] = groupset.groups[g].id;
+            }
+
+      py::dict layout;
+      layout["cell"] = convert_vector_to_ndarray(std::move(cell_ids));
+      layout["node"] = convert_vector_to_ndarray(std::move(nodes));
+      layout["direction"] = convert_vector_to_ndarray(std::move(directions));
+      layout["group"] = convert_vector_to_ndarray(std::move(groups));
+      return layout;
+    },
+    R"(
+    Describe the layout of the local angular flux vector of a groupset.
+
+    Parameters
+    ----------
+    groupset_id : int
+        The groupset index.
+
+    Returns
+    -------
+    Dict[str, numpy.ndarray]
+        Integer arrays ``cell`` (cell global id), ``node`` (cell node index), ``direction``
+        (groupset quadrature direction) and ``group`` (global group index), each giving, for every
+        entry of the groupset angular flux vector returned by :meth:`GetPsiNewLocal`, the index
+        the entry corresponds to.
+    )",
+    py::arg("groupset_id")
+  );
   lbs_problem.def(
     "SetOptions",
     [](LBSProblem& self, py::kwargs& params)
@@ -205,6 +381,22 @@ WrapLBS(py::module& slv)
         The level of harmonic expansion for the scattering source.
     max_mpi_message_size: int default=32768
         The maximum MPI message size used during sweeps.
+    streaming_operator_cache_size: int, default=0
+        Maximum memory, in MB per MPI rank, used to cache the direction-dependent streaming
+        operators and face cosines of cells for sweeps. Cells that do not fit are evaluated on the
+        fly. A value of 0 disables the cache.
+    sweep_cache_directory: str, default=''
+        Directory in which the AAH sweep-plane data structures, feedback arc sets and task
+        dependency graphs are cached, and from which they are reloaded by later runs with the same
+        mesh partition and directions. An empty string disables the cache.
+    cbc_task_scheduling: {'ready_queue', 'scan'}, default='ready_queue'
+        How the cells of CBC sweeps are scheduled. With ``ready_queue``, cells are queued when their
+        upwind data is available. With ``scan``, the whole task list is repeatedly scanned for cells
+        that can be executed.
+    share_unit_cell_matrices: bool, default=False
+        Shares the unit cell matrices between cells of the same shape, up to translation and
+        uniform scaling. The matrices of cells of another size are scaled from those of the first
+        cell of the shape. Ignored with curvilinear geometries.
     restart_writes_enabled: bool, default=False
         Flag that controls writing of restart dumps.
     write_delayed_psi_to_restart: bool, default=True
@@ -215,8 +407,14 @@ WrapLBS(py::module& slv)
         Full path for writing restart dumps including file basename.
     write_restart_time_interval: int, default=0
         Time interval in seconds at which restart data is to be written.
+    restart_writes_async: bool, default=False
+        Flag that controls whether restart data is written on a background I/O thread while the
+        solver continues to iterate.
+    max_async_restart_writes: int, default=1
+        Maximum number of asynchronous restart dumps that can be in flight. The solver blocks when a
+        new dump is requested and this limit is reached.
     use_precursors: bool, default=False
-        Flag for using delayed neutron precursors.
+        Flag for using delayed neutron precursors. The precursors are included in restart dumps.
     use_source_moments: bool, default=False
         Flag for ignoring fixed sources and selectively using source moments obtained elsewhere.
     save_angular_flux: bool, default=False
@@ -308,9 +506,9 @@ WrapLBS(py::module& slv)
   );
   lbs_problem.def(
     "WriteFluxMoments",
-    [](LBSProblem& self, const std::string& file_base)
+    [](LBSProblem& self, const std::string& file_base, bool single_file, unsigned int compression_level)
     {
-      LBSSolverIO::WriteFluxMoments(self, file_base);
+      LBSSolverIO::WriteFluxMoments(self, file_base, single_file, compression_level);
     },
     R"(
     Write flux moments to file.
@@ -319,15 +517,23 @@ WrapLBS(py::module& slv)
     ----------
     file_base: str
         File basename.
+    single_file: bool, default=False
+        If True, all ranks write to the single file ``<file_base>.h5`` using parallel HDF5.
+        Otherwise, each rank writes its own file ``<file_base><rank>.h5``. Single files can be
+        read back with a different number of ranks.
+    compression_level: int, default=0
+        Deflate compression level (0-9) used for single files. 0 disables compression.
     )",
-    py::arg("file_base")
+    py::arg("file_base"),
+    py::arg("single_file") = false,
+    py::arg("compression_level") = 0
   );
   lbs_problem.def(
     "CreateAndWriteSourceMoments",
-    [](LBSProblem& self, const std::string& file_base)
+    [](LBSProblem& self, const std::string& file_base, bool single_file)
     {
       std::vector<double> source_moments = self.MakeSourceMomentsFromPhi();
-      LBSSolverIO::WriteFluxMoments(self, file_base, source_moments);
+      LBSSolverIO::WriteFluxMoments(self, file_base, single_file, 0, source_moments);
     },
     R"(
     Write source moments from latest flux iterate to file.
@@ -336,8 +542,11 @@ WrapLBS(py::module& slv)
     ----------
     file_base: str
         File basename.
+    single_file: bool, default=False
+        If True, all ranks write to the single file ``<file_base>.h5`` using parallel HDF5.
     )",
-    py::arg("file_base")
+    py::arg("file_base"),
+    py::arg("single_file") = false
   );
   lbs_problem.def(
     "ReadFluxMomentsAndMakeSourceMoments",
@@ -358,7 +567,9 @@ WrapLBS(py::module& slv)
     file_base: str
         File basename.
     single_file_flag: bool
-        True if all flux moments are in a single file.
+        True if all flux moments are in the single file ``<file_base>.h5``. Files written with
+        ``single_file=True`` can be read with any number of ranks. Other single files must hold
+        the per-rank layout and are read by every rank.
     )",
     py::arg("file_base"),
     py::arg("single_file_flag")
@@ -377,7 +588,9 @@ WrapLBS(py::module& slv)
     file_base: str
         File basename.
     single_file_flag: bool
-        True if all source moments are in a single file.
+        True if all source moments are in the single file ``<file_base>.h5``. Files written with
+        ``single_file=True`` can be read with any number of ranks. Other single files must hold
+        the per-rank layout and are read by every rank.
     )",
     py::arg("file_base"),
     py::arg("single_file_flag")
@@ -396,16 +609,18 @@ WrapLBS(py::module& slv)
     file_base: str
         File basename.
     single_file_flag: bool
-        True if all flux moments are in a single file.
+        True if all flux moments are in the single file ``<file_base>.h5``. Files written with
+        ``single_file=True`` can be read with any number of ranks. Other single files must hold
+        the per-rank layout and are read by every rank.
     )",
     py::arg("file_base"),
     py::arg("single_file_flag")
   );
   lbs_problem.def(
     "WriteAngularFluxes",
-    [](LBSProblem& self, const std::string& file_base)
+    [](LBSProblem& self, const std::string& file_base, bool single_file, unsigned int compression_level)
     {
-      LBSSolverIO::WriteAngularFluxes(self, file_base);
+      LBSSolverIO::WriteAngularFluxes(self, file_base, single_file, compression_level);
     },
     R"(
     Write angular flux data to file.
@@ -414,14 +629,22 @@ WrapLBS(py::module& slv)
     ----------
     file_base: str
         File basename.
+    single_file: bool, default=False
+        If True, all ranks write to the single file ``<file_base>.h5`` using parallel HDF5.
+        Otherwise, each rank writes its own file ``<file_base><rank>.h5``. Single files can be
+        read back with a different number of ranks.
+    compression_level: int, default=0
+        Deflate compression level (0-9) used for single files. 0 disables compression.
     )",
-    py::arg("file_base")
+    py::arg("file_base"),
+    py::arg("single_file") = false,
+    py::arg("compression_level") = 0
   );
   lbs_problem.def(
     "ReadAngularFluxes",
-    [](LBSProblem& self, const std::string& file_base)
+    [](LBSProblem& self, const std::string& file_base, bool single_file)
     {
-      LBSSolverIO::ReadAngularFluxes(self, file_base);
+      LBSSolverIO::ReadAngularFluxes(self, file_base, single_file);
     },
     R"(
     Read angular fluxes from file.
@@ -430,8 +653,11 @@ WrapLBS(py::module& slv)
     ----------
     file_base: str
         File basename.
+    single_file: bool, default=False
+        True if the angular fluxes are in a single file written with ``single_file=True``.
     )",
-    py::arg("file_base")
+    py::arg("file_base"),
+    py::arg("single_file") = false
   );
 
   // discrete ordinate solver
@@ -507,14 +733,8 @@ WrapLBS(py::module& slv)
       std::map<std::uint64_t, std::vector<double>> leakage = self.ComputeLeakage(bndry_ids);
       // convert result to native Python
       py::dict result;
-      for (const auto& [bndry_id, gr_wise_leakage] : leakage)
-      {
-        py::array_t<double> np_vector = py::array_t<double>(gr_wise_leakage.size());
-        py::buffer_info buffer = np_vector.request();
-        double* np_vector_data = static_cast<double*>(buffer.ptr);
-        std::copy(gr_wise_leakage.begin(), gr_wise_leakage.end(), np_vector_data);
-        result[allowed_bd_ids.at(bndry_id).data()] = np_vector;
-      }
+      for (auto& [bndry_id, gr_wise_leakage] : leakage)
+        result[allowed_bd_ids.at(bndry_id).data()] = convert_vector_to_ndarray(std::move(gr_wise_leakage));
       return result;
     },
     R"(
@@ -849,6 +1069,78 @@ WrapPIteration(py::module& slv)
   // clang-format on
 }
 
+// Wrap transient solver
+void
+WrapTransient(py::module& slv)
+{
+  // clang-format off
+  // transient solver
+  auto transient_solver = py::class_<TransientSolver, std::shared_ptr<TransientSolver>, Solver>(
+    slv,
+    "TransientSolver",
+    R"(
+    Time-dependent discrete ordinates solver.
+
+    Wrapper of :cpp:class:`opensn::TransientSolver`.
+    )"
+  );
+  transient_solver.def(
+    py::init(
+      [](py::kwargs& params)
+      {
+        return TransientSolver::Create(kwargs_to_param_block(params));
+      }
+    ),
+    R"(
+    Construct a transient solver.
+
+    The problem must be a discrete ordinates problem with ``save_angular_flux`` enabled and cross
+    sections with inverse velocities. Its current solution is the initial condition.
+
+    Parameters
+    ----------
+    lbs_problem : DiscreteOrdinatesProblem
+        Existing discrete ordinates problem.
+    dt : float, default=0.01
+        Initial time step size.
+    start_time : float, default=0.0
+        Start time.
+    end_time : float, default=1.0
+        End time.
+    max_time_steps : int, default=-1
+        Maximum number of time steps. A negative value disables this limit.
+    time_integration : str, default='implicit_euler'
+        One of {'implicit_euler', 'crank_nicolson', 'theta_scheme'}.
+    theta : float, default=0.5
+        Theta parameter of the 'theta_scheme' time integration, in [0.5, 1].
+    adaptive_time_step : bool, default=False
+        Adapt the time step size to a local error estimate of each time step. Steps whose error
+        exceeds the tolerance are repeated with a smaller time step.
+    error_tolerance : float, default=1.0e-3
+        Tolerance on the relative local error of adaptive time steps.
+    dt_min : float, default=1.0e-12
+        Minimum time step size.
+    dt_max : float, default=0.0
+        Maximum time step size of adaptive time steps. Zero disables this limit.
+    )"
+  );
+  transient_solver.def(
+    "GetTime",
+    &TransientSolver::GetTime,
+    R"(
+    Get the current time.
+    )"
+  );
+  transient_solver.def(
+    "GetTimeStepSize",
+    &TransientSolver::GetTimeStepSize,
+    R"(
+    Get the size of the next time step.
+    )"
+  );
+  // clang-format on
+}
+
 // Wrap PRK solver
 void
 WrapPRK(py::module& slv)
@@ -958,6 +1250,206 @@ WrapPRK(py::module& slv)
   // clang-format on
 }
 
+// Wrap PRK ensemble
+void
+WrapPRKEnsemble(py::module& slv)
+{
+  using DoubleArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+  const double default_lambdas[] = {0.0124, 0.0304, 0.111, 0.301, 1.14, 3.01};
+  const double default_betas[] = {0.00021, 0.00142, 0.00127, 0.00257, 0.00075, 0.00027};
+
+  // Copy the values of a NumPy array, or of a scalar
+  const auto ToVector = [](const DoubleArray& array)
+  { return std::vector<double>(array.data(), array.data() + array.size()); };
+
+  // clang-format off
+  // point reactor kinetics ensemble
+  auto prk_ensemble = py::class_<PRKEnsemble, std::shared_ptr<PRKEnsemble>>(
+    slv,
+    "PRKEnsemble",
+    R"(
+    Ensemble of point reactor kinetics systems that are advanced together.
+
+    The members share the precursor decay constants and time steps, but each member can have its
+    own reactivity history, delayed neutron fractions, generation time and source. All members are
+    advanced in a single call, with vectorized loops over the members.
+
+    Wrapper of :cpp:class:`opensn::PRKEnsemble`.
+    )"
+  );
+  prk_ensemble.def(
+    py::init(
+      [ToVector](std::size_t num_members,
+                 const DoubleArray& precursor_lambdas,
+                 const DoubleArray& precursor_betas,
+                 const DoubleArray& gen_time,
+                 const DoubleArray& initial_rho,
+                 const DoubleArray& initial_source,
+                 const DoubleArray& initial_population,
+                 const std::string& time_integration)
+      {
+        return std::make_shared<PRKEnsemble>(num_members,
+                                             ToVector(precursor_lambdas),
+                                             ToVector(precursor_betas),
+                                             ToVector(gen_time),
+                                             ToVector(initial_rho),
+                                             ToVector(initial_source),
+                                             ToVector(initial_population),
+                                             time_integration);
+      }
+    ),
+    R"(
+    Construct an ensemble of point reactor kinetics systems.
+
+    Each member is initialized as by :py:class:`pyopensn.solver.PRKSolver`. The parameters
+    marked as per member take a single value shared by all members, or one value per member.
+
+    Parameters
+    ----------
+    num_members: int
+        Number of members.
+    precursor_lambdas: List[float], default=[0.0124, 0.0304, 0.111, 0.301, 1.14, 3.01]
+        Decay constants for delayed neutron precursors, shared by all members.
+    precursor_betas: numpy.ndarray, default=[0.00021, 0.00142, 0.00127, 0.00257, 0.00075, 0.00027]
+        Fractional delayed neutron fractions, shared by all members or of shape
+        (num_members, num_precursors).
+    gen_time: float or numpy.ndarray, default=1.0e-5
+        Neutron generation time [s], per member.
+    initial_rho: float or numpy.ndarray, default=0.0
+        Initial reactivity in dollars, per member.
+    initial_source: float or numpy.ndarray, default=1.0
+        Source strength [particles/s], per member.
+    initial_population: float or numpy.ndarray, default=1.0
+        Initial neutron population of members that are not initialized at a steady state with a
+        source, per member.
+    time_integration: str, default='implicit_euler'
+        One of {'explicit_euler','implicit_euler','crank_nicolson'}.
+    )",
+    py::arg("num_members"),
+    py::arg("precursor_lambdas") = DoubleArray(6, default_lambdas),
+    py::arg("precursor_betas") = DoubleArray(6, default_betas),
+    py::arg("gen_time") = 1.0e-5,
+    py::arg("initial_rho") = 0.0,
+    py::arg("initial_source") = 1.0,
+    py::arg("initial_population") = 1.0,
+    py::arg("time_integration") = "implicit_euler"
+  );
+  prk_ensemble.def(
+    "Step",
+    [](PRKEnsemble& self, double dt, const DoubleArray& rho)
+    {
+      const std::size_t num_members = self.GetNumMembers();
+      if (rho.size() == 1)
+      {
+        const std::vector<double> rhos(num_members, *rho.data());
+        self.Step(dt, rhos.data());
+      }
+      else if (static_cast<std::size_t>(rho.size()) == num_members)
+        self.Step(dt, rho.data());
+      else
+        throw std::invalid_argument("PRKEnsemble.Step: rho must have 1 or " +
+                                    std::to_string(num_members) + " values.");
+    },
+    R"(
+    Advance all members by one time step.
+
+    Parameters
+    ----------
+    dt: float
+        Time step size [s].
+    rho: float or numpy.ndarray
+        Reactivity in dollars over the time step, shared by all members or per member.
+    )",
+    py::arg("dt"),
+    py::arg("rho")
+  );
+  prk_ensemble.def(
+    "Run",
+    [ToVector](PRKEnsemble& self, double dt, const DoubleArray& rho)
+    {
+      const std::size_t num_members = self.GetNumMembers();
+      if (rho.ndim() != 1 and
+          not (rho.ndim() == 2 and static_cast<std::size_t>(rho.shape(1)) == num_members))
+        throw std::invalid_argument("PRKEnsemble.Run: rho must have the shape (num_steps,) or "
+                                    "(num_steps, " + std::to_string(num_members) + ").");
+      const auto num_steps = static_cast<std::size_t>(rho.shape(0));
+      std::vector<double> populations;
+      {
+        py::gil_scoped_release release;
+        populations = self.Run(dt, num_steps, ToVector(rho));
+      }
+      return convert_vector_to_ndarray(std::move(populations))
+        .reshape({num_steps + 1, num_members});
+    },
+    R"(
+    Advance all members by a sequence of time steps.
+
+    Parameters
+    ----------
+    dt: float
+        Time step size [s].
+    rho: numpy.ndarray
+        Reactivity in dollars over each time step, of shape (num_steps,) when shared by all
+        members, or of shape (num_steps, num_members).
+
+    Returns
+    -------
+    numpy.ndarray
+        The populations of shape (num_steps + 1, num_members), at the start and after each time
+        step.
+    )",
+    py::arg("dt"),
+    py::arg("rho")
+  );
+  prk_ensemble.def(
+    "GetTime",
+    &PRKEnsemble::GetTime,
+    R"(
+    Get the current time.
+    )"
+  );
+  prk_ensemble.def(
+    "GetPopulations",
+    [](PRKEnsemble& self)
+    {
+      return convert_vector_to_ndarray(std::vector<double>(self.GetPopulations()));
+    },
+    R"(
+    Get the populations of the members.
+    )"
+  );
+  prk_ensemble.def(
+    "GetPrecursors",
+    [](PRKEnsemble& self)
+    {
+      const std::size_t num_members = self.GetNumMembers();
+      const std::size_t num_precursors = self.GetNumPrecursors();
+      const auto& precursors = self.GetPrecursors();
+      py::array_t<double> array({num_members, num_precursors});
+      auto array_view = array.mutable_unchecked<2>();
+      for (std::size_t m = 0; m < num_members; ++m)
+        for (std::size_t j = 0; j < num_precursors; ++j)
+          array_view(m, j) = precursors[j * num_members + m];
+      return array;
+    },
+    R"(
+    Get the precursor concentrations of the members, of shape (num_members, num_precursors).
+    )"
+  );
+  prk_ensemble.def(
+    "GetPeriods",
+    [](PRKEnsemble& self)
+    {
+      return convert_vector_to_ndarray(std::vector<double>(self.GetPeriods()));
+    },
+    R"(
+    Get the periods of the members computed for the last time step.
+    )"
+  );
+  // clang-format on
+}
+
 // Wrap the solver components of OpenSn
 void
 py_solver(py::module& pyopensn)
@@ -969,7 +1461,9 @@ py_solver(py::module& pyopensn)
   WrapSteadyState(slv);
   WrapNLKEigen(slv);
   WrapPIteration(slv);
+  WrapTransient(slv);
   WrapPRK(slv);
+  WrapPRKEnsemble(slv);
 }
 
 } // namespace opensn
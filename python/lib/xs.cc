@@ -7,7 +7,8 @@
 #include <string>
 #include <vector>
 
-#define XS_GETTER(method_name) [](MultiGroupXS& self) { return convert_vector(self.method_name()); }
+#define XS_GETTER(method_name)                                                                     \
+  [](MultiGroupXS& self) { return convert_vector_to_ndarray(self.method_name(), py::cast(&self)); }
 
 namespace opensn
 {
@@ -143,50 +144,42 @@ WrapMultiGroupXS(py::module& xs)
   multigroup_xs.def_property_readonly(
     "sigma_t",
     XS_GETTER(GetSigmaTotal),
-    "Get total cross section.",
-    py::keep_alive<0, 1>()
+    "Get total cross section."
   );
   multigroup_xs.def_property_readonly(
     "sigma_a",
     XS_GETTER(GetSigmaAbsorption),
-    "Get absorption cross section.",
-    py::keep_alive<0, 1>()
+    "Get absorption cross section."
   );
   multigroup_xs.def_property_readonly(
     "sigma_f",
     XS_GETTER(GetSigmaFission),
-    "Get fission cross section.",
-    py::keep_alive<0, 1>()
+    "Get fission cross section."
   );
   multigroup_xs.def_property_readonly(
     "chi",
     XS_GETTER(GetChi),
-    "Get neutron fission spectrum.",
-    py::keep_alive<0, 1>()
+    "Get neutron fission spectrum."
   );
   multigroup_xs.def_property_readonly(
     "nu_sigma_f",
     XS_GETTER(GetNuSigmaF),
-    "Get neutron production due to fission.",
-    py::keep_alive<0, 1>()
+    "Get neutron production due to fission."
   );
   multigroup_xs.def_property_readonly(
     "nu_prompt_sigma_f",
     XS_GETTER(GetNuPromptSigmaF),
-    "Get prompt neutron production due to fission.",
-    py::keep_alive<0, 1>()
+    "Get prompt neutron production due to fission."
   );
   multigroup_xs.def_property_readonly(
     "nu_delayed_sigma_f",
     XS_GETTER(GetNuDelayedSigmaF),
-    "Get delayed neutron production due to fission.",
-    py::keep_alive<0, 1>()
+    "Get delayed neutron production due to fission."
   );
   multigroup_xs.def_property_readonly(
     "inv_velocity",
     XS_GETTER(GetInverseVelocity),
-    "Get inverse velocity.",
-    py::keep_alive<0, 1>()
+    "Get inverse velocity."
   );
   // clang-format on
 }
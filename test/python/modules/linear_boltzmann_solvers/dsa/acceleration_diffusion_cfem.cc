@@ -45,8 +45,7 @@ acceleration_Diffusion_CFEM(std::shared_ptr<MeshContinuum> grid)
   MatID2XSMap matid_2_xs_map;
   matid_2_xs_map.insert(std::make_pair(0, Multigroup_D_and_sigR{{1.0}, {0.0}}));
 
-  std::vector<UnitCellMatrices> unit_cell_matrices;
-  unit_cell_matrices.resize(grid->local_cells.size());
+  UnitCellMatricesStore unit_cell_matrices;
 
   // Build unit integrals
   for (const auto& cell : grid->local_cells)
@@ -115,14 +114,16 @@ acceleration_Diffusion_CFEM(std::shared_ptr<MeshContinuum> grid)
       }   // for i
     }     // for f
 
-    unit_cell_matrices[cell.local_id] = UnitCellMatrices{IntV_gradshapeI_gradshapeJ,
-                                                         {},
-                                                         IntV_shapeI_shapeJ,
-                                                         IntV_shapeI,
+    const auto matrices_id =
+      unit_cell_matrices.AddMatrices(UnitCellMatrices{IntV_gradshapeI_gradshapeJ,
+                                                      {},
+                                                      IntV_shapeI_shapeJ,
+                                                      IntV_shapeI,
 
-                                                         IntS_shapeI_shapeJ,
-                                                         IntS_shapeI_gradshapeJ,
-                                                         IntS_shapeI};
+                                                      IntS_shapeI_shapeJ,
+                                                      IntS_shapeI_gradshapeJ,
+                                                      IntS_shapeI});
+    unit_cell_matrices.SetLocalCellMatrices(cell.local_id, matrices_id);
   } // for cell
 
   // Make solver
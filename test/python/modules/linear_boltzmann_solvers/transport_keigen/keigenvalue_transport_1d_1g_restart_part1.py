@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+1D 1G keigenvalue test using power iteration with delayed neutron precursors and asynchronous
+restart writes. The restart files and the precursors of each rank are read by
+keigenvalue_transport_1d_1g_restart_part2.py.
+Test: Final k-eigenvalue: 0.99954
+"""
+
+import os
+import sys
+import numpy as np
+
+if "opensn_console" not in globals():
+    from mpi4py import MPI
+    size = MPI.COMM_WORLD.size
+    rank = MPI.COMM_WORLD.rank
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../")))
+    from pyopensn.mesh import OrthogonalMeshGenerator
+    from pyopensn.xs import MultiGroupXS
+    from pyopensn.aquad import GLProductQuadrature1DSlab
+    from pyopensn.solver import DiscreteOrdinatesProblem, PowerIterationKEigenSolver
+
+if __name__ == "__main__":
+
+    num_procs = 4
+    if size != num_procs:
+        sys.exit(f"Incorrect number of processors. Expected {num_procs} but got {size}.")
+
+    # Mesh
+    L = 100.0
+    n_cells = 50
+    dx = L / n_cells
+    nodes = [i * dx for i in range(n_cells + 1)]
+    meshgen = OrthogonalMeshGenerator(node_sets=[nodes])
+    grid = meshgen.Execute()
+    grid.SetUniformBlockID(0)
+
+    # 1-group fissile material with one precursor family
+    num_groups = 1
+    xs_simple_fissile = MultiGroupXS()
+    xs_simple_fissile.LoadFromOpenSn("simple_fissile.xs")
+
+    phys = DiscreteOrdinatesProblem(
+        mesh=grid,
+        num_groups=num_groups,
+        groupsets=[
+            {
+                "groups_from_to": (0, num_groups - 1),
+                "angular_quadrature": GLProductQuadrature1DSlab(32),
+                "inner_linear_method": "petsc_gmres",
+                "l_max_its": 500,
+                "l_abs_tol": 1.0e-10,
+            }
+        ],
+        xs_map=[
+            {"block_ids": [0], "xs": xs_simple_fissile},
+        ],
+        options={
+            "scattering_order": 0,
+            "use_precursors": True,
+            "verbose_inner_iterations": False,
+            "verbose_outer_iterations": True,
+            "restart_writes_enabled": True,
+            "restart_writes_async": True,
+            "write_restart_time_interval": 1,
+            "write_restart_path": "keigenvalue_transport_1d_1g_restart/restart",
+        }
+    )
+    k_solver = PowerIterationKEigenSolver(lbs_problem=phys)
+    k_solver.Initialize()
+    k_solver.Execute()
+
+    # The precursors of the final restart dump, compared with the restarted ones by part 2
+    np.save(f"keigenvalue_transport_1d_1g_restart/precursors{rank}.npy",
+            phys.GetPrecursorsNewLocal())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+1D 1G keigenvalue test using power iteration with delayed neutron precursors, restarted from the
+converged solution written by keigenvalue_transport_1d_1g_restart_part1.py. The precursors read
+from the restart files must match the ones written, and power iteration converges in the first
+iteration.
+Test: Precursor-Max-Diff=0.0, Final k-eigenvalue: 0.99954
+"""
+
+import os
+import sys
+import numpy as np
+
+if "opensn_console" not in globals():
+    from mpi4py import MPI
+    size = MPI.COMM_WORLD.size
+    rank = MPI.COMM_WORLD.rank
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../")))
+    from pyopensn.mesh import OrthogonalMeshGenerator
+    from pyopensn.xs import MultiGroupXS
+    from pyopensn.aquad import GLProductQuadrature1DSlab
+    from pyopensn.solver import DiscreteOrdinatesProblem, PowerIterationKEigenSolver
+    from pyopensn.logvol import RPPLogicalVolume
+    from pyopensn.fieldfunc import FieldFunctionInterpolationVolume
+
+if __name__ == "__main__":
+
+    num_procs = 4
+    if size != num_procs:
+        sys.exit(f"Incorrect number of processors. Expected {num_procs} but got {size}.")
+
+    # Mesh
+    L = 100.0
+    n_cells = 50
+    dx = L / n_cells
+    nodes = [i * dx for i in range(n_cells + 1)]
+    meshgen = OrthogonalMeshGenerator(node_sets=[nodes])
+    grid = meshgen.Execute()
+    grid.SetUniformBlockID(0)
+
+    # 1-group fissile material with one precursor family
+    num_groups = 1
+    xs_simple_fissile = MultiGroupXS()
+    xs_simple_fissile.LoadFromOpenSn("simple_fissile.xs")
+
+    phys = DiscreteOrdinatesProblem(
+        mesh=grid,
+        num_groups=num_groups,
+        groupsets=[
+            {
+                "groups_from_to": (0, num_groups - 1),
+                "angular_quadrature": GLProductQuadrature1DSlab(32),
+                "inner_linear_method": "petsc_gmres",
+                "l_max_its": 500,
+                "l_abs_tol": 1.0e-10,
+            }
+        ],
+        xs_map=[
+            {"block_ids": [0], "xs": xs_simple_fissile},
+        ],
+        options={
+            "scattering_order": 0,
+            "use_precursors": True,
+            "verbose_inner_iterations": False,
+            "verbose_outer_iterations": True,
+            "read_restart_path": "keigenvalue_transport_1d_1g_restart/restart",
+        }
+    )
+    k_solver = PowerIterationKEigenSolver(lbs_problem=phys)
+    k_solver.Initialize()
+
+    # Compare the restarted precursors with the ones written by part 1. With one precursor family
+    # there is one precursor per cell, which is spread over the nodes of the cell in the scalar flux
+    # field function to compute the maximum difference over all ranks.
+    precursors = np.load(f"keigenvalue_transport_1d_1g_restart/precursors{rank}.npy")
+    precursor_diff = np.abs(phys.GetPrecursorsNewLocal() - precursors)
+    ff = phys.GetScalarFieldFunctionList()[0]
+    ff_values = ff.GetLocalFieldVector()
+    ff_values[:] = np.repeat(precursor_diff, len(ff_values) // len(precursor_diff))
+
+    ffi = FieldFunctionInterpolationVolume()
+    ffi.SetOperationType("max")
+    ffi.SetLogicalVolume(RPPLogicalVolume(infx=True, infy=True, infz=True))
+    ffi.AddFieldFunction(ff)
+    ffi.Initialize()
+    ffi.Execute()
+    precursor_max_diff = ffi.GetValue()
+    if rank == 0:
+        print(f"Precursor-Max-Diff={precursor_max_diff:.5e}")
+
+    k_solver.Execute()
+
+    if rank == 0:
+        os.system("rm -r keigenvalue_transport_1d_1g_restart")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Standard Reed 1D 1-group problem with Anderson accelerated Richardson, which must converge in
+# fewer iterations than classic Richardson
+
+import os
+import sys
+
+if "opensn_console" not in globals():
+    from mpi4py import MPI
+    size = MPI.COMM_WORLD.size
+    rank = MPI.COMM_WORLD.rank
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../")))
+    from pyopensn.mesh import OrthogonalMeshGenerator
+    from pyopensn.xs import MultiGroupXS
+    from pyopensn.source import VolumetricSource
+    from pyopensn.aquad import GLProductQuadrature1DSlab
+    from pyopensn.logvol import RPPLogicalVolume
+    from pyopensn.solver import DiscreteOrdinatesProblem, SteadyStateSolver
+    from pyopensn.context import EnableTelemetry, DisableTelemetry, GetTelemetry, ClearTelemetry
+
+if __name__ == "__main__":
+
+    # Create Mesh
+    widths = [2., 1., 2., 1., 2.]
+    nrefs = [200, 200, 200, 200, 200]
+    Nmat = len(widths)
+    nodes = [0.]
+    for imat in range(Nmat):
+        dx = widths[imat] / nrefs[imat]
+        for i in range(nrefs[imat]):
+            nodes.append(nodes[-1] + dx)
+    meshgen = OrthogonalMeshGenerator(node_sets=[nodes])
+    grid = meshgen.Execute()
+
+    # Set block IDs
+    z_min = 0.0
+    z_max = widths[1]
+    for imat in range(Nmat):
+        z_max = z_min + widths[imat]
+        lv = RPPLogicalVolume(infx=True, infy=True, zmin=z_min, zmax=z_max)
+        grid.SetBlockIDFromLogicalVolume(lv, imat, True)
+        z_min = z_max
+
+    # Add cross sections to materials
+    total = [50., 5., 0., 1., 1.]
+    c = [0., 0., 0., 0.9, 0.9]
+    xs_map = len(total) * [None]
+    for imat in range(Nmat):
+        xs_ = MultiGroupXS()
+        xs_.CreateSimpleOneGroup(total[imat], c[imat])
+        xs_map[imat] = {
+            "block_ids": [imat], "xs": xs_,
+        }
+
+    # Create sources in 1st and 4th materials
+    src0 = VolumetricSource(block_ids=[0], group_strength=[50.])
+    src1 = VolumetricSource(block_ids=[3], group_strength=[1.])
+
+    # Angular Quadrature
+    gl_quad = GLProductQuadrature1DSlab(128)
+
+    # Solve with the given within-group method, and count the within-group iterations
+    def Solve(inner_linear_method, **groupset_options):
+        num_groups = 1
+        phys = DiscreteOrdinatesProblem(
+            mesh=grid,
+            num_groups=num_groups,
+            groupsets=[
+                {
+                    "groups_from_to": (0, num_groups - 1),
+                    "angular_quadrature": gl_quad,
+                    "inner_linear_method": inner_linear_method,
+                    "l_abs_tol": 1.0e-9,
+                    "l_max_its": 1000,
+                    **groupset_options,
+                },
+            ],
+            xs_map=xs_map,
+            options={
+                "scattering_order": 0,
+                "spatial_discretization": "pwld",
+                "boundary_conditions": [
+                    {"name": "zmin", "type": "vacuum"},
+                    {"name": "zmax", "type": "vacuum"}
+                ],
+                "volumetric_sources": [src0, src1],
+            },
+        )
+
+        ClearTelemetry()
+        EnableTelemetry()
+        ss_solver = SteadyStateSolver(lbs_problem=phys)
+        ss_solver.Initialize()
+        ss_solver.Execute()
+        DisableTelemetry()
+        num_its = len([r for r in GetTelemetry() if r["solver"] == "wgs"])
+        return phys, num_its
+
+    _, richardson_its = Solve("classic_richardson")
+    phys, anderson_its = Solve("anderson_richardson", anderson_depth=5)
+    if rank == 0:
+        print(f"Anderson-fewer-iterations={int(anderson_its < richardson_its)}")
+
+    # compute particle balance
+    phys.ComputeBalance()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Reed 1D 1-group problem with the iterations recorded by the telemetry
+
+import os
+import sys
+import json
+
+if "opensn_console" not in globals():
+    from mpi4py import MPI
+    size = MPI.COMM_WORLD.size
+    rank = MPI.COMM_WORLD.rank
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../")))
+    from pyopensn.mesh import OrthogonalMeshGenerator
+    from pyopensn.xs import MultiGroupXS
+    from pyopensn.source import VolumetricSource
+    from pyopensn.aquad import GLProductQuadrature1DSlab
+    from pyopensn.logvol import RPPLogicalVolume
+    from pyopensn.solver import DiscreteOrdinatesProblem, SteadyStateSolver
+    from pyopensn.context import EnableTelemetry, DisableTelemetry, GetTelemetry
+
+if __name__ == "__main__":
+
+    # Create Mesh
+    widths = [2., 1., 2., 1., 2.]
+    nrefs = [20, 20, 20, 20, 20]
+    Nmat = len(widths)
+    nodes = [0.]
+    for imat in range(Nmat):
+        dx = widths[imat] / nrefs[imat]
+        for i in range(nrefs[imat]):
+            nodes.append(nodes[-1] + dx)
+    meshgen = OrthogonalMeshGenerator(node_sets=[nodes])
+    grid = meshgen.Execute()
+
+    # Set block IDs
+    z_min = 0.0
+    for imat in range(Nmat):
+        z_max = z_min + widths[imat]
+        lv = RPPLogicalVolume(infx=True, infy=True, zmin=z_min, zmax=z_max)
+        grid.SetBlockIDFromLogicalVolume(lv, imat, True)
+        z_min = z_max
+
+    # Add cross sections to materials
+    total = [50., 5., 0., 1., 1.]
+    c = [0., 0., 0., 0.9, 0.9]
+    xs_map = len(total) * [None]
+    for imat in range(Nmat):
+        xs_ = MultiGroupXS()
+        xs_.CreateSimpleOneGroup(total[imat], c[imat])
+        xs_map[imat] = {
+            "block_ids": [imat], "xs": xs_,
+        }
+
+    # Create sources in 1st and 4th materials
+    src0 = VolumetricSource(block_ids=[0], group_strength=[50.])
+    src1 = VolumetricSource(block_ids=[3], group_strength=[1.])
+
+    # Angular Quadrature
+    gl_quad = GLProductQuadrature1DSlab(16)
+
+    # LBS block option
+    num_groups = 1
+    phys = DiscreteOrdinatesProblem(
+        mesh=grid,
+        num_groups=num_groups,
+        groupsets=[
+            {
+                "groups_from_to": (0, num_groups - 1),
+                "angular_quadrature": gl_quad,
+                "inner_linear_method": "classic_richardson",
+                "l_abs_tol": 1.0e-6,
+                "l_max_its": 1000,
+            },
+        ],
+        xs_map=xs_map,
+        options={
+            "scattering_order": 0,
+            "spatial_discretization": "pwld",
+            "boundary_conditions": [
+                {"name": "zmin", "type": "vacuum"},
+                {"name": "zmax", "type": "vacuum"}
+            ],
+            "volumetric_sources": [src0, src1],
+        },
+    )
+
+    # Initialize and execute solver with the telemetry enabled
+    file_name = "telemetry_1d.jsonl"
+    EnableTelemetry(file_name)
+    ss_solver = SteadyStateSolver(lbs_problem=phys)
+    ss_solver.Initialize()
+    ss_solver.Execute()
+    DisableTelemetry()
+
+    # Check the records: every iteration of the within-groupset solve is recorded, the last one
+    # is converged, and the times are consistent over the ranks
+    records = GetTelemetry()
+    wgs_records = [r for r in records if r["solver"] == "wgs"]
+    iterations_ok = [r["iteration"] for r in wgs_records] == list(range(len(wgs_records)))
+    converged = wgs_records[-1]["values"]["pointwise_change"] < 1.0e-6
+    times = [t for r in records for t in r["times"].values()]
+    times_ok = all(0.0 <= t["min"] <= t["mean"] * (1 + 1e-12) <= t["max"] * (1 + 1e-12)
+                   for t in times)
+    swept = all(r["times"]["sweep"]["max"] > 0.0 for r in wgs_records)
+    if rank == 0:
+        with open(file_name) as f:
+            lines = [json.loads(line) for line in f]
+        file_ok = len(lines) == len(records)
+        os.remove(file_name)
+        ok = iterations_ok and converged and times_ok and swept and file_ok
+        print(f"Telemetry-records-ok={int(ok)}")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+3D Transport test with Vacuum and Incident-isotropic BC on a graded mesh, solved with and without
+shared unit cell matrices. The cells of the graded mesh have several sizes of the same shapes, so
+that shared matrices are also scaled.
+SDM: PWLD
+Test: Max-diff=0.0
+"""
+
+import os
+import sys
+import math
+import numpy as np
+
+if "opensn_console" not in globals():
+    from mpi4py import MPI
+    size = MPI.COMM_WORLD.size
+    rank = MPI.COMM_WORLD.rank
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../")))
+    from pyopensn.mesh import OrthogonalMeshGenerator, KBAGraphPartitioner
+    from pyopensn.xs import MultiGroupXS
+    from pyopensn.source import VolumetricSource
+    from pyopensn.aquad import GLCProductQuadrature3DXYZ
+    from pyopensn.solver import DiscreteOrdinatesProblem, SteadyStateSolver
+    from pyopensn.fieldfunc import FieldFunctionGridBased
+    from pyopensn.fieldfunc import FieldFunctionInterpolationLine, FieldFunctionInterpolationVolume
+    from pyopensn.settings import EnableCaliper
+    from pyopensn.math import Vector3
+    from pyopensn.logvol import RPPLogicalVolume
+
+if __name__ == "__main__":
+
+    num_procs = 4
+
+    if size != num_procs:
+        sys.exit(f"Incorrect number of processors. Expected {num_procs} processors but got {size}.")
+
+    # Setup a graded mesh, refined towards the center
+    L = 5.0
+    xmin = -L / 2
+    widths = [2.0, 1.0, 0.5, 0.5, 0.5, 0.5, 1.0, 2.0]
+    nodes = [xmin]
+    for width in widths:
+        nodes.append(nodes[-1] + width * L / 8)
+    meshgen = OrthogonalMeshGenerator(node_sets=[nodes, nodes, nodes])
+    grid = meshgen.Execute()
+
+    # Set block IDs
+    vol0 = RPPLogicalVolume(infx=True, infy=True, infz=True)
+    grid.SetBlockIDFromLogicalVolume(vol0, 0, True)
+
+    # Cross sections
+    num_groups = 21
+    xs_graphite = MultiGroupXS()
+    xs_graphite.LoadFromOpenSn("xs_graphite_pure.xs")
+
+    # Source
+    strength = [0.0 for _ in range(num_groups)]
+    mg_src = VolumetricSource(block_ids=[1], group_strength=strength)
+
+    # Setup Physics
+    pquad = GLCProductQuadrature3DXYZ(4, 8)
+
+    bsrc = [0.0 for _ in range(num_groups)]
+    bsrc[0] = 1.0 / 4.0 / math.pi
+
+    # Solve with the given unit cell matrices option
+    def Solve(share_unit_cell_matrices):
+        phys = DiscreteOrdinatesProblem(
+            mesh=grid,
+            num_groups=num_groups,
+            groupsets=[
+                {
+                    "groups_from_to": [0, 20],
+                    "angular_quadrature": pquad,
+                    "angle_aggregation_type": "single",
+                    "angle_aggregation_num_subsets": 1,
+                    "inner_linear_method": "petsc_gmres",
+                    "l_abs_tol": 1.0e-6,
+                    "l_max_its": 300,
+                    "gmres_restart_interval": 100,
+                },
+            ],
+            xs_map=[
+                {"block_ids": [0, 1], "xs": xs_graphite},
+            ],
+            options={
+                "boundary_conditions": [
+                    {"name": "xmin",
+                     "type": "isotropic",
+                     "group_strength": bsrc},
+                ],
+                "scattering_order": 1,
+                "share_unit_cell_matrices": share_unit_cell_matrices,
+                "volumetric_sources": [mg_src],
+            },
+        )
+        ss_solver = SteadyStateSolver(lbs_problem=phys)
+        ss_solver.Initialize()
+        ss_solver.Execute()
+        return phys
+
+    phys_shared = Solve(True)
+    phys = Solve(False)
+
+    # Maximum difference of the scalar fluxes of all groups over all ranks, computed in the local
+    # field vector of the first group
+    fflist_shared = phys_shared.GetScalarFieldFunctionList()
+    fflist = phys.GetScalarFieldFunctionList()
+    phi_diff = np.zeros(len(fflist[0].GetLocalFieldVector()))
+    for g in range(num_groups):
+        diff = np.abs(fflist_shared[g].GetLocalFieldVector() - fflist[g].GetLocalFieldVector())
+        phi_diff = np.maximum(phi_diff, diff)
+    fflist[0].GetLocalFieldVector()[:] = phi_diff
+
+    ffi = FieldFunctionInterpolationVolume()
+    ffi.SetOperationType("max")
+    ffi.SetLogicalVolume(vol0)
+    ffi.AddFieldFunction(fflist[0])
+    ffi.Initialize()
+    ffi.Execute()
+    max_diff = ffi.GetValue()
+    if rank == 0:
+        print(f"Max-diff={max_diff:.5e}")
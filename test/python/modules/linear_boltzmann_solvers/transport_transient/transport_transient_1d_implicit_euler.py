@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+1D transient infinite medium with a source, using implicit Euler time steps.
+Test: Avg-value=2 (1 - 1.05^-10) = 0.77217
+"""
+
+import os
+import sys
+
+if "opensn_console" not in globals():
+    from mpi4py import MPI
+    size = MPI.COMM_WORLD.size
+    rank = MPI.COMM_WORLD.rank
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../")))
+    from pyopensn.mesh import OrthogonalMeshGenerator
+    from pyopensn.xs import MultiGroupXS
+    from pyopensn.source import VolumetricSource
+    from pyopensn.aquad import GLProductQuadrature1DSlab
+    from pyopensn.solver import DiscreteOrdinatesProblem, TransientSolver
+    from pyopensn.fieldfunc import FieldFunctionInterpolationVolume
+    from pyopensn.logvol import RPPLogicalVolume
+
+if __name__ == "__main__":
+
+    # Setup mesh
+    nodes = []
+    N = 20
+    L = 10.0
+    xmin = 0.0
+    dx = L / N
+    for i in range(N + 1):
+        nodes.append(xmin + i * dx)
+    meshgen = OrthogonalMeshGenerator(node_sets=[nodes])
+    grid = meshgen.Execute()
+    grid.SetUniformBlockID(0)
+
+    # Cross sections, with sigma_a = 0.5 and v = 1
+    xs1g = MultiGroupXS()
+    xs1g.LoadFromOpenSn("xs_1g_transient.xs")
+
+    mg_src = VolumetricSource(block_ids=[0], group_strength=[1.0])
+
+    # Angular quadrature
+    pquad = GLProductQuadrature1DSlab(8)
+
+    # Problem, initially without particles
+    num_groups = 1
+    phys = DiscreteOrdinatesProblem(
+        mesh=grid,
+        num_groups=num_groups,
+        groupsets=[
+            {
+                "groups_from_to": (0, num_groups - 1),
+                "angular_quadrature": pquad,
+                "inner_linear_method": "petsc_gmres",
+                "l_abs_tol": 1.0e-10,
+                "l_max_its": 100,
+            },
+        ],
+        xs_map=[
+            {"block_ids": [0], "xs": xs1g},
+        ],
+        options={
+            "boundary_conditions": [
+                {"name": "zmin", "type": "reflecting"},
+                {"name": "zmax", "type": "reflecting"},
+            ],
+            "volumetric_sources": [mg_src],
+            "save_angular_flux": True,
+        },
+    )
+
+    # Transient solver
+    solver = TransientSolver(
+        lbs_problem=phys,
+        dt=0.1,
+        end_time=1.0,
+        time_integration="implicit_euler",
+    )
+    solver.Initialize()
+    solver.Execute()
+
+    # Flux at the end time
+    fflist = phys.GetScalarFieldFunctionList()
+    vol0 = RPPLogicalVolume(infx=True, infy=True, infz=True)
+    ffi = FieldFunctionInterpolationVolume()
+    ffi.SetOperationType("avg")
+    ffi.SetLogicalVolume(vol0)
+    ffi.AddFieldFunction(fflist[0])
+    ffi.Initialize()
+    ffi.Execute()
+    avgval = ffi.GetValue()
+    if rank == 0:
+        print(f"Time={solver.GetTime():.5f}")
+        print(f"Avg-value={avgval:.5f}")
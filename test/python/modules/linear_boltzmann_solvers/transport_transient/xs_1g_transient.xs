@@ -0,0 +1,15 @@
+# 1-group cross sections with an inverse velocity
+NUM_GROUPS 1
+NUM_MOMENTS 1
+
+SIGMA_T_BEGIN
+0 1.0
+SIGMA_T_END
+
+TRANSFER_MOMENTS_BEGIN
+M_GPRIME_G_VAL 0 0 0 0.5
+TRANSFER_MOMENTS_END
+
+INV_VELOCITY_BEGIN
+0 1.0
+INV_VELOCITY_END
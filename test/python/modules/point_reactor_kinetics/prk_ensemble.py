@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Point reactor kinetics ensemble, compared with individual PRKSolver runs
+Test: Population2=4.90920, Max-rel-diff < 1e-10
+"""
+
+import os
+import sys
+import numpy as np
+
+if "opensn_console" not in globals():
+    from mpi4py import MPI
+    size = MPI.COMM_WORLD.size
+    rank = MPI.COMM_WORLD.rank
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../")))
+    from pyopensn.solver import PRKSolver, PRKEnsemble
+
+if __name__ == "__main__":
+
+    # Members with different generation times, and a reactivity step of 0.8$ after 0.1 s
+    gen_times = np.array([1.0e-5, 2.0e-5, 5.0e-5])
+    num_steps = 20
+    dt = 0.01
+    rho = np.where(np.arange(num_steps) >= 10, 0.8, 0.0)
+
+    ensemble = PRKEnsemble(num_members=len(gen_times), gen_time=gen_times, initial_source=0.0)
+    populations = ensemble.Run(dt, rho)
+
+    # Reference solutions
+    max_rel_diff = 0.0
+    for m, gen_time in enumerate(gen_times):
+        prk = PRKSolver(gen_time=gen_time, initial_source=0.0, dt=dt, end_time=1.0)
+        prk.Initialize()
+        for step in range(num_steps):
+            prk.SetRho(rho[step])
+            prk.Step()
+            prk.Advance()
+            rel_diff = abs(prk.GetPopulationPrev() / populations[step + 1, m] - 1.0)
+            max_rel_diff = max(max_rel_diff, rel_diff)
+
+    if rank == 0:
+        print(f"Time={ensemble.GetTime():.5f}")
+        print(f"Population2={ensemble.GetPopulations()[2]:.5f}")
+        print(f"Max-rel-diff={max_rel_diff:.3e}")
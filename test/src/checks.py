@@ -8,21 +8,106 @@ import difflib
 
 
 class Check:
-    """Base class for a Check data structure"""
+    """Base class for a Check data structure.
+
+    Checks are performed in a single pass over the output of a test: `Begin` is called before the
+    first line, `ProcessLine` for every line until the check reports that it is `done`, and `End`
+    returns the outcome once the output has been scanned."""
 
     def __init__(self):
         self.annotations = []
+        self.skip_lines_until: str = ""
+        self.done = False
+        self.passed = False
+        self.verbose = False
+        self.skipping = False
 
     def __str__(self):
         return "Check base class"
 
+    def Begin(self, filename: str, verbose: bool):
+        """Resets the state of the check before scanning the output file `filename`"""
+        self.done = False
+        self.passed = False
+        self.verbose = verbose
+        self.skipping = bool(self.skip_lines_until != "")
+
+    def ProcessLine(self, line: str):
+        """Processes a line of output"""
+        self.done = True
+
+    def Abort(self, error: Exception):
+        """Stops the check after an error was raised while processing a line"""
+        self.annotations.append("Python error")
+        self.done = True
+        self.passed = False
+        if self.verbose:
+            warnings.warn(str(error))
+
+    def End(self, errorcode) -> bool:
+        """Returns whether the check passed. Called once the output has been scanned"""
+        return self.passed
+
     def PerformCheck(self, filename, errorcode, verbose: bool):
-        warnings.warn("Unimplemented base class routine")
-        return False
+        return PerformChecks([self], filename, errorcode, verbose)
 
     def GetAnnotations(self):
         return self.annotations
 
+    def SkipLine(self, line: str) -> bool:
+        """Whether a line precedes the line containing `skip_lines_until`, and must be skipped"""
+        if self.skipping and line.find(self.skip_lines_until) >= 0:
+            self.skipping = False
+        return self.skipping
+
+
+def ScanOutput(filename: str, scanners: list):
+    """Reads an output file once, line by line, and passes every line to each scanner until the
+       scanner is done. A scanner provides a `done` flag, `ProcessLine(line)` and `Abort(error)`,
+       which is called when processing a line raises an exception."""
+    active = [scanner for scanner in scanners if not scanner.done]
+    if len(active) == 0:
+        return
+
+    with open(filename, "r", encoding='utf-8') as file:
+        for line in file:
+            finished = False
+            for scanner in active:
+                try:
+                    scanner.ProcessLine(line)
+                except Exception as e:
+                    scanner.Abort(e)
+                finished = finished or scanner.done
+
+            if finished:
+                active = [scanner for scanner in active if not scanner.done]
+                if len(active) == 0:
+                    break
+
+
+def PerformChecks(checks: list, filename, errorcode, verbose: bool, scanners=None):
+    """Performs all the checks of a test in a single pass over its output file. Additional
+       scanners, e.g., to extract information from the output, share the same pass. Returns
+       whether all checks passed."""
+    for check in checks:
+        check.Begin(filename, verbose)
+
+    try:
+        ScanOutput(filename, list(checks) + (scanners if scanners is not None else []))
+    except FileNotFoundError as e:
+        warnings.warn(str(e))
+
+    passed = True
+    for check in checks:
+        try:
+            check_passed = check.End(errorcode)
+        except Exception as e:
+            check.Abort(e)
+            check_passed = False
+        passed = passed and check_passed
+
+    return passed
+
 
 class KeyValuePairCheck(Check):
     """Given a string key, checks the floating point value of the word immediately following the
@@ -68,58 +153,41 @@ class KeyValuePairCheck(Check):
             f'goldvalue={self.goldvalue}, ' + \
             f'rel_tol={self.rel_tol}, ' + f'abs_tol={self.abs_tol}'
 
-    def PerformCheck(self, filename, errorcode, verbose: bool):
+    def ProcessLine(self, line: str):
+        if self.SkipLine(line):
+            return
+
+        key_pos = line.find(self.key)
+        if key_pos < 0:
+            return
+
+        postkey = line[(key_pos + len(self.key)):].strip()
+
+        words = re.split(r'\s+|,+]', postkey)
+        if len(words) == 0:
+            raise ValueError("word split failure: " + line)
+
         try:
-            with open(filename, "r", encoding='utf-8') as file:
-                skip_lines = False
-                perform_skip_check = bool(self.skip_lines_until != "")
-                if perform_skip_check:
-                    skip_lines = True
-
-                lines = file.readlines()
-                for line in lines:
-                    if perform_skip_check:
-                        if line.find(self.skip_lines_until) >= 0:
-                            skip_lines = False
-                            perform_skip_check = False
-                    if skip_lines:
-                        continue
-
-                    key_pos = line.find(self.key)
-                    if key_pos >= 0:
-                        postkey = line[(key_pos + len(self.key)):].strip()
-
-                        words = re.split(r'\s+|,+]', postkey)
-                        if len(words) == 0:
-                            raise ValueError("word split failure: " + line)
-
-                        try:
-                            value = float(words[0])
-                        except Exception:
-                            self.annotations.append("Python error")
-                            if verbose:
-                                warnings.warn('Failed to convert word "' + words[0] + '" to float\n'
-                                              + 'post key: ' + postkey + "\n"
-                                              + 'words' + str(words))
-
-                            return False
-
-                        if abs(value - self.goldvalue) <= self.abs_tol + self.rel_tol * \
-                           self.goldvalue:
-                            return True
-                        elif verbose:
-                            print("Check failed : " + self.__str__() + "\n" + line)
-
-                if verbose:
-                    print('Check failed : key, "' + self.key + '", not found ')
-        except FileNotFoundError as e:
-            warnings.warn(str(e))
-        except Exception as e:
+            value = float(words[0])
+        except Exception:
             self.annotations.append("Python error")
-            if verbose:
-                warnings.warn(str(e))
+            if self.verbose:
+                warnings.warn('Failed to convert word "' + words[0] + '" to float\n'
+                              + 'post key: ' + postkey + "\n"
+                              + 'words' + str(words))
+            self.done = True
+            return
 
-        return False
+        if abs(value - self.goldvalue) <= self.abs_tol + self.rel_tol * self.goldvalue:
+            self.passed = True
+            self.done = True
+        elif self.verbose:
+            print("Check failed : " + self.__str__() + "\n" + line)
+
+    def End(self, errorcode):
+        if not self.done and self.verbose:
+            print('Check failed : key, "' + self.key + '", not found ')
+        return self.passed
 
 
 class StrCompareCheck(Check):
@@ -158,55 +226,42 @@ class StrCompareCheck(Check):
             f'wordnum={self.wordnum}, ' + \
             f'gold={self.gold} '
 
-    def PerformCheck(self, filename, errorcode, verbose: bool):
-        try:
-            with open(filename, "r", encoding='utf-8') as file:
-                skip_lines = False
-                perform_skip_check = bool(self.skip_lines_until != "")
-                if perform_skip_check:
-                    skip_lines = True
-
-                lines = file.readlines()
-                for line in lines:
-                    if perform_skip_check:
-                        if line.find(self.skip_lines_until) >= 0:
-                            skip_lines = False
-                            perform_skip_check = False
-                    if skip_lines:
-                        continue
-
-                    key_pos = line.find(self.key)
-                    if key_pos >= 0:
-                        if self.wordnum < 0:
-                            return True
-                        words = re.split(r'\s+|,+|=+', line.rstrip())
-
-                        if len(words) <= self.wordnum:
-                            warnings.warn("word count: " + str(len(words)) + "\n"
-                                          + "line: " + line.rstrip() + "\n"
-                                          + "words: " + str(words))
-                            raise ValueError(f"Required word {self.wordnum} does not exist")
-
-                        value = words[self.wordnum]
-
-                        if value == self.gold:
-                            return True
-                        elif verbose:
-                            warnings.warn("Check failed : " + self.__str__() + "\n"
-                                          + line + "\n"
-                                          + str(words))
-
-                if verbose:
-                    warnings.warn('Check failed : key, "' + self.key + '", not found '
-                                  + str(self.wordnum))
-        except FileNotFoundError as e:
-            print(str(e))
-        except Exception as e:
-            self.annotations.append("Python error")
-            if verbose:
-                print(str(e))
+    def ProcessLine(self, line: str):
+        if self.SkipLine(line):
+            return
 
-        return False
+        key_pos = line.find(self.key)
+        if key_pos < 0:
+            return
+
+        if self.wordnum < 0:
+            self.passed = True
+            self.done = True
+            return
+
+        words = re.split(r'\s+|,+|=+', line.rstrip())
+
+        if len(words) <= self.wordnum:
+            warnings.warn("word count: " + str(len(words)) + "\n"
+                          + "line: " + line.rstrip() + "\n"
+                          + "words: " + str(words))
+            raise ValueError(f"Required word {self.wordnum} does not exist")
+
+        value = words[self.wordnum]
+
+        if value == self.gold:
+            self.passed = True
+            self.done = True
+        elif self.verbose:
+            warnings.warn("Check failed : " + self.__str__() + "\n"
+                          + line + "\n"
+                          + str(words))
+
+    def End(self, errorcode):
+        if not self.done and self.verbose:
+            warnings.warn('Check failed : key, "' + self.key + '", not found '
+                          + str(self.wordnum))
+        return self.passed
 
 
 class FloatCompareCheck(Check):
@@ -259,70 +314,49 @@ class FloatCompareCheck(Check):
             f'gold={self.gold}, ' + \
             f'rel_tol={self.rel_tol}, ' + f'abs_tol={self.abs_tol}'
 
-    def PerformCheck(self, filename, errorcode, verbose: bool):
+    def ProcessLine(self, line: str):
+        if self.SkipLine(line):
+            return
+
+        key_pos = line.find(self.key)
+        if key_pos < 0:
+            return
+
+        words = re.split(r'\s+|,+|=+', line.rstrip())
+
+        if len(words) <= self.wordnum:
+            warnings.warn("word count: " + str(len(words)) + "\n"
+                          + "line: " + line + "\n"
+                          + "\n"
+                          + "words: " + str(words))
+            raise ValueError(f"Required word {self.wordnum} does not exist")
+
         try:
-            with open(filename, "r", encoding='utf-8') as file:
-                skip_lines = False
-                perform_skip_check = bool(self.skip_lines_until != "")
-                if perform_skip_check:
-                    skip_lines = True
-
-                skip_lines = False
-                perform_skip_check = bool(self.skip_lines_until != "")
-                if perform_skip_check:
-                    skip_lines = True
-
-                lines = file.readlines()
-                for line in lines:
-                    if perform_skip_check:
-                        if line.find(self.skip_lines_until) >= 0:
-                            skip_lines = False
-                            perform_skip_check = False
-                    if skip_lines:
-                        continue
-
-                    key_pos = line.find(self.key)
-                    if key_pos >= 0:
-                        words = re.split(r'\s+|,+|=+', line.rstrip())
-
-                        if len(words) <= self.wordnum:
-                            warnings.warn("word count: " + str(len(words)) + "\n"
-                                          + "line: " + line + "\n"
-                                          + "\n"
-                                          + "words: " + str(words))
-                            raise ValueError(f"Required word {self.wordnum} does not exist")
-
-                        value = 0.0
-                        try:
-                            value = float(words[self.wordnum])
-                        except Exception:
-                            self.annotations.append("Python error")
-                            warnings.warn("    Check failed :\n"
-                                          + "    Check = " + self.__str__() + "\n"
-                                          + "    line = " + line
-                                          + "    words = " + str(words) + "\n"
-                                          + "    info = Failed to convert word "
-                                          + str(self.wordnum) + " to float.")
-                            return False
-
-                        if abs(value - self.gold) <= self.abs_tol + self.rel_tol * self.gold:
-                            return True
-                        elif verbose:
-                            warnings.warn("Check failed : " + self.__str__() + "\n"
-                                          + line + "\n"
-                                          + str(words))
-
-                if verbose:
-                    warnings.warn('Check failed : key, "' + self.key + '", not found '
-                                  + str(self.wordnum))
-        except FileNotFoundError as e:
-            print(str(e))
-        except Exception as e:
+            value = float(words[self.wordnum])
+        except Exception:
             self.annotations.append("Python error")
-            if verbose:
-                print(str(e))
-
-        return False
+            warnings.warn("    Check failed :\n"
+                          + "    Check = " + self.__str__() + "\n"
+                          + "    line = " + line
+                          + "    words = " + str(words) + "\n"
+                          + "    info = Failed to convert word "
+                          + str(self.wordnum) + " to float.")
+            self.done = True
+            return
+
+        if abs(value - self.gold) <= self.abs_tol + self.rel_tol * self.gold:
+            self.passed = True
+            self.done = True
+        elif self.verbose:
+            warnings.warn("Check failed : " + self.__str__() + "\n"
+                          + line + "\n"
+                          + str(words))
+
+    def End(self, errorcode):
+        if not self.done and self.verbose:
+            warnings.warn('Check failed : key, "' + self.key + '", not found '
+                          + str(self.wordnum))
+        return self.passed
 
 
 class IntCompareCheck(Check):
@@ -361,66 +395,49 @@ class IntCompareCheck(Check):
             f'wordnum={self.wordnum}, ' + \
             f'gold={self.gold} '
 
-    def PerformCheck(self, filename, errorcode, verbose: bool):
+    def ProcessLine(self, line: str):
+        if self.SkipLine(line):
+            return
+
+        key_pos = line.find(self.key)
+        if key_pos < 0:
+            return
+
+        words = re.split(r'\s+|,+|=+', line.rstrip())
+
+        if len(words) <= self.wordnum:
+            warnings.warn("word count: " + str(len(words)) + "\n"
+                          + "line: " + line + "\n"
+                          + "\n"
+                          + "words: " + str(words))
+            raise ValueError(f"Required word {self.wordnum} does not exist")
+
         try:
-            with open(filename, "r", encoding='utf-8') as file:
-                skip_lines = False
-                perform_skip_check = bool(self.skip_lines_until != "")
-                if perform_skip_check:
-                    skip_lines = True
-
-                lines = file.readlines()
-                for line in lines:
-                    if perform_skip_check:
-                        if line.find(self.skip_lines_until) >= 0:
-                            skip_lines = False
-                            perform_skip_check = False
-                    if skip_lines:
-                        continue
-
-                    key_pos = line.find(self.key)
-                    if key_pos >= 0:
-                        words = re.split(r'\s+|,+|=+', line.rstrip())
-
-                        if len(words) <= self.wordnum:
-                            warnings.warn("word count: " + str(len(words)) + "\n"
-                                          + "line: " + line + "\n"
-                                          + "\n"
-                                          + "words: " + str(words))
-                            raise ValueError(f"Required word {self.wordnum} does not exist")
-
-                        value = 0.0
-                        try:
-                            value = int(words[self.wordnum])
-                        except Exception:
-                            self.annotations.append("Python error")
-                            warnings.warn("    Check failed :\n"
-                                          + "    Check = " + self.__str__() + "\n"
-                                          + "    line = " + line
-                                          + "    words = " + str(words) + "\n"
-                                          + "    info = Failed to convert word "
-                                          + str(self.wordnum) + " to int.")
-                            return False
-
-                        if value == self.gold:
-                            return True
-                        elif verbose:
-                            warnings.warn("Check failed : " + self.__str__() + "\n"
-                                          + line + "\n"
-                                          + str(words))
-
-                if verbose:
-                    warnings.warn('Check failed : key, "' + self.key + '", not found, wordnum = '
-                                  + str(self.wordnum))
-
-        except FileNotFoundError as e:
-            print(str(e))
-        except Exception as e:
+            value = int(words[self.wordnum])
+        except Exception:
             self.annotations.append("Python error")
-            if verbose:
-                print(str(e))
-
-        return False
+            warnings.warn("    Check failed :\n"
+                          + "    Check = " + self.__str__() + "\n"
+                          + "    line = " + line
+                          + "    words = " + str(words) + "\n"
+                          + "    info = Failed to convert word "
+                          + str(self.wordnum) + " to int.")
+            self.done = True
+            return
+
+        if value == self.gold:
+            self.passed = True
+            self.done = True
+        elif self.verbose:
+            warnings.warn("Check failed : " + self.__str__() + "\n"
+                          + line + "\n"
+                          + str(words))
+
+    def End(self, errorcode):
+        if not self.done and self.verbose:
+            warnings.warn('Check failed : key, "' + self.key + '", not found, wordnum = '
+                          + str(self.wordnum))
+        return self.passed
 
 
 class ErrorCodeCheck(Check):
@@ -441,18 +458,16 @@ class ErrorCodeCheck(Check):
     def __str__(self):
         return f'error_code="{self.error_code}"'
 
-    def PerformCheck(self, filename, errorcode, verbose: bool):
-        try:
-            if errorcode == self.error_code:
-                return True
+    def Begin(self, filename: str, verbose: bool):
+        super().Begin(filename, verbose)
+        self.done = True
 
-            if verbose:
-                warnings.warn(f'Check failed: error_code, {self.error_code} vs {errorcode}')
+    def End(self, errorcode):
+        if errorcode == self.error_code:
+            return True
 
-        except Exception as e:
-            self.annotations.append("Python error")
-            if verbose:
-                warnings.warn(str(e))
+        if self.verbose:
+            warnings.warn(f'Check failed: error_code, {self.error_code} vs {errorcode}')
 
         return False
 
@@ -467,6 +482,11 @@ class GoldFileCheck(Check):
         self.candidate_filename: str = ""
         self.skiplines_top: int = 0
         self.check_numlines: int = 0
+        self.filename: str = ""
+        self.golddir: str = ""
+        self.goldfilename: str = ""
+        self.lines = []
+        self.read_gate_open = False
 
         if "scope_keyword" in params:
             self.scope_keyword = params["scope_keyword"]
@@ -483,95 +503,101 @@ class GoldFileCheck(Check):
                 f'scope_end_keyword="{self.scope_keyword}_END" '
         return "pure_diff"
 
-    def PerformCheck(self, filename, errorcode, verbose: bool):
-        try:
-            outfiledir = pathlib.Path(os.path.dirname(filename) + "/")
-            if self.candidate_filename != "":
-                filename = str(outfiledir.parent.absolute()) + "/" + self.candidate_filename
-            golddir = str(outfiledir.parent.absolute()) + "/gold/"
-
-            goldfilename = os.path.splitext(os.path.basename(filename))[0] + ".gold"
-            if self.candidate_filename != "":
-                goldfilename = self.candidate_filename + ".gold"
-
-            if not os.path.isfile(golddir + goldfilename):
-                if verbose:
-                    warnings.warn(f'Gold file {goldfilename} does not exist at \n'
-                                  + f'{golddir + goldfilename}')
-                self.annotations.append("Gold file missing")
-                return False
-
-            lines_a, lines_b = self.GetFileLines(filename, golddir + goldfilename)
-
-            if len(lines_a) == 0:
-                if verbose:
-                    print(f"no lines to compare in {filename}. "
-                          + f"Maybe {self.scope_keyword}_BEGIN/_END was not found?")
-                return False
-
-            if len(lines_b) == 0:
-                if verbose:
-                    print(f"no lines to compare in {golddir + goldfilename}. "
-                          + f"Maybe {self.scope_keyword}_BEGIN/_END was not found?")
-                return False
-
-            if self.check_numlines == 0:
-                diff = list(difflib.unified_diff(lines_a[self.skiplines_top:],
-                                                 lines_b[self.skiplines_top:],
-                                                 fromfile=filename,
-                                                 tofile=golddir + goldfilename,
-                                                 n=0  # Removes context
-                                                 ))
-            else:
-                diff = list(difflib.unified_diff(
-                    lines_a[self.skiplines_top:self.skiplines_top + self.check_numlines],
-                    lines_b[self.skiplines_top:self.skiplines_top + self.check_numlines],
-                    fromfile=filename,
-                    tofile=golddir + goldfilename,
-                    n=0  # Removes context
-                ))
-
-            if len(diff) == 0:
-                return True
-            elif verbose:
-                print("diff-begin")
-                for line in diff:
-                    print(line, end='')
-                print("diff-end")
-
-        except Exception as e:
-            self.annotations.append("Python error")
-            if verbose:
-                warnings.warn(str(e))
+    def Begin(self, filename: str, verbose: bool):
+        super().Begin(filename, verbose)
+        outfiledir = pathlib.Path(os.path.dirname(filename) + "/")
+        self.filename = filename
+        if self.candidate_filename != "":
+            self.filename = str(outfiledir.parent.absolute()) + "/" + self.candidate_filename
+        self.golddir = str(outfiledir.parent.absolute()) + "/gold/"
 
-        return False
+        self.goldfilename = os.path.splitext(os.path.basename(self.filename))[0] + ".gold"
+        if self.candidate_filename != "":
+            self.goldfilename = self.candidate_filename + ".gold"
 
-    def GetFileLines(self, filename_a: str, filename_b: str):
-        def GetRawLines(filename):
-            with open(filename, "r", encoding='utf-8') as file:
-                lines = file.readlines()
-            return lines
+        self.lines = []
+        self.read_gate_open = False
 
-        def ScopeFilterLines(input_lines: list, scope_keyword: str):
-            lines = []
-            read_gate_open = False
-            for line in input_lines:
-                if line.find(scope_keyword + "_BEGIN") >= 0:
-                    read_gate_open = True
-
-                if line.find(scope_keyword + "_END") >= 0:
-                    read_gate_open = False
-
-                if read_gate_open:
-                    lines.append(line)
-
-            return lines
-
-        lines_a = GetRawLines(filename_a)
-        lines_b = GetRawLines(filename_b)
+        # A candidate file is read separately from the output of the test
+        self.done = (self.candidate_filename != ""
+                     or not os.path.isfile(self.golddir + self.goldfilename))
 
+    def ProcessLine(self, line: str):
+        """Collects the lines to compare"""
         if self.scope_keyword != "":
-            lines_a = ScopeFilterLines(lines_a, self.scope_keyword)
-            lines_b = ScopeFilterLines(lines_b, self.scope_keyword)
+            if line.find(self.scope_keyword + "_BEGIN") >= 0:
+                self.read_gate_open = True
+
+            if line.find(self.scope_keyword + "_END") >= 0:
+                self.read_gate_open = False
+
+            if not self.read_gate_open:
+                return
+
+        self.lines.append(line)
+        if self.check_numlines > 0 and \
+           len(self.lines) >= self.skiplines_top + self.check_numlines:
+            self.done = True
+
+    def End(self, errorcode):
+        filename = self.filename
+        goldfilename = self.goldfilename
+        golddir = self.golddir
+
+        if not os.path.isfile(golddir + goldfilename):
+            if self.verbose:
+                warnings.warn(f'Gold file {goldfilename} does not exist at \n'
+                              + f'{golddir + goldfilename}')
+            self.annotations.append("Gold file missing")
+            return False
+
+        lines_a = self.lines
+        if self.candidate_filename != "":
+            lines_a = self.GetFileLines(filename)
+        lines_b = self.GetFileLines(golddir + goldfilename)
+
+        if len(lines_a) == 0:
+            if self.verbose:
+                print(f"no lines to compare in {filename}. "
+                      + f"Maybe {self.scope_keyword}_BEGIN/_END was not found?")
+            return False
+
+        if len(lines_b) == 0:
+            if self.verbose:
+                print(f"no lines to compare in {golddir + goldfilename}. "
+                      + f"Maybe {self.scope_keyword}_BEGIN/_END was not found?")
+            return False
+
+        if self.check_numlines == 0:
+            diff = list(difflib.unified_diff(lines_a[self.skiplines_top:],
+                                             lines_b[self.skiplines_top:],
+                                             fromfile=filename,
+                                             tofile=golddir + goldfilename,
+                                             n=0  # Removes context
+                                             ))
+        else:
+            diff = list(difflib.unified_diff(
+                lines_a[self.skiplines_top:self.skiplines_top + self.check_numlines],
+                lines_b[self.skiplines_top:self.skiplines_top + self.check_numlines],
+                fromfile=filename,
+                tofile=golddir + goldfilename,
+                n=0  # Removes context
+            ))
+
+        if len(diff) == 0:
+            return True
+        elif self.verbose:
+            print("diff-begin")
+            for line in diff:
+                print(line, end='')
+            print("diff-end")
+
+        return False
 
-        return lines_a, lines_b
+    def GetFileLines(self, filename: str):
+        """Reads the lines of a file that are compared"""
+        self.lines = []
+        self.read_gate_open = False
+        self.done = False
+        ScanOutput(filename, [self])
+        return self.lines
@@ -5,10 +5,15 @@ import os
 import warnings
 import shutil
 import time
+import xml.etree.ElementTree as ElementTree
 from nbconvert import PythonExporter
 import nbformat
 from . import checks
 from . import test_slot
+from . import timing_db
+
+# Seconds to sleep between checks of the running test processes
+WAIT_INTERVAL = 0.05
 
 
 class TestConfiguration:
@@ -104,6 +109,15 @@ class TestConfiguration:
         """Shorthand utility to get the relative path to a test"""
         return os.path.relpath(self.file_dir + self.filename)
 
+    def GetName(self, directory: str) -> str:
+        """Get a name identifying the test, made of its path relative to a directory and its
+           arguments"""
+        name = os.path.relpath(os.path.join(self.file_dir, self.filename), directory)
+        args_str = ', '.join(map(str, self.args))
+        if len(args_str) != 0:
+            name += " (" + args_str + ")"
+        return name
+
     def GetOutFilenamePrefix(self) -> str:
         """Get the output filename prefix"""
         if self.outfileprefix == "":
@@ -321,6 +335,9 @@ def ConfigureTests(test_hierarchy: dict, argv):
     test_objects = []
     for testdir in test_hierarchy:
         for config_file in ListFilesInDir(testdir, ".json"):
+            # The timing database is a .json file too, but not a test configuration
+            if os.path.abspath(testdir + config_file) == argv.timing_db:
+                continue
             sub_test_objs = ParseTestConfiguration(testdir + config_file)
             specific_test_dependency = None
             for obj in sub_test_objs.values():
@@ -362,16 +379,88 @@ def EchoTests(tests: list):
         print(f"test {test_num} " + str(test))
 
 
+def GetCapacity(argv) -> int:
+    """Gets the number of processes that can run at once. Unless specified, this is the number of
+       cpus the runner is allowed to use, which can be less than the number of cpus on the node,
+       e.g., in containers and batch jobs."""
+    if argv.jobs > 0:
+        return argv.jobs
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+
+def WaitForSlot(running_slots: dict):
+    """Waits until the process of one of the running test slots exits, and returns the slot along
+       with the exit code and resource usage of its process. Only the processes launched for the
+       test slots are reaped, never other children of the runner."""
+    while True:
+        for pid in running_slots:
+            try:
+                reaped_pid, status, rusage = os.wait4(pid, os.WNOHANG)
+            except InterruptedError:
+                continue
+            if reaped_pid == pid:
+                return running_slots.pop(pid), os.waitstatus_to_exitcode(status), rusage
+        time.sleep(WAIT_INTERVAL)
+
+
+def WriteJSONReport(file_path: str, test_slots: list, elapsed_time: float, argv):
+    """Writes a JSON report with the outcome, wall time and peak memory usage of each test"""
+    report = {"elapsed_time": elapsed_time, "tests": []}
+    for slot in test_slots:
+        test = slot.test
+        report["tests"].append({"name": test.GetName(argv.directory),
+                                "num_procs": test.num_procs,
+                                "weight_class": test.weight_class,
+                                "status": ("skipped" if test.skip != ""
+                                           else "passed" if slot.passed else "failed"),
+                                "annotations": test.annotations,
+                                "wall_time": slot.wall_time,
+                                "peak_rss": slot.peak_rss})
+
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+
+def WriteJUnitReport(file_path: str, test_slots: list, elapsed_time: float, argv):
+    """Writes a JUnit XML report with the outcome, wall time and peak memory usage of each test"""
+    num_failures = sum(1 for slot in test_slots if not slot.passed and slot.test.skip == "")
+    num_skipped = sum(1 for slot in test_slots if slot.test.skip != "")
+    suite = ElementTree.Element("testsuite",
+                                name="opensn",
+                                tests=str(len(test_slots)),
+                                failures=str(num_failures),
+                                skipped=str(num_skipped),
+                                time="{:.3f}".format(elapsed_time))
+
+    for slot in test_slots:
+        test = slot.test
+        case = ElementTree.SubElement(suite, "testcase",
+                                      name=test.GetName(argv.directory),
+                                      classname=os.path.relpath(test.file_dir, argv.directory),
+                                      time="{:.3f}".format(slot.wall_time))
+        properties = ElementTree.SubElement(case, "properties")
+        ElementTree.SubElement(properties, "property", name="num_procs", value=str(test.num_procs))
+        ElementTree.SubElement(properties, "property", name="peak_rss", value=str(slot.peak_rss))
+        if test.skip != "":
+            ElementTree.SubElement(case, "skipped", message=test.skip)
+        elif not slot.passed:
+            failure = ElementTree.SubElement(case, "failure", message=", ".join(test.annotations))
+            failure.text = slot.command
+
+    ElementTree.ElementTree(suite).write(file_path, encoding="utf-8", xml_declaration=True)
+
+
 def RunTests(tests: list, argv):
-    """Actually runs the tests. This routine dynamically checks the system load."""
+    """Actually runs the tests. Tests are started, longest first according to the timing database,
+       whenever enough processes are free, and the runner sleeps until a running test exits."""
     start_time = time.perf_counter()
 
-    # os.cpu_count() may not be ideal in this case since it returns the number of logical cpus.
-    capacity = os.cpu_count()
-    if argv.jobs > 0:
-        capacity = argv.jobs
+    capacity = GetCapacity(argv)
     system_load = 0
     test_slots = []
+    running_slots = {}
 
     specific_test = ""
     if argv.test is not None:
@@ -390,37 +479,74 @@ def RunTests(tests: list, argv):
 
     print("Executing tests with weights in: " + str(weight_classes_allowed))
 
-    while True:
-        done = True
-        # Check for tests to run
-        for test in tests:
-            if test.ran or (test.weight_class not in weight_classes_allowed):
+    # Order the tests longest first. Tests that never ran have no recorded time and go first, since
+    # they might be long. Ties are broken by decreasing number of processes.
+    timings = timing_db.TimingDatabase(argv.timing_db)
+
+    def Priority(test):
+        recorded_time = timings.Get(test.GetName(argv.directory))
+        if recorded_time is None:
+            return (0, 0.0, -test.num_procs)
+        return (1, -recorded_time, -test.num_procs)
+
+    pending = sorted([test for test in tests if test.weight_class in weight_classes_allowed],
+                     key=Priority)
+
+    while len(pending) > 0 or len(running_slots) > 0:
+        # Start every ready test that fits
+        not_started = []
+        for test in pending:
+            if not test.CheckDependencies(tests):
+                not_started.append(test)
+                continue
+            if test.skip == "" and test.num_procs > (capacity - system_load):
+                not_started.append(test)
                 continue
-            done = False
-
-            if not test.submitted and test.CheckDependencies(tests):
-                if test.num_procs <= (capacity - system_load):
-                    system_load += test.num_procs
-
-                    new_slot = test_slot.TestSlot(test, argv)
-
-                    # This will only run if a specific test has been specified
-                    if new_slot.test.filename == specific_test:
-                        print("Running " + new_slot.test.GetTestPath() + ":")
-
-                    test_slots.append(new_slot)
 
-        # Check test progress
-        system_load = 0
-        for slot in test_slots:
-            if slot.Probe():
-                system_load += slot.test.num_procs
+            new_slot = test_slot.TestSlot(test, argv)
 
-        time.sleep(1.0)
+            # This will only run if a specific test has been specified
+            if new_slot.test.filename == specific_test:
+                print("Running " + new_slot.test.GetTestPath() + ":")
 
-        if done:
+            test_slots.append(new_slot)
+            if test.skip != "":
+                new_slot.Complete()
+            else:
+                system_load += test.num_procs
+                running_slots[new_slot.process.pid] = new_slot
+        pending = not_started
+
+        if len(running_slots) == 0:
+            # Completing skipped tests can satisfy dependencies. Otherwise, nothing can start.
+            if any(test.CheckDependencies(tests) and (test.skip != "" or test.num_procs <= capacity)
+                   for test in pending):
+                continue
             break
 
+        # Wait for a test to finish
+        slot, exit_code, rusage = WaitForSlot(running_slots)
+        slot.Complete(exit_code, rusage)
+        system_load -= slot.test.num_procs
+        timings.Update(slot.test.GetName(argv.directory), slot.wall_time)
+
+    timings.Save()
+
+    # Tests that could never start are reported as failed, unless they are skipped anyway
+    num_tests_not_run = 0
+    for test in pending:
+        if test.skip != "":
+            reason = ""
+        elif not test.CheckDependencies(tests):
+            reason = f'Dependency "{test.dependency}" not run'
+        else:
+            reason = f"Needs {test.num_procs} processes, capacity is {capacity}"
+        if reason != "":
+            num_tests_not_run += 1
+        new_slot = test_slot.TestSlot(test, argv, not_run_reason=reason)
+        test_slots.append(new_slot)
+        new_slot.Complete()
+
     num_tests_failed = 0
     for slot in test_slots:
         if not slot.passed:
@@ -429,6 +555,11 @@ def RunTests(tests: list, argv):
     end_time = time.perf_counter()
     elapsed_time = end_time - start_time
 
+    if argv.json_report is not None:
+        WriteJSONReport(argv.json_report, test_slots, elapsed_time, argv)
+    if argv.junit_report is not None:
+        WriteJUnitReport(argv.junit_report, test_slots, elapsed_time, argv)
+
     print("Done executing tests with weights in: " + str(weight_classes_allowed))
 
     num_skipped_tests = 0
@@ -449,8 +580,10 @@ def RunTests(tests: list, argv):
 
     print()
     print("Elapsed time            : {:.2f} seconds".format(elapsed_time))
-    print(f"Number of tests run     : {len(test_slots)}")
+    print(f"Number of tests run     : {len(test_slots) - num_tests_not_run}")
     print(f"Number of failed tests  : {num_tests_failed}")
+    if num_tests_not_run > 0:
+        print(f"Number of tests not run : {num_tests_not_run}")
 
     if num_tests_failed > 0:
         return 1
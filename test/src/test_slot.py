@@ -5,12 +5,37 @@ import subprocess
 import shutil
 import re
 import sys
+import time
+from . import checks
+
+
+class ElapsedTimeScanner:
+    """Extracts the execution time reported by OpenSn from the output of a test"""
+
+    def __init__(self):
+        self.done = False
+        self.elapsed_time = 0.0
+
+    def ProcessLine(self, line: str):
+        if line.find("Elapsed execution time:") < 0:
+            return
+
+        values_slice = re.split(r'[,:]', line.strip())
+        self.elapsed_time = (float(values_slice[1]) * 3600
+                             + float(values_slice[2]) * 60
+                             + float(values_slice[3]))
+        self.done = True
+
+    def Abort(self, error: Exception):
+        self.done = True
 
 
 class TestSlot:
     """Data structure to hold information regarding the execution of a test"""
 
-    def __init__(self, test, argv):
+    def __init__(self, test, argv, not_run_reason: str = ""):
+        """Constructor. Launches the test, unless it is skipped or a reason why it cannot run is
+           given, in which case it is reported as failed."""
         self.process = None
         self.stdout_file = None
         self.stderr_file = None
@@ -18,6 +43,10 @@ class TestSlot:
         self.passed = False
         self.argv = argv
         self.command: str = ""
+        self.start_time = 0.0
+        self.wall_time = 0.0
+        self.peak_rss = 0
+        self.not_run_reason = not_run_reason
 
         self._Run()
 
@@ -25,10 +54,10 @@ class TestSlot:
         """Protected method to run the test"""
         test = self.test
         test.submitted = True
-        stdout_filename = test.file_dir + f"out/{test.GetOutFilenamePrefix()}.tmp"
+        unified_filename = test.file_dir + f"out/{test.GetOutFilenamePrefix()}.out"
         stderr_filename = test.file_dir + f"out/{test.GetOutFilenamePrefix()}.err"
 
-        if test.skip != "":
+        if test.skip != "" or self.not_run_reason != "":
             return
 
         if self.argv.engine in ["module", "jupyter"]:
@@ -65,10 +94,14 @@ class TestSlot:
                     cmd += arg + " "
         self.command = cmd
 
-        # Write command to output file
-        self.stdout_file = open(stdout_filename, "w", encoding="utf-8")
+        # Write command to output file. The standard output of the test is written directly after
+        # it, the standard error is appended once the test has finished.
+        self.stdout_file = open(unified_filename, "a", encoding="utf-8")
+        self.stdout_file.write(cmd + "\n")
+        self.stdout_file.flush()
         self.stderr_file = open(stderr_filename, "w", encoding="utf-8")
 
+        self.start_time = time.perf_counter()
         self.process = subprocess.Popen(cmd,
                                         cwd=test.file_dir,
                                         shell=True,
@@ -76,33 +109,30 @@ class TestSlot:
                                         stderr=self.stderr_file,
                                         universal_newlines=True)
 
-    def Probe(self):
-        """Probes the test to see if it finished"""
+    def Complete(self, exit_code=None, rusage=None):
+        """Finalizes the test after its process has been reaped. The exit code and the resource
+           usage are the ones reported by the operating system when the process was reaped."""
         test = self.test
-        running = True
 
         if test.ran:
-            running = False
-            return running
-
-        if not test.ran and test.skip != "":
-            self.PerformChecks()
-            test.ran = True
-            running = False
-            return running
+            return
 
-        if self.process.poll() is not None:
+        if test.skip == "" and self.not_run_reason == "":
+            self.wall_time = time.perf_counter() - self.start_time
+            self.process.returncode = exit_code
+            if rusage is not None:
+                # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+                self.peak_rss = rusage.ru_maxrss
+                if not sys.platform.startswith('darwin'):
+                    self.peak_rss *= 1024
             self.CreateUnifiedOutput()
-            self.PerformChecks()
-            test.ran = True
-            running = False
 
-        return running
+        self.PerformChecks()
+        test.ran = True
 
     def CreateUnifiedOutput(self):
-        """Combines output and error files into one file"""
+        """Appends the error file to the output file, which results in one unified file"""
         test = self.test
-        stdout_filename = test.file_dir + f"out/{test.GetOutFilenamePrefix()}.tmp"
         stderr_filename = test.file_dir + f"out/{test.GetOutFilenamePrefix()}.err"
         unified_filename = test.file_dir + f"out/{test.GetOutFilenamePrefix()}.out"
 
@@ -114,14 +144,11 @@ class TestSlot:
             if not self.stderr_file.closed:
                 self.stderr_file.close()
 
-        # Append stderr and stdout to unified file
-        with open(unified_filename, "a", encoding="utf-8") as unified_file:
-            unified_file.write(self.command + "\n")
-            with open(stdout_filename, "r", encoding="utf-8") as self.stdout_file:
-                shutil.copyfileobj(self.stdout_file, unified_file)
-            with open(stderr_filename, "r", encoding="utf-8") as self.stderr_file:
-                shutil.copyfileobj(self.stderr_file, unified_file)
-        os.remove(stdout_filename)
+        # Append stderr to unified file
+        if os.path.getsize(stderr_filename) > 0:
+            with open(unified_filename, "a", encoding="utf-8") as unified_file:
+                with open(stderr_filename, "r", encoding="utf-8") as self.stderr_file:
+                    shutil.copyfileobj(self.stderr_file, unified_file)
         os.remove(stderr_filename)
 
     def PerformChecks(self):
@@ -130,13 +157,16 @@ class TestSlot:
         passed = True
         output_filename = f"{test.file_dir}out/{test.GetOutFilenamePrefix()}.out"
 
-        if test.skip == "":
+        elapsed_time_scanner = ElapsedTimeScanner()
+        if self.not_run_reason != "":
+            passed = False
+            test.annotations.append(self.not_run_reason)
+        elif test.skip == "":
             error_code = self.process.returncode
-            for check in test.checks:
-                verbose = self.argv.verbose
-                check_passed = check.PerformCheck(output_filename, error_code, verbose)
-                passed = passed and check_passed
+            passed = checks.PerformChecks(test.checks, output_filename, error_code,
+                                          self.argv.verbose, [elapsed_time_scanner])
 
+            for check in test.checks:
                 check_annotations = check.GetAnnotations()
                 for ann in check_annotations:
                     test.annotations.append(ann)
@@ -144,16 +174,11 @@ class TestSlot:
             test.annotations.append("Skipped")
 
         test_path = os.path.join(test.file_dir, test.filename)
-        test_file_name = os.path.relpath(test_path, self.argv.directory)
+        test_file_name = test.GetName(self.argv.directory)
 
         if not os.path.isfile(test_path):
             test.annotations.append("Input file missing")
 
-        args_str = ', '.join(map(str, test.args))
-        if len(args_str) != 0:
-            args_str = " (" + args_str + ")"
-        test_file_name += args_str
-
         pad = 0
         if passed:
             self.passed = True
@@ -174,19 +199,7 @@ class TestSlot:
         width = 120 - len(prefix + test_file_name) + pad
         message = message.rjust(width, ".")
 
-        opensn_elapsed_time_sec = 0.0
-        if os.path.exists(output_filename):
-            with open(output_filename, 'r', encoding='utf-8') as file:
-                for line in file:
-                    found = re.search("Elapsed execution time:", line)
-                    if found:
-                        values_slice = re.split(r'[,:]', line.strip())
-                        opensn_elapsed_time_sec = (float(values_slice[1]) * 3600
-                                                   + float(values_slice[2]) * 60
-                                                   + float(values_slice[3]))
-                        break
-
-        time_message = " {:.1f}s".format(opensn_elapsed_time_sec)
+        time_message = " {:.1f}s".format(elapsed_time_scanner.elapsed_time)
 
         print(prefix + " " + test_file_name + message + time_message)
 
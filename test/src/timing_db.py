@@ -0,0 +1,64 @@
+"""Module providing a persistent database of regression test runtimes."""
+
+import json
+import os
+import warnings
+
+
+class TimingDatabase:
+    """Stores the wall time of each test from previous runs, keyed by test name.
+
+    The recorded times are used to start the longest tests first. A new measurement is blended with
+    the recorded time so that a single slow or fast run does not dominate the schedule.
+    """
+
+    SMOOTHING = 0.5
+
+    def __init__(self, file_path: str):
+        """Constructor. Loads the database if the file exists"""
+        self.file_path = file_path
+        self.timings = {}
+
+        if file_path is None or not os.path.isfile(file_path):
+            return
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            warnings.warn('Could not read timing database "' + file_path + '", ignoring it')
+            return
+
+        if not isinstance(data, dict):
+            warnings.warn('Timing database "' + file_path + '" is not a dictionary, ignoring it')
+            return
+
+        for name, seconds in data.items():
+            if isinstance(seconds, (int, float)) and seconds >= 0.0:
+                self.timings[name] = float(seconds)
+
+    def Get(self, name: str):
+        """Returns the recorded wall time of a test in seconds, or None if it never ran"""
+        return self.timings.get(name)
+
+    def Update(self, name: str, seconds: float):
+        """Records a new wall time measurement for a test"""
+        old_seconds = self.timings.get(name)
+        if old_seconds is None:
+            self.timings[name] = seconds
+        else:
+            self.timings[name] = self.SMOOTHING * seconds + (1.0 - self.SMOOTHING) * old_seconds
+
+    def Save(self):
+        """Writes the database. The file is replaced atomically so that an interrupted run never
+           leaves a truncated database behind."""
+        if self.file_path is None:
+            return
+
+        tmp_file_path = self.file_path + ".tmp"
+        try:
+            with open(tmp_file_path, 'w', encoding='utf-8') as file:
+                json.dump(self.timings, file, indent=2, sort_keys=True)
+            os.replace(tmp_file_path, self.file_path)
+        except OSError:
+            warnings.warn('Could not write timing database "' + self.file_path + '"')
@@ -0,0 +1,73 @@
+#include "test/unit/opensn_unit_test.h"
+#include "framework/data_types/index_map.h"
+#include "framework/mesh/mesh_continuum/mesh_continuum_vertex_handler.h"
+#include <gtest/gtest.h>
+#include <map>
+
+using namespace opensn;
+
+class IndexMapTest : public OpenSnUnitTest
+{
+};
+
+TEST_F(IndexMapTest, InsertFind)
+{
+  IndexMap map;
+  std::map<uint64_t, uint64_t> reference;
+
+  // Strided ids, to collide in the low bits, inserted through several rehashes
+  for (uint64_t i = 0; i < 1000; ++i)
+  {
+    const uint64_t id = (i * 7919) << 12;
+    EXPECT_TRUE(map.Insert(id, i));
+    reference[id] = i;
+  }
+  EXPECT_EQ(map.size(), reference.size());
+  for (const auto& [id, value] : reference)
+    EXPECT_EQ(map.Find(id), value);
+
+  // Insert does not replace existing entries, InsertOrAssign does
+  const uint64_t id = 7919 << 12;
+  EXPECT_FALSE(map.Insert(id, 42));
+  EXPECT_EQ(map.at(id), 1);
+  map.InsertOrAssign(id, 42);
+  EXPECT_EQ(map.at(id), 42);
+  EXPECT_EQ(map.size(), reference.size());
+
+  EXPECT_EQ(map.Find(1), IndexMap::NOT_FOUND);
+  EXPECT_FALSE(map.Contains(1));
+  EXPECT_THROW(map.at(1), std::out_of_range);
+  EXPECT_THROW(map.Insert(IndexMap::NOT_FOUND, 0), std::invalid_argument);
+
+  map.clear();
+  EXPECT_TRUE(map.empty());
+  EXPECT_EQ(map.Find(id), IndexMap::NOT_FOUND);
+  EXPECT_EQ(map.GetMemoryUsage(), 0);
+}
+
+TEST_F(IndexMapTest, VertexHandler)
+{
+  VertexHandler vertices;
+  vertices.Insert(10, Vector3(1.0, 0.0, 0.0));
+  vertices.Insert(3, Vector3(0.0, 1.0, 0.0));
+  vertices.Insert(10, Vector3(5.0, 5.0, 5.0));
+  vertices.Insert(7, Vector3(0.0, 0.0, 1.0));
+
+  EXPECT_EQ(vertices.GetNumLocallyStored(), 3);
+  EXPECT_DOUBLE_EQ(vertices[10].x, 1.0);
+  EXPECT_DOUBLE_EQ(vertices[3].y, 1.0);
+  EXPECT_DOUBLE_EQ(vertices[7].z, 1.0);
+  EXPECT_THROW(vertices[4], std::out_of_range);
+
+  vertices[3].x = 2.0;
+  EXPECT_DOUBLE_EQ(vertices[3].x, 2.0);
+
+  // Iteration is in insertion order
+  std::vector<uint64_t> ids;
+  for (const auto& [vid, vertex] : vertices)
+    ids.push_back(vid);
+  EXPECT_EQ(ids, std::vector<uint64_t>({10, 3, 7}));
+
+  vertices.Clear();
+  EXPECT_EQ(vertices.GetNumLocallyStored(), 0);
+}
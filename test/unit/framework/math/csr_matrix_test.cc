@@ -0,0 +1,62 @@
+#include "test/unit/opensn_unit_test.h"
+#include "framework/math/sparse_matrix/csr_matrix.h"
+#include "framework/math/sparse_matrix/sparse_matrix.h"
+#include <gmock/gmock.h>
+#include <gtest/gtest.h>
+
+using namespace opensn;
+
+class CSRMatrixTest : public OpenSnUnitTest
+{
+};
+
+TEST_F(CSRMatrixTest, FromSparseMatrix)
+{
+  SparseMatrix m(3, 4);
+  m.Insert(0, 3, 1.);
+  m.Insert(0, 1, 2.);
+  m.Insert(2, 2, 3.);
+  m.Insert(2, 0, 4.);
+  m.Insert(2, 1, 5.);
+
+  CSRMatrix csr(m);
+  EXPECT_EQ(csr.GetNumRows(), 3);
+  EXPECT_EQ(csr.GetNumCols(), 4);
+  EXPECT_EQ(csr.GetNumNonZeros(), 5);
+  EXPECT_THAT(csr.GetRowOffsets(), ::testing::ElementsAre(0, 2, 2, 5));
+  EXPECT_THAT(csr.GetColumnIndices(), ::testing::ElementsAre(1, 3, 0, 1, 2));
+  EXPECT_THAT(csr.GetValues(), ::testing::ElementsAre(2., 1., 4., 5., 3.));
+}
+
+TEST_F(CSRMatrixTest, FindColumn)
+{
+  SparseMatrix m(2, 6);
+  m.Insert(0, 1, 1.);
+  m.Insert(0, 4, 2.);
+  m.Insert(1, 0, 3.);
+  m.Insert(1, 2, 4.);
+  m.Insert(1, 3, 5.);
+
+  CSRMatrix csr(m);
+  EXPECT_EQ(csr.FindColumn(0, 0), 0);
+  EXPECT_EQ(csr.FindColumn(0, 2), 1);
+  EXPECT_EQ(csr.FindColumn(0, 5), 2);
+  EXPECT_EQ(csr.FindColumn(1, 1), 3);
+  EXPECT_EQ(csr.FindColumn(1, 3), 4);
+  EXPECT_EQ(csr.FindColumn(1, 6), 5);
+}
+
+TEST_F(CSRMatrixTest, Multiply)
+{
+  SparseMatrix m(3, 3);
+  m.Insert(0, 0, 1.);
+  m.Insert(1, 0, 2.);
+  m.Insert(1, 1, 3.);
+  m.Insert(2, 2, 4.);
+  m.Insert(2, 0, 5.);
+
+  CSRMatrix csr(m);
+  std::vector<double> y;
+  csr.Multiply({1., 2., 3.}, y);
+  EXPECT_THAT(y, ::testing::ElementsAre(1., 8., 17.));
+}
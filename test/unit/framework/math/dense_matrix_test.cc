@@ -449,3 +449,49 @@ TEST_F(DenseMatrixTest, Transpose)
   EXPECT_DOUBLE_EQ(a(2, 1), -3);
   EXPECT_DOUBLE_EQ(a(3, 1), -4);
 }
+
+TEST_F(DenseMatrixTest, BatchedGaussElimination)
+{
+  // Two interleaved 3x3 systems, A_s = A + s * I
+  const unsigned int n = 3;
+  const size_t num_systems = 2;
+  DenseMatrix<double> a(n, n);
+  a(0, 0) = 4.;
+  a(0, 1) = -1.;
+  a(0, 2) = 0.;
+  a(1, 0) = -1.;
+  a(1, 1) = 4.;
+  a(1, 2) = -1.;
+  a(2, 0) = 0.;
+  a(2, 1) = -1.;
+  a(2, 2) = 4.;
+  Vector<double> rhs(n);
+  rhs(0) = 1.;
+  rhs(1) = 2.;
+  rhs(2) = 3.;
+
+  std::vector<double> A(n * n * num_systems);
+  std::vector<double> b(n * num_systems);
+  for (size_t s = 0; s < num_systems; ++s)
+  {
+    for (unsigned int i = 0; i < n; ++i)
+    {
+      for (unsigned int j = 0; j < n; ++j)
+        A[(i * n + j) * num_systems + s] = a(i, j) + (i == j ? static_cast<double>(s) : 0.);
+      b[i * num_systems + s] = rhs(i);
+    }
+  }
+
+  BatchedGaussElimination(A.data(), b.data(), n, num_systems);
+
+  for (size_t s = 0; s < num_systems; ++s)
+  {
+    auto as = a;
+    auto x = rhs;
+    for (unsigned int i = 0; i < n; ++i)
+      as(i, i) += static_cast<double>(s);
+    GaussElimination(as, x, n);
+    for (unsigned int i = 0; i < n; ++i)
+      EXPECT_NEAR(b[i * num_systems + s], x(i), 1.0e-12);
+  }
+}
@@ -204,3 +204,82 @@ TEST_F(MeshContinuumTest, PointInsideCellFace3D)
   const auto grid_ptr = BuildOrthogonalMesh({{-1.0, 1.0}, {0.0, 0.5, 1.0}, {-1.0, 0.0, 1.0}});
   TestPointInsideCellFace(grid_ptr);
 }
+
+/// Helper for the FindCellsContainingPointXD tests
+void
+TestFindCellsContainingPoint(const std::shared_ptr<MeshContinuum> grid)
+{
+  std::vector<Vector3> points;
+  for (const auto& cell : grid->local_cells)
+  {
+    points.push_back(cell.centroid);
+    for (const auto vi : cell.vertex_ids)
+      points.push_back(grid->vertices[vi]);
+    for (const auto& face : cell.faces)
+      points.push_back(face.centroid);
+  }
+  // Outside the mesh
+  points.emplace_back(10.0, 10.0, 10.0);
+
+  // The spatial index finds the same cells as checking every cell
+  const auto containing_cells = grid->FindLocalCellsContainingPoints(points);
+  ASSERT_EQ(containing_cells.size(), points.size());
+  for (size_t p = 0; p < points.size(); ++p)
+  {
+    std::vector<uint64_t> expected;
+    for (const auto& cell : grid->local_cells)
+      if (grid->CheckPointInsideCell(cell, points[p]))
+        expected.push_back(cell.local_id);
+    EXPECT_EQ(containing_cells[p], expected);
+  }
+  EXPECT_TRUE(containing_cells.back().empty());
+}
+
+TEST_F(MeshContinuumTest, FindCellsContainingPoint1D)
+{
+  const auto grid_ptr = BuildOrthogonalMesh({{-1.0, -0.75, 0.0, 1.0, 2.0}});
+  TestFindCellsContainingPoint(grid_ptr);
+}
+
+TEST_F(MeshContinuumTest, FindCellsContainingPoint2D)
+{
+  const auto grid_ptr = BuildOrthogonalMesh({{-1.0, -0.75, 0.0, 1.0}, {0.0, 0.5, 1.0}});
+  TestFindCellsContainingPoint(grid_ptr);
+}
+
+TEST_F(MeshContinuumTest, FindCellsContainingPoint3D)
+{
+  const auto grid_ptr = BuildOrthogonalMesh({{-1.0, 1.0}, {0.0, 0.5, 1.0}, {-1.0, 0.0, 1.0}});
+  TestFindCellsContainingPoint(grid_ptr);
+}
+
+/// Helper for the FindCellsContainingPointOff* tests. Shifts the cell centroids along the axes on
+/// which the mesh has no extent, which CheckPointInsideCell ignores for slabs and polygons.
+void
+TestFindCellsContainingShiftedPoint(const std::shared_ptr<MeshContinuum> grid, const Vector3& shift)
+{
+  for (const auto& cell : grid->local_cells)
+  {
+    const auto point = cell.centroid + shift;
+    std::vector<uint64_t> expected;
+    for (const auto& other_cell : grid->local_cells)
+      if (grid->CheckPointInsideCell(other_cell, point))
+        expected.push_back(other_cell.local_id);
+    ASSERT_FALSE(expected.empty());
+    EXPECT_EQ(grid->FindLocalCellsContainingPoint(point), expected);
+  }
+}
+
+TEST_F(MeshContinuumTest, FindCellsContainingPointOffLine1D)
+{
+  const auto grid_ptr = BuildOrthogonalMesh({{-1.0, -0.75, 0.0, 1.0, 2.0}});
+  TestFindCellsContainingShiftedPoint(grid_ptr, Vector3(0.5, -3.0, 0.0));
+  TestFindCellsContainingShiftedPoint(grid_ptr, Vector3(1.0e3, 2.0, 0.0));
+}
+
+TEST_F(MeshContinuumTest, FindCellsContainingPointOffPlane2D)
+{
+  const auto grid_ptr = BuildOrthogonalMesh({{-1.0, -0.75, 0.0, 1.0}, {0.0, 0.5, 1.0}});
+  TestFindCellsContainingShiftedPoint(grid_ptr, Vector3(0.0, 0.0, 2.5));
+  TestFindCellsContainingShiftedPoint(grid_ptr, Vector3(0.0, 0.0, -1.0e3));
+}
@@ -0,0 +1,73 @@
+#include "test/unit/opensn_unit_test.h"
+#include "framework/mesh/surface_mesh/triangle_bvh.h"
+#include <gtest/gtest.h>
+
+using namespace opensn;
+
+class TriangleBVHTest : public OpenSnUnitTest
+{
+};
+
+/// Triangulated surface of the unit cube [0, 1]^3 shifted by `offset`.
+std::vector<TriangleBVH::Triangle>
+CubeTriangles(const Vector3& offset)
+{
+  std::vector<Vector3> v;
+  for (int k = 0; k < 2; ++k)
+    for (int j = 0; j < 2; ++j)
+      for (int i = 0; i < 2; ++i)
+        v.push_back(offset + Vector3(i, j, k));
+
+  const std::vector<std::array<int, 4>> quads = {
+    {0, 2, 3, 1}, {4, 5, 7, 6}, {0, 1, 5, 4}, {2, 6, 7, 3}, {0, 4, 6, 2}, {1, 3, 7, 5}};
+  std::vector<TriangleBVH::Triangle> triangles;
+  for (const auto& q : quads)
+  {
+    triangles.push_back({v[q[0]], v[q[1]], v[q[2]]});
+    triangles.push_back({v[q[0]], v[q[2]], v[q[3]]});
+  }
+  return triangles;
+}
+
+TEST_F(TriangleBVHTest, RayCrossings)
+{
+  // Two disjoint cubes, so that the tree has interior nodes
+  auto triangles = CubeTriangles(Vector3(0.0, 0.0, 0.0));
+  const auto second_cube = CubeTriangles(Vector3(3.0, 0.0, 0.0));
+  triangles.insert(triangles.end(), second_cube.begin(), second_cube.end());
+
+  TriangleBVH bvh(triangles);
+  EXPECT_EQ(bvh.GetNumTriangles(), 24);
+
+  const Vector3 direction(0.5773, 0.6219, 0.5298);
+  bool degenerate = true;
+
+  // Inside the first cube
+  EXPECT_EQ(bvh.CountRayCrossings(Vector3(0.3, 0.4, 0.2), direction, degenerate), 1);
+  EXPECT_FALSE(degenerate);
+
+  // Inside the second cube
+  EXPECT_EQ(bvh.CountRayCrossings(Vector3(3.3, 0.4, 0.2), direction, degenerate), 1);
+  EXPECT_FALSE(degenerate);
+
+  // Between the cubes, the ray crosses neither cube
+  EXPECT_EQ(bvh.CountRayCrossings(Vector3(2.0, 0.5, 0.5), direction, degenerate), 0);
+  EXPECT_FALSE(degenerate);
+
+  // Below the first cube, the ray crosses it twice
+  EXPECT_EQ(bvh.CountRayCrossings(Vector3(0.2, 0.2, -0.5), direction, degenerate), 2);
+  EXPECT_FALSE(degenerate);
+
+  // A ray through the diagonal edge of a triangle is flagged
+  bvh.CountRayCrossings(Vector3(0.5, 0.5, 0.5), Vector3(1.0e-3, 1.0e-3, -1.0), degenerate);
+  EXPECT_TRUE(degenerate);
+}
+
+TEST_F(TriangleBVHTest, Empty)
+{
+  TriangleBVH bvh({});
+  bool degenerate = true;
+  EXPECT_EQ(bvh.GetNumTriangles(), 0);
+  EXPECT_EQ(bvh.CountRayCrossings(Vector3(0.0, 0.0, 0.0), Vector3(1.0, 1.0, 1.0), degenerate), 0);
+  EXPECT_FALSE(degenerate);
+}
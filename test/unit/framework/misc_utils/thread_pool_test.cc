@@ -0,0 +1,57 @@
+#include "test/unit/opensn_unit_test.h"
+#include "framework/utils/thread_pool.h"
+#include <gmock/gmock.h>
+#include <atomic>
+
+using namespace opensn;
+
+class ThreadPoolTest : public OpenSnUnitTest
+{
+};
+
+TEST_F(ThreadPoolTest, ParallelForVisitsAllItems)
+{
+  ThreadPool pool(4);
+  EXPECT_EQ(pool.GetNumThreads(), 4);
+
+  const size_t N = 1000;
+  std::vector<int> visits(N, 0);
+  std::atomic<size_t> bad_thread_ids(0);
+  for (int rep = 0; rep < 10; ++rep)
+    pool.ParallelFor(N,
+                     [&](size_t i, unsigned int thread_id)
+                     {
+                       ++visits[i];
+                       if (thread_id >= 4)
+                         ++bad_thread_ids;
+                     });
+
+  for (size_t i = 0; i < N; ++i)
+    EXPECT_EQ(visits[i], 10);
+  EXPECT_EQ(bad_thread_ids.load(), 0);
+}
+
+TEST_F(ThreadPoolTest, SingleThreadRunsInline)
+{
+  ThreadPool pool(1);
+  std::vector<unsigned int> thread_ids;
+  pool.ParallelFor(5, [&](size_t i, unsigned int thread_id) { thread_ids.push_back(thread_id); });
+  EXPECT_THAT(thread_ids, ::testing::ElementsAre(0, 0, 0, 0, 0));
+}
+
+TEST_F(ThreadPoolTest, ExceptionPropagates)
+{
+  ThreadPool pool(3);
+  EXPECT_THROW(pool.ParallelFor(16,
+                                [](size_t i, unsigned int)
+                                {
+                                  if (i == 7)
+                                    throw std::runtime_error("failure");
+                                }),
+               std::runtime_error);
+
+  // The pool remains usable after an exception
+  std::atomic<size_t> count(0);
+  pool.ParallelFor(16, [&](size_t, unsigned int) { ++count; });
+  EXPECT_EQ(count.load(), 16);
+}
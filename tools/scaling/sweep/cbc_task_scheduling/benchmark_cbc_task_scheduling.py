@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compares the CBC sweep task scheduling with a ready queue against the scan over all tasks, on the
+regression tests in test/python/modules/linear_boltzmann_solvers/transport_steady_cbc.
+
+Each test is run with both values of the ``cbc_task_scheduling`` option and the solver telemetry
+enabled. The reported sweep time is the sum, over the iterations of the outermost solver, of the
+maximum over the ranks of the time spent sweeping.
+
+Usage: python3 benchmark_cbc_task_scheduling.py --opensn /path/to/opensn [--repeats 3]
+"""
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+
+SCHEDULINGS = ["scan", "ready_queue"]
+
+# Input run by the console in place of the test input. It creates the problems of the unmodified
+# test input with the chosen scheduling, records the telemetry and then runs the test input. It is
+# given as an input file because the values of the console's -p option are split at commas.
+WRAPPER = """
+_DiscreteOrdinatesProblem = DiscreteOrdinatesProblem
+
+
+def DiscreteOrdinatesProblem(**kwargs):
+    kwargs["options"] = dict(kwargs.get("options", {{}}), cbc_task_scheduling="{scheduling}")
+    return _DiscreteOrdinatesProblem(**kwargs)
+
+
+EnableTelemetry("{telemetry_file}")
+
+exec(compile(open("{input_file}").read(), "{input_file}", "exec"))
+"""
+
+
+def sweep_times(telemetry_file):
+    """Returns the maximum and mean sweep times summed over the outermost solver iterations."""
+    max_time = 0.0
+    mean_time = 0.0
+    with open(telemetry_file, "r") as file:
+        for line in file:
+            record = json.loads(line)
+            if record["outer"]:
+                continue
+            max_time += record["times"]["sweep"]["max"] or 0.0
+            mean_time += record["times"]["sweep"]["mean"] or 0.0
+    return max_time, mean_time
+
+
+def run_case(args, case_dir, case, scheduling):
+    """Runs a test with a scheduling and returns its sweep times and wall time."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        telemetry_file = os.path.join(tmp_dir, "telemetry.jsonl")
+        wrapper_file = os.path.join(tmp_dir, "input.py")
+        with open(wrapper_file, "w") as file:
+            file.write(WRAPPER.format(scheduling=scheduling, telemetry_file=telemetry_file,
+                                      input_file=os.path.join(case_dir, case["file"])))
+        command = shlex.split(args.mpiexec) + [str(case["num_procs"]), args.opensn,
+                                               "-i", wrapper_file]
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=case_dir, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True)
+        wall_time = time.perf_counter() - start
+        if result.returncode != 0 or not os.path.exists(telemetry_file):
+            print(result.stdout)
+            sys.exit(f"Failed to run {case['file']} with cbc_task_scheduling={scheduling}.")
+        return sweep_times(telemetry_file) + (wall_time,)
+
+
+def main():
+    repo_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+    default_case_dir = os.path.join(
+        repo_dir, "test/python/modules/linear_boltzmann_solvers/transport_steady_cbc")
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--opensn", required=True, help="Path to the OpenSn executable")
+    parser.add_argument("--mpiexec", default="mpiexec -n",
+                        help="MPI launcher, followed by the number of processes")
+    parser.add_argument("--case-dir", default=default_case_dir,
+                        help="Directory of the tests and their tests.json")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="Number of runs of each test and scheduling; the fastest is reported")
+    args = parser.parse_args()
+    args.opensn = os.path.abspath(args.opensn)
+
+    with open(os.path.join(args.case_dir, "tests.json"), "r") as file:
+        cases = json.load(file)
+
+    print(f"{'Test':<28} {'Scheduling':<12} {'Sweep max (s)':>14} {'Sweep mean (s)':>15} "
+          f"{'Wall (s)':>10} {'Speedup':>8}")
+    for case in cases:
+        best = {}
+        for scheduling in SCHEDULINGS:
+            runs = [run_case(args, args.case_dir, case, scheduling) for _ in range(args.repeats)]
+            best[scheduling] = min(runs)
+        for scheduling in SCHEDULINGS:
+            max_time, mean_time, wall_time = best[scheduling]
+            speedup = best["scan"][0] / max_time if max_time > 0.0 else float("nan")
+            print(f"{case['file']:<28} {scheduling:<12} {max_time:>14.4f} {mean_time:>15.4f} "
+                  f"{wall_time:>10.2f} {speedup:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import math
+
+
+def rank_grid(nranks):
+    """Split the ranks into a KBA grid of px x py ranks that is as square as possible."""
+    px = int(math.sqrt(nranks))
+    while nranks % px != 0:
+        px -= 1
+    return px, nranks // px
+
+
+def create_slurm_file(job_name, opensn_binary, input_filename, nnodes, ntasks):
+    """Create a SLURM job file to run OpenSn."""
+    slurm_filename = f'slurm_{nnodes}n.sh'
+    print(f"Generating SLURM file {slurm_filename}")
+    px, py = rank_grid(nnodes * ntasks)
+    slurm_content = f"""#!/bin/bash
+#SBATCH --job-name={job_name}_{nnodes}n
+#SBATCH --output={job_name}_{nnodes}n.out
+#SBATCH --error={job_name}_{nnodes}n.err
+#SBATCH --nodes={nnodes}
+#SBATCH --ntasks-per-node={ntasks}
+#SBATCH --time=00:30:00
+
+srun {opensn_binary} -i {input_filename} -p px={px} -p py={py}
+"""
+    with open(slurm_filename, "w") as slurm_file:
+        slurm_file.write(slurm_content)
+
+
+def generate_files_for_scaling_study(opensn_binary, input_filename, nnodes, ntasks, job_name):
+    for nodes in nnodes:
+        print(f"Generating inputs for {nodes} nodes...")
+        create_slurm_file(job_name, opensn_binary, input_filename, nodes, ntasks)
+        print("")
+
+
+# Name of the OpenSn input file for this study
+input_filename = "spds_setup.py"
+
+# Name of the job to include in job scripts
+job_name = "spds_setup"
+
+# Path to the OpenSn binary
+opensn_binary = "/path/to/opensn"
+
+# Node counts
+nnodes = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512]
+
+# Tasks (MPI ranks) per node
+ntasks = 64
+
+generate_files_for_scaling_study(opensn_binary, input_filename, nnodes, ntasks, job_name)
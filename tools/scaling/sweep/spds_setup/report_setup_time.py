@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Reports the AAH SPDS setup time versus the number of MPI ranks, from the output files of the
+SPDS setup scaling study.
+
+Usage: python3 report_setup_time.py spds_setup_*n.out
+"""
+
+import re
+import sys
+
+ranks_re = re.compile(r"Running \S+ with (\d+) processes")
+setup_re = re.compile(r"SPDS setup time\s+([0-9.eE+-]+) s for (\d+) AAH SPDS")
+
+
+def parse_output(filename):
+    """Returns the number of ranks, the number of SPDS and the setup time of a run."""
+    nranks = None
+    result = None
+    with open(filename, "r") as file:
+        for line in file:
+            match = ranks_re.search(line)
+            if match:
+                nranks = int(match.group(1))
+            match = setup_re.search(line)
+            if match:
+                result = (int(match.group(2)), float(match.group(1)))
+    if nranks is None or result is None:
+        return None
+    return nranks, result[0], result[1]
+
+
+def main(filenames):
+    runs = []
+    for filename in filenames:
+        run = parse_output(filename)
+        if run is None:
+            print(f"Skipping {filename}: no SPDS setup time found.")
+        else:
+            runs.append(run)
+    runs.sort()
+    if not runs:
+        return
+
+    base_ranks, _, base_time = runs[0]
+    print(f"{'Ranks':>10} {'SPDS':>8} {'Setup time (s)':>16} {'Weak efficiency':>16}")
+    for nranks, nspds, time in runs:
+        efficiency = base_time / time if time > 0.0 else float("nan")
+        print(f"{nranks:>10} {nspds:>8} {time:>16.4f} {efficiency:>16.3f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    main(sys.argv[1:])
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+This script sets up a 1-group transport problem on a KBA partitioned orthogonal
+mesh with a fixed number of cells per rank. It is used for weak scaling studies
+of the AAH sweep data structure setup with OpenSn, and therefore only
+initializes the solver.
+
+The number of ranks in x and y is given on the command line, e.g.,
+  mpiexec -n 64 opensn -i spds_setup.py -p px=8 -p py=8
+"""
+
+import os
+import sys
+
+if "opensn_console" not in globals():
+    from mpi4py import MPI
+    size = MPI.COMM_WORLD.size
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../")))
+    from pyopensn.mesh import OrthogonalMeshGenerator, KBAGraphPartitioner
+    from pyopensn.xs import MultiGroupXS
+    from pyopensn.aquad import GLCProductQuadrature3DXYZ
+    from pyopensn.solver import DiscreteOrdinatesProblem, SteadyStateSolver
+
+# Ranks in x and y
+if "px" not in globals():
+    px = 1
+if "py" not in globals():
+    py = 1
+
+if size != px * py:
+    sys.exit(f"Incorrect number of processors. Expected {px * py} processors but got {size}.")
+
+# Cells per rank
+cells_per_rank_xy = 16
+cells_z = 32
+
+Npolar = 16      # Number of polar angles
+Nazimuthal = 32  # Number of azimuthal angles
+
+# Mesh
+nx = cells_per_rank_xy * px
+ny = cells_per_rank_xy * py
+xnodes = [float(i) for i in range(nx + 1)]
+ynodes = [float(j) for j in range(ny + 1)]
+znodes = [float(k) for k in range(cells_z + 1)]
+meshgen = OrthogonalMeshGenerator(
+    node_sets=[xnodes, ynodes, znodes],
+    partitioner=KBAGraphPartitioner(
+        nx=px,
+        ny=py,
+        xcuts=[float(cells_per_rank_xy * i) for i in range(1, px)],
+        ycuts=[float(cells_per_rank_xy * j) for j in range(1, py)],
+    ),
+)
+grid = meshgen.Execute()
+grid.SetUniformBlockID(0)
+
+# Cross-section data
+xs = MultiGroupXS()
+xs.CreateSimpleOneGroup(1.0, 0.5)
+
+# Angular quadrature
+pquad = GLCProductQuadrature3DXYZ(Npolar, Nazimuthal)
+
+# Solver
+phys = DiscreteOrdinatesProblem(
+    mesh=grid,
+    num_groups=1,
+    groupsets=[
+        {
+            "groups_from_to": (0, 0),
+            "angular_quadrature": pquad,
+            "angle_aggregation_type": "single",
+            "inner_linear_method": "petsc_richardson",
+            "l_abs_tol": 1.0e-6,
+            "l_max_its": 1,
+        },
+    ],
+    xs_map=[
+        {"block_ids": [0], "xs": xs},
+    ],
+    options={
+        "scattering_order": 0,
+    },
+    sweep_type="AAH",
+)
+ss_solver = SteadyStateSolver(lbs_problem=phys)
+ss_solver.Initialize()